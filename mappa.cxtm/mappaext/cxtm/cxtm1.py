@@ -56,6 +56,7 @@ class CXTMTopicMapWriter(object):
         self._assocs = None
         self._assoc2roles = None
         self._tmc2id = None
+        self._tmc2key = None
 
     def write(self, topicmap):
         """\
@@ -85,6 +86,7 @@ class CXTMTopicMapWriter(object):
         self._assocs = None
         self._assoc2roles = None
         self._tmc2id = None
+        self._tmc2key = None
         self._iri2norm = None
 
     def _index(self, construct):
@@ -104,16 +106,17 @@ class CXTMTopicMapWriter(object):
         `topicmap`
             The topic map to create the index for.
         """
-        self._topics = sorted(topicmap.topics, self._cmp_topic)
+        self._tmc2key = {}
+        self._topics = sorted(topicmap.topics, key=self._topic_key)
         assoc2roles = {}
         self._tmc2id = {}
         tmc2id = self._tmc2id
         for i, topic in enum(self._topics):
             tmc2id[topic] = i
-        self._assocs = sorted(topicmap.associations, self._cmp_assoc)
+        self._assocs = sorted(topicmap.associations, key=self._assoc_key)
         for i, assoc in enum(self._assocs):
             tmc2id[assoc] = i
-            roles = sorted(assoc.roles, self._cmp_role_ignore_parent)
+            roles = sorted(assoc.roles, key=self._role_key_ignore_parent)
             assoc2roles[assoc] = roles
             for j, role in enum(roles):
                 tmc2id[role] = j
@@ -137,7 +140,7 @@ class CXTMTopicMapWriter(object):
         for pos, occ in enum(self._occs(topic)):
             write_occurrence(occ, pos)
         emptyElement = self._writer.emptyElement
-        for role in sorted(topic.roles_played, self._cmp_role):
+        for role in sorted(topic.roles_played, key=self._role_key):
             emptyElement(u'rolePlayed', {u'ref': u'association.%s.role.%s' % (index_of(role.parent), index_of(role))})
             newline()
         endElement(u'topic')
@@ -287,7 +290,7 @@ class CXTMTopicMapWriter(object):
         newline = self._writer.newline
         emptyElement = self._writer.emptyElement
         written = False
-        for i, theme in enumerate(sorted(scoped.scope, self._cmp_topic)):
+        for i, theme in enumerate(sorted(scoped.scope, key=self._topic_key)):
             if not i:
                 self._writer.startElement(u'scope')
                 newline()
@@ -302,13 +305,13 @@ class CXTMTopicMapWriter(object):
         """\
         Returns sorted occurrences from the `topic`.
         """
-        return sorted(topic.occurrences, self._cmp_occ)
+        return sorted(topic.occurrences, key=self._occ_key)
 
     def _names(self, topic):
         """\
         Returns sorted names from the `topic`.
         """
-        return sorted(topic.names, self._cmp_name)
+        return sorted(topic.names, key=self._name_key)
 
     def _roles(self, association):
         """\
@@ -320,7 +323,7 @@ class CXTMTopicMapWriter(object):
         """\
         Returns sorted variants from the `name`.
         """
-        return sorted(name.variants, self._cmp_variant)
+        return sorted(name.variants, key=self._variant_key)
 
     def _attributes(self, reifiable, pos):
         """\
@@ -408,40 +411,43 @@ class CXTMTopicMapWriter(object):
             iri = iri[:-1]
         return iri
 
-    def _cmp_topic(self, a, b):
+    def _topic_key(self, topic):
         """\
+        Returns the canonical sort key of the `topic`.
+
         Canonical sort order:
         1. [subject identifiers]
         2. [subject locators]
         3. [item identifiers]
         """
-        if a == b:
-            return 0
-        cmp_locators = self._cmp_locators
-        return cmp_locators(a.sids, b.sids) \
-                or cmp_locators(a.slos, b.slos) \
-                or cmp_locators(a.iids, b.iids)
+        key = self._tmc2key.get(topic)
+        if key is None:
+            locators_key = self._locators_key
+            key = locators_key(topic.sids) + locators_key(topic.slos) + locators_key(topic.iids)
+            self._tmc2key[topic] = key
+        return key
 
-    def _cmp_role_ignore_parent(self, a, b):
+    def _role_key_ignore_parent(self, role):
         """\
-        Role comparator which ignores the parent association.
+        Returns the sort key of the `role` which ignores the parent association.
         """
-        if a == b:
-            return 0
-        return self._cmp_topic(a.player, b.player) or self._cmp_topic(a.type, b.type)
+        key = self._tmc2key.get(role)
+        if key is None:
+            topic_key = self._topic_key
+            key = topic_key(role.player), topic_key(role.type)
+            self._tmc2key[role] = key
+        return key
 
-    def _cmp_role(self, a, b):
+    def _role_key(self, role):
         """\
         Canonical sort order:
         1. [player]
         2. [type]
         3. [parent]
         """
-        if a == b:
-            return 0
-        return self._cmp_role_ignore_parent(a, b) or self._cmp_assoc(a.parent, b.parent)
+        return self._role_key_ignore_parent(role) + (self._assoc_key(role.parent),)
 
-    def _cmp_assoc(self, a, b):
+    def _assoc_key(self, assoc):
         """\
         Canonical sort order:
         1. [type]
@@ -449,13 +455,16 @@ class CXTMTopicMapWriter(object):
         3. [scope]
         4. [parent]
         """
-        if a == b:
-            return 0
-        return self._cmp_topic(a.type, b.type) \
-                or self._cmp_roles(a.roles, b.roles) \
-                or self._cmp_scope(a, b)
+        key = self._tmc2key.get(assoc)
+        if key is None:
+            roles = assoc.roles
+            key = self._topic_key(assoc.type), \
+                  (len(roles), tuple(sorted([self._role_key_ignore_parent(role) for role in roles]))), \
+                  self._scope_key(assoc)
+            self._tmc2key[assoc] = key
+        return key
 
-    def _cmp_occ(self, a, b):
+    def _occ_key(self, occ):
         """\
         Canonical sort order:
         1. [value]
@@ -464,14 +473,9 @@ class CXTMTopicMapWriter(object):
         4. [scope]
         5. [parent]
         """
-        if a == b:
-            return 0
-        return cmp(a.value, b.value) \
-                or cmp(a.datatype, b.datatype) \
-                or self._cmp_topic(a.type, b.type) \
-                or self._cmp_scope(a, b)
+        return occ.value, occ.datatype, self._topic_key(occ.type), self._scope_key(occ)
 
-    def _cmp_name(self, a, b):
+    def _name_key(self, name):
         """\
         Canonical sort order:
         1. [value]
@@ -479,12 +483,9 @@ class CXTMTopicMapWriter(object):
         3. [scope]
         4. [parent]
         """
-        if a == b:
-            return 0
-        return cmp(a.value, b.value) or self._cmp_topic(a.type, b.type) \
-                or self._cmp_scope(a, b)
+        return name.value, self._topic_key(name.type), self._scope_key(name)
 
-    def _cmp_variant(self, a, b):
+    def _variant_key(self, variant):
         """\
         Canonical sort order:
         1. [value]
@@ -492,56 +493,25 @@ class CXTMTopicMapWriter(object):
         3. [scope]
         4. [parent]
         """
-        if a == b:
-            return 0
-        return cmp(a.value, b.value) or cmp(a.datatype, b.datatype) \
-                or self._cmp_scope(a, b)
+        return variant.value, variant.datatype, self._scope_key(variant)
 
-    def _cmp_size(self, a, b):
+    def _locators_key(self, locs):
         """\
-        Compares the size of ``a`` and ``b``.
-        """
-        return len(a) - len(b)
-
-    def _cmp_set_content(self, a, b, comparator=cmp):
-        """\
-        Compares the content of ``a`` and ``b``.
-
-        Both must have the same size.
-        """
-        coll_a = sorted(a, comparator)
-        coll_b = sorted(b, comparator)
-        for i in xrange(len(a)):
-            res = comparator(coll_a[i], coll_b[i])
-            if res:
-                return res
-        return 0
+        Returns the sort key of the locator collection `locs`.
 
-    def _cmp_locators(self, a, b):
-        """\
-        Compares the locator collection ``a`` and ``b``.
+        Collections are ordered by their size and then by their (sorted)
+        content.
         """
         normalize_iri = self._normalize_iri
-        return self._cmp_size(a, b) \
-                or self._cmp_set_content([normalize_iri(iri) for iri in a],
-                                         [normalize_iri(iri) for iri in b])
-
-    def _cmp_roles(self, a, b):
-        """\
-        Compares the collections `a` and `b`. Both collections must consist
-        of roles.
-        """
-        return self._cmp_size(a, b) \
-                or self._cmp_set_content(a, b, self._cmp_role_ignore_parent)
+        return len(locs), tuple(sorted([normalize_iri(iri) for iri in locs]))
 
-    def _cmp_scope(self, a, b):
+    def _scope_key(self, scoped):
         """\
-        Compares the scope of the scoped constructs `a` and `b`.
+        Returns the sort key of the scope of the `scoped` construct.
         """
-        scope_a = list(a.scope)
-        scope_b = list(b.scope)
-        return self._cmp_size(scope_a, scope_b) \
-                or self._cmp_set_content(scope_a, scope_b, self._cmp_topic)
+        scope = scoped.scope
+        topic_key = self._topic_key
+        return len(scope), tuple(sorted([topic_key(theme) for theme in scope]))
 
 
 class CXTMWriter(object):
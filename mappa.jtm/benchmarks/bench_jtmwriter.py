@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Benchmarks the JTM writer with and without a buffer and with a growing
+number of prefixes.
+
+Creates a topic map with the provided number of topics (each topic has a
+subject identifier, a name and an occurrence) and one association per two
+topics.
+
+Usage::
+
+    python bench_jtmwriter.py [number of topics]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import io
+import sys
+from time import time
+import mappa
+from mappa import TMDM
+from mio.jtm.json import DEFAULT_BUFFER_SIZE
+from mappaext.jtm import create_writer
+
+_BASE = u'http://www.semagia.com/bench/'
+
+
+def create_topicmap(n):
+    """\
+    Returns a topic map with `n` topics.
+    """
+    conn = mappa.connect()
+    tm = conn.create(_BASE + u'map')
+    with tm.bulk_load():
+        name_type = tm.create_topic_by_sid(TMDM.topic_name)
+        occ_type = tm.create_topic_by_sid(_BASE + u'description')
+        assoc_type = tm.create_topic_by_sid(_BASE + u'knows')
+        role_type = tm.create_topic_by_sid(_BASE + u'person')
+        prev = None
+        for i in xrange(n):
+            topic = tm.create_topic_by_sid(u'http://psi.example.org/%d/topic-%d' % (i % 10, i))
+            topic.create_name(name_type, u'Topic %d' % i)
+            topic.create_occurrence(occ_type, u'A description of "topic" %d' % i)
+            if prev is not None:
+                assoc = tm.create_association(assoc_type)
+                assoc.create_role(role_type, prev)
+                assoc.create_role(role_type, topic)
+                prev = None
+            else:
+                prev = topic
+    return tm
+
+
+def bench(tm, buffer_size, prefixes):
+    """\
+    Returns the time (in seconds) to serialize the `tm` and the size of the
+    serialization.
+    """
+    out = io.BytesIO()
+    start = time()
+    create_writer(out, _BASE, version=1.1, buffer_size=buffer_size, prefixes=prefixes).write(tm)
+    return time() - start, len(out.getvalue())
+
+
+def main(n=1000000):
+    start = time()
+    tm = create_topicmap(n)
+    print('created %d topics in %.3fs' % (n, time() - start))
+    prefixes = dict((u'p%d' % i, u'http://psi.example.org/%d/' % i) for i in range(10))
+    prefixes[u'bench'] = _BASE
+    for label, prefixes in (('no prefixes', None), ('11 prefixes', prefixes)):
+        for buffer_size in (0, DEFAULT_BUFFER_SIZE):
+            duration, size = bench(tm, buffer_size, prefixes)
+            print('%s, buffer size %6d: %.3fs (%.2f us/topic, %d bytes)'
+                  % (label, buffer_size, duration, duration / n * 1000000, size))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
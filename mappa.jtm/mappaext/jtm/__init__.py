@@ -13,11 +13,13 @@ A ``TopicMapWriter`` implementation that serializes a topic map into
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+from mio.jtm.json import DEFAULT_BUFFER_SIZE
 from mappaext.jtm import jtmwriter
 
 
 def create_writer(out, base, version=1.1, prettify=False,
-                  export_iids=True, omit_loners=False, prefixes=None, **kw):
+                  export_iids=True, omit_loners=False, prefixes=None,
+                  shards=1, processes=None, buffer_size=DEFAULT_BUFFER_SIZE, **kw):
     """\
     
     """
@@ -27,4 +29,7 @@ def create_writer(out, base, version=1.1, prettify=False,
     writer.prettify = prettify
     writer.export_iids = export_iids
     writer.omit_loners = omit_loners
+    writer.shards = shards
+    writer.processes = processes
+    writer.buffer_size = buffer_size
     return writer
@@ -13,9 +13,12 @@ a `JSON Topic Maps (JTM) <http://www.cerny-online.com/jtm/>`_ representation.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import io
+from itertools import islice
 from tm.voc import XSD
-from mio.jtm.json import JSONWriter
+from mio.jtm.json import JSONWriter, DEFAULT_BUFFER_SIZE
 from mappa._internal.it import one_of, no
+from mappa._internal.shards import shard_ranges, map_shards
 from mappa.utils import is_default_name, is_default_name_type
 
 
@@ -23,20 +26,27 @@ class JTMTopicMapWriter(object):
     """\
     Writer for JSON Topic Maps (JTM).
     """
-    __slots__ = ['_writer', '_base', 'prettify', 'export_iids',
-                 'omit_loners', 'version', 'prefixes']
+    __slots__ = ['_out', '_writer', '_base', 'prettify', 'export_iids',
+                 'omit_loners', 'version', 'prefixes', 'shards', 'processes',
+                 'buffer_size', '_iri2prefix', '_prefix_lengths']
 
     def __init__(self, out, base, version=1.0, prefixes=None):
         if not out:
             raise ValueError('"out" is not specified')
         if not base:
             raise ValueError('"base" is not specified')
-        self._writer = JSONWriter(out)
+        self._out = out
+        self._writer = None
         self._base = base
+        self._iri2prefix = {}
+        self._prefix_lengths = ()
+        self.buffer_size = DEFAULT_BUFFER_SIZE
         self.prettify = False
         self.export_iids = True
         self.version = version
         self.omit_loners = False
+        self.shards = 1
+        self.processes = None
         self.prefixes = {}
         if prefixes:
             for ident, iri in prefixes.iteritems():
@@ -56,7 +66,13 @@ class JTMTopicMapWriter(object):
     def write(self, topicmap):
         """\
         Serializes the specified ``topicmap``.
+
+        If ``shards`` is greater than ``1``, the topics and associations are
+        partitioned into ``shards`` ranges each which are serialized by
+        ``processes`` worker processes (default: the number of CPUs).
         """
+        self._writer = JSONWriter(self._out, buffer_size=self.buffer_size)
+        self._index_prefixes()
         writer = self._writer
         writer.prettify = self.prettify
         writer.start()
@@ -66,12 +82,56 @@ class JTMTopicMapWriter(object):
         writer.key_value(u'item_type', u'topicmap')
         self._write_iids(topicmap)
         self._write_reifier(topicmap)
-        write_if_available = self._write_if_available
-        write_if_available(u'topics', topicmap.topics, self._write_topic)
-        write_if_available(u'associations', topicmap.associations, self._write_association)
+        if self.shards > 1:
+            self._write_shards(topicmap)
+        else:
+            write_if_available = self._write_if_available
+            write_if_available(u'topics', topicmap.topics, self._write_topic)
+            write_if_available(u'associations', topicmap.associations, self._write_association)
         writer.end_object()
         writer.end()
 
+    def _write_shards(self, topicmap):
+        """\
+        Writes the topics and associations of the `topicmap` in parallel.
+        """
+        args = [(key, start, stop) for key in (u'topics', u'associations')
+                    for start, stop in shard_ranges(len(getattr(topicmap, key)), self.shards)]
+        def write_shard(key, start, stop):
+            return key, self._write_shard(topicmap, key, start, stop)
+        writer = self._writer
+        current = None
+        for key, fragment in map_shards(write_shard, args, self.processes):
+            if not fragment:
+                continue
+            if key != current:
+                if current:
+                    writer.end_array()
+                writer.key(key)
+                writer.start_array()
+                current = key
+            writer.raw(fragment)
+        if current:
+            writer.end_array()
+
+    def _write_shard(self, topicmap, key, start, stop):
+        """\
+        Returns the serialized topics or associations (`key`) from `start`
+        to `stop` (exclusive) as comma-separated JSON objects.
+        """
+        write = self._write_topic if key == u'topics' else self._write_association
+        out = io.BytesIO()
+        writer = self._writer
+        self._writer = JSONWriter(out, depth=2, buffer_size=self.buffer_size)
+        self._writer.prettify = self.prettify
+        try:
+            for tmc in islice(getattr(topicmap, key), start, stop):
+                write(tmc)
+            self._writer.flush()
+        finally:
+            self._writer = writer
+        return out.getvalue().decode('utf-8')
+
     def _write_prefixes(self):
         if self.prefixes:
             writer = self._writer
@@ -81,11 +141,29 @@ class JTMTopicMapWriter(object):
                 writer.key_value(ident, iri)
             writer.end_object()
 
-    def _uri(self, uri):
+    def _index_prefixes(self):
+        """\
+        Creates a longest-prefix map of the prefixes: The IRIs are mapped to
+        their prefixes and the distinct lengths of the IRIs are kept in
+        descending order.
+        """
+        self._iri2prefix = {}
         if self.version >= 1.1:
             for prefix, iri in self.prefixes.iteritems():
-                if uri.startswith(iri):
-                    return u'[%s:%s]' % (prefix, uri[len(iri):])
+                self._iri2prefix[iri] = prefix
+        self._prefix_lengths = sorted(set(len(iri) for iri in self._iri2prefix), reverse=True)
+
+    def _uri(self, uri):
+        """\
+        Returns the `uri` as CURIE which uses the longest matching prefix
+        or the `uri` itself if no prefix matches.
+        """
+        if self._prefix_lengths:
+            iri2prefix = self._iri2prefix
+            for length in self._prefix_lengths:
+                prefix = iri2prefix.get(uri[:length])
+                if prefix is not None:
+                    return u'[%s:%s]' % (prefix, uri[length:])
         return uri
 
     def _uris(self, uris):
@@ -13,8 +13,10 @@
 :license:      BSD license
 """
 import io
-from nose.tools import ok_
+from nose.tools import ok_, eq_
 from tm.voc import XSD
+import mappa
+from mappa import TMDM
 from mappaext.cxtm.cxtm_test import create_writer_cxtm_cases
 from mio.jtm import create_deserializer
 from mappaext.jtm import create_writer
@@ -38,6 +40,12 @@ def test_jtm_10_writer():
         yield test
 
 
+def create_jtm11_sharded_writer(out, base):
+    writer = create_jtm11_writer(out, base)
+    writer.shards = 3
+    return writer
+
+
 def test_jtm_11_writer():
     for test in create_writer_cxtm_cases(create_jtm11_writer, create_deserializer, 'jtm', 'jtm'):
         yield test
@@ -45,6 +53,11 @@ def test_jtm_11_writer():
         yield test
 
 
+def test_jtm_11_sharded_writer():
+    for test in create_writer_cxtm_cases(create_jtm11_sharded_writer, create_deserializer, 'jtm11', 'jtm'):
+        yield test
+
+
 def test_add_prefix11():
     iri = 'http://www.semagia.com/'
     writer = create_jtm11_writer(io.BytesIO(), iri)
@@ -88,6 +101,59 @@ def test_add_xsd_prefix_invalid():
         pass
 
 
+def test_longest_prefix():
+    iri = 'http://www.semagia.com/'
+    conn = mappa.connect()
+    tm = conn.create(iri + u'map')
+    tm.create_topic_by_sid(iri + u'psi/a')
+    tm.create_topic_by_sid(iri + u'b')
+    out = io.BytesIO()
+    writer = create_writer(out, iri, version=1.1, prefixes={'x': iri, 'y': iri + u'psi/'})
+    writer.write(tm)
+    ok_('"[y:a]"' in out.getvalue())
+    ok_('"[x:b]"' in out.getvalue())
+
+
+def test_buffer_size():
+    iri = 'http://www.semagia.com/'
+    conn = mappa.connect()
+    tm = conn.create(iri + u'map')
+    for i in range(100):
+        tm.create_topic_by_sid(iri + u'psi/%d' % i)
+    results = []
+    for buffer_size in (0, 10, 1024):
+        out = io.BytesIO()
+        create_writer(out, iri, buffer_size=buffer_size).write(tm)
+        results.append(out.getvalue())
+    eq_(1, len(set(results)))
+
+
+def test_shards():
+    iri = u'http://www.semagia.com/'
+    conn = mappa.connect()
+    tm = conn.create(iri + u'map')
+    name_type = tm.create_topic_by_sid(TMDM.topic_name)
+    knows = tm.create_topic_by_sid(iri + u'psi/knows')
+    prev = None
+    for i in range(20):
+        topic = tm.create_topic_by_sid(iri + u'psi/%d' % i)
+        topic.create_name(name_type, u'Topic %d' % i)
+        topic.create_occurrence(knows, u'%d' % i)
+        if prev is not None:
+            assoc = tm.create_association(knows)
+            assoc.create_role(knows, prev)
+            assoc.create_role(knows, topic)
+        prev = topic
+    def serialize(**kw):
+        out = io.BytesIO()
+        create_writer(out, iri, version=1.1, prefixes={'x': iri}, **kw).write(tm)
+        return out.getvalue()
+    expected = serialize(shards=1)
+    eq_(expected, serialize(shards=3))
+    eq_(expected, serialize(shards=3, processes=1))
+    eq_(serialize(prettify=True), serialize(prettify=True, shards=3))
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
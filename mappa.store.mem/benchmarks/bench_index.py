@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Benchmarks against the indices of the memory store.
+
+Removing typed occurrences must take linear time: Doubling the number
+of occurrences should roughly double the time.
+
+Usage::
+
+    python bench_index.py [max. number of occurrences]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import sys
+from time import time
+from mappaext.store.mem import create_connection
+
+
+def bench_remove_occurrences(n):
+    """\
+    Creates ``n`` occurrences of the same type and returns the time
+    (in seconds) which was necessary to remove them.
+    """
+    conn = create_connection()
+    tm = conn.create('http://www.semagia.com/bench/')
+    topic = tm.create_topic()
+    typ = tm.create_topic()
+    occs = [topic.create_occurrence(typ, unicode(i)) for i in xrange(n)]
+    start = time()
+    for occ in occs:
+        occ.remove()
+    duration = time() - start
+    assert not tm.index.type_instance.occurrences(typ)
+    return duration
+
+
+def main(max_n=100000):
+    n = max_n / 4
+    while n <= max_n:
+        duration = bench_remove_occurrences(n)
+        print('%7d occurrences: %.3fs (%.2f us/occurrence)' % (n, duration, duration / n * 1000000))
+        n *= 2
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
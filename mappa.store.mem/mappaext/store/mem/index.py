@@ -38,10 +38,15 @@
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
-from collections import defaultdict
-from mappa.utils import is_association, is_role, is_occurrence, is_name, is_literal
+from operator import attrgetter
+from collections import OrderedDict
+from mappa.utils import is_topic, is_association, is_role, is_occurrence, \
+    is_name, is_literal
 from mappa.backend.events import *
-from mappa import XSD, TMDM, Literal
+from mappa import XSD, TMDM, ANY, Literal
+from mappa._internal.it import closure
+from mappa._internal.implhelper import topic_types, topic_instances, \
+    topic_supertypes, topic_subtypes
 
 class IndexManager(object):
 
@@ -49,10 +54,96 @@ class IndexManager(object):
         self.type_instance = TypeInstanceIndex(dispatcher)
         self.scoped = ScopedIndex(dispatcher)
         self.literal = LiteralIndex(dispatcher)
+        self.signature = SignatureIndex(dispatcher)
+        self.type_hierarchy = TypeHierarchyIndex(dispatcher)
+        self.statistics = StatisticsIndex(dispatcher)
+
+    def _indices(self):
+        return self.type_instance, self.scoped, self.literal, self.signature, \
+               self.type_hierarchy, self.statistics
+
+    def _suspendable_indices(self):
+        """\
+        Returns the indices which may be suspended while a topic map is bulk
+        loaded. The type-instance, the scoped, and the signature index are
+        required to merge topics and are always maintained.
+        """
+        return self.literal, self.type_hierarchy, self.statistics
+
+    def subscribe(self, dispatcher):
+        """\
+        Subscribes the indices to the `dispatcher`.
+        """
+        for idx in self._indices():
+            idx.subscribe(dispatcher)
+
+    def unsubscribe(self, dispatcher):
+        """\
+        Unsubscribes the indices from the `dispatcher`. The indices are not
+        updated until they are subscribed again.
+        """
+        for idx in self._indices():
+            idx.unsubscribe(dispatcher)
+
+    def suspend(self, dispatcher):
+        """\
+        Unsubscribes the suspendable indices from the `dispatcher`.
+        """
+        for idx in self._suspendable_indices():
+            idx.unsubscribe(dispatcher)
+
+    def resume(self, tm, dispatcher):
+        """\
+        Rebuilds the suspendable indices from the topic map `tm` and
+        subscribes them to the `dispatcher` again.
+        """
+        indices = self._suspendable_indices()
+        self.rebuild(tm, indices)
+        for idx in indices:
+            idx.subscribe(dispatcher)
+
+    def rebuild(self, tm, indices=None):
+        """\
+        Discards the content of the `indices` (default: all indices) and
+        indexes all constructs of the topic map `tm` in one pass.
+        """
+        dispatcher = EventDispatcher()
+        EventMultiplier(dispatcher)
+        for idx in indices or self._indices():
+            idx.clear()
+            idx.subscribe(dispatcher)
+        dispatch = dispatcher.dispatch
+        for topic in tm.topics:
+            dispatch(AddTopic(tm, topic))
+        for assoc in tm.associations:
+            dispatch(AddAssociation(tm, assoc))
 
 
 class Index(object):
-    pass
+
+    def __init__(self, dispatcher):
+        self.clear()
+        self.subscribe(dispatcher)
+
+    def subscribe(self, dispatcher):
+        for event_type, handler in self._subscriptions():
+            dispatcher.subscribe(event_type, handler)
+
+    def unsubscribe(self, dispatcher):
+        for event_type, handler in self._subscriptions():
+            dispatcher.unsubscribe(event_type, handler)
+
+    def clear(self):
+        """\
+        Removes all constructs from this index.
+        """
+        raise NotImplementedError()
+
+    def _subscriptions(self):
+        """\
+        Returns an iterable of ``(event type, handler)`` tuples.
+        """
+        raise NotImplementedError()
 
 def as_literal(lit):
     if not is_literal(lit):
@@ -61,21 +152,21 @@ def as_literal(lit):
 
 class LiteralIndex(Index):
     
-    def __init__(self, dispatcher):
-        super(LiteralIndex, self).__init__()
+    def clear(self):
         self._lit2occ = {}
         self._lit2name = {}
         self._lit2var = {}
-        self.subscribe(dispatcher)
-
-    def subscribe(self, dispatcher):
-        dispatcher.subscribe(SetValue, self._set_value)
-        dispatcher.subscribe(AddOccurrence, self._add_occ)
-        dispatcher.subscribe(RemoveOccurrence, self._remove_occ)
-        dispatcher.subscribe(AddName, self._add_name)
-        dispatcher.subscribe(RemoveName, self._remove_name)
-        dispatcher.subscribe(AddVariant, self._add_var)
-        dispatcher.subscribe(RemoveVariant, self._remove_var)
+        # value -> literals with this value (regardless of the datatype)
+        self._value2lit = {}
+
+    def _subscriptions(self):
+        return ((SetValue, self._set_value),
+                (AddOccurrence, self._add_occ),
+                (RemoveOccurrence, self._remove_occ),
+                (AddName, self._add_name),
+                (RemoveName, self._remove_name),
+                (AddVariant, self._add_var),
+                (RemoveVariant, self._remove_var))
 
     def _set_value(self, evt):
         source = evt.source
@@ -85,179 +176,575 @@ class LiteralIndex(Index):
             dct = self._lit2name
         else:
             dct = self._lit2var
-        _unregister_literal(dct, source, evt.old)
-        _register_literal(dct, source, evt.new)
+        self._unregister(dct, source, evt.old)
+        self._register(dct, source, evt.new)
 
     def _add_occ(self, evt):
-        _register_literal(self._lit2occ, evt.new, evt.new.literal)
+        self._register(self._lit2occ, evt.new, evt.new.literal)
 
     def _remove_occ(self, evt):
-        _unregister_literal(self._lit2occ, evt.old, evt.old.literal)
+        self._unregister(self._lit2occ, evt.old, evt.old.literal)
 
     def _add_name(self, evt):
-        _register_literal(self._lit2name, evt.new, evt.new.literal)
+        self._register(self._lit2name, evt.new, evt.new.literal)
 
     def _remove_name(self, evt):
-        _unregister_literal(self._lit2name, evt.old, evt.old.literal)
+        self._unregister(self._lit2name, evt.old, evt.old.literal)
 
     def _add_var(self, evt):
-        _register_literal(self._lit2var, evt.new, evt.new.literal)
+        self._register(self._lit2var, evt.new, evt.new.literal)
 
     def _remove_var(self, evt):
-        _unregister_literal(self._lit2var, evt.old, evt.old.literal)
+        self._unregister(self._lit2var, evt.old, evt.old.literal)
+
+    def _register(self, dct, construct, literal):
+        _add(dct, literal, construct)
+        # The literal is counted once per construct, it is kept until the
+        # last construct with this literal is unregistered
+        _add(self._value2lit, literal.value, literal)
+
+    def _unregister(self, dct, construct, literal):
+        _remove(dct, literal, construct)
+        _remove(self._value2lit, literal.value, literal)
 
     def occurrences(self, lit):
-        return self._lit2occ.get(as_literal(lit)) or ()
+        return _lookup(self._lit2occ, as_literal(lit))
 
     def names(self, lit):
-        return self._lit2name.get(as_literal(lit)) or ()
+        return _lookup(self._lit2name, as_literal(lit))
 
     def variants(self, lit):
-        return self._lit2var.get(as_literal(lit)) or ()
+        return _lookup(self._lit2var, as_literal(lit))
+
+    def occurrence_count(self, lit):
+        return _count(self._lit2occ, as_literal(lit))
+
+    def name_count(self, lit):
+        return _count(self._lit2name, as_literal(lit))
 
+    def variant_count(self, lit):
+        return _count(self._lit2var, as_literal(lit))
 
-def _register_literal(dct, construct, literal):
-    if literal not in dct:
-        dct[literal] = []
-    dct[literal].append(construct)
+    def literals(self, value):
+        """\
+        Returns the literals of all occurrences, names and variants which
+        have the provided `value`, regardless of their datatype.
+        """
+        return _lookup(self._value2lit, value)
+
+    def value_count(self):
+        """\
+        Returns the number of distinct values of all occurrences, names and
+        variants.
+        """
+        return len(self._value2lit)
 
-def _unregister_literal(dct, construct, literal):
-    l = dct.get(literal)
-    if l and construct in l:
-        l.remove(construct)
 
 class ScopedIndex(Index):
 
-    def __init__(self, dispatcher):
-        super(ScopedIndex, self).__init__()
+    def clear(self):
         self._scope2assoc = {}
         self._scope2occ = {}
         self._scope2name = {}
         self._scope2var = {}
-        self.subscribe(dispatcher)
-
-    def subscribe(self, dispatcher):
-        dispatcher.subscribe(AddAssociation, self._add_assoc)
-        dispatcher.subscribe(RemoveAssociation, self._remove_assoc)
-        dispatcher.subscribe(AddOccurrence, self._add_occ)
-        dispatcher.subscribe(RemoveOccurrence, self._remove_occ)
-        dispatcher.subscribe(AddName, self._add_name)
-        dispatcher.subscribe(RemoveName, self._remove_name)
-        dispatcher.subscribe(AddVariant, self._add_var)
-        dispatcher.subscribe(RemoveVariant, self._remove_var)
-        dispatcher.subscribe(SetScope, self._set_scope)
+        # Constructs in the unconstrained scope
+        self._ucs_assoc = OrderedDict()
+        self._ucs_occ = OrderedDict()
+        self._ucs_name = OrderedDict()
+        self._ucs_var = OrderedDict()
+
+    def _subscriptions(self):
+        return ((AddAssociation, self._add_assoc),
+                (RemoveAssociation, self._remove_assoc),
+                (AddOccurrence, self._add_occ),
+                (RemoveOccurrence, self._remove_occ),
+                (AddName, self._add_name),
+                (RemoveName, self._remove_name),
+                (AddVariant, self._add_var),
+                (RemoveVariant, self._remove_var),
+                (SetScope, self._set_scope))
 
     def _set_scope(self, evt):
         src = evt.source
         old_scope = evt.old
         new_scope = evt.new
         if is_association(src):
-            dct = self._scope2assoc
+            dct, ucs = self._scope2assoc, self._ucs_assoc
         elif is_occurrence(src):
-            dct = self._scope2occ
+            dct, ucs = self._scope2occ, self._ucs_occ
         elif is_name(src):
-            dct = self._scope2name
+            dct, ucs = self._scope2name, self._ucs_name
         else:
-            dct = self._scope2var
-        _unregister_scope(dct, src, old_scope)
-        _register_scope(dct, src, new_scope)
+            dct, ucs = self._scope2var, self._ucs_var
+        _unregister_scope(dct, ucs, src, old_scope)
+        _register_scope(dct, ucs, src, new_scope)
 
     def _add_assoc(self, evt):
-        _register_scope(self._scope2assoc, evt.new, evt.new.scope)
+        _register_scope(self._scope2assoc, self._ucs_assoc, evt.new, evt.new.scope)
 
     def _remove_assoc(self, evt):
-        _unregister_scope(self._scope2assoc, evt.old, evt.old.scope)
+        _unregister_scope(self._scope2assoc, self._ucs_assoc, evt.old, evt.old.scope)
 
     def _add_occ(self, evt):
-        _register_scope(self._scope2occ, evt.new, evt.new.scope)
+        _register_scope(self._scope2occ, self._ucs_occ, evt.new, evt.new.scope)
 
     def _remove_occ(self, evt):
-        _unregister_scope(self._scope2occ, evt.old, evt.old.scope)
+        _unregister_scope(self._scope2occ, self._ucs_occ, evt.old, evt.old.scope)
 
     def _add_name(self, evt):
-        _register_scope(self._scope2name, evt.new, evt.new.scope)
+        _register_scope(self._scope2name, self._ucs_name, evt.new, evt.new.scope)
 
     def _remove_name(self, evt):
-        _unregister_scope(self._scope2name, evt.old, evt.old.scope)
+        _unregister_scope(self._scope2name, self._ucs_name, evt.old, evt.old.scope)
 
     def _add_var(self, evt):
-        _register_scope(self._scope2var, evt.new, evt.new.scope)
+        _register_scope(self._scope2var, self._ucs_var, evt.new, evt.new.scope)
 
     def _remove_var(self, evt):
-        _unregister_scope(self._scope2var, evt.old, evt.old.scope)
+        _unregister_scope(self._scope2var, self._ucs_var, evt.old, evt.old.scope)
 
     def associations(self, scope, exact=True):
-        return _filter(self._scope2assoc, scope, exact)
+        return _filter(self._scope2assoc, self._ucs_assoc, scope, exact)
 
     def associations_by_theme(self, theme):
-        return self._scope2assoc.get(theme, ())
+        return _lookup(self._scope2assoc, theme)
+
+    def association_count_by_theme(self, theme):
+        return _count(self._scope2assoc, theme)
 
     def association_themes(self):
         return self._scope2assoc.keys()
 
     def occurrences(self, scope, exact=True):
-        return _filter(self._scope2occ, scope, exact)
+        return _filter(self._scope2occ, self._ucs_occ, scope, exact)
 
     def occurrences_by_theme(self, theme):
-        return self._scope2occ.get(theme, ())
+        return _lookup(self._scope2occ, theme)
+
+    def occurrence_count_by_theme(self, theme):
+        return _count(self._scope2occ, theme)
 
     def occurrence_themes(self):
         return self._scope2occ.keys()
 
     def names(self, scope, exact=True):
-        return _filter(self._scope2name, scope, exact)
+        return _filter(self._scope2name, self._ucs_name, scope, exact)
 
     def names_by_theme(self, theme):
-        return self._scope2name.get(theme, ())
+        return _lookup(self._scope2name, theme)
+
+    def name_count_by_theme(self, theme):
+        return _count(self._scope2name, theme)
 
     def name_themes(self):
         return self._scope2name.keys()
 
     def variants(self, scope, exact=True):
-        return _filter(self._scope2var, scope, exact)
+        return _filter(self._scope2var, self._ucs_var, scope, exact)
 
     def variants_by_theme(self, theme):
-        return self._scope2var.get(theme, ())
+        return _lookup(self._scope2var, theme)
+
+    def variant_count_by_theme(self, theme):
+        return _count(self._scope2var, theme)
 
     def variant_themes(self):
         return self._scope2var.keys()
 
-def _register_scope(dct, scoped, scope):
+def _register_scope(dct, ucs, scoped, scope):
+    if not scope:
+        _add_to_posting(ucs, scoped)
+        return
     for theme in scope:
-        if theme not in dct:
-            dct[theme] = []
-        dct[theme].append(scoped)
+        _add(dct, theme, scoped)
  
-def _unregister_scope(dct, scoped, scope):
+def _unregister_scope(dct, ucs, scoped, scope):
+    if not scope:
+        _remove_from_posting(ucs, scoped)
+        return
+    for theme in scope:
+        _remove(dct, theme, scoped)
+
+def _filter(dct, ucs, scope, exact):
+    """\
+    Returns the scoped constructs which match the provided `scope`.
+
+    `dct`
+        The theme -> scoped constructs dict.
+    `ucs`
+        The scoped constructs in the unconstrained scope.
+    `scope`
+        A topic, an iterable of topics, or ``ANY``.
+    `exact`
+        If ``True``, the constructs must have exactly the provided `scope`,
+        otherwise the provided `scope` must be a subset of the construct's
+        scope.
+    """
+    if scope is ANY:
+        return _all_scoped(dct, ucs)
+    if is_topic(scope):
+        scope = (scope,)
+    scope = frozenset(scope)
+    if not scope:
+        # Every scope is a superset of the unconstrained scope
+        return tuple(ucs) if exact else _all_scoped(dct, ucs)
+    # Start with the smallest posting, the result cannot be larger
+    # than it. The remaining postings are checked against the (usually very
+    # small) scope of each candidate instead of intersecting the postings.
+    postings = []
     for theme in scope:
-        l = dct.get(theme)
-        if l and scoped in l:
-            l.remove(scoped)
+        posting = dct.get(theme)
+        if not posting:
+            return ()
+        postings.append(posting)
+    candidates = min(postings, key=len)
+    if exact:
+        return tuple(c for c in candidates if frozenset(c.scope) == scope)
+    return tuple(c for c in candidates if scope.issubset(c.scope))
+
+def _all_scoped(dct, ucs):
+    """\
+    Returns all scoped constructs from the index `dct` and `ucs`.
+    """
+    res = list(ucs)
+    seen = set()
+    for posting in dct.itervalues():
+        for construct in posting:
+            if construct not in seen:
+                seen.add(construct)
+                res.append(construct)
+    return tuple(res)
+
+class SignatureIndex(Index):
+    """\
+    Indexes associations, roles, occurrences, names, and variants by their
+    parent and their signature.
+
+    Events are fired before a change is applied, so the signature of an
+    added or changed construct cannot be computed by the event handler.
+    These constructs are (re-)indexed when the index is queried.
+    """
+    def clear(self):
+        self._key2constructs = {}
+        self._construct2key = {}
+        self._duplicates = set()
+        self._dirty = set()
+
+    def _subscriptions(self):
+        return ((AddAssociation, self._add),
+                (RemoveAssociation, self._remove),
+                (AddRole, self._add_role),
+                (RemoveRole, self._remove_role),
+                (AddOccurrence, self._add),
+                (RemoveOccurrence, self._remove),
+                (AddName, self._add),
+                (RemoveName, self._remove),
+                (AddVariant, self._add),
+                (RemoveVariant, self._remove),
+                (SetType, self._changed),
+                (SetScope, self._changed),
+                (SetValue, self._changed),
+                (SetPlayer, self._changed))
+
+    def _add(self, evt):
+        self._dirty.add(evt.new)
+
+    def _remove(self, evt):
+        self._unindex(evt.old)
+        self._dirty.discard(evt.old)
 
-def _filter(dct, scope, exact):
-    raise NotImplementedError()
+    def _add_role(self, evt):
+        self._add(evt)
+        self._invalidate(evt.source)
 
-class TypeInstanceIndex(Index):
+    def _remove_role(self, evt):
+        self._remove(evt)
+        self._invalidate(evt.source)
 
-    def __init__(self, dispatcher):
-        super(TypeInstanceIndex, self).__init__()
-        self._type2topic = defaultdict(list)
-        self._type2assoc = defaultdict(list)
-        self._type2role = defaultdict(list)
-        self._type2occ = defaultdict(list)
-        self._type2name = defaultdict(list)
-        self.subscribe(dispatcher)
+    def _changed(self, evt):
+        source = evt.source
+        self._invalidate(source)
+        if is_role(source):
+            self._invalidate(source.parent)
+        elif is_name(source):
+            # The scope of a variant includes the scope of the name
+            for variant in source.variants:
+                self._invalidate(variant)
+
+    def _invalidate(self, construct):
+        self._unindex(construct)
+        self._dirty.add(construct)
+
+    def _unindex(self, construct):
+        key = self._construct2key.pop(construct, None)
+        if key is None:
+            return
+        constructs = self._key2constructs[key]
+        constructs.discard(construct)
+        if len(constructs) < 2:
+            self._duplicates.discard(key)
+        if not constructs:
+            del self._key2constructs[key]
+
+    def _flush(self):
+        """\
+        Indexes the added and changed constructs.
+        """
+        dirty, self._dirty = self._dirty, set()
+        key2constructs, construct2key = self._key2constructs, self._construct2key
+        for construct in dirty:
+            if not construct._is_attached():
+                continue
+            key = construct.parent, construct.__sig__()
+            construct2key[construct] = key
+            constructs = key2constructs.get(key)
+            if constructs is None:
+                key2constructs[key] = set([construct])
+            else:
+                constructs.add(construct)
+                if len(constructs) > 1:
+                    self._duplicates.add(key)
+
+    def find(self, parent, construct):
+        """\
+        Returns a child of `parent` which has the same signature as the
+        provided `construct` (or ``None`` if no such child exists).
+        """
+        self._flush()
+        constructs = self._key2constructs.get((parent, construct.__sig__()), ())
+        for existing in constructs:
+            if existing != construct:
+                return existing
+        return None
+
+    def duplicates(self):
+        """\
+        Returns a list of tuples of duplicate constructs (constructs with the
+        same parent and the same signature).
+
+        The constructs of each tuple are sorted by their identifiers.
+        """
+        self._flush()
+        key2constructs = self._key2constructs
+        return [tuple(sorted(key2constructs[key], key=attrgetter('id')))
+                    for key in self._duplicates]
+
+
+# Association types which define the type hierarchy
+_HIERARCHY_ASSOC_TYPES = frozenset([TMDM.type_instance, TMDM.supertype_subtype])
+
+# Topics which define the type hierarchy
+_HIERARCHY_SIDS = _HIERARCHY_ASSOC_TYPES.union([TMDM.type, TMDM.instance,
+                                                TMDM.supertype, TMDM.subtype])
+
+def _is_hierarchy_type(topic):
+    return not _HIERARCHY_ASSOC_TYPES.isdisjoint(topic.sids)
+
+def _is_hierarchy_association(assoc):
+    return assoc is not None and _is_hierarchy_type(assoc.type)
+
+class TypeHierarchyIndex(Index):
+    """\
+    Memoizes the transitive closure of the ``tmdm:supertype-subtype`` and
+    ``tmdm:type-instance`` relationships.
+
+    The memoized relationships are discarded if an association of the type
+    ``tmdm:supertype-subtype`` or ``tmdm:type-instance`` is changed.
+    """
+    def clear(self):
+        self._supertypes = {}
+        self._subtypes = {}
+        self._types = {}
+        self._instances = {}
+
+    def _subscriptions(self):
+        return ((AddRole, self._assoc_changed),
+                (RemoveRole, self._assoc_changed),
+                (SetScope, self._assoc_changed),
+                (SetType, self._type_changed),
+                (SetPlayer, self._player_changed),
+                (AddSubjectIdentifier, self._sid_changed),
+                (RemoveSubjectIdentifier, self._sid_changed))
+
+    def _assoc_changed(self, evt):
+        if is_association(evt.source) and _is_hierarchy_association(evt.source):
+            self.clear()
+
+    def _type_changed(self, evt):
+        source = evt.source
+        if is_association(source):
+            if _is_hierarchy_type(evt.old) or _is_hierarchy_type(evt.new):
+                self.clear()
+        elif is_role(source) and _is_hierarchy_association(source.parent):
+            self.clear()
+
+    def _player_changed(self, evt):
+        if _is_hierarchy_association(evt.source.parent):
+            self.clear()
+
+    def _sid_changed(self, evt):
+        if (evt.new or evt.old) in _HIERARCHY_SIDS:
+            self.clear()
+
+    def supertypes(self, topic):
+        """\
+        Returns the transitive supertypes of `topic`.
+        """
+        return _memoized(self._supertypes, topic, 
+                         lambda: closure(topic, topic_supertypes))
+
+    def subtypes(self, topic):
+        """\
+        Returns the transitive subtypes of `topic`.
+        """
+        return _memoized(self._subtypes, topic, 
+                         lambda: closure(topic, topic_subtypes))
+
+    def types(self, topic):
+        """\
+        Returns the types of `topic` and the supertypes of these types.
+        """
+        def types():
+            res = set()
+            for typ in topic_types(topic):
+                res.add(typ)
+                res.update(self.supertypes(typ))
+            return res
+        return _memoized(self._types, topic, types)
+
+    def instances(self, topic):
+        """\
+        Returns the instances of `topic` and the instances of its subtypes.
+        """
+        def instances():
+            res = set(topic_instances(topic))
+            for subtype in self.subtypes(topic):
+                res.update(topic_instances(subtype))
+            return res
+        return _memoized(self._instances, topic, instances)
+
+    def isa(self, instance, type):
+        """\
+        Returns if the topic `instance` is an instance of `type`.
+        """
+        return type in self.types(instance)
+
+    def iko(self, subtype, supertype):
+        """\
+        Returns if the topic `subtype` is a subtype of `supertype`.
+        """
+        return supertype in self.supertypes(subtype)
+
+class StatisticsIndex(Index):
+    """\
+    Counts the constructs of the topic map.
+
+    The counters are updated by the add / remove events, reading them
+    takes constant time.
+    """
+    def clear(self):
+        self._topics = 0
+        self._assocs = 0
+        self._roles = 0
+        self._occs = 0
+        self._names = 0
+        self._variants = 0
+
+    def _subscriptions(self):
+        return ((AddTopic, self._add_topic),
+                (RemoveTopic, self._remove_topic),
+                (AddAssociation, self._add_assoc),
+                (RemoveAssociation, self._remove_assoc),
+                (AddRole, self._add_role),
+                (RemoveRole, self._remove_role),
+                (AddOccurrence, self._add_occ),
+                (RemoveOccurrence, self._remove_occ),
+                (AddName, self._add_name),
+                (RemoveName, self._remove_name),
+                (AddVariant, self._add_var),
+                (RemoveVariant, self._remove_var))
+
+    def _add_topic(self, evt):
+        self._topics += 1
+
+    def _remove_topic(self, evt):
+        self._topics -= 1
 
-    def subscribe(self, dispatcher):
-        dispatcher.subscribe(SetType, self._set_type)
-        dispatcher.subscribe(AddAssociation, self._add_assoc)
-        dispatcher.subscribe(RemoveAssociation, self._remove_assoc)
-        dispatcher.subscribe(AddRole, self._add_role)
-        dispatcher.subscribe(RemoveRole, self._remove_role)
-        dispatcher.subscribe(AddOccurrence, self._add_occ)
-        dispatcher.subscribe(RemoveOccurrence, self._remove_occ)
-        dispatcher.subscribe(AddName, self._add_name)
-        dispatcher.subscribe(RemoveName, self._remove_name)
+    def _add_assoc(self, evt):
+        self._assocs += 1
+
+    def _remove_assoc(self, evt):
+        self._assocs -= 1
+
+    def _add_role(self, evt):
+        self._roles += 1
+
+    def _remove_role(self, evt):
+        self._roles -= 1
+
+    def _add_occ(self, evt):
+        self._occs += 1
+
+    def _remove_occ(self, evt):
+        self._occs -= 1
+
+    def _add_name(self, evt):
+        self._names += 1
+
+    def _remove_name(self, evt):
+        self._names -= 1
+
+    def _add_var(self, evt):
+        self._variants += 1
+
+    def _remove_var(self, evt):
+        self._variants -= 1
+
+    def topic_count(self):
+        return self._topics
+
+    def association_count(self):
+        return self._assocs
+
+    def role_count(self):
+        return self._roles
+
+    def occurrence_count(self):
+        return self._occs
+
+    def name_count(self):
+        return self._names
+
+    def variant_count(self):
+        return self._variants
+
+
+def _memoized(cache, topic, func):
+    res = cache.get(topic)
+    if res is None:
+        res = cache[topic] = frozenset(func())
+    return res
+
+
+class TypeInstanceIndex(Index):
+
+    def clear(self):
+        self._type2topic = {}
+        self._type2assoc = {}
+        self._type2role = {}
+        self._type2occ = {}
+        self._type2name = {}
+
+    def _subscriptions(self):
+        return ((SetType, self._set_type),
+                (AddAssociation, self._add_assoc),
+                (RemoveAssociation, self._remove_assoc),
+                (AddRole, self._add_role),
+                (RemoveRole, self._remove_role),
+                (AddOccurrence, self._add_occ),
+                (RemoveOccurrence, self._remove_occ),
+                (AddName, self._add_name),
+                (RemoveName, self._remove_name))
  
     def _set_type(self, evt):
         src = evt.source
@@ -317,39 +804,122 @@ class TypeInstanceIndex(Index):
         _unregister_type(self._type2name, evt.old, evt.old.type)
 
     def topics(self, type):
-        return self._type2topic[type]
+        return _lookup(self._type2topic, type)
 
     def topic_types(self):
         return self._type2topic.keys()
 
+    def topic_count(self, type):
+        return _count(self._type2topic, type)
+
+    def topic_type_count(self):
+        return len(self._type2topic)
+
     def associations(self, type):
-        return self._type2assoc[type]
+        return _lookup(self._type2assoc, type)
 
     def association_types(self):
         return self._type2assoc.keys()
 
+    def association_count(self, type):
+        return _count(self._type2assoc, type)
+
+    def association_type_count(self):
+        return len(self._type2assoc)
+
     def roles(self, type):
-        return self._type2role[type]
+        return _lookup(self._type2role, type)
 
     def role_types(self):
         return self._type2role.keys()
 
+    def role_count(self, type):
+        return _count(self._type2role, type)
+
+    def role_type_count(self):
+        return len(self._type2role)
+
     def occurrences(self, type):
-        return self._type2occ[type]
+        return _lookup(self._type2occ, type)
 
     def occurrence_types(self):
         return self._type2occ.keys()
 
+    def occurrence_count(self, type):
+        return _count(self._type2occ, type)
+
+    def occurrence_type_count(self):
+        return len(self._type2occ)
+
     def names(self, type):
-        return self._type2name[type]
+        return _lookup(self._type2name, type)
 
     def name_types(self):
         return self._type2name.keys()
 
+    def name_count(self, type):
+        return _count(self._type2name, type)
+
+    def name_type_count(self):
+        return len(self._type2name)
+
 def _register_type(dct, typed, type):
-    dct[type].append(typed)
+    _add(dct, type, typed)
 
 def _unregister_type(dct, typed, type):
-    l = dct.get(type)
-    if l and typed in l:
-        l.remove(typed)
+    _remove(dct, type, typed)
+
+# The constructs stored under a key (a posting) are kept in an OrderedDict
+# which maps each construct to the number of times it was added. The
+# constructs are reported in insertion order and a construct which was added
+# twice (i.e. a topic which is an instance of the same type through two
+# type-instance associations) is kept until it was removed twice.
+
+def _add(dct, key, construct):
+    """\
+    Adds the `construct` to the posting stored under `key`.
+    """
+    constructs = dct.get(key)
+    if constructs is None:
+        constructs = dct[key] = OrderedDict()
+    _add_to_posting(constructs, construct)
+
+def _remove(dct, key, construct):
+    """\
+    Removes the `construct` from the posting stored under `key`.
+    
+    The `key` is removed if no further constructs are stored under it.
+    """
+    constructs = dct.get(key)
+    if constructs is not None:
+        _remove_from_posting(constructs, construct)
+        if not constructs:
+            del dct[key]
+
+def _add_to_posting(posting, construct):
+    posting[construct] = posting.get(construct, 0) + 1
+
+def _remove_from_posting(posting, construct):
+    count = posting.get(construct)
+    if count is None:
+        return
+    if count > 1:
+        posting[construct] = count - 1
+    else:
+        del posting[construct]
+
+def _lookup(dct, key):
+    """\
+    Returns a tuple of the constructs stored under `key` in insertion order.
+
+    The tuple is a snapshot, the caller may modify the returned constructs
+    while iterating over it.
+    """
+    constructs = dct.get(key)
+    return tuple(constructs) if constructs else ()
+
+def _count(dct, key):
+    """\
+    Returns the number of constructs stored under `key` without copying them.
+    """
+    return len(dct.get(key, ()))
@@ -39,11 +39,16 @@ Memory backend.
 :license:      BSD License
 """
 import cPickle as pickle
+from itertools import chain
+from contextlib import contextmanager
 from mappa import UCS
 from mappa._internal.utils import random_id
 from mappa.backend.stub import *
 from mappa.utils import is_topic
 from mappa.backend.identityman import IdentityManager
+from mappa.backend.events import RemoveSubjectIdentifier, RemoveTopic
+from mappa._internal.dupremoval import remove_indexed_duplicates
+from mappa._internal.implhelper import core_topics
 from .index import IndexManager
 
 #pylint: disable-msg=W0622
@@ -114,33 +119,152 @@ class TopicMapsConstructBuilder(object):
         return Variant(self.tm, value, scope)
 
 
+# Shared by all constructs with an empty container (i.e. no item identifiers)
+_EMPTY = frozenset()
+
+_CONSTRUCT_SLOTS = ('id', '_tm', '_parent', 'iids', '_merged_into')
+
+
 class TMCMixin(object):
-    
-    def __init__(self):
-        self.id = random_id()
+    """\
+    Mixin for the Topic Maps constructs (except the topic map).
+
+    The constructs use ``__slots__`` and share an immutable empty container
+    until a child / an identity is added.
+    """
+    __slots__ = ()
+
+    def __init__(self, tm):
+        self.id = tm._create_id()
 
     def _create_iids(self): 
-        return set()
+        return _EMPTY
+
+    def _container(self, name):
+        container = getattr(self, name)
+        if container is _EMPTY:
+            container = set()
+            setattr(self, name, container)
+        return container
+
+    def __forward__(self, target):
+        """\
+        Makes this (removed) construct an alias of the `target` construct.
+        """
+        object.__setattr__(self, '_merged_into', target)
+        self.__class__ = _forwarder_class(type(self))
 
 
 class ScopedMixin(TMCMixin):
 
-    def __init__(self):
-        TMCMixin.__init__(self)
+    __slots__ = ()
 
     def _create_scope(self, scope):
         if not scope:
             return UCS
         return frozenset(scope)
 
-class TopicMap(TopicMapStub, TMCMixin):
+
+class _Forwarder(object):
+    """\
+    Delegates all attribute access to the construct which replaced
+    this construct.
+    """
+    __slots__ = ()
+
+    def __getattribute__(self, name):
+        return getattr(object.__getattribute__(self, '_merged_into'), name)
+
+    def __setattr__(self, name, value):
+        setattr(object.__getattribute__(self, '_merged_into'), name, value)
+
+_FORWARDER_CLASSES = {}
+
+def _forwarder_class(cls):
+    """\
+    Returns a class with the same layout as `cls` which forwards all
+    attribute access to the construct stored in ``_merged_into``.
+    """
+    forwarder = _FORWARDER_CLASSES.get(cls)
+    if forwarder is None:
+        forwarder = type(cls.__name__, (_Forwarder, cls), {'__slots__': ()})
+        _FORWARDER_CLASSES[cls] = forwarder
+    return forwarder
+
+
+class _BulkLoadIndices(object):
+    """\
+    The indices of a topic map which is bulk loaded.
+
+    Provides the indices which are maintained during the bulk load. The
+    type hierarchy index is reported as missing, callers use the slower path
+    which does not require this index. Accessing any other index ends the
+    bulk load mode.
+    """
+    type_hierarchy = None
+
+    def __init__(self, tm):
+        self._tm = tm
+
+    type_instance = property(lambda self: self._tm._index.type_instance)
+    scoped = property(lambda self: self._tm._index.scoped)
+    signature = property(lambda self: self._tm._index.signature)
+
+    def __getattr__(self, name):
+        tm = self._tm
+        tm._end_bulk_load()
+        return getattr(tm._index, name)
+
+
+class TopicMap(TopicMapStub):
 
     def __init__(self, locator):
-        TMCMixin.__init__(self)
+        self.id = random_id()
+        self._last_id = 0
         TopicMapStub.__init__(self, locator)
         self._idman = IdentityManager(self)
         self.builder = TopicMapsConstructBuilder(self)
-        self.index = IndexManager(self)
+        self._index = IndexManager(self)
+        self._bulk_loading = False
+        self._core = {}
+        self.subscribe(RemoveSubjectIdentifier, self._core_sid_removed)
+        self.subscribe(RemoveTopic, self._core_topic_removed)
+
+    @contextmanager
+    def bulk_load(self):
+        """\
+        Suspends the maintenance of the literal, type hierarchy, and
+        statistics indices. These indices are rebuilt in one pass when the
+        context is left.
+
+        The identities (item identifiers, subject identifiers, and subject
+        locators) and the type-instance, scoped, and signature indices are
+        still maintained and the events are still dispatched to them:
+        deserializers need the identities to detect topics which must be
+        merged and merging topics needs these indices. Merging topics does
+        not end the bulk load mode. Reading the literal or statistics index
+        ends the bulk load mode.
+        """
+        if self._bulk_loading:
+            yield self
+            return
+        self._bulk_loading = True
+        self._index.suspend(self)
+        try:
+            yield self
+        finally:
+            self._end_bulk_load()
+
+    def _end_bulk_load(self):
+        if not self._bulk_loading:
+            return
+        self._bulk_loading = False
+        self._index.resume(self, self)
+
+    def _get_index(self):
+        if self._bulk_loading:
+            return _BulkLoadIndices(self)
+        return self._index
 
     def construct_by_iid(self, iid):
         return self._idman.construct_by_iid(iid)
@@ -150,6 +274,22 @@ class TopicMap(TopicMapStub, TMCMixin):
             return self
         return self._idman.construct_by_id(ident)
 
+    def constructs_by_id(self):
+        """\
+        Returns an iterator over the Topic Maps constructs of this topic map
+        in the order of their identifiers (i.e. in creation order).
+
+        The iterator does not copy the constructs, the constructs which are
+        added while iterating are reported as well.
+        """
+        construct_by_id = self._idman.construct_by_id
+        ident = 0
+        while ident < self._last_id:
+            ident += 1
+            tmc = construct_by_id(ident)
+            if tmc is not None and tmc.id == ident:
+                yield tmc
+
     def topic_by_iid(self, iid):
         tmc = self.construct_by_iid(iid)
         if is_topic(tmc):
@@ -165,73 +305,129 @@ class TopicMap(TopicMapStub, TMCMixin):
     def remove(self):
         del self.__dict__
 
+    def _core_topics(self, sids, create=False):
+        """\
+        Returns a tuple of topics with the provided subject identifiers.
+
+        The topics are cached until one of them looses its subject identifier
+        or is removed from the topic map.
+        """
+        topics = self._core.get(sids)
+        if topics is None:
+            topics = core_topics(self, sids, create)
+            if None in topics:
+                return topics
+            self._core[sids] = topics
+        return topics
+
+    def _core_sid_removed(self, evt):
+        if self._core and evt.old in self._core_sids():
+            self._core.clear()
+
+    def _core_topic_removed(self, evt):
+        if self._core and not self._core_sids().isdisjoint(evt.old.sids):
+            self._core.clear()
+
+    def _core_sids(self):
+        return frozenset(chain(*self._core))
+
+    def _remove_duplicates(self):
+        self._end_bulk_load()
+        remove_indexed_duplicates(self._index.signature.duplicates)
+
+    def _create_id(self):
+        """\
+        Returns an identifier for a Topic Maps construct of this topic map.
+        """
+        self._last_id += 1
+        return self._last_id
+
+    def _create_iids(self): 
+        return set()
+
     def _create_topics(self): 
         return set()
 
     def _create_associations(self): 
         return set()
 
+    index = property(_get_index)
+
 
 class Topic(TMCMixin, TopicStub):
 
+    __slots__ = _CONSTRUCT_SLOTS + ('_reified', 'sids', 'slos', 'roles_played',
+                                    'occurrences', 'names')
+
     def __init__(self, tm):
-        TMCMixin.__init__(self)
+        TMCMixin.__init__(self, tm)
         TopicStub.__init__(self, tm)
 
     def _create_sids(self): 
-        return set()
+        return _EMPTY
 
     def _create_slos(self): 
-        return set()
+        return _EMPTY
 
     def _create_roles_played(self): 
-        return set()
+        return _EMPTY
 
     def _create_occurrences(self): 
-        return set()
+        return _EMPTY
 
     def _create_names(self): 
-        return set()
+        return _EMPTY
+
 
+class Association(ScopedMixin, AssociationStub):
 
-class Association(AssociationStub, ScopedMixin):
+    __slots__ = _CONSTRUCT_SLOTS + ('_scope', '_type', '_reifier', '_sig', 'roles')
 
     def __init__(self, tm, type, scope):
-        ScopedMixin.__init__(self)
+        ScopedMixin.__init__(self, tm)
         AssociationStub.__init__(self, tm, type, scope)
 
     def _create_roles(self): 
-        return set()
+        return _EMPTY
+
 
+class Role(TMCMixin, RoleStub):
 
-class Role(RoleStub, TMCMixin):
+    __slots__ = _CONSTRUCT_SLOTS + ('_type', '_reifier', '_sig', '_player')
 
     def __init__(self, tm, type, player):
-        TMCMixin.__init__(self)
+        TMCMixin.__init__(self, tm)
         RoleStub.__init__(self, tm, type, player)
 
 
-class Occurrence(OccurrenceStub, ScopedMixin):
-    
+class Occurrence(ScopedMixin, OccurrenceStub):
+
+    __slots__ = _CONSTRUCT_SLOTS + ('_scope', '_type', '_reifier', '_sig', '_literal')
+
     def __init__(self, tm, type, value, scope):
-        ScopedMixin.__init__(self)
+        ScopedMixin.__init__(self, tm)
         OccurrenceStub.__init__(self, tm, type, value, scope)
 
 
-class Name(NameStub, ScopedMixin):
+class Name(ScopedMixin, NameStub):
+
+    __slots__ = _CONSTRUCT_SLOTS + ('_scope', '_type', '_reifier', '_sig',
+                                    '_literal', 'variants')
 
     def __init__(self, tm, type, value, scope):
-        ScopedMixin.__init__(self)
+        ScopedMixin.__init__(self, tm)
         NameStub.__init__(self, tm, type, value, scope)
 
     def _create_variants(self): 
-        return set()
+        return _EMPTY
+
 
+class Variant(ScopedMixin, VariantStub):
 
-class Variant(VariantStub, ScopedMixin):
+    __slots__ = _CONSTRUCT_SLOTS + ('_scope', '_reifier', '_sig', '_literal')
 
     def __init__(self, tm, value, scope):
-        ScopedMixin.__init__(self)
+        ScopedMixin.__init__(self, tm)
         VariantStub.__init__(self, tm, value, scope)
 
 
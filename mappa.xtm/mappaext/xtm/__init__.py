@@ -13,10 +13,14 @@
 :license:      BSD license
 """
 from __future__ import absolute_import
+from tm.xmlutils import DEFAULT_BUFFER_SIZE
 from . import xtm1, xtm2
 
 
-def create_writer(out, base, version=None, prettify=False, export_iids=True, **kw):
+def create_writer(out, base, version=None, prettify=False, export_iids=True,
+                  buffer_size=DEFAULT_BUFFER_SIZE, streaming=False,
+                  flush_every=xtm2.DEFAULT_FLUSH_EVERY, progress=None,
+                  compress=False, shards=1, processes=None, **kw):
     """\
     
     """
@@ -30,4 +34,14 @@ def create_writer(out, base, version=None, prettify=False, export_iids=True, **k
     writer = cls(out, base, version=version)
     writer.prettify = prettify
     writer.export_iids = export_iids
+    writer.buffer_size = buffer_size
+    if streaming or compress or shards > 1:
+        if cls is not xtm2.XTM2TopicMapWriter:
+            raise IOError('Streaming, compression and shards are not supported by XTM %s' % str(version))
+        writer.streaming = streaming
+        writer.flush_every = flush_every
+        writer.progress = progress
+        writer.compress = compress
+        writer.shards = shards
+        writer.processes = processes
     return writer
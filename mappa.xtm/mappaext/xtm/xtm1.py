@@ -13,7 +13,7 @@ This module provides a ``TopicMapWriter`` which writes
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
-from tm.xmlutils import XMLWriter
+from tm.xmlutils import XMLWriter, DEFAULT_BUFFER_SIZE
 from mappa.utils import is_default_name_type
 from mappa._internal.it import no
 from mappa._internal.utils import topic_id
@@ -39,13 +39,14 @@ class XTM10TopicMapWriter(object):
         self._encoding = encoding
         self.export_iids = True
         self.prettify = False
+        self.buffer_size = DEFAULT_BUFFER_SIZE
         self._base = base
 
     def write(self, topicmap):
         """\
         Serializes the specified ``topicmap``.
         """
-        self._writer = XMLWriter(self._out, self._encoding)
+        self._writer = XMLWriter(self._out, self._encoding, buffer_size=self.buffer_size)
         writer = self._writer
         writer.prettify = self.prettify
         writer.startDocument()
@@ -15,19 +15,26 @@ and `XML Topic Maps (XTM) 2.1 <http://www.isotopicmaps.org/sam/sam-xtm/2009-11-1
 :license:      BSD license
 """
 import io
+import gzip
+from itertools import chain, islice
 from xml.sax import make_parser
 from xml.sax.xmlreader import InputSource
 import xml.sax.handler as sax_handler
-from tm.xmlutils import XMLWriter, xmlwriter_as_contenthandler
+from tm.xmlutils import XMLWriter, xmlwriter_as_contenthandler, DEFAULT_BUFFER_SIZE
 from mappa import XSD
 from mappa._internal.it import one_of, no
+from mappa._internal.shards import shard_ranges, map_shards
 from mappa._internal.utils import topic_id
-from mappa.utils import is_default_name, is_default_name_type
+from mappa.utils import is_default_name, is_default_name_type, is_topic, is_association
 
 from mappa import voc
 _NS_XTM = voc.XTM
 del voc
 
+# Number of topics and associations which are written in streaming mode
+# before the output is flushed and the progress callback is notified
+DEFAULT_FLUSH_EVERY = 10000
+
 
 def _is_omitable(topic, sids, slos, iids):
     """\
@@ -61,6 +68,13 @@ class XTM2TopicMapWriter(object):
         self._base = base
         self.export_iids = True
         self.prettify = False
+        self.buffer_size = DEFAULT_BUFFER_SIZE
+        self.streaming = False
+        self.flush_every = DEFAULT_FLUSH_EVERY
+        self.progress = None
+        self.compress = False
+        self.shards = 1
+        self.processes = None
         if self._version == 2.0:
             self._reifier = self._reifier_xtm20
             self._write_topic_ref = self._write_topic_ref_xtm20
@@ -73,8 +87,32 @@ class XTM2TopicMapWriter(object):
     def write(self, topicmap):
         """\
         Serializes the specified ``topicmap``.
+
+        If ``compress`` is ``True``, the output is gzip-compressed.
+
+        If ``streaming`` is ``True``, the topics and associations are written
+        in the order of their identifiers if the topic map provides them
+        through ``constructs_by_id()`` (c.f. ``mappa.store.mem``), the output
+        is flushed each ``flush_every`` topics / associations and the
+        ``progress`` callback (if any) is called with the number of written
+        topics and associations.
+
+        If ``shards`` is greater than ``1``, the topics and associations are
+        partitioned into ``shards`` ranges each which are serialized by
+        ``processes`` worker processes (default: the number of CPUs). The
+        fragments are written in order, the ``progress`` callback (if any)
+        is called after each fragment.
         """
-        self._writer = XMLWriter(self._out, self._encoding)
+        if not self.compress:
+            return self._write(topicmap, self._out)
+        out = gzip.GzipFile(fileobj=self._out, mode='wb')
+        try:
+            self._write(topicmap, out)
+        finally:
+            out.close()
+
+    def _write(self, topicmap, out):
+        self._writer = XMLWriter(out, self._encoding, buffer_size=self.buffer_size)
         writer = self._writer
         writer.prettify = self.prettify
         writer.startDocument()
@@ -84,15 +122,87 @@ class XTM2TopicMapWriter(object):
         writer.startElement(u'topicMap', attrs)
         self._write_reifier(topicmap)
         self._write_iids(topicmap)
-        write_topic = self._write_topic
-        for topic in topicmap.topics:
-            write_topic(topic)
-        write_assoc = self._write_association
-        for assoc in topicmap.associations:
-            write_assoc(assoc)
+        if self.shards > 1:
+            self._write_shards(topicmap)
+        elif self.streaming:
+            self._write_constructs(topicmap)
+        else:
+            write_topic = self._write_topic
+            for topic in topicmap.topics:
+                write_topic(topic)
+            write_assoc = self._write_association
+            for assoc in topicmap.associations:
+                write_assoc(assoc)
         writer.endElement(u'topicMap')
         writer.endDocument()
 
+    def _write_constructs(self, topicmap):
+        """\
+        Writes the topics and associations of the `topicmap` without
+        collecting them.
+        """
+        progress = self.progress
+        flush_every = self.flush_every
+        flush = self._writer.flush
+        write_topic = self._write_topic
+        write_assoc = self._write_association
+        constructs_by_id = getattr(topicmap, 'constructs_by_id', None)
+        if constructs_by_id is not None:
+            constructs = constructs_by_id()
+        else:
+            constructs = chain(topicmap.topics, topicmap.associations)
+        count, reported = 0, -1
+        for tmc in constructs:
+            if is_topic(tmc):
+                write_topic(tmc)
+            elif is_association(tmc):
+                write_assoc(tmc)
+            else:
+                continue
+            count += 1
+            if flush_every and not count % flush_every:
+                flush()
+                if progress:
+                    progress(count)
+                    reported = count
+        if progress and count != reported:
+            progress(count)
+
+    def _write_shards(self, topicmap):
+        """\
+        Writes the topics and associations of the `topicmap` in parallel.
+        """
+        args = [(kind, start, stop) for kind in (u'topics', u'associations')
+                    for start, stop in shard_ranges(len(getattr(topicmap, kind)), self.shards)]
+        def write_shard(kind, start, stop):
+            return self._write_shard(topicmap, kind, start, stop)
+        progress = self.progress
+        count = 0
+        for fragment, size in map_shards(write_shard, args, self.processes):
+            self._writer.raw(fragment)
+            count += size
+            if progress:
+                self._writer.flush()
+                progress(count)
+
+    def _write_shard(self, topicmap, kind, start, stop):
+        """\
+        Returns a tuple of the serialized topics or associations (`kind`)
+        from `start` to `stop` (exclusive) and the number of constructs.
+        """
+        write = self._write_topic if kind == u'topics' else self._write_association
+        out = io.BytesIO()
+        writer = self._writer
+        self._writer = XMLWriter(out, self._encoding, prettify=self.prettify,
+                                 buffer_size=self.buffer_size, depth=1)
+        try:
+            for tmc in islice(getattr(topicmap, kind), start, stop):
+                write(tmc)
+            self._writer.flush()
+        finally:
+            self._writer = writer
+        return out.getvalue().decode(self._encoding), stop - start
+
     def _write_topic(self, topic):
         """\
         Serializes a topic and its characteristics.
@@ -12,11 +12,18 @@ Tests against the XTM writers.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import io
+import gzip
+from nose.tools import eq_, ok_, raises
+import mappa
+from mappa import TMDM
 from mappaext.cxtm.cxtm_test import create_writer_cxtm_cases
 from mio.xtm import create_deserializer
 from mappaext import xtm
 from mappa.xtm1utils import convert_to_tmdm
 
+_BASE = u'http://www.semagia.com/test-xtm/'
+
 
 def create_xtm10_writer(out, base):
     return xtm.create_writer(out, base, prettify=True, version=1.0)
@@ -29,6 +36,14 @@ def create_xtm20_writer(out, base):
 def create_xtm21_writer(out, base):
     return xtm.create_writer(out, base, prettify=True, version=2.1)
 
+
+def create_xtm21_sharded_writer(out, base):
+    return xtm.create_writer(out, base, prettify=True, version=2.1, shards=3)
+
+
+def create_xtm21_streaming_writer(out, base):
+    return xtm.create_writer(out, base, prettify=True, version=2.1, streaming=True, flush_every=1)
+
 # Excluding these tms since they cause problems with iids
 # Either the writer adds an iid or it exports not enough iids
 _EXCLUDE_XTM_10 = [
@@ -110,6 +125,100 @@ def test_xtm_21_writer():
         yield test
 
 
+def test_xtm_21_streaming_writer():
+    for test in create_writer_cxtm_cases(create_xtm21_streaming_writer, create_deserializer, 'xtm2', 'xtm'):
+        yield test
+    for test in create_writer_cxtm_cases(create_xtm21_streaming_writer, create_deserializer, 'xtm21', 'xtm'):
+        yield test
+
+
+def test_xtm_21_sharded_writer():
+    for test in create_writer_cxtm_cases(create_xtm21_sharded_writer, create_deserializer, 'xtm21', 'xtm'):
+        yield test
+
+
+def create_topicmap(iri=_BASE + u'map'):
+    """\
+    Returns a topic map with some topics, names, occurrences, and
+    associations.
+    """
+    tm = mappa.connect().create(iri)
+    name_type = tm.create_topic_by_sid(TMDM.topic_name)
+    occ_type = tm.create_topic_by_sid(_BASE + u'description')
+    assoc_type = tm.create_topic_by_sid(_BASE + u'knows')
+    role_type = tm.create_topic_by_sid(_BASE + u'person')
+    prev = None
+    for i in range(20):
+        topic = tm.create_topic_by_sid(_BASE + u'topic-%d' % i)
+        topic.create_name(name_type, u'Topic %d' % i)
+        topic.create_occurrence(occ_type, u'Description of topic %d' % i)
+        if prev is not None:
+            assoc = tm.create_association(assoc_type)
+            assoc.create_role(role_type, prev)
+            assoc.create_role(role_type, topic)
+        prev = topic
+    return tm
+
+
+def serialize(tm, **kw):
+    out = io.BytesIO()
+    xtm.create_writer(out, _BASE, version=2.1, **kw).write(tm)
+    return out.getvalue()
+
+
+def test_compress():
+    tm = create_topicmap()
+    data = serialize(tm, compress=True)
+    eq_(serialize(tm), gzip.GzipFile(fileobj=io.BytesIO(data)).read())
+    conn = mappa.connect()
+    conn.loads(gzip.GzipFile(fileobj=io.BytesIO(data)).read(), into=_BASE + u'copy', format='xtm')
+    copy = conn.get(_BASE + u'copy')
+    eq_(len(tm.topics), len(copy.topics))
+    eq_(len(tm.associations), len(copy.associations))
+
+
+def test_streaming_progress():
+    tm = create_topicmap()
+    count = len(tm.topics) + len(tm.associations)
+    counts = []
+    data = serialize(tm, streaming=True, flush_every=4, progress=counts.append)
+    expected = range(4, count + 1, 4)
+    if count % 4:
+        expected.append(count)
+    eq_(expected, counts)
+    ok_(data.rstrip().endswith('</topicMap>'))
+
+
+def test_streaming_progress_no_flush():
+    tm = create_topicmap()
+    counts = []
+    serialize(tm, streaming=True, flush_every=0, progress=counts.append)
+    eq_([len(tm.topics) + len(tm.associations)], counts)
+
+
+@raises(IOError)
+def test_xtm_10_streaming():
+    xtm.create_writer(io.BytesIO(), _BASE, version=1.0, streaming=True)
+
+
+@raises(IOError)
+def test_xtm_10_compress():
+    xtm.create_writer(io.BytesIO(), _BASE, version=1.0, compress=True)
+
+
+@raises(IOError)
+def test_xtm_10_shards():
+    xtm.create_writer(io.BytesIO(), _BASE, version=1.0, shards=3)
+
+
+def test_shards():
+    tm = create_topicmap()
+    expected = serialize(tm, prettify=True, shards=1)
+    eq_(expected, serialize(tm, prettify=True, shards=3))
+    eq_(expected, serialize(tm, prettify=True, shards=3, processes=1))
+    eq_(serialize(tm), serialize(tm, shards=3))
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
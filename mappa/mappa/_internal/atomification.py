@@ -12,16 +12,17 @@ Implementation independent default atomification algorithms.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
-from mappa import ANY, UCS, TMDM
+from mappa import ANY, UCS
 from mappa.utils import is_name, nice_identifier, topic_for
 from mappa._internal.it import one_of
+from mappa._internal.implhelper import TOPIC_NAME_SIDS
 
 
 def atomify_topic(topic, ctx=ANY):
     """\
     Defaut algorithm to atomify a topic.
     """
-    name_type = topic.tm.topic(sid=TMDM.topic_name) or ANY
+    name_type = topic.tm._core_topics(TOPIC_NAME_SIDS)[0] or ANY
     name = None
     names_by = topic.names_by
     if ctx in (ANY, UCS):
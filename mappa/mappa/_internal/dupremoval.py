@@ -22,7 +22,9 @@ Utility function to remove duplicates.
 :license:      BSD License
 """
 from itertools import imap
-from mappa._internal.mergeutils import move_variants, handle_existing
+from mappa.utils import is_name, is_association
+from mappa._internal.mergeutils import move_variants, move_role_properties, \
+    handle_existing
 
 def remove_duplicates(tm):
     """\
@@ -37,6 +39,32 @@ def remove_duplicates(tm):
     for assoc_type in ti_idx.association_types():
         _remove_duplicate_associations(ti_idx.associations(assoc_type))
 
+def remove_indexed_duplicates(duplicates):
+    """\
+    Removes duplicates which are provided by an index.
+
+    `duplicates`
+        A function which returns an iterable of tuples of duplicate
+        constructs. The first construct of each tuple is kept. The function
+        is called until it reports no further duplicates (removing
+        duplicates may lead to new duplicates).
+    """
+    dups = duplicates()
+    while dups:
+        for constructs in dups:
+            existing = constructs[0]
+            for tmc in constructs[1:]:
+                # The construct may be removed by a previous step
+                if not tmc._is_attached() or not existing._is_attached():
+                    continue
+                handle_existing(tmc, existing)
+                if is_name(tmc):
+                    move_variants(tmc, existing)
+                elif is_association(tmc):
+                    move_role_properties(tmc, existing)
+                tmc.remove()
+        dups = duplicates()
+
 def remove_duplicates_from_topic(topic):
     """\
     Removes duplicates from the specified ``topic``.
@@ -83,6 +111,8 @@ def _remove_duplicate_associations(assocs):
         sig = assoc.__sig__()
         existing = sigs.get(sig)
         if existing:
+            handle_existing(assoc, existing)
+            move_role_properties(assoc, existing)
             assoc.remove()
         else:
             sigs[sig] = assoc
@@ -19,13 +19,15 @@ These enhancers are used to avoid unncessary subclassing.
 :license:      BSD License
 """
 from itertools import ifilter, imap
-from mappa import TMDM, UCS, ANY
+from contextlib import contextmanager
+from mappa import UCS, ANY
 from mappa.utils import is_binary, is_construct, is_scoped, is_topicmap, \
     is_topic, is_association, is_role, is_occurrence, is_name, is_variant
 from mappa.predicates import parent, player
 from mappa._internal.implhelper import topic_types, topic_instances, \
     topic_supertypes, create_topic_by_identity, \
-    topic_by_identity, construct_by_identity, get_topic
+    topic_by_identity, construct_by_identity, get_topic, core_topics, \
+    TYPE_INSTANCE_SIDS, SUPERTYPE_SUBTYPE_SIDS
 from mappa._internal.itemexpr import filter_topic_children, add_topic_child, \
     filter_players, add_role
 from mappa._internal.filter import filter_by_type_scope, filter_roles
@@ -94,7 +96,8 @@ def enhance_connection(cls):
                 raise IOError('No deserializer found for "%s"' % format)
             tmap = conn.get(into) or conn.create(into)
             deser.handler = MappaMapHandler(tmap)
-            deser.parse(src)
+            with tmap.bulk_load():
+                deser.parse(src)
             _post_process_loading(tmap, format, kw.get('version'), deser)
         cls.load = _load
     if not hasattr(cls, 'loads'):
@@ -108,7 +111,8 @@ def enhance_connection(cls):
                 raise IOError('No deserializer found for "%s"' % format)
             tmap = conn.get(into) or conn.create(into)
             deser.handler = MappaMapHandler(tmap)
-            deser.parse(src)
+            with tmap.bulk_load():
+                deser.parse(src)
             _post_process_loading(tmap, format, kw.get('version'), deser)
         cls.loads = _loads
     if not hasattr(cls, 'write'):
@@ -138,6 +142,13 @@ def enhance_construct(cls):
         cls.find = _not_implemented
     if not hasattr(cls, 'findall'):
         cls.findall = _not_implemented
+    if not hasattr(cls, '__forward__'):
+        def _forward(tmc, target):
+            try:
+                tmc.__dict__ = target.__dict__
+            except AttributeError:
+                pass
+        cls.__forward__ = _forward
 
 
 def enhance_topicmap(cls):
@@ -151,6 +162,13 @@ def enhance_topicmap(cls):
         def _merge(tm, other):
             mergeutils. merge_topicmaps(other, tm)
         cls.merge = _merge
+    if not hasattr(cls, 'bulk_load'):
+        @contextmanager
+        def _bulk_load(tm):
+            yield tm
+        cls.bulk_load = _bulk_load
+    if not hasattr(cls, '_core_topics'):
+        cls._core_topics = core_topics
 
 
 def enhance_topic(cls):
@@ -158,27 +176,25 @@ def enhance_topic(cls):
         if tt in topic.types:
             return
         tm = topic.tm
-        type_instance, typ, instance = map(tm.create_topic_by_sid, (TMDM.type_instance, TMDM.type, TMDM.instance))
+        type_instance, typ, instance = tm._core_topics(TYPE_INSTANCE_SIDS, create=True)
         assoc = tm.create_association(type_instance)
         assoc.create_role(typ, tt)
         assoc.create_role(instance, topic)
     def remove_type(topic, tt):
-        tm = topic.tm
-        tmdm_type = tm.topic(sid=TMDM.type)
-        for assoc in ifilter(is_binary, imap(parent, topic.roles_by(type=tm.topic(sid=TMDM.instance), assoc_type=tm.topic(sid=TMDM.type_instance), scope=UCS))):
+        type_instance, tmdm_type, instance = topic.tm._core_topics(TYPE_INSTANCE_SIDS)
+        for assoc in ifilter(is_binary, imap(parent, topic.roles_by(type=instance, assoc_type=type_instance, scope=UCS))):
             if tt in assoc.players_by(type=tmdm_type):
                 assoc.remove()
                 break
     def add_supertype(topic, st):
         tm = topic.tm
-        supertype_subtype, supertype, subtype = map(tm.create_topic_by_sid, (TMDM.supertype_subtype, TMDM.supertype, TMDM.subtype))
+        supertype_subtype, supertype, subtype = tm._core_topics(SUPERTYPE_SUBTYPE_SIDS, create=True)
         assoc = tm.create_association(supertype_subtype)
         assoc.create_role(supertype, st)
         assoc.create_role(subtype, topic)
     def remove_supertype(topic, st):
-        tm = topic.tm
-        supertype = tm.topic(sid=TMDM.supertype)
-        for assoc in ifilter(is_binary, imap(parent, topic.roles_by(type=tm.topic(sid=TMDM.subtype), assoc_type=tm.topic(sid=TMDM.supertype_subtype), scope=UCS))):
+        supertype_subtype, supertype, subtype = topic.tm._core_topics(SUPERTYPE_SUBTYPE_SIDS)
+        for assoc in ifilter(is_binary, imap(parent, topic.roles_by(type=subtype, assoc_type=supertype_subtype, scope=UCS))):
             if st in assoc.players_by(type=supertype):
                 assoc.remove()
                 break
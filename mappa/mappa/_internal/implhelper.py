@@ -86,6 +86,26 @@ def construct_by_identity(tm, *identity, **kw):
         return tm.construct_by_iid(identity or kw.get('iid'))
     return tm.construct_by_id(kw.get('id'))
 
+TYPE_INSTANCE_SIDS = (TMDM.type_instance, TMDM.type, TMDM.instance)
+
+SUPERTYPE_SUBTYPE_SIDS = (TMDM.supertype_subtype, TMDM.supertype, TMDM.subtype)
+
+TOPIC_NAME_SIDS = (TMDM.topic_name,)
+
+def core_topics(tm, sids, create=False):
+    """\
+    Returns a tuple of topics with the provided subject identifiers.
+
+    If `create` is ``False`` and a topic does not exist, the tuple contains
+    ``None`` at the position of the missing topic.
+
+    `sids`
+        A tuple of normalized subject identifiers (i.e. TMDM PSIs).
+    """
+    if create:
+        return tuple(map(tm.create_topic_by_sid, sids))
+    return tuple(map(tm.topic_by_sid, sids))
+
 def _type_instance_topics(tm):
     """\
     Returns a tuple of topics: ``(tmdm:type-instance, tmdm:type, tmdm:instance)``.
@@ -93,16 +113,10 @@ def _type_instance_topics(tm):
     If one of the topics is not available in the topic map, this function
     raises a ``ValueError``
     """
-    type_instance = tm.topic_by_sid(TMDM.type_instance)
-    if not type_instance:
-        raise ValueError()
-    typ = tm.topic_by_sid(TMDM.type)
-    if not typ:
+    topics = tm._core_topics(TYPE_INSTANCE_SIDS)
+    if None in topics:
         raise ValueError()
-    instance = tm.topic_by_sid(TMDM.instance)
-    if not instance:
-        raise ValueError()
-    return type_instance, typ, instance
+    return topics
 
 def _supertype_subtype_topics(tm):
     """\
@@ -111,16 +125,10 @@ def _supertype_subtype_topics(tm):
     If one of the topics is not available in the topic map, this function
     raises a ``ValueError``
     """
-    supertype_subtype = tm.topic_by_sid(TMDM.supertype_subtype)
-    if not supertype_subtype:
-        raise ValueError()
-    supertype = tm.topic_by_sid(TMDM.supertype)
-    if not supertype:
-        raise ValueError()
-    subtype = tm.topic_by_sid(TMDM.subtype)
-    if not subtype:
+    topics = tm._core_topics(SUPERTYPE_SUBTYPE_SIDS)
+    if None in topics:
         raise ValueError()
-    return supertype_subtype, supertype, subtype
+    return topics
 
 def topic_types(topic):
     """\
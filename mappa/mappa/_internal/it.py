@@ -16,7 +16,7 @@ Utility functions that operate on iterables.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
-__all__ = ['all', 'exists', 'no', 'one_of', 'product']
+__all__ = ['all', 'exists', 'no', 'one_of', 'product', 'closure']
 
 from itertools import ifilter, ifilterfalse
 # pylint: disable-msg=E0611, W0611, W0141, W0622
@@ -67,3 +67,17 @@ def no(seq, pred=None):
     for elem in ifilter(pred, seq):
         return False
     return True
+
+def closure(start, successors):
+    """\
+    Returns a set of the elements which are reachable from `start` by the
+    `successors` function (which returns the direct successors of an element).
+    """
+    res = set()
+    stack = [start]
+    while stack:
+        for elem in successors(stack.pop()):
+            if elem not in res:
+                res.add(elem)
+                stack.append(elem)
+    return res
@@ -69,13 +69,53 @@ class Literal(tuple):
             return value
         if datatype is None:
             value, datatype = _value_datatype(value)
+        key = _flyweight_key(cls, value, datatype)
+        if key is not None:
+            lit = _FLYWEIGHTS.get(key)
+            if lit is not None:
+                return lit
         if XSD.anyURI == datatype:
-            return tuple.__new__(cls, (unicode(irilib.normalize(value)), unicode(datatype)))
-        try:
-            value, datatype = normalize_literal(value, datatype)
-            return tuple.__new__(cls, (unicode(value), unicode(datatype)))
-        except UnicodeDecodeError:
-            return tuple.__new__(cls, (value, unicode(datatype)))
+            value = unicode(irilib.normalize(value))
+        else:
+            try:
+                value, datatype = normalize_literal(value, datatype)
+                value = unicode(value)
+            except UnicodeDecodeError:
+                pass
+        return _make_literal(cls, key, value, datatype)
+
+    @classmethod
+    def from_normalized(cls, value, datatype=XSD.string):
+        """\
+        Returns a literal from a `value` which is already normalized
+        according to the `datatype`.
+
+        In contrast to the constructor, the value is not normalized again.
+        Callers must not use this method for untrusted input.
+
+        >>> lit = Literal.from_normalized(u'0.1', XSD.decimal)
+        >>> lit.value
+        u'0.1'
+        >>> lit == Literal('000.1', XSD.decimal)
+        True
+        """
+        key = _flyweight_key(cls, value, datatype)
+        if key is not None:
+            lit = _FLYWEIGHTS.get(key)
+            if lit is not None:
+                return lit
+            if datatype in _NORMALIZED_DATATYPES:
+                # The constructor must not find a value which was not
+                # normalized by the constructor
+                key = None
+        if value.__class__ is not unicode:
+            if not isinstance(value, basestring):
+                raise TypeError('Expected a string, got: %r' % (value,))
+            try:
+                value = unicode(value)
+            except UnicodeDecodeError:
+                pass
+        return _make_literal(cls, key, value, datatype)
 
     def __pyvalue__(self):
         return _pyvalue(self[0], self[1])
@@ -102,6 +142,61 @@ class Literal(tuple):
     datatype = property(itemgetter(1))
 
 
+# Literals with a value up to this length are kept in the flyweight cache
+_FLYWEIGHT_MAX_LENGTH = 32
+# Max. number of literals in the flyweight cache. If more literals are
+# added, the cache is cleared
+_FLYWEIGHT_MAX_SIZE = 10000
+# (type of the value, value, datatype) -> Literal
+_FLYWEIGHTS = {}
+# Datatypes which are normalized by the constructor
+_NORMALIZED_DATATYPES = frozenset([XSD.anyURI, XSD.decimal, XSD.integer, XSD.boolean])
+# datatype IRI -> shared datatype IRI
+_DATATYPES = {}
+_DATATYPES_MAX_SIZE = 1000
+
+
+def _flyweight_key(cls, value, datatype):
+    """\
+    Returns the key of the literal in the flyweight cache or ``None`` if
+    the literal should not be cached.
+    """
+    # The type is part of the key since 'a' == u'a' but non-ASCII strings
+    # are kept as they are
+    if cls is Literal and isinstance(value, basestring) \
+            and len(value) <= _FLYWEIGHT_MAX_LENGTH:
+        return value.__class__, value, datatype
+    return None
+
+
+def _make_literal(cls, key, value, datatype):
+    """\
+    Creates a literal with the shared datatype IRI and adds it to the
+    flyweight cache if `key` is not ``None``.
+    """
+    lit = tuple.__new__(cls, (value, intern_datatype(datatype)))
+    if key is not None:
+        if len(_FLYWEIGHTS) >= _FLYWEIGHT_MAX_SIZE:
+            _FLYWEIGHTS.clear()
+        _FLYWEIGHTS[key] = lit
+    return lit
+
+
+def intern_datatype(datatype):
+    """\
+    Returns a shared unicode object which is equal to the `datatype` IRI.
+
+    >>> intern_datatype('http://www.w3.org/2001/XMLSchema#string') is XSD.string
+    True
+    """
+    res = _DATATYPES.get(datatype)
+    if res is None:
+        res = unicode(datatype)
+        if len(_DATATYPES) < _DATATYPES_MAX_SIZE:
+            _DATATYPES[res] = res
+    return res
+
+
 def _str_to_date(val):
     """\
     Returns a datetime.date instance from the specified string.
@@ -167,6 +262,11 @@ _XSD2Py = {
           XSD.anyURI:             unicode
           }
 
+for _datatype in _XSD2Py:
+    intern_datatype(_datatype)
+del _datatype
+
+
 def _value_datatype(value):
     """\
     Creates a value/datatype tuple from a Python object.
@@ -16,10 +16,31 @@ This module provides functions to merge topic maps and topics.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
+from time import time
+from itertools import imap
 from mappa import ModelConstraintViolation
 from mappa.predicates import parent
 from mappa._internal.constraints import check_same_topicmap
 
+
+class TopicMerger(object):
+    """\
+    Merges topics and records the number of merges and the time spent.
+    """
+    def __init__(self):
+        self.merges = 0
+        self.time = 0.0
+
+    def merge(self, source, target):
+        """\
+        Merges the `source` topic into the `target` topic.
+        """
+        start = time()
+        target.merge(source)
+        self.merges += 1
+        self.time += time() - start
+
+
 def merge_topicmaps(source, target):
     """\
     Merges the `source´ topic map with the `target` topic map.
@@ -240,56 +261,63 @@ def merge_topics(source, target):
         target.add_slo(loc) 
     # Replace the `source` with `target` as type and theme
     _replace_topics(source, target)
-    # Collecting occurrence signatures
-    sigs = _signatures(target.occurrences)
+    tm = target.tm
+    find_existing = _finder(tm, target, lambda: target.occurrences)
     for occ in tuple(source.occurrences):
-        existing = sigs.get(occ.__sig__())
+        existing = find_existing(occ)
         if existing:
             handle_existing(occ, existing)
             occ.remove()
-            try:
-                occ.__dict__ = existing.__dict__
-            except AttributeError: 
-                pass
+            occ.__forward__(existing)
         else:
             source.remove_occurrence(occ)
             target.add_occurrence(occ)
-    # Collecting name signatures
-    sigs = _signatures(target.names)
+    find_existing = _finder(tm, target, lambda: target.names)
     for name in tuple(source.names):
-        existing = sigs.get(name.__sig__())
+        existing = find_existing(name)
         if existing:
             handle_existing(name, existing)
             move_variants(name, existing)
             name.remove()
-            try:
-                name.__dict__ = existing.__dict__
-            except AttributeError:
-                pass
+            name.__forward__(existing)
         else:
             source.remove_name(name)
             target.add_name(name)
-    # Collecting association signatures
-    sigs = _signatures(map(parent, target.roles_played))
-    # Note: Reifiers and and item identifiers are ignored at roles
-    #TODO: Issue a warning that reifiers and iids are ignored?
+    find_existing = _finder(tm, tm, lambda: imap(parent, target.roles_played))
+    assocs = set()
     for role in tuple(source.roles_played):
         role.player = target
-        existing = sigs.get(role.parent.__sig__())
-        if existing:
-            assoc = role.parent
+        assocs.add(role.parent)
+    # Note: Reifiers and and item identifiers are ignored at roles
+    #TODO: Issue a warning that reifiers and iids are ignored?
+    for assoc in assocs:
+        existing = find_existing(assoc)
+        if existing and existing != assoc:
             handle_existing(assoc, existing)
             assoc.remove()
-            try:
-                assoc.__dict__ = existing.__dict__
-            except AttributeError:
-                pass
+            assoc.__forward__(existing)
     source.remove()
-    try:
-        source.__dict__ = target.__dict__
-    except AttributeError:
-        pass
+    source.__forward__(target)
+
 
+def _finder(tm, parent, children):
+    """\
+    Returns a function which returns an existing child of `parent` with the 
+    same signature as the provided construct (or ``None``).
+
+    `tm`
+        The topic map.
+    `parent`
+        The parent of the existing constructs.
+    `children`
+        A function which returns the children of `parent`. Only used if the
+        topic map provides no signature index. 
+    """
+    sig_idx = getattr(tm.index, 'signature', None)
+    if sig_idx is not None:
+        return lambda tmc: sig_idx.find(parent, tmc)
+    sigs = _signatures(children())
+    return lambda tmc: sigs.get(tmc.__sig__())
 
 def _signatures(iterable):
     """\
@@ -340,9 +368,9 @@ def move_variants(source, target):
     """\
     Moves the variants from the C{source} name to the C{target} name.
     """
-    sigs = _signatures(target.variants)
+    find_existing = _finder(target.tm, target, lambda: target.variants)
     for var in tuple(source.variants):
-        existing = sigs.get(var.__sig__())
+        existing = find_existing(var)
         if existing:
             handle_existing(var, existing)
         else:
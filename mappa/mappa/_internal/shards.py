@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Utility functions to serialize a topic map in shards.
+
+The shards are processed by forked worker processes which inherit the
+topic map (and the writer) instead of receiving a pickled copy.
+
+.. Warning::
+
+    This module does not belong to the public API.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import os
+__all__ = ['shard_ranges', 'map_shards']
+
+# The function which is executed by a worker process. It is set by the
+# initializer of the worker process (see `_init_worker`).
+_TASK = None
+
+
+def shard_ranges(count, shards):
+    """\
+    Returns a list of ``(start, stop)`` tuples which partition ``count``
+    elements into (at most) ``shards`` ranges of almost equal size.
+
+    Empty ranges are omitted.
+    """
+    size, rest = divmod(count, max(shards, 1))
+    ranges = []
+    start = 0
+    for i in range(shards):
+        stop = start + size + (i < rest)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def map_shards(func, args, processes=None):
+    """\
+    Returns an iterator over the results of ``func(*arg)`` for each tuple of
+    ``args``. The results are returned in the order of ``args``.
+
+    The function is executed by ``processes`` worker processes (default:
+    the number of CPUs). If the platform does not support forking, if
+    ``processes`` is ``1`` or if there is at most one shard, the function
+    is executed in the current process.
+    """
+    if len(args) < 2 or processes == 1 or not hasattr(os, 'fork'):
+        return (func(*arg) for arg in args)
+    return _map_forked(func, args, processes)
+
+
+def _map_forked(func, args, processes):
+    import multiprocessing
+    # The forked workers inherit the initializer arguments, the function is
+    # not pickled and concurrent calls do not share any state
+    pool = multiprocessing.Pool(processes, _init_worker, (func,))
+    try:
+        for res in pool.imap(_run, args, 1):
+            yield res
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _init_worker(func):
+    global _TASK
+    _TASK = func
+
+
+def _run(arg):
+    return _TASK(*arg)
@@ -19,24 +19,82 @@ from collections import defaultdict
 
 class EventDispatcher(object):
     """\
-    
+    Dispatches events to the handlers which are subscribed to the type of
+    the event.
+
+    The handlers of an event type are compiled into a tuple on the first
+    dispatch. Subscribing or unsubscribing a handler invalidates the tuple.
     """
     def __init__(self):
-        self._handlers = defaultdict(set)
+        self._handlers = defaultdict(list)
+        self._compiled = {}
+        self._dispatch_counts = defaultdict(int)
 
     def subscribe(self, event_type, handler):
         """\
         Subscribes the `handler` to the specified `event_type`.
         """
-        self._handlers[event_type].add(handler)
+        handlers = self._handlers[event_type]
+        if handler not in handlers:
+            handlers.append(handler)
+        self._compiled.pop(event_type, None)
+
+    def unsubscribe(self, event_type, handler):
+        """\
+        Unsubscribes the `handler` from the specified `event_type`.
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+        self._compiled.pop(event_type, None)
+
+    def handlers(self, event_type):
+        """\
+        Returns a tuple of handlers which are subscribed to the 
+        specified `event_type`.
+        """
+        try:
+            return self._compiled[event_type]
+        except KeyError:
+            handlers = tuple(self._handlers.get(event_type, ()))
+            self._compiled[event_type] = handlers
+            return handlers
 
     def dispatch(self, event):
         """\
         Dispatches the specified `event` to the subscribed handlers.
         """
-        for handler in self._handlers.get(type(event), ()):
+        event_type = type(event)
+        self._dispatch_counts[event_type] += 1
+        for handler in self.handlers(event_type):
+            handler(event)
+
+    def fire(self, event_type, *args):
+        """\
+        Creates an event of the specified `event_type` with the provided
+        arguments and dispatches it to the subscribed handlers.
+
+        The event is not created if no handler is subscribed to the
+        `event_type`.
+        """
+        handlers = self.handlers(event_type)
+        if not handlers:
+            return
+        self._dispatch_counts[event_type] += 1
+        event = event_type(*args)
+        for handler in handlers:
             handler(event)
 
+    def dispatch_counts(self):
+        """\
+        Returns a dict which maps the event types to the number of 
+        dispatched events of that type.
+
+        Events which were not created since no handler was subscribed are
+        not counted.
+        """
+        return dict(self._dispatch_counts)
+
 class EventMultiplier(object):
     """\
     This class subscribes itself to several `Add*` and `Remove*` events
@@ -175,3 +233,4 @@ class SetType(ChangeEvent): pass
 class SetReifier(ChangeEvent): pass
 class SetScope(ChangeEvent): pass
 class SetValue(ChangeEvent): pass
+class SetPlayer(ChangeEvent): pass
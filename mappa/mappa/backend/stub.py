@@ -18,10 +18,11 @@ These stubs are useful for an `OO`_ view on the `TMDM`_.
 :license:      BSD License
 """
 from operator import attrgetter
-from mappa import irilib, ModelConstraintViolation, Literal, ANY, UCS, TMDM, XSD
+from mappa import irilib, ModelConstraintViolation, Literal, ANY, UCS, XSD
 from mappa.utils import is_construct, is_topic
-from mappa._internal import kind, it
+from mappa._internal import kind, it, siggen
 from mappa._internal.constraints import check_not_none, check_same_topicmap
+from mappa._internal.implhelper import TOPIC_NAME_SIDS
 from mappa.backend.events import *
 
 
@@ -30,13 +31,15 @@ __all__ = ('TopicMapStub',
            'OccurrenceStub', 'NameStub', 'VariantStub')
 
 class ReifiableConstructStub(object):
+    __slots__ = ()
+
     def __init__(self, reifier):
         self._reifier = reifier
 
     def _set_reifier(self, reifier):
         if self._reifier == reifier:
             return
-        self._fire_event(SetReifier(self, self._reifier, reifier))
+        self._fire_event(SetReifier, self, self._reifier, reifier)
         if self._reifier:
             self._reifier._reified = None
         self._reifier = reifier
@@ -47,6 +50,8 @@ class ReifiableConstructStub(object):
 
 
 class TypedConstructStub(object):
+    __slots__ = ()
+
     def __init__(self, type):
         self._type = type
 
@@ -55,13 +60,16 @@ class TypedConstructStub(object):
         assert is_topic(type)
         if self._type == type:
             return
-        self._fire_event(SetType(self, self._type, type))
+        self._fire_event(SetType, self, self._type, type)
         self._type = type
+        self._reset_signature()
 
     type = property(attrgetter('_type'), _set_type)
 
 
 class DatatypeAwareConstructStub(object):
+    __slots__ = ()
+
 
     def __init__(self, literal):
         self._literal = literal
@@ -71,8 +79,9 @@ class DatatypeAwareConstructStub(object):
         lit = Literal(lit)
         if self._literal == lit:
             return
-        self._fire_event(SetValue(self, self._literal, lit))
+        self._fire_event(SetValue, self, self._literal, lit)
         self._literal = lit
+        self._reset_signature()
 
     def __pyvalue__(self):
         return self._literal.__pyvalue__()
@@ -93,11 +102,40 @@ class DatatypeAwareConstructStub(object):
     value = property(lambda self: self._literal.value, _set_literal)
     datatype = property(lambda self: self._literal.datatype)
 
+class SignatureAwareConstructStub(object):
+    """\
+    Caches the signature of a construct.
+
+    Derived classes must provide the following attributes:
+    - `_sig` (mutable)
+    - `_signature` (a function which returns the signature of the construct)
+    """
+    __slots__ = ()
+
+    def __init__(self):
+        self._sig = None
+
+    def __sig__(self):
+        sig = self._sig
+        if sig is None:
+            sig = self._sig = self._signature()
+        return sig
+
+    def _reset_signature(self):
+        self._sig = None
+
+
 class TopicMapsConstructStub(object):
     """\
     Derived classes must provide the following mutable attributes:
     - `iids` (a set)
+
+    A derived class may use immutable empty containers, in this case the
+    derived class must override `_container` which must return a mutable
+    container.
     """
+    __slots__ = ()
+
     def __init__(self, tm):
         self._tm = tm
         self._parent = None
@@ -114,8 +152,8 @@ class TopicMapsConstructStub(object):
         iid = irilib.normalize(iid)
         if iid in self.iids:
             return
-        self._fire_event(AddItemIdentifier(self, iid))
-        self.iids.add(iid)
+        self._fire_event(AddItemIdentifier, self, iid)
+        self._container('iids').add(iid)
 
     def remove_iid(self, iid):
         check_not_none(iid)
@@ -123,19 +161,26 @@ class TopicMapsConstructStub(object):
         iid = irilib.normalize(iid)
         if iid not in self.iids:
             return
-        self._fire_event(RemoveItemIdentifier(self, iid))
+        self._fire_event(RemoveItemIdentifier, self, iid)
         self.iids.remove(iid)
 
+    def _container(self, name):
+        """\
+        Returns the mutable container (i.e. ``iids``) with the provided `name`.
+        """
+        return getattr(self, name)
+
     def __hash__(self):
         return hash(self.id)
 
     def __eq__(self, other):
-        return self.id == getattr(other, 'id', None)
+        return self.id == getattr(other, 'id', None) \
+                and self._tm is getattr(other, '_tm', None)
 
-    def _fire_event(self, evt):
+    def _fire_event(self, event_type, *args):
         if not self._is_attached():
             return
-        self._tm.dispatch(evt)
+        self._tm.fire(event_type, *args)
 
     tm = property(attrgetter('_tm'))
     parent = property(attrgetter('_parent'))
@@ -146,6 +191,8 @@ class ScopedConstructStub(TopicMapsConstructStub):
     Derived classes must provide the following mutable attributes:
     - `_scope` (a set)
     """
+    __slots__ = ()
+
     def __init__(self, tm, scope=()):
         TopicMapsConstructStub.__init__(self, tm)
         self._scope = self._create_scope(scope)
@@ -157,8 +204,9 @@ class ScopedConstructStub(TopicMapsConstructStub):
         for theme in scope:
             check_same_topicmap(self.tm, theme)
         new_scope = self._create_scope(scope)
-        self._fire_event(SetScope(self, self._scope, new_scope))
+        self._fire_event(SetScope, self, self._scope, new_scope)
         self._scope = new_scope
+        self._reset_signature()
 
     scope = property(attrgetter('_scope'), _set_scope)
 
@@ -186,6 +234,13 @@ class TopicMapStub(TopicMapsConstructStub, ReifiableConstructStub,
             check_same_topicmap(self, evt.new)
         EventDispatcher.dispatch(self, evt)
 
+    def fire(self, event_type, *args):
+        # The last argument is the new value (or the removed construct which
+        # belongs to this topic map)
+        if is_construct(args[-1]):
+            check_same_topicmap(self, args[-1])
+        EventDispatcher.fire(self, event_type, *args)
+
     def _is_attached(self):
         return True
 
@@ -232,14 +287,14 @@ class TopicMapStub(TopicMapsConstructStub, ReifiableConstructStub,
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddTopic(self, child))
+        self._fire_event(AddTopic, self, child)
         child._parent = self
-        self.topics.add(child)
+        self._container('topics').add(child)
 
     def remove_topic(self, child):
         if child._parent != self:
             return
-        self._fire_event(RemoveTopic(self, child))
+        self._fire_event(RemoveTopic, self, child)
         self.topics.remove(child)
         child._parent = None
 
@@ -247,19 +302,19 @@ class TopicMapStub(TopicMapsConstructStub, ReifiableConstructStub,
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddAssociation(self, child))
+        self._fire_event(AddAssociation, self, child)
         child._parent = self
-        self.associations.add(child)
+        self._container('associations').add(child)
 
     def remove_association(self, child):
         if child._parent != self:
             return
-        self._fire_event(RemoveAssociation(self, child))
+        self._fire_event(RemoveAssociation, self, child)
         self.associations.remove(child)
         child._parent = None
 
-    def _fire_event(self, evt):
-        self.dispatch(evt)
+    def _fire_event(self, event_type, *args):
+        self.fire(event_type, *args)
 
     parent = property(lambda self: self)
     tm = property(lambda self: self)
@@ -275,6 +330,7 @@ class TopicStub(TopicMapsConstructStub):
     - `occurrences` (a set)
     - `names` (a set)
     """
+    __slots__ = ()
     _kind = kind.TOPIC
     def __init__(self, tm):
         TopicMapsConstructStub.__init__(self, tm)
@@ -294,8 +350,8 @@ class TopicStub(TopicMapsConstructStub):
         sid = irilib.normalize(sid)
         if sid in self.sids:
             return
-        self._fire_event(AddSubjectIdentifier(self, sid))
-        self.sids.add(sid)
+        self._fire_event(AddSubjectIdentifier, self, sid)
+        self._container('sids').add(sid)
 
     def remove_sid(self, sid):
         check_not_none(sid)
@@ -303,7 +359,7 @@ class TopicStub(TopicMapsConstructStub):
         sid = irilib.normalize(sid)
         if sid not in self.sids:
             return
-        self._fire_event(RemoveSubjectIdentifier(self, sid))
+        self._fire_event(RemoveSubjectIdentifier, self, sid)
         self.sids.remove(sid)
 
     def add_slo(self, slo):
@@ -312,8 +368,8 @@ class TopicStub(TopicMapsConstructStub):
         slo = irilib.normalize(slo)
         if slo in self.slos:
             return
-        self._fire_event(AddSubjectLocator(self, slo))
-        self.slos.add(slo)
+        self._fire_event(AddSubjectLocator, self, slo)
+        self._container('slos').add(slo)
 
     def remove_slo(self, slo):
         check_not_none(slo)
@@ -321,7 +377,7 @@ class TopicStub(TopicMapsConstructStub):
         slo = irilib.normalize(slo)
         if slo not in self.slos:
             return
-        self._fire_event(RemoveSubjectLocator(self, slo))
+        self._fire_event(RemoveSubjectLocator, self, slo)
         self.slos.remove(slo)
 
     def create_occurrence(self, type, value, scope=()):
@@ -335,20 +391,20 @@ class TopicStub(TopicMapsConstructStub):
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddOccurrence(self, child))
+        self._fire_event(AddOccurrence, self, child)
         child._parent = self
-        self.occurrences.add(child)
+        self._container('occurrences').add(child)
 
     def remove_occurrence(self, child):
         if child._parent != self:
             return
-        self._fire_event(RemoveOccurrence(self, child))
+        self._fire_event(RemoveOccurrence, self, child)
         self.occurrences.remove(child)
         child._parent = None
 
     def create_name(self, type, value, scope=()):
         if not type:
-            type = self._tm.create_topic(sid=TMDM.topic_name)
+            type, = self._tm._core_topics(TOPIC_NAME_SIDS, create=True)
         assert value is not None
         name = self._tm.builder.create_name(type, Literal(value), scope)
         self.add_name(name)
@@ -358,15 +414,15 @@ class TopicStub(TopicMapsConstructStub):
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddName(self, child))
+        self._fire_event(AddName, self, child)
         child._parent = self
-        self.names.add(child)
+        self._container('names').add(child)
 
     def remove_name(self, child):
         assert child is not None
         if child._parent != self:
             return
-        self._fire_event(RemoveName(self, child))
+        self._fire_event(RemoveName, self, child)
         self.names.remove(child)
         child._parent = None
 
@@ -384,16 +440,21 @@ class TopicStub(TopicMapsConstructStub):
     reified = property(attrgetter('_reified'))
 
 
-class AssociationStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub):
+class AssociationStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub,
+                      SignatureAwareConstructStub):
     """\
     Derived classes must provide the following mutable attributes:
     - `roles` (a set)
     """
+    __slots__ = ()
     _kind = kind.ASSOCIATION
+    _signature = siggen.association_signature
+
     def __init__(self, tm, type, scope=()):
         ScopedConstructStub.__init__(self, tm, scope)
         TypedConstructStub.__init__(self, type)
         ReifiableConstructStub.__init__(self, None)
+        SignatureAwareConstructStub.__init__(self)
         self.roles = self._create_roles()
 
     def create_role(self, type, player):
@@ -408,19 +469,21 @@ class AssociationStub(ScopedConstructStub, TypedConstructStub, ReifiableConstruc
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddRole(self, child))
+        self._fire_event(AddRole, self, child)
         child._parent = self
-        child.player.roles_played.add(child)
-        self.roles.add(child)
+        child.player._container('roles_played').add(child)
+        self._container('roles').add(child)
+        self._reset_signature()
 
     def remove_role(self, child):
         assert child is not None
         if child._parent != self:
             return
-        self._fire_event(RemoveRole(self, child))
+        self._fire_event(RemoveRole, self, child)
         self.roles.remove(child)
         child.player.roles_played.remove(child)
         child._parent = None
+        self._reset_signature()
 
     def remove(self):
         self.reifier = None
@@ -431,23 +494,35 @@ class AssociationStub(ScopedConstructStub, TypedConstructStub, ReifiableConstruc
     parent = property(attrgetter('_tm'))
 
 
-class RoleStub(TopicMapsConstructStub, TypedConstructStub, ReifiableConstructStub):
+class RoleStub(TopicMapsConstructStub, TypedConstructStub, ReifiableConstructStub,
+               SignatureAwareConstructStub):
 
+    __slots__ = ()
     _kind = kind.ROLE
+    _signature = siggen.role_signature
 
     def __init__(self, tm, type, player):
         TopicMapsConstructStub.__init__(self, tm)
         TypedConstructStub.__init__(self, type)
         ReifiableConstructStub.__init__(self, None)
+        SignatureAwareConstructStub.__init__(self)
         self._player = player
 
+    def _reset_signature(self):
+        self._sig = None
+        # The signature of the parent depends on the signature of the role
+        if self._parent is not None:
+            self._parent._reset_signature()
+
     def _set_player(self, player):
         check_not_none(player)
         check_same_topicmap(self, player)
+        self._fire_event(SetPlayer, self, self._player, player)
         if self._player:
             self._player.roles_played.remove(self)
         self._player = player
-        player.roles_played.add(self)
+        player._container('roles_played').add(self)
+        self._reset_signature()
 
     def remove(self):
         self.reifier = None
@@ -456,33 +531,41 @@ class RoleStub(TopicMapsConstructStub, TypedConstructStub, ReifiableConstructStu
     player = property(attrgetter('_player'), _set_player)
 
 
-class OccurrenceStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub, DatatypeAwareConstructStub):
+class OccurrenceStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub, DatatypeAwareConstructStub,
+                     SignatureAwareConstructStub):
 
+    __slots__ = ()
     _kind = kind.OCCURRENCE
+    _signature = siggen.occurrence_signature
 
     def __init__(self, tm, type, value, scope=UCS):
         ScopedConstructStub.__init__(self, tm, scope)
         TypedConstructStub.__init__(self, type)
         ReifiableConstructStub.__init__(self, None)
         DatatypeAwareConstructStub.__init__(self, value)
+        SignatureAwareConstructStub.__init__(self)
 
     def remove(self):
         self.reifier = None
         self._parent.remove_occurrence(self)
 
 
-class NameStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub):
+class NameStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub,
+               SignatureAwareConstructStub):
     """\
 
     Derived classes must provide the following mutable attributes:
     - `variants` (a set)
     """
+    __slots__ = ()
     _kind = kind.NAME
+    _signature = siggen.name_signature
     
     def __init__(self, tm, type, value, scope=()):
         ScopedConstructStub.__init__(self, tm, scope)
         TypedConstructStub.__init__(self, type)
         ReifiableConstructStub.__init__(self, None)
+        SignatureAwareConstructStub.__init__(self)
         self._literal = value
         self.variants = self._create_variants()
 
@@ -491,8 +574,9 @@ class NameStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub):
         lit = Literal(value, XSD.string)
         if self._literal == lit:
             return
-        self._fire_event(SetValue(self, self._literal, lit))
+        self._fire_event(SetValue, self, self._literal, lit)
         self._literal = lit
+        self._reset_signature()
 
     def create_variant(self, value, scope):
         def in_name_scope(theme):
@@ -509,17 +593,25 @@ class NameStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub):
         assert child is not None
         if not _accept_child(self, child):
             return
-        self._fire_event(AddVariant(self, child))
+        self._fire_event(AddVariant, self, child)
         child._parent = self
-        self.variants.add(child)
+        child._reset_signature()
+        self._container('variants').add(child)
 
     def remove_variant(self, child):
         assert child is not None
         if child._parent != self:
             return
-        self._fire_event(RemoveVariant(self, child))
+        self._fire_event(RemoveVariant, self, child)
         self.variants.remove(child)
         child._parent = None
+        child._reset_signature()
+
+    def _reset_signature(self):
+        self._sig = None
+        # The scope of the variants depends on the scope of the name
+        for var in self.variants:
+            var._reset_signature()
 
     def remove(self):
         self.reifier = None
@@ -531,14 +623,18 @@ class NameStub(ScopedConstructStub, TypedConstructStub, ReifiableConstructStub):
     value = property(lambda self: self._literal.value, _set_value)
 
 
-class VariantStub(ScopedConstructStub, ReifiableConstructStub, DatatypeAwareConstructStub):
+class VariantStub(ScopedConstructStub, ReifiableConstructStub, DatatypeAwareConstructStub,
+                  SignatureAwareConstructStub):
 
+    __slots__ = ()
     _kind = kind.VARIANT
+    _signature = siggen.variant_signature
 
     def __init__(self, tm, value, scope):
         ScopedConstructStub.__init__(self, tm, scope)
         ReifiableConstructStub.__init__(self, None)
         DatatypeAwareConstructStub.__init__(self, value)
+        SignatureAwareConstructStub.__init__(self)
 
     def _get_scope(self):
         scope = set(self._scope)
@@ -556,8 +652,9 @@ class VariantStub(ScopedConstructStub, ReifiableConstructStub, DatatypeAwareCons
         if it.all(scope, in_name_scope):
             raise ModelConstraintViolation("The variant's scope is equal to the parent's scope")
         new_scope = self._create_scope(scope)
-        self._fire_event(SetScope(self, self._scope, new_scope))
+        self._fire_event(SetScope, self, self._scope, new_scope)
         self._scope = new_scope
+        self._reset_signature()
 
     def remove(self):
         self.reifier = None
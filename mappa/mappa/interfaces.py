@@ -564,6 +564,21 @@ class ITopicMap(IConstruct, IReifiable):
         """\
         Closes this topic map instance.
         """
+
+    def bulk_load():
+        """\
+        Returns a context manager which may be used to add a large number
+        of Topic Maps constructs to this topic map.
+
+        The implementation may defer the maintenance of indices until the
+        context is left. The identity constraints are enforced.
+
+        ::
+
+            >>> with tm.bulk_load():
+            ...     for i in xrange(1000000):
+            ...         tm.create_topic()
+        """
     iri = Attribute("""\
     The storage address of this topic map.
     
@@ -13,10 +13,12 @@
 :license:      BSD License
 """
 from __future__ import absolute_import
-from tm import mio, UCS, TMDM
+import logging
+from tm import mio, UCS
 import tm.mio.handler as mio_handler
-from mappa import utils, ModelConstraintViolation, IdentityViolation
+from mappa import utils, ModelConstraintViolation, IdentityViolation, Literal
 from ._internal import mergeutils, kind
+from ._internal.implhelper import TOPIC_NAME_SIDS
 from .utils import _kind
 
 __all__ = ['MappaMapHandler']
@@ -25,8 +27,11 @@ __all__ = ['MappaMapHandler']
 class MappaMapHandler(mio_handler.HamsterMapHandler):
     """\
     ``MapHandler`` implementation for Mappa.
+
+    The number of merged topics and the time spent merging them is available
+    via ``merger``.
     """
-    __slots__ = ['_tm', '_delayed']
+    __slots__ = ['_tm', '_delayed', 'merger']
 
     def __init__(self, tm):
         """
@@ -38,6 +43,7 @@ class MappaMapHandler(mio_handler.HamsterMapHandler):
         super(MappaMapHandler, self).__init__()
         self._tm = tm
         self._delayed = {}
+        self.merger = mergeutils.TopicMerger()
 
     def _create_topic_by_iid(self, iri):
         return self._tm.create_topic_by_iid(iri)
@@ -83,7 +89,13 @@ class MappaMapHandler(mio_handler.HamsterMapHandler):
         Merges the ``source`` topic into the ``target`` topic.
         """
         super(MappaMapHandler, self).notify_merge(source, target)
-        target.merge(source)
+        self.merger.merge(source, target)
+
+    def endTopicMap(self):
+        merger = self.merger
+        if merger.merges:
+            logging.debug('Merged %d topics in %.3f seconds' % (merger.merges, merger.time))
+        super(MappaMapHandler, self).endTopicMap()
 
     def _create_association(self, type, scope, reifier, iids, roles):
         assoc = self._tm.create_association(type, scope or UCS)
@@ -103,18 +115,20 @@ class MappaMapHandler(mio_handler.HamsterMapHandler):
             delayed.clear()
 
     def _create_occurrence(self, parent, type, value, datatype, scope, reifier, iids):
-        occ = parent.create_occurrence(type=type, value=(value, datatype), scope=scope or UCS)
+        occ = parent.create_occurrence(type=type, value=Literal(value, datatype), scope=scope or UCS)
         occ = _apply_reifier(occ, reifier)
         _apply_iids(occ, iids)
 
     def _create_name(self, parent, type, value, scope, reifier, iids, variants):
-        name = parent.create_name(type=type or self._tm.create_topic_by_sid(TMDM.topic_name),
-                                  value=value, scope=scope or UCS)
+        if not type:
+            type, = self._tm._core_topics(TOPIC_NAME_SIDS, create=True)
+        # Names are xsd:string which is not subject to a normalization
+        name = parent.create_name(type=type, value=Literal.from_normalized(value), scope=scope or UCS)
         name = _apply_reifier(name, reifier)
         _apply_iids(name, iids)
         delayed = self._delayed
         for v in variants:
-            var = name.create_variant(value=(v.value, v.datatype), scope=v.scope)
+            var = name.create_variant(value=Literal(v.value, v.datatype), scope=v.scope)
             if v.reifier or v.iids:
                 delayed[var.__sig__()] = v.reifier, v.iids
         if delayed:
@@ -187,27 +201,18 @@ def _merge_reifiables(source, target):
             mergeutils.handle_existing(source_parent, target_parent)
             mergeutils.move_roles(source_parent, target_parent)
             source_parent.remove()
-            try:
-                source_parent.__dict__ = target_parent.__dict__
-            except AttributeError:
-                pass
+            source_parent.__forward__(target_parent)
     elif utils.is_variant(source):
         source_parent, target_parent = source.parent, target.parent
         if source_parent != target_parent:
             mergeutils.handle_existing(source_parent, target_parent)
             mergeutils.move_variants(source_parent, target_parent)
             source_parent.remove()
-            try:
-                source_parent.__dict__ = target_parent.__dict__
-            except AttributeError:
-                pass
+            source_parent.__forward__(target_parent)
     else:
         if utils.is_association(source):
             mergeutils.move_role_properties(source, target)
         elif utils.is_name(source):
             mergeutils.move_variants(source, target)
         source.remove()
-        try:
-            source.__dict__ = target.__dict__
-        except AttributeError:
-            pass
+        source.__forward__(target)
@@ -18,8 +18,6 @@ Utilities.
 :license:      BSD License
 """
 import sys
-from functools import partial
-from operator import eq
 from itertools import chain, imap
 from mappa import ANY, TMDM, XSD, predicates as pred
 from mappa._internal import it, kind
@@ -297,12 +295,15 @@ def isa(instance, type): # pylint: disable-msg=W0622
     if not is_topic(instance):
         return _typed_isa(instance, type)
     # 'instance' is a topic
+    hierarchy = _type_hierarchy(instance.tm)
+    if hierarchy is not None:
+        return hierarchy.isa(instance, type)
     if type in instance.types:
         return True
-    return iko(instance, type)
+    return it.exists(instance.types, lambda typ: iko(typ, type))
 
 def _typed_isa(instance, type): # pylint: disable-msg=W0622
-    return instance.type == type or _typed_iko(instance, type)
+    return instance.type == type or iko(instance.type, type)
 
 def iko(subtype, supertype):
     """\
@@ -310,68 +311,46 @@ def iko(subtype, supertype):
     
     `subtype`
         A topic, an association, a role, an occurrence or a name.
+        If `subtype` is not a topic, the type of `subtype` is used.
     `supertype`
         A topic.
     """
     if not is_topic(subtype):
-        return _typed_iko(subtype, supertype)
-    return it.exists(supertypes(subtype), partial(eq, supertype))
-
-def _typed_iko(subtype, supertype):
-    tm = subtype.tm
-    return it.exists(_supertypes_of(subtype.type, 
-                                 tm.topic(sid=TMDM.supertype_subtype), 
-                                 tm.topic(sid=TMDM.supertype), 
-                                 tm.topic(sid=TMDM.subtype)),
-                              partial(eq, supertype))
+        subtype = subtype.type
+    return supertype in supertypes(subtype)
 
 def supertypes(subtype):
     """\
-    Returns all supertypes of the specified `subtype`.
+    Returns all (transitive) supertypes of the specified `subtype`.
     
     `subtype`
         A topic.
     """
-    tm = subtype.tm
-    for typ in subtype.types:
-        yield typ
-        for supertype in _supertypes_of(typ, 
-                                        tm.topic(sid=TMDM.supertype_subtype), 
-                                        tm.topic(sid=TMDM.supertype), 
-                                        tm.topic(sid=TMDM.subtype)):
-            yield supertype
+    hierarchy = _type_hierarchy(subtype.tm)
+    if hierarchy is not None:
+        return hierarchy.supertypes(subtype)
+    from mappa._internal.implhelper import topic_supertypes
+    return it.closure(subtype, topic_supertypes)
 
 def subtypes(supertype):
     """\
-    Returns all subtypes of the specified `supertype`.
+    Returns all (transitive) subtypes of the specified `supertype`.
     
     `supertype`
-        A topic, an association, role, occurrence or name.
-    """
-    tm = supertype.tm
-    return chain(tm.index.type_instance.topics(supertype), 
-                 _subtypes_of(supertype, 
-                              tm.topic(sid=TMDM.supertype_subtype), 
-                              tm.topic(sid=TMDM.supertype), 
-                              tm.topic(sid=TMDM.subtype)))
-
-def _supertypes_of(topic, supertype_subtype, supertype, subtype):
-    for assoc in imap(pred.parent, topic.roles_by(type=subtype, assoc_type=supertype_subtype)):
-        for supertyp in assoc[supertype]:
-            yield supertyp
-            # The recursive call may violate the Python rec.limit?
-            for super_super in _supertypes_of(supertyp, supertype_subtype, supertype, subtype):
-                yield super_super
-
-def _subtypes_of(topic, supertype_subtype, supertype, subtype):
-    type_idx = topic.tm.index.type_instance
-    for assoc in imap(pred.parent, topic.roles_by(type=supertype, assoc_type=supertype_subtype)):
-        for subtyp in assoc[subtype]:
-            yield subtyp
-            for instance in type_idx.topics(subtyp):
-                yield instance
-            for subsub in _subtypes_of(subtyp, supertype_subtype, supertype, subtype):
-                yield subsub
+        A topic.
+    """
+    hierarchy = _type_hierarchy(supertype.tm)
+    if hierarchy is not None:
+        return hierarchy.subtypes(supertype)
+    from mappa._internal.implhelper import topic_subtypes
+    return it.closure(supertype, topic_subtypes)
+
+def _type_hierarchy(tm):
+    """\
+    Returns the type hierarchy index of the topic map or ``None`` if the
+    topic map does not provide such an index.
+    """
+    return getattr(tm.index, 'type_hierarchy', None)
 
 def is_default_name(name):
     """\
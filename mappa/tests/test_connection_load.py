@@ -52,6 +52,47 @@ class TestConnectionLoad(MappaTestCase):
         self.assert_(topic)
         self.assert_(1, len_(topic.sids))
 
+    def test_load_bulk_load_merge(self):
+        tm = self._tm
+        with tm.bulk_load():
+            self._conn.loads("""\
+%prefix ex <http://www.example.org/>
+
+ex:a isa ex:person.
+
+^<http://www.example.org/#person> - "Person".
+
+ex:person ^<http://www.example.org/#person>.
+""", into=self.base, format='ctm')
+            # Merging topics does not end the bulk load mode
+            self.assertTrue(getattr(tm, '_bulk_loading', True))
+        person = tm.topic(sid='http://www.example.org/person')
+        self.assertEqual(person, tm.topic(iid='http://www.example.org/#person'))
+        self.assertEqual(1, len_(person.names))
+        self.assertEqual([person], list(tm.topic(sid='http://www.example.org/a').types))
+
+    def test_load_bulk_load_merge_hub(self):
+        # The topics ex:m0 ... ex:m19 are merged into the hub topic, their
+        # associations are duplicates of the associations of the hub
+        ctm = [u'%prefix ex <http://www.example.org/>\n']
+        for i in range(200):
+            ctm.append(u'ex:knows(ex:person: ex:hub, ex:other: ex:t%d)\n' % i)
+        for i in range(20):
+            ctm.append(u'ex:knows(ex:person: ex:m%d, ex:other: ex:t%d)\n' % (i, i))
+            ctm.append(u'ex:m%d ^<http://www.example.org/hub>.\n' % i)
+        tm = self._tm
+        with tm.bulk_load():
+            # Merging uses the signature index instead of the roles of the hub
+            self.assertTrue(tm.index.signature is not None)
+            self._conn.loads(u''.join(ctm), into=self.base, format='ctm')
+            self.assertTrue(getattr(tm, '_bulk_loading', True))
+        hub = tm.topic(sid='http://www.example.org/hub')
+        for i in range(20):
+            self.assertEqual(hub, tm.topic(sid='http://www.example.org/m%d' % i))
+        self.assertEqual(200, len_(hub.roles_played))
+        self.assertEqual(200, len_(tm.associations))
+        self.assertEqual([], list(tm.index.signature.duplicates()))
+
 
 if __name__ == '__main__':
     import nose
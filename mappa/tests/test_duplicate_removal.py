@@ -13,6 +13,7 @@ Tests the (internal) duplicate removal module.
 :license:      BSD License
 """
 from . mappa_test import MappaTestCase, len_
+from mappa import utils
 from mappa._internal import dupremoval
 
 class TestDuplicateRemoval(MappaTestCase):
@@ -28,6 +29,44 @@ class TestDuplicateRemoval(MappaTestCase):
         dupremoval._remove_duplicates_from_name(name)
         self.assertEqual(1, len_(name.variants))
 
+    def test_remove_duplicates(self):
+        t = self.create_topic()
+        typ = self.create_topic()
+        t.create_occurrence(typ, 'Semagia')
+        t.create_occurrence(typ, 'Semagia')
+        n = t.create_name(typ, 'Semagia')
+        n2 = t.create_name(typ, 'Semagia')
+        theme = self.create_topic()
+        n.create_variant('Semagia', [theme])
+        n2.create_variant('Semagia', [theme])
+        n2.create_variant('Mappa', [theme])
+        for i in range(2):
+            a = self.create_association(typ)
+            a.create_role(typ, t)
+            a.create_role(typ, t)
+        self.assertEqual(2, len_(t.occurrences))
+        self.assertEqual(2, len_(t.names))
+        self.assertEqual(2, len_(self._tm.associations))
+        utils.remove_duplicates(self._tm)
+        self.assertEqual(1, len_(t.occurrences))
+        self.assertEqual(1, len_(t.names))
+        self.assertEqual(2, len_(tuple(t.names)[0].variants))
+        self.assertEqual(1, len_(self._tm.associations))
+        self.assertEqual(1, len_(tuple(self._tm.associations)[0].roles))
+        utils.remove_duplicates(self._tm)
+        self.assertEqual(1, len_(self._tm.associations))
+
+    def test_remove_duplicates_iids(self):
+        t = self.create_topic()
+        typ = self.create_topic()
+        iid = self.random_locator()
+        o = t.create_occurrence(typ, 'Semagia')
+        o2 = t.create_occurrence(typ, 'Semagia')
+        o2.add_iid(iid)
+        utils.remove_duplicates(self._tm)
+        self.assertEqual(1, len_(t.occurrences))
+        self.assertTrue(iid in tuple(t.occurrences)[0].iids)
+
 
 if __name__ == '__main__':
     import nose
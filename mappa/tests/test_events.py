@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the event dispatcher.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from unittest import TestCase
+from mappa.backend.events import EventDispatcher, AddTopic, RemoveTopic, SetType
+from . mappa_test import MappaTestCase
+
+
+class TestEventDispatcher(TestCase):
+
+    def setUp(self):
+        self._dispatcher = EventDispatcher()
+        self._events = []
+
+    def _handler(self, evt):
+        self._events.append(evt)
+
+    def test_dispatch(self):
+        dispatcher = self._dispatcher
+        dispatcher.subscribe(AddTopic, self._handler)
+        evt = AddTopic('tm', 'topic')
+        dispatcher.dispatch(evt)
+        self.assertEqual([evt], self._events)
+        dispatcher.dispatch(RemoveTopic('tm', 'topic'))
+        self.assertEqual([evt], self._events)
+
+    def test_subscribe_twice(self):
+        dispatcher = self._dispatcher
+        dispatcher.subscribe(AddTopic, self._handler)
+        dispatcher.subscribe(AddTopic, self._handler)
+        self.assertEqual(1, len(dispatcher.handlers(AddTopic)))
+        dispatcher.fire(AddTopic, 'tm', 'topic')
+        self.assertEqual(1, len(self._events))
+
+    def test_subscribe_invalidates_handlers(self):
+        dispatcher = self._dispatcher
+        self.assertEqual((), dispatcher.handlers(AddTopic))
+        dispatcher.subscribe(AddTopic, self._handler)
+        self.assertEqual((self._handler,), dispatcher.handlers(AddTopic))
+        dispatcher.unsubscribe(AddTopic, self._handler)
+        self.assertEqual((), dispatcher.handlers(AddTopic))
+
+    def test_fire(self):
+        dispatcher = self._dispatcher
+        dispatcher.subscribe(SetType, self._handler)
+        dispatcher.fire(SetType, 'source', 'old', 'new')
+        self.assertEqual(1, len(self._events))
+        evt = self._events[0]
+        self.assertEqual(SetType, type(evt))
+        self.assertEqual('source', evt.source)
+        self.assertEqual('old', evt.old)
+        self.assertEqual('new', evt.new)
+
+    def test_dispatch_counts(self):
+        dispatcher = self._dispatcher
+        self.assertEqual({}, dispatcher.dispatch_counts())
+        dispatcher.fire(AddTopic, 'tm', 'topic')
+        self.assertEqual({}, dispatcher.dispatch_counts())
+        dispatcher.subscribe(AddTopic, self._handler)
+        dispatcher.fire(AddTopic, 'tm', 'topic')
+        dispatcher.fire(AddTopic, 'tm', 'topic')
+        self.assertEqual({AddTopic: 2}, dispatcher.dispatch_counts())
+
+
+class TestTopicMapEvents(MappaTestCase):
+
+    def test_dispatch_counts(self):
+        counts = self._tm.dispatch_counts()
+        self.create_topic()
+        self.assertEqual(counts.get(AddTopic, 0) + 1, self._tm.dispatch_counts()[AddTopic])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -13,6 +13,7 @@ Tests against indices.
 :license:      BSD License
 """
 import unittest
+from mappa import UCS, ANY, XSD, TMDM, Literal
 from . mappa_test import MappaTestCase, len_
 
 class TestTypeInstanceIndex(MappaTestCase):
@@ -77,6 +78,81 @@ class TestTypeInstanceIndex(MappaTestCase):
         self.assertEqual(1, len_(idx.roles(r_type)))
         self.assertTrue(r in idx.roles(r_type))
 
+    def test_type_removed_if_unused(self):
+        idx = self._tm.index.type_instance
+        a_type = self.create_topic()
+        a = self.create_association(a_type)
+        self.assertTrue(a_type in idx.association_types())
+        a.remove()
+        self.assertFalse(a_type in idx.association_types())
+        self.assertEqual(0, len_(idx.associations(a_type)))
+        self.assertFalse(a_type in idx.association_types())
+
+    def test_insertion_order(self):
+        idx = self._tm.index.type_instance
+        a_type = self.create_topic()
+        assocs = [self.create_association(a_type) for i in range(20)]
+        self.assertEqual(assocs, list(idx.associations(a_type)))
+        assocs[5].remove()
+        del assocs[5]
+        self.assertEqual(assocs, list(idx.associations(a_type)))
+
+    def test_modify_while_iterating(self):
+        idx = self._tm.index.type_instance
+        a_type = self.create_topic()
+        a_type2 = self.create_topic()
+        for i in range(10):
+            self.create_association(a_type)
+        for assoc in idx.associations(a_type):
+            assoc.type = a_type2
+        self.assertEqual(0, len_(idx.associations(a_type)))
+        self.assertEqual(10, len_(idx.associations(a_type2)))
+
+    def test_instance_of_twice(self):
+        idx = self._tm.index.type_instance
+        tm = self._tm
+        type_instance = tm.create_topic_by_sid(TMDM.type_instance)
+        type_role = tm.create_topic_by_sid(TMDM.type)
+        instance_role = tm.create_topic_by_sid(TMDM.instance)
+        typ = self.create_topic()
+        instance = self.create_topic()
+        assocs = []
+        for i in range(2):
+            assoc = tm.create_association(type_instance)
+            assoc.create_role(type_role, typ)
+            assoc.create_role(instance_role, instance)
+            assocs.append(assoc)
+        self.assertEqual([instance], list(idx.topics(typ)))
+        assocs[0].remove()
+        self.assertEqual([instance], list(idx.topics(typ)))
+        assocs[1].remove()
+        self.assertEqual(0, len_(idx.topics(typ)))
+
+    def test_counts(self):
+        idx = self._tm.index.type_instance
+        typ = self.create_topic()
+        self.assertEqual(0, idx.association_count(typ))
+        association_types = idx.association_type_count()
+        a = self.create_association(typ)
+        self.create_association(typ)
+        self.assertEqual(2, idx.association_count(typ))
+        self.assertEqual(association_types + 1, idx.association_type_count())
+        self.assertEqual(0, idx.role_count(typ))
+        a.create_role(typ, self.create_topic())
+        self.assertEqual(1, idx.role_count(typ))
+        t = self.create_topic()
+        t.create_occurrence(typ, 'Semagia')
+        t.create_name(typ, 'Semagia')
+        self.assertEqual(1, idx.occurrence_count(typ))
+        self.assertEqual(1, idx.name_count(typ))
+        self.assertEqual(0, idx.topic_count(typ))
+        t.add_type(typ)
+        self.assertEqual(1, idx.topic_count(typ))
+        self.assertEqual(len(idx.topic_types()), idx.topic_type_count())
+        a.remove()
+        self.assertEqual(1, idx.association_count(typ))
+        self.assertEqual(0, idx.role_count(typ))
+
 
 class TestLiteralIndex(MappaTestCase):
     """\
@@ -112,6 +188,80 @@ class TestLiteralIndex(MappaTestCase):
         self.assert_(var not in idx.variants('Semagia'))
         self.assert_(var in idx.variants('Mappa'))
 
+    def test_literals(self):
+        idx = self._tm.index.literal
+        self.assert_(not idx.literals('http://www.semagia.com/'))
+        occ = self.create_occurrence('http://www.semagia.com/')
+        name = self.create_name('http://www.semagia.com/')
+        occ.value = Literal('http://www.semagia.com/', XSD.anyURI)
+        lits = set(idx.literals('http://www.semagia.com/'))
+        self.assertEqual(set([occ.literal, name.literal]), lits)
+        self.assert_(occ in idx.occurrences(occ.literal))
+        name.value = 'Mappa'
+        self.assertEqual(set([occ.literal]), set(idx.literals('http://www.semagia.com/')))
+        self.assertEqual(set([name.literal]), set(idx.literals('Mappa')))
+        occ.value = 'Semagia'
+        self.assert_(not idx.literals('http://www.semagia.com/'))
+
+    def test_value_count(self):
+        idx = self._tm.index.literal
+        self.assertEqual(0, idx.value_count())
+        occ = self.create_occurrence('Semagia')
+        self.create_name('Semagia')
+        self.assertEqual(1, idx.value_count())
+        occ.value = 'Mappa'
+        self.assertEqual(2, idx.value_count())
+        occ.remove()
+        self.assertEqual(1, idx.value_count())
+
+    def test_counts(self):
+        idx = self._tm.index.literal
+        self.assertEqual(0, idx.occurrence_count('Semagia'))
+        occ = self.create_occurrence('Semagia')
+        self.create_occurrence('Semagia')
+        self.create_name('Semagia')
+        self.create_variant('Semagia')
+        self.assertEqual(2, idx.occurrence_count('Semagia'))
+        self.assertEqual(1, idx.name_count('Semagia'))
+        self.assertEqual(1, idx.variant_count('Semagia'))
+        occ.value = 'Mappa'
+        self.assertEqual(1, idx.occurrence_count('Semagia'))
+        self.assertEqual(1, idx.occurrence_count('Mappa'))
+
+class TestStatisticsIndex(MappaTestCase):
+    """\
+    Tests against the statistics index.
+    """
+    def test_counts(self):
+        idx = self._tm.index.statistics
+        self.assertEqual(len(self._tm.topics), idx.topic_count())
+        self.assertEqual(0, idx.association_count())
+        role = self.create_role()
+        self.assertEqual(1, idx.association_count())
+        self.assertEqual(1, idx.role_count())
+        var = self.create_variant('Semagia')
+        self.assertEqual(1, idx.name_count())
+        self.assertEqual(1, idx.variant_count())
+        self.create_occurrence('Mappa')
+        self.assertEqual(1, idx.occurrence_count())
+        self.assertEqual(len(self._tm.topics), idx.topic_count())
+        role.parent.remove()
+        var.parent.remove()
+        self.assertEqual(0, idx.association_count())
+        self.assertEqual(0, idx.role_count())
+        self.assertEqual(0, idx.name_count())
+        self.assertEqual(0, idx.variant_count())
+
+    def test_rebuild(self):
+        idx = self._tm.index.statistics
+        self.create_occurrence('Semagia')
+        with self._tm.bulk_load():
+            self.create_role()
+        self.assertEqual(len(self._tm.topics), idx.topic_count())
+        self.assertEqual(1, idx.association_count())
+        self.assertEqual(1, idx.role_count())
+        self.assertEqual(1, idx.occurrence_count())
+
 class TestScopedIndex(MappaTestCase):
     """\
     Tests against the scoped index.
@@ -133,6 +283,22 @@ class TestScopedIndex(MappaTestCase):
         assoc.remove()
         self.assert_(assoc not in idx.associations_by_theme(theme))
 
+    def test_counts(self):
+        idx = self._tm.index.scoped
+        theme = self.create_topic()
+        self.assertEqual(0, idx.association_count_by_theme(theme))
+        assoc = self.create_association()
+        assoc.scope = theme
+        self.create_occurrence().scope = theme
+        self.create_name().scope = theme
+        self.create_variant().scope = [theme, self.create_topic()]
+        self.assertEqual(1, idx.association_count_by_theme(theme))
+        self.assertEqual(1, idx.occurrence_count_by_theme(theme))
+        self.assertEqual(1, idx.name_count_by_theme(theme))
+        self.assertEqual(1, idx.variant_count_by_theme(theme))
+        assoc.remove()
+        self.assertEqual(0, idx.association_count_by_theme(theme))
+
     def test_occurrence(self):
         idx = self._tm.index.scoped
         occ = self.create_occurrence()
@@ -184,6 +350,120 @@ class TestScopedIndex(MappaTestCase):
         var.remove()
         self.assert_(var not in idx.variants_by_theme(theme))
 
+    def test_association_scope(self):
+        idx = self._tm.index.scoped
+        theme1 = self.create_topic()
+        theme2 = self.create_topic()
+        a_ucs = self.create_association()
+        a1 = self.create_association(scope=[theme1])
+        a12 = self.create_association(scope=[theme1, theme2])
+        self.assertEqual([a_ucs], list(idx.associations(UCS)))
+        self.assertEqual([a1], list(idx.associations(theme1)))
+        self.assertEqual([a12], list(idx.associations([theme2, theme1])))
+        self.assertEqual(0, len_(idx.associations([theme2])))
+        res = idx.associations(theme1, exact=False)
+        self.assertEqual(2, len_(res))
+        self.assert_(a1 in res)
+        self.assert_(a12 in res)
+        self.assertEqual([a12], list(idx.associations(theme2, exact=False)))
+        self.assertEqual(3, len_(idx.associations(UCS, exact=False)))
+        self.assertEqual(3, len_(idx.associations(ANY)))
+        a1.scope = UCS
+        self.assertEqual(2, len_(idx.associations(UCS)))
+        self.assert_(a1 in idx.associations(UCS))
+        self.assertEqual(0, len_(idx.associations(theme1)))
+        a_ucs.remove()
+        self.assertEqual([a1], list(idx.associations(UCS)))
+        self.assertEqual(2, len_(idx.associations(ANY)))
+
+    def test_occurrence_scope(self):
+        idx = self._tm.index.scoped
+        theme = self.create_topic()
+        occ = self.create_occurrence()
+        self.assertEqual([occ], list(idx.occurrences(UCS)))
+        self.assertEqual(0, len_(idx.occurrences(theme)))
+        occ.scope = theme
+        self.assertEqual(0, len_(idx.occurrences(UCS)))
+        self.assertEqual([occ], list(idx.occurrences(theme)))
+        self.assertEqual([occ], list(idx.occurrences(UCS, exact=False)))
+
+    def test_name_scope(self):
+        idx = self._tm.index.scoped
+        theme = self.create_topic()
+        name = self.create_name()
+        self.assertEqual([name], list(idx.names(UCS)))
+        name.scope = [theme]
+        self.assertEqual(0, len_(idx.names(UCS)))
+        self.assertEqual([name], list(idx.names([theme])))
+        name.remove()
+        self.assertEqual(0, len_(idx.names([theme])))
+
+    def test_variant_scope(self):
+        idx = self._tm.index.scoped
+        theme = self.create_topic()
+        var = self.create_variant()
+        self.assertEqual(0, len_(idx.variants(UCS)))
+        self.assertEqual(0, len_(idx.variants(theme)))
+        var.scope = theme
+        self.assertEqual([var], list(idx.variants(theme)))
+        self.assertEqual([var], list(idx.variants(theme, exact=False)))
+
+
+class TestSignatureIndex(MappaTestCase):
+
+    def test_occurrence(self):
+        idx = self._tm.index.signature
+        t = self.create_topic()
+        typ = self.create_topic()
+        o = t.create_occurrence(typ, 'Semagia')
+        self.assertEqual([], idx.duplicates())
+        o2 = t.create_occurrence(typ, 'Semagia')
+        self.assertEqual([(o, o2)], idx.duplicates())
+        o2.value = 'Mappa'
+        self.assertEqual([], idx.duplicates())
+        o.value = 'Mappa'
+        self.assertEqual([(o, o2)], idx.duplicates())
+        o.remove()
+        self.assertEqual([], idx.duplicates())
+
+    def test_occurrence_different_parents(self):
+        idx = self._tm.index.signature
+        typ = self.create_topic()
+        self.create_topic().create_occurrence(typ, 'Semagia')
+        self.create_topic().create_occurrence(typ, 'Semagia')
+        self.assertEqual([], idx.duplicates())
+
+    def test_association(self):
+        idx = self._tm.index.signature
+        typ = self.create_topic()
+        role_type = self.create_topic()
+        player = self.create_topic()
+        a = self.create_association(typ)
+        a.create_role(role_type, player)
+        a2 = self.create_association(typ)
+        self.assertEqual([], idx.duplicates())
+        role = a2.create_role(role_type, self.create_topic())
+        self.assertEqual([], idx.duplicates())
+        role.player = player
+        self.assertEqual([(a, a2)], idx.duplicates())
+        role.type = self.create_topic()
+        self.assertEqual([], idx.duplicates())
+
+    def test_variant(self):
+        idx = self._tm.index.signature
+        theme = self.create_topic()
+        name = self.create_name()
+        name2 = self.create_name()
+        v = name.create_variant('Semagia', [theme])
+        v2 = name.create_variant('Semagia', [self.create_topic()])
+        self.assertEqual([], idx.duplicates())
+        v2.scope = [theme]
+        self.assertEqual([(v, v2)], idx.duplicates())
+        name.remove_variant(v2)
+        name2.add_variant(v2)
+        self.assertEqual([], idx.duplicates())
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the ``Literal``.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from unittest import TestCase
+from mappa import XSD, Literal
+from mappa._internal import lit as litmod
+
+
+class TestLiteral(TestCase):
+
+    def test_normalization(self):
+        self.assertEqual((u'0.1', XSD.decimal), Literal('000.1', XSD.decimal))
+        self.assertEqual((u'1', XSD.integer), Literal(u'0001', XSD.integer))
+        self.assertEqual((u'http://www.semagia.com/', XSD.anyURI),
+                         Literal('HTTP://www.semagia.com', XSD.anyURI))
+        # The flyweight returns the normalized literal as well
+        self.assertEqual((u'0.1', XSD.decimal), Literal('000.1', XSD.decimal))
+
+    def test_flyweight(self):
+        lit = Literal(u'Semagia')
+        self.assertTrue(lit is Literal(u'Semagia'))
+        self.assertTrue(lit is Literal(u'Semagia', XSD.string))
+        self.assertTrue(lit is Literal.from_normalized(u'Semagia'))
+        self.assertTrue(Literal(u'1', XSD.integer) is not Literal(u'1', XSD.string))
+
+    def test_flyweight_max_length(self):
+        value = u'x' * (litmod._FLYWEIGHT_MAX_LENGTH + 1)
+        self.assertEqual(Literal(value), Literal(value))
+        self.assertFalse(Literal(value) is Literal(value))
+
+    def test_flyweight_max_size(self):
+        for i in range(litmod._FLYWEIGHT_MAX_SIZE + 1):
+            Literal(u'%d' % i, XSD.integer)
+        self.assertTrue(len(litmod._FLYWEIGHTS) <= litmod._FLYWEIGHT_MAX_SIZE)
+
+    def test_interned_datatype(self):
+        self.assertTrue(XSD.string is Literal('a', 'http://www.w3.org/2001/XMLSchema#string').datatype)
+        datatype = 'http://psi.example.org/datatype'
+        self.assertTrue(Literal('a', datatype).datatype is Literal('b', datatype).datatype)
+
+    def test_from_normalized(self):
+        # The value is not normalized again
+        lit = Literal.from_normalized(u'0001', XSD.integer)
+        self.assertEqual((u'0001', XSD.integer), lit)
+        lit = Literal.from_normalized('Semagia')
+        self.assertEqual((u'Semagia', XSD.string), lit)
+        self.assertTrue(isinstance(lit.value, unicode))
+
+    def test_from_normalized_illegal(self):
+        self.assertRaises(TypeError, Literal.from_normalized, None)
+        self.assertRaises(TypeError, Literal.from_normalized, 1, XSD.integer)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -791,6 +791,53 @@ class TestMappaHandler(MappaTestCase):
         for iid in iids:
             self.assert_(self._tm.topic(iid=iid))
 
+    def test_merge(self):
+        sid = 'http://psi.example.org/a'
+        sid2 = 'http://psi.example.org/b'
+        iid = 'http://www.semagia.com/something#x'
+        mio_handler = MappaMapHandler(self._tm)
+        handler = simplify(mio_handler)
+        handler.startTopicMap()
+        handler.startTopic((mio.SUBJECT_IDENTIFIER, sid))
+        handler.name('Semagia')
+        handler.endTopic()
+        handler.startTopic((mio.SUBJECT_IDENTIFIER, sid2))
+        handler.name('Semagia')
+        handler.occurrence((mio.SUBJECT_IDENTIFIER, sid2), 'Mappa')
+        handler.endTopic()
+        handler.startTopic((mio.ITEM_IDENTIFIER, iid))
+        handler.subjectIdentifier(sid)
+        handler.subjectIdentifier(sid2)
+        handler.endTopic()
+        handler.endTopicMap()
+        self.assertEqual(2, mio_handler.merger.merges)
+        topic = self._tm.topic(sid=sid)
+        self.assertEqual(topic, self._tm.topic(sid=sid2))
+        self.assertEqual(topic, self._tm.topic(iid=iid))
+        self.assertEqual(1, len_(topic.names))
+        self.assertEqual(1, len_(topic.occurrences))
+        self.assertEqual(topic, tuple(topic.occurrences)[0].type)
+
+    def test_merge_reifier(self):
+        # The reified statements become equal after ex:t1 and ex:t2 are merged
+        self._conn.loads("""\
+%prefix ex <http://www.example.org/>
+
+ex:a ex:t1: "Semagia" ~ ex:reifier.
+
+ex:t2 ^<http://www.example.org/t1>.
+
+ex:a ex:t2: "Semagia" ~ ex:reifier.
+""", into=self.base, format='ctm')
+        tm = self._tm
+        topic = tm.topic(sid='http://www.example.org/a')
+        typ = tm.topic(sid='http://www.example.org/t1')
+        self.assertEqual(typ, tm.topic(sid='http://www.example.org/t2'))
+        self.assertEqual(1, len_(topic.occurrences))
+        occ = tuple(topic.occurrences)[0]
+        self.assertEqual(typ, occ.type)
+        self.assertEqual(tm.topic(sid='http://www.example.org/reifier'), occ.reifier)
+
 
 if __name__ == '__main__':
     import nose
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the ``mappa._internal.shards`` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from nose.tools import eq_
+from mappa._internal.shards import shard_ranges, map_shards
+
+
+def test_shard_ranges():
+    eq_([(0, 4), (4, 7), (7, 10)], shard_ranges(10, 3))
+    eq_([(0, 1), (1, 2)], shard_ranges(2, 5))
+    eq_([(0, 10)], shard_ranges(10, 1))
+    eq_([], shard_ranges(0, 4))
+
+
+def test_map_shards():
+    data = range(100)
+    def func(start, stop):
+        return sum(data[start:stop])
+    args = shard_ranges(len(data), 7)
+    expected = [func(*arg) for arg in args]
+    eq_(expected, list(map_shards(func, args, 1)))
+    eq_(expected, list(map_shards(func, args, 3)))
+
+
+def test_map_shards_threads():
+    import threading
+    data = range(100)
+    args = shard_ranges(len(data), 4)
+    results = {}
+    def run(factor):
+        def func(start, stop):
+            return sum(data[start:stop]) * factor
+        results[factor] = list(map_shards(func, args, 2))
+    threads = [threading.Thread(target=run, args=(factor,)) for factor in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for factor in (1, 2, 3):
+        eq_([sum(data[start:stop]) * factor for start, stop in args], results[factor])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
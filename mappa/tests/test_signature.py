@@ -12,6 +12,8 @@ Signature tests.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
+from mappa.backend.events import SetType, SetScope, SetValue, SetPlayer, \
+        AddRole, RemoveRole
 from . mappa_test import MappaTestCase
 
 class TestSignature(MappaTestCase):
@@ -94,6 +96,83 @@ class TestSignature(MappaTestCase):
         v.value = 'Another value'
         self.assertNotEqual(v.__sig__(), v2.__sig__())
 
+    def test_role_change_association_signature(self):
+        typ = self.create_topic()
+        role_type = self.create_topic()
+        role_player = self.create_topic()
+        a = self.create_association(typ)
+        a2 = self.create_association(typ)
+        role = a.create_role(role_type, role_player)
+        a2.create_role(role_type, role_player)
+        self.assertEqual(a.__sig__(), a2.__sig__())
+        role.player = self.create_topic()
+        self.assertNotEqual(a.__sig__(), a2.__sig__())
+        role.player = role_player
+        self.assertEqual(a.__sig__(), a2.__sig__())
+        role.type = self.create_topic()
+        self.assertNotEqual(a.__sig__(), a2.__sig__())
+        role.remove()
+        self.assertNotEqual(a.__sig__(), a2.__sig__())
+        self.assertEqual((), a.__sig__()[1])
+
+    def test_name_scope_variant_signature(self):
+        t = self.create_topic()
+        n = t.create_name(value='Semagia', type=self.create_topic())
+        n2 = t.create_name(value='Semagia', type=n.type)
+        scope = [self.create_topic()]
+        v = n.create_variant(value='Semagia', scope=scope)
+        v2 = n2.create_variant(value='Semagia', scope=scope)
+        self.assertEqual(v.__sig__(), v2.__sig__())
+        n.scope = [self.create_topic()]
+        self.assertNotEqual(v.__sig__(), v2.__sig__())
+        n.scope = ()
+        self.assertEqual(v.__sig__(), v2.__sig__())
+
+    def test_signature_read_during_event(self):
+        # An event handler which reads the signature must not cache a stale
+        # signature since the events are fired before the change is applied
+        tm = self._tm
+        def read_signature(evt):
+            evt.source.__sig__()
+        for event_type in (SetType, SetScope, SetValue, SetPlayer, AddRole, RemoveRole):
+            tm.subscribe(event_type, read_signature)
+        typ = self.create_topic()
+        t = self.create_topic()
+        a = self.create_association(typ)
+        a2 = self.create_association(typ)
+        role = a.create_role(typ, t)
+        self.assertNotEqual(a.__sig__(), a2.__sig__())
+        role2 = a2.create_role(typ, t)
+        self.assertEqual(a.__sig__(), a2.__sig__())
+        role.player = typ
+        self.assertNotEqual(role.__sig__(), role2.__sig__())
+        role2.player = typ
+        self.assertEqual(role.__sig__(), role2.__sig__())
+        role.type = t
+        self.assertNotEqual(role.__sig__(), role2.__sig__())
+        a.scope = [t]
+        self.assertNotEqual(a.__sig__(), a2.__sig__())
+        a2.scope = [t]
+        role2.type = t
+        self.assertEqual(a.__sig__(), a2.__sig__())
+        role.remove()
+        self.assertEqual((), a.__sig__()[1])
+        occ = t.create_occurrence(typ, 'Semagia')
+        occ2 = t.create_occurrence(typ, 'Semagia')
+        occ.value = 'Mappa'
+        self.assertNotEqual(occ.__sig__(), occ2.__sig__())
+        occ2.value = 'Mappa'
+        self.assertEqual(occ.__sig__(), occ2.__sig__())
+        n = t.create_name(value='Semagia', type=typ)
+        n2 = t.create_name(value='Semagia', type=typ)
+        n.value = 'Mappa'
+        self.assertNotEqual(n.__sig__(), n2.__sig__())
+        n.type = t
+        n2.value = 'Mappa'
+        self.assertNotEqual(n.__sig__(), n2.__sig__())
+        n2.type = t
+        self.assertEqual(n.__sig__(), n2.__sig__())
+
 
 if __name__ == '__main__':
     import nose
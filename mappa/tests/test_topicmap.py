@@ -12,6 +12,7 @@ Tests against the topic map impl.
 :organization: Semagia - <http://www.semagia.com/>
 :license:      BSD License
 """
+from mappa import IdentityViolation, TMDM
 from . mappa_test import MappaTestCase, len_
 
 class TestTopicMap(MappaTestCase):
@@ -171,6 +172,120 @@ class TestTopicMap(MappaTestCase):
         _construct_by_id(self._tm)
         _construct_by_iid(self._tm)
 
+    def test_bulk_load(self):
+        tm = self._tm
+        idx = tm.index.type_instance
+        with tm.bulk_load():
+            t = self.create_topic()
+            typ = self.create_topic()
+            occ = t.create_occurrence(typ, 'Semagia')
+            a = self.create_association(typ)
+            a.create_role(typ, t)
+            self.assertEqual(t, tm.construct(id=t.id))
+        self.assertEqual([occ], list(idx.occurrences(typ)))
+        self.assertEqual([a], list(idx.associations(typ)))
+        self.assertEqual(1, len_(idx.roles(typ)))
+        self.assertEqual([occ], list(tm.index.literal.occurrences('Semagia')))
+
+    def test_bulk_load_identity_violation(self):
+        loc = 'http://www.semagia.com/mymap#test'
+        with self._tm.bulk_load():
+            t = self.create_topic(sid=loc)
+            t2 = self.create_topic()
+            try:
+                t2.add_sid(loc)
+                self.fail('Expected an identity violation')
+            except IdentityViolation:
+                pass
+        self.assertEqual(t, self.topic_by_sid(loc))
+
+    def test_bulk_load_index_access(self):
+        tm = self._tm
+        with tm.bulk_load():
+            typ = self.create_topic()
+            a = self.create_association(typ)
+            # The type-instance index is maintained during the bulk load
+            self.assertEqual([a], list(tm.index.type_instance.associations(typ)))
+            a2 = self.create_association(typ)
+            self.assertEqual(2, len_(tm.index.type_instance.associations(typ)))
+            self.assertTrue(getattr(tm, '_bulk_loading', True))
+            # Accessing the statistics index ends the bulk load mode
+            self.assertEqual(2, tm.index.statistics.association_count())
+            self.assertFalse(getattr(tm, '_bulk_loading', False))
+        self.assertEqual(2, len_(tm.index.type_instance.associations(typ)))
+
+    def test_constructs_by_id(self):
+        tm = self._tm
+        if not hasattr(tm, 'constructs_by_id'):
+            return
+        t1 = self.create_topic()
+        t2 = self.create_topic()
+        t3 = self.create_topic()
+        typ = self.create_topic()
+        a = self.create_association(typ)
+        role = a.create_role(typ, t3)
+        removed = self.create_topic()
+        removed_id, t3_id = removed.id, t3.id
+        removed.remove()
+        t1.merge(t3)
+        constructs = list(tm.constructs_by_id())
+        ids = [tmc.id for tmc in constructs]
+        self.assertEqual(sorted(set(ids)), ids)
+        self.assertFalse(removed_id in ids)
+        self.assertFalse(t3_id in ids)
+        created = [tmc for tmc in constructs if tmc in (t1, t2, typ, a, role)]
+        self.assertEqual([t1, t2, typ, a, role], created)
+        self.assertEqual(t1, role.player)
+
+    def test_bulk_load_merge(self):
+        tm = self._tm
+        sid = 'http://www.semagia.com/mymap#merge'
+        iid = 'http://www.semagia.com/mymap#iid'
+        with tm.bulk_load():
+            typ = self.create_topic(sid=sid)
+            other_type = self.create_topic(iid=iid)
+            t = self.create_topic()
+            t.add_type(other_type)
+            occ = t.create_occurrence(typ, 'Semagia')
+            occ2 = t.create_occurrence(other_type, 'Semagia')
+            a = self.create_association(other_type)
+            a.create_role(typ, t)
+            # Merges the topics, the occurrences become duplicates
+            other_type.merge(typ)
+            self.assertTrue(getattr(tm, '_bulk_loading', True))
+            merged = self.topic_by_sid(sid)
+            self.assertEqual(merged, tm.topic(iid=iid))
+            self.assertEqual(2, len_(t.occurrences))
+            self.assertEqual([merged], list(t.types))
+            self.assertEqual([a], list(tm.index.type_instance.associations(merged)))
+            self.assertTrue(getattr(tm, '_bulk_loading', True))
+        idx = tm.index
+        self.assertEqual(2, len_(idx.type_instance.occurrences(merged)))
+        self.assertEqual(2, len_(idx.literal.occurrences('Semagia')))
+        self.assertEqual(2, idx.statistics.occurrence_count())
+        self.assertEqual(1, len_(idx.signature.duplicates()))
+
+    def test_types_core_topic_sid_removed(self):
+        t = self.create_topic()
+        typ = self.create_topic()
+        t.add_type(typ)
+        self.assertEqual([typ], list(t.types))
+        type_instance = self._tm.topic(sid=TMDM.type_instance)
+        type_instance.remove_sid(TMDM.type_instance)
+        self.assertEqual([], list(t.types))
+        type_instance.add_sid(TMDM.type_instance)
+        self.assertEqual([typ], list(t.types))
+
+    def test_types_core_topic_merged(self):
+        t = self.create_topic()
+        typ = self.create_topic()
+        t.add_type(typ)
+        tmdm_type = self._tm.topic(sid=TMDM.type)
+        other = self.create_topic()
+        other.merge(tmdm_type)
+        self.assertEqual(other, self._tm.topic(sid=TMDM.type))
+        self.assertEqual([typ], list(t.types))
+
 
 if __name__ == '__main__':
     import nose
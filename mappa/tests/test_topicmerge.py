@@ -130,6 +130,37 @@ class TestTopicMerge(MappaTestCase):
         self.assertEqual(t, n.type)
         self.assertTrue(t in n.scope)
 
+    def test_stale_reference(self):
+        t = self.create_topic()
+        t2 = self.create_topic()
+        sid = self.random_locator()
+        t2.add_sid(sid)
+        t.merge(t2)
+        self.assertEqual(t, t2)
+        self.assertTrue(sid in t2.sids)
+        sid2 = self.random_locator()
+        t2.add_sid(sid2)
+        self.assertTrue(sid2 in t.sids)
+        self.assertEqual(1, len_(self._tm.topics))
+
+    def test_stale_duplicate_occurrence(self):
+        t = self.create_topic()
+        t2 = self.create_topic()
+        occ = t.create_occurrence(t, 'Semagia')
+        occ2 = t2.create_occurrence(t, 'Semagia')
+        t.merge(t2)
+        self.assertEqual(1, len_(t.occurrences))
+        self.assertEqual(occ, occ2)
+        self.assertEqual(t, occ2.parent)
+
+    def test_construct_ids_per_map(self):
+        t = self.create_topic()
+        tm = self.create_map()
+        t2 = self.create_topic(tm)
+        self.assertNotEqual(t, t2)
+        self.assertEqual(t, self._tm.construct_by_id(t.id))
+        self.assertEqual(t2, tm.construct_by_id(t2.id))
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
@@ -393,10 +393,48 @@ class TestUtils(MappaTestCase):
         self.assertFalse(isa(assoc, supersuper))
         
     def test_supertypes_of(self):
-        pass
+        t = self.create_topic()
+        super = self.create_topic()
+        supersuper = self.create_topic()
+        self.assertEqual(0, len_(supertypes(t)))
+        self.make_iko(t, super)
+        self.assertEqual(set([super]), set(supertypes(t)))
+        self.make_iko(super, supersuper)
+        self.assertEqual(set([super, supersuper]), set(supertypes(t)))
+        self.assertTrue(iko(t, supersuper))
+        self.assertFalse(iko(supersuper, t))
+        t.remove_supertype(super)
+        self.assertEqual(0, len_(supertypes(t)))
+        self.assertFalse(iko(t, supersuper))
     
     def test_subtypes_of(self):
-        pass
+        t = self.create_topic()
+        sub = self.create_topic()
+        subsub = self.create_topic()
+        self.make_iko(sub, t)
+        self.make_iko(subsub, sub)
+        self.assertEqual(set([sub, subsub]), set(subtypes(t)))
+        self.assertEqual(set([subsub]), set(subtypes(sub)))
+        self.assertEqual(0, len_(subtypes(subsub)))
+
+    def test_supertypes_cycle(self):
+        t = self.create_topic()
+        t2 = self.create_topic()
+        self.make_iko(t, t2)
+        self.make_iko(t2, t)
+        self.assertEqual(set([t, t2]), set(supertypes(t)))
+        self.assertTrue(iko(t, t))
+
+    def test_isa_player_change(self):
+        t = self.create_topic()
+        type = self.create_topic()
+        t.add_type(type)
+        self.assertTrue(isa(t, type))
+        role = tuple(t.roles_played)[0]
+        t2 = self.create_topic()
+        role.player = t2
+        self.assertFalse(isa(t, type))
+        self.assertTrue(isa(t2, type))
         
 if __name__ == '__main__':
     import nose
@@ -13,7 +13,6 @@ Compact Topic Maps Syntax (CTM) 1.0.
 :license:      BSD license
 """
 import re
-import io
 import codecs
 from urllib import urlopen
 from tm.mio import MIOException
@@ -44,8 +43,36 @@ def _make_lexer():
     return plyutils.make_lexer(lexer_mod)
 
 
+def _tokenizer(lexer, segments):
+    """\
+    Returns a function which returns the tokens of the provided ``segments``
+    one after another (``None`` if all segments have been consumed).
+
+    `lexer`
+        The lexer which is fed with the segments.
+    `segments`
+        An iterable of (unicode) strings, each one tokenizable on its own,
+        see `lexer.segments`.
+    """
+    segments = iter(segments)
+    lexer.input(u'')
+    def token():
+        tok = lexer.token()
+        while tok is None:
+            segment = next(segments, None)
+            if segment is None:
+                return None
+            lexer.input(segment)
+            tok = lexer.token()
+        return tok
+    return token
+
+
 _ENCODING = re.compile(ur'^%encoding\s*"([^"]+)"').match
 
+# Number of bytes which are read at once
+_CHUNK_SIZE = 64 * 1024
+
 
 class CTMDeserializer(Deserializer):
     """\
@@ -72,11 +99,9 @@ class CTMDeserializer(Deserializer):
         """\
         
         """
-        parser = _make_parser()
         env = Environment(handler=self.handler, iri=source.iri,
                           subordinate=self.subordinate, included_by=self._included_by,
                           context=self.context, wildcard_counter=self._wildcard_counter)
-        parser.content_handler = MainContentHandler(env)
         self.environment = env
         data = source.stream
         if not data:
@@ -84,13 +109,22 @@ class CTMDeserializer(Deserializer):
                 data = urlopen(source.iri)
             except IOError:
                 raise MIOException('Cannot read from "%s"' % source.iri)
-        parser.parse(self._reader(data, source.encoding), lexer=_make_lexer())
+        segments = lexer_mod.segments(self._reader(data, source.encoding))
+        with plyutils.pooled_parser(parser_mod) as parser:
+            with plyutils.pooled_lexer(lexer_mod) as lexer:
+                parser.content_handler = MainContentHandler(env)
+                parser.parse(lexer=lexer, tokenfunc=_tokenizer(lexer, segments))
         self.wildcard_counter = self.environment.wildcard_counter
 
     def _reader(self, fileobj, encoding=None):
+        """\
+        Returns an iterator over the decoded content of ``fileobj``.
+
+        The content is read in chunks of ``_CHUNK_SIZE`` bytes.
+        """
         found_bom = False
         encoding = encoding or 'utf-8'
-        line = fileobj.readline()
+        line = fileobj.readline(_CHUNK_SIZE)
         if line.startswith(codecs.BOM_UTF8):
             found_bom = True
             encoding = 'utf-8'
@@ -100,4 +134,11 @@ class CTMDeserializer(Deserializer):
             encoding = m.group(1)
             if found_bom and encoding.lower() != 'utf-8':
                 raise MIOException('Found BOM, but encoding directive declares "%s"' % encoding)
-        return codecs.getreader(encoding)(io.BytesIO(''.join([line, fileobj.read()]))).read()
+        decoder = codecs.getincrementaldecoder(encoding)()
+        yield decoder.decode(line)
+        while True:
+            data = fileobj.read(_CHUNK_SIZE)
+            if not data:
+                break
+            yield decoder.decode(data)
+        yield decoder.decode('', True)
@@ -12,6 +12,7 @@ Compact Topic Maps (CTM) lexer.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import re
 import sys
 from tm.ply import TOKEN
 from tm.mio import MIOException
@@ -197,7 +198,7 @@ def t_INTEGER(t):
 
 
 def t_triple_string(t):
-    ur'"{3}([^"\\]|(\\[\\"rntuU])|"|"")*"{3}'
+    ur'"{3}(("|"")?([^"\\]|(\\[\\"rntuU])))*"{3}'
     t.value = t.value[3:-3]
     t.type = 'STRING'
     t.lexer.lineno += t.value.count('\n')
@@ -209,3 +210,131 @@ def t_STRING(t):
     t.value = t.value[1:-1]
     t.lexer.lineno += t.value.count('\n')
     return t
+
+
+_TOPLEVEL_SPECIAL = re.compile(ur'"|#|<|://').search
+_STRING_BODY = re.compile(ur'([^"\\]|\\[\s\S])*').match
+_LINE_END = re.compile(ur'[\r\n]').search
+_COMMENT_DELIMITER = re.compile(ur'#\(|\)#').search
+_IRI_END = re.compile(ur'[<>"{}`\\ ]').search
+# Characters which end an unbracketed IRI (see ``t_IRI``)
+_PLAIN_IRI_END = re.compile(ur'[\s\(\]]').search
+
+# Whitespace as recognized by ``t_ws``
+_WS = u' \t\n\r\f\v'
+
+_TOPLEVEL, _STRING, _TRIPLE_STRING, _COMMENT, _MLCOMMENT, _IRI, _PLAIN_IRI = range(7)
+
+
+def segments(chunks):
+    """\
+    Returns an iterator over (unicode) segments of the provided (unicode)
+    ``chunks`` which can be tokenized independently of each other.
+
+    A segment ends with whitespace outside of strings, comments and IRIs,
+    so no token spans two segments. Only the data which belongs to the
+    current segment is held in memory.
+    """
+    buf = u''
+    state, pos, level = _TOPLEVEL, 0, 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf += chunk
+        cut, state, pos, level = _scan(buf, state, pos, level)
+        if cut:
+            yield buf[:cut]
+            buf = buf[cut:]
+            pos -= cut
+    if buf:
+        yield buf
+
+
+def _scan(buf, state, pos, level):
+    """\
+    Scans ``buf`` starting at ``pos`` and returns a tuple
+    ``(cut, state, pos, level)`` where ``cut`` is the position after the
+    last whitespace character which is not part of a string, comment or
+    IRI (or ``0`` if there is no such position), ``state`` and ``pos`` the
+    state and position where scanning should be resumed if more data is
+    available and ``level`` the nesting level of multi-line comments.
+    """
+    cut = 0
+    end = len(buf)
+    while pos < end:
+        if state == _TOPLEVEL:
+            m = _TOPLEVEL_SPECIAL(buf, pos)
+            stop = m.start() if m else end
+            for i in xrange(stop - 1, pos - 1, -1):
+                if buf[i] in _WS:
+                    cut = i + 1
+                    break
+            if not m:
+                # Keep a trailing ":" or ":/", it may start an unbracketed IRI
+                colon = buf.rfind(u':', end - 2)
+                pos = max(pos, colon) if colon != -1 else end
+                break
+            c = m.group()
+            if c == u'"':
+                if end - stop < 3:
+                    pos = stop
+                    break
+                if buf[stop:stop+3] == u'"""':
+                    state, pos = _TRIPLE_STRING, stop + 3
+                else:
+                    state, pos = _STRING, stop + 1
+            elif c == u'#':
+                if end - stop < 2:
+                    pos = stop
+                    break
+                if buf[stop+1] == u'(':
+                    state, pos, level = _MLCOMMENT, stop + 2, 1
+                else:
+                    state, pos = _COMMENT, stop + 1
+            elif c == u'<':
+                state, pos = _IRI, stop + 1
+            else:
+                # An unbracketed IRI may contain "#" and '"'
+                state, pos = _PLAIN_IRI, stop + 3
+        elif state in (_STRING, _TRIPLE_STRING):
+            pos = _STRING_BODY(buf, pos).end()
+            if pos == end or buf[pos] != u'"':
+                # End of data or an incomplete escape sequence
+                break
+            if state == _STRING:
+                state, pos = _TOPLEVEL, pos + 1
+            elif end - pos < 3:
+                break
+            elif buf[pos:pos+3] == u'"""':
+                state, pos = _TOPLEVEL, pos + 3
+            else:
+                pos += 1
+        elif state == _COMMENT:
+            m = _LINE_END(buf, pos)
+            if not m:
+                pos = end
+                break
+            state, pos = _TOPLEVEL, m.start()
+        elif state == _MLCOMMENT:
+            m = _COMMENT_DELIMITER(buf, pos)
+            if not m:
+                # Keep the last character, it may start a delimiter
+                pos = max(pos, end - 1)
+                break
+            pos = m.end()
+            level += 1 if m.group() == u'#(' else -1
+            if not level:
+                state = _TOPLEVEL
+        elif state == _IRI:
+            m = _IRI_END(buf, pos)
+            if not m:
+                pos = end
+                break
+            state, pos = _TOPLEVEL, m.end() if m.group() == u'>' else m.start()
+        else: # _PLAIN_IRI
+            m = _PLAIN_IRI_END(buf, pos)
+            if not m:
+                pos = end
+                break
+            state, pos = _TOPLEVEL, m.start()
+    return cut, state, pos, level
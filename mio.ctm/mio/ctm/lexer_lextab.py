@@ -0,0 +1,9 @@
+# mio.ctm.lexer_lextab.py. This file automatically created by PLY (version 3.4). Don't edit!
+_tabversion   = '3.4'
+_lextokens    = {'DIR_MERGEMAP': 1, 'STAR': 1, 'HYPHEN': 1, 'QNAME': 1, 'CIRCUMFLEX': 1, 'KW_DEF': 1, 'DOUBLE_CIRCUMFLEX': 1, 'DATE': 1, 'DOT': 1, 'STRING': 1, 'DATE_TIME': 1, 'RPAREN': 1, 'SEMI': 1, 'TILDE': 1, 'KW_AKO': 1, 'COLON': 1, 'DIR_VERSION': 1, 'COMMA': 1, 'NAMED_WILDCARD': 1, 'DIR_ENCODING': 1, 'KW_ISA': 1, 'DECIMAL': 1, 'IDENT': 1, 'DIR_PREFIX': 1, 'KW_END': 1, 'RBRACK': 1, 'DIR_INCLUDE': 1, 'IRI': 1, 'AT': 1, 'LPAREN': 1, 'INTEGER': 1, 'VARIABLE': 1, 'EQ': 1, 'LBRACK': 1, 'WILDCARD': 1}
+_lexreflags   = 0
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'mlcomment': 'exclusive'}
+_lexstatere   = {'INITIAL': [(u'(?P<t_mlcomment>\\#\\()|(?P<t_comment>\\#[^\\r\\n]*)|(?P<t_ws>\\s+)|(?P<t_IRI>[a-zA-Z]+[a-zA-Z0-9\\+\\-\\.]*://([;\\.\\)]*[^\\s;\\]\\.\\(\\)]+)+)|(?P<t_iri2><[^<>"\\{\\}\\`\\ ]+>)|(?P<t_directive>%[a-z]+)|(?P<t_QNAME>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*:(([0-9]+([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040])*)|([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_IDENT>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*)|(?P<t_VARIABLE>(\\$([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_NAMED_WILDCARD>\\?([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*)|(?P<t_DATE_TIME>\\-?(000[1-9]|00[1-9][0-9]|0[1-9][0-9][0-9]|[1-9][0-9][0-9][0-9]+)\\-(0[1-9]|1[0-2])\\-(0[1-9]|1[0-9]|2[0-9]|3[0-1])T[0-9]{2}:[0-9]{2}:[0-9]{2}(\\.[0-9]+)?(Z|((\\+|\\-)[0-9]{2}:[0-9]{2}))?)|(?P<t_DATE>\\-?(000[1-9]|00[1-9][0-9]|0[1-9][0-9][0-9]|[1-9][0-9][0-9][0-9]+)\\-(0[1-9]|1[0-2])\\-(0[1-9]|1[0-9]|2[0-9]|3[0-1]))|(?P<t_DECIMAL>(\\-|\\+)?([0-9]+\\.[0-9]+|\\.([0-9])+))|(?P<t_INTEGER>(\\-|\\+)?[0-9]+)|(?P<t_triple_string>"{3}(("|"")?([^"\\\\]|(\\\\[\\\\"rntuU])))*"{3})|(?P<t_STRING>"([^"\\\\]|(\\\\[\\\\"rntuU]))*")|(?P<t_DOUBLE_CIRCUMFLEX>\\^\\^)|(?P<t_LBRACK>\\[)|(?P<t_DOT>\\.)|(?P<t_WILDCARD>\\?)|(?P<t_STAR>\\*)|(?P<t_CIRCUMFLEX>\\^)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_RBRACK>\\])|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_AT>@)|(?P<t_EQ>=)|(?P<t_SEMI>;)|(?P<t_HYPHEN>-)|(?P<t_TILDE>~)', [None, (u't_mlcomment', 'mlcomment'), (u't_comment', 'comment'), (u't_ws', 'ws'), (u't_IRI', 'IRI'), None, (u't_iri2', 'iri2'), (u't_directive', 'directive'), (u't_QNAME', 'QNAME'), None, None, None, None, None, None, None, None, None, (u't_IDENT', 'IDENT'), None, None, None, (u't_VARIABLE', 'VARIABLE'), None, None, None, None, (u't_NAMED_WILDCARD', 'NAMED_WILDCARD'), None, None, None, (u't_DATE_TIME', 'DATE_TIME'), None, None, None, None, None, None, None, (u't_DATE', 'DATE'), None, None, None, (u't_DECIMAL', 'DECIMAL'), None, None, None, (u't_INTEGER', 'INTEGER'), None, (u't_triple_string', 'triple_string'), None, None, None, None, (u't_STRING', 'STRING'), None, None, (None, 'DOUBLE_CIRCUMFLEX'), (None, 'LBRACK'), (None, 'DOT'), (None, 'WILDCARD'), (None, 'STAR'), (None, 'CIRCUMFLEX'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'RBRACK'), (None, 'COLON'), (None, 'COMMA'), (None, 'AT'), (None, 'EQ'), (None, 'SEMI'), (None, 'HYPHEN'), (None, 'TILDE')])], 'mlcomment': [(u'(?P<t_mlcomment_content>[^#\\(\\)]+)|(?P<t_mlcomment_start>\\#\\()|(?P<t_mlcomment_end>\\)\\#)|(?P<t_mlcomment_content2>\\#|\\(|\\))', [None, (u't_mlcomment_content', 'content'), (u't_mlcomment_start', 'start'), (u't_mlcomment_end', 'end'), (u't_mlcomment_content2', 'content2')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'mlcomment': 't_mlcomment_error'}
@@ -0,0 +1,176 @@
+
+# /root/package/mio.ctm/mio/ctm/parser_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\xe1\x1f&\xb6\xb0\xf0\x9d^\xef\xe0v=\xe9\x0cx\xa3'
+    
+_lr_action_items = {'DIR_MERGEMAP':([0,2,5,6,7,8,9,12,13,14,15,17,20,21,25,26,28,31,32,36,41,43,48,52,53,60,63,69,75,78,79,80,81,82,83,84,85,86,87,88,89,94,95,96,97,98,102,104,106,109,128,132,138,139,140,148,152,166,176,178,189,190,191,192,196,207,208,211,213,215,],[-5,-7,-8,10,-26,-58,-6,-23,-79,-14,10,-63,-19,-9,10,-24,-85,-80,-25,-16,-21,-11,-125,-12,10,-69,-70,-71,-68,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,-61,-82,-81,-83,-84,-28,-60,-126,-13,-132,-133,-86,-27,-59,-46,-87,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'STAR':([90,93,150,160,186,201,],[121,121,121,121,-102,121,]),'HYPHEN':([13,18,23,24,27,28,29,31,33,37,39,40,42,44,95,96,97,98,118,],[-79,56,-72,-78,-62,-85,-77,-80,-76,-88,-75,-74,56,-73,-82,-81,-83,-84,56,]),'QNAME':([0,2,5,6,7,8,9,10,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,150,152,157,159,160,162,165,166,167,175,176,177,178,186,189,190,191,192,196,199,201,203,207,208,211,213,215,],[-5,-7,-8,13,-26,-58,-6,13,13,-23,-79,-14,13,-63,13,-19,-9,13,-72,-78,13,-24,-62,-85,-77,-80,-25,-76,13,13,-16,-88,13,-75,-74,-21,13,-11,-73,13,-49,-125,-50,-51,13,-12,13,13,13,-69,13,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,13,13,13,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,13,13,-132,-133,-86,-27,-59,-112,-46,13,-87,13,13,13,-127,13,-115,13,13,-45,13,-134,-102,-116,-47,-113,-111,-114,13,13,13,-103,-45,-48,-114,-104,]),'CIRCUMFLEX':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,38,-26,-58,-6,38,-23,-79,-14,38,-63,38,-19,-9,38,-72,-78,38,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,38,-11,-73,-49,-125,-50,-51,38,-12,38,38,38,-69,38,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,38,38,38,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,38,38,-132,-133,-86,-27,-59,-112,-46,-87,38,38,-127,38,-115,38,38,-45,38,-134,-116,-47,-113,-111,-114,38,38,-103,-45,-48,-114,-104,]),'KW_DEF':([0,2,5,6,7,8,9,12,13,14,15,17,20,21,25,26,28,31,32,36,41,43,48,52,53,60,63,69,75,78,79,80,81,82,83,84,85,86,87,88,89,94,95,96,97,98,102,104,106,109,128,132,138,139,140,148,152,166,176,178,189,190,191,192,196,207,208,211,213,215,],[-5,-7,-8,16,-26,-58,-6,-23,-79,-14,16,-63,-19,-9,16,-24,-85,-80,-25,-16,-21,-11,-125,-12,16,-69,-70,-71,-68,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,-61,-82,-81,-83,-84,-28,-60,-126,-13,-132,-133,-86,-27,-59,-46,-87,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'DOUBLE_CIRCUMFLEX':([130,],[157,]),'DATE':([90,93,150,160,186,201,],[124,124,124,124,-102,124,]),'DOT':([13,17,23,24,27,28,29,31,33,39,40,42,44,55,57,58,60,62,63,65,67,68,69,70,71,73,74,75,76,79,80,81,82,84,95,96,97,98,99,100,101,112,113,115,116,118,121,124,126,127,128,129,130,131,132,144,145,146,148,151,152,163,164,166,168,169,170,171,172,173,174,178,179,184,185,187,188,189,190,191,192,193,194,200,202,204,205,211,212,217,],[-79,-63,-72,-78,-62,-85,-77,-80,-76,-75,-74,-55,-73,-32,-118,-96,-69,-29,-70,-120,-117,-34,-71,-31,-33,-119,-36,-68,-35,-67,-65,-62,-64,-66,-82,-81,-83,-84,138,-56,-55,-98,-45,-90,-89,-56,-143,-144,-138,-145,-132,-142,-137,-141,-133,-45,-137,-114,-46,-30,-87,-114,-37,-115,-99,-45,-100,-146,-45,-139,-147,-134,-140,-37,-94,-38,-39,-116,-47,-113,-111,-114,-114,-95,-40,-37,-91,-48,-93,-101,]),'DATE_TIME':([90,93,150,160,186,201,],[127,127,127,127,-102,127,]),'RPAREN':([13,17,28,30,31,60,63,64,69,75,79,80,81,82,84,90,91,95,96,97,98,110,121,122,123,124,125,126,127,129,130,131,133,134,135,136,137,141,142,143,152,154,155,156,158,166,179,180,181,182,183,189,190,191,192,195,197,198,206,209,211,214,216,],[-79,-63,-85,-135,-80,-69,-70,-135,-71,-68,-67,-65,-62,-64,-66,128,132,-82,-81,-83,-84,-128,-143,-107,-135,-144,-67,-138,-145,-142,-137,-141,-109,-124,-121,-136,-123,-129,-130,162,-87,-43,176,178,-106,-115,-140,-41,-110,-122,-131,-116,-47,-113,-111,-109,-44,208,-108,-42,-48,-114,217,]),'SEMI':([13,17,23,24,27,28,29,31,33,39,40,42,44,55,57,58,60,62,63,65,67,68,69,70,71,72,73,74,75,76,79,80,81,82,84,95,96,97,98,101,112,113,115,116,121,124,126,127,128,129,130,131,132,144,145,146,148,151,152,163,164,166,168,169,170,171,172,173,174,178,179,184,185,187,188,189,190,191,192,193,194,200,202,204,205,211,212,217,],[-79,-63,-72,-78,-62,-85,-77,-80,-76,-75,-74,100,-73,-32,-118,-96,-69,-29,-70,-120,-117,-34,-71,-31,-33,118,-119,-36,-68,-35,-67,-65,-62,-64,-66,-82,-81,-83,-84,118,-98,-45,-90,-89,-143,-144,-138,-145,-132,-142,-137,-141,-133,-45,-137,-114,-46,-30,-87,-114,-37,-115,-99,-45,-100,-146,-45,-139,-147,-134,-140,-37,-94,-38,-39,-116,-47,-113,-111,-114,-114,-95,-40,-37,-91,-48,-93,-101,]),'KW_AKO':([13,18,23,24,27,28,29,31,33,37,39,40,42,44,95,96,97,98,118,],[-79,59,-72,-78,-62,-85,-77,-80,-76,-88,-75,-74,59,-73,-82,-81,-83,-84,59,]),'COMMA':([13,17,28,30,31,60,63,64,69,75,79,80,81,82,84,95,96,97,98,121,122,123,124,125,126,127,129,130,131,133,134,135,136,137,141,142,152,154,155,158,179,180,181,182,183,190,191,192,195,197,206,209,211,],[-79,-63,-85,93,-80,-69,-70,93,-71,-68,-67,-65,-62,-64,-66,-82,-81,-83,-84,-143,-107,93,-144,-67,-138,-145,-142,-137,-141,-109,-124,-121,160,-123,161,-130,-87,-43,177,-106,-140,199,-110,-122,-131,-47,-113,203,-109,-44,-108,177,-48,]),'TILDE':([0,2,5,6,7,8,9,12,13,17,21,26,28,31,32,52,58,60,63,69,75,79,80,81,82,84,94,95,96,97,98,104,112,113,121,124,126,127,129,130,131,133,140,144,145,146,148,152,163,168,169,170,171,172,173,174,176,179,190,191,192,193,194,195,196,208,211,213,214,],[-5,-7,-8,22,-26,-58,-6,-23,-79,-63,22,-24,-85,-80,-25,22,-96,-69,-70,-71,-68,-67,-65,-62,-64,-66,-61,-82,-81,-83,-84,-60,-98,-45,-143,-144,-138,-145,-142,-137,-141,159,-59,-45,-137,165,-46,-87,165,-99,-45,-100,-146,-45,-139,-147,-45,-140,-47,-113,-111,165,165,159,165,-45,-48,165,165,]),'COLON':([13,17,27,28,30,31,57,58,60,63,65,66,67,69,73,75,79,80,81,82,84,95,96,97,98,112,114,117,122,125,152,153,],[-79,-63,-62,-85,92,-80,-67,-97,-69,-70,-64,-92,-65,-71,-66,-68,-67,-65,-62,-64,-66,-82,-81,-83,-84,-98,149,150,-107,-67,-87,175,]),'NAMED_WILDCARD':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,24,-26,-58,-6,24,-23,-79,-14,24,-63,60,-19,-9,60,-72,-78,24,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,60,-11,-73,-49,-125,-50,-51,24,-12,24,60,60,-69,60,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,60,60,60,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,60,60,-132,-133,-86,-27,-59,-112,-46,-87,60,60,-127,60,-115,60,60,-45,60,-134,-116,-47,-113,-111,-114,60,60,-103,-45,-48,-114,-104,]),'DIR_ENCODING':([0,],[1,]),'KW_ISA':([13,18,23,24,27,28,29,31,33,37,39,40,42,44,95,96,97,98,118,],[-79,61,-72,-78,-62,-85,-77,-80,-76,-88,-75,-74,61,-73,-82,-81,-83,-84,61,]),'KW_END':([11,13,17,28,31,47,49,50,51,60,63,69,75,79,80,81,82,84,95,96,97,98,102,105,107,108,128,132,138,139,148,152,162,166,176,178,189,190,191,192,196,207,208,211,213,215,],[48,-79,-63,-85,-80,-49,-50,-51,106,-69,-70,-71,-68,-67,-65,-62,-64,-66,-82,-81,-83,-84,-28,-52,-53,-54,-132,-133,-86,-27,-46,-87,-127,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'$end':([0,2,3,5,6,7,8,9,12,13,14,15,17,20,21,25,26,28,31,32,36,41,43,48,52,53,60,63,69,75,78,79,80,81,82,83,84,85,86,87,88,89,94,95,96,97,98,102,104,106,109,128,132,138,139,140,148,152,166,176,178,189,190,191,192,196,207,208,211,213,215,],[-5,-7,0,-8,-4,-26,-58,-6,-23,-79,-14,-2,-63,-19,-9,-3,-24,-85,-80,-25,-16,-21,-11,-125,-12,-1,-69,-70,-71,-68,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,-61,-82,-81,-83,-84,-28,-60,-126,-13,-132,-133,-86,-27,-59,-46,-87,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'IDENT':([0,2,5,6,7,8,9,11,12,13,14,15,16,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,45,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,27,-26,-58,-6,27,-23,-79,-14,27,54,-63,27,-19,-9,81,-72,-78,27,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,27,-11,-73,103,-49,-125,-50,-51,27,-12,27,81,81,-69,81,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,81,81,81,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,27,81,-132,-133,-86,-27,-59,-112,-46,-87,81,81,-127,81,-115,81,81,-45,81,-134,-116,-47,-113,-111,-114,81,81,-103,-45,-48,-114,-104,]),'STRING':([1,56,90,93,111,149,150,160,186,201,],[7,-97,130,130,145,145,130,130,-102,130,]),'DECIMAL':([4,90,93,150,160,186,201,],[8,131,131,131,131,-102,131,]),'DIR_VERSION':([0,5,7,],[4,4,-26,]),'DIR_INCLUDE':([0,2,5,6,7,8,9,12,13,14,15,17,20,21,25,26,28,31,32,36,41,43,48,52,53,60,63,69,75,78,79,80,81,82,83,84,85,86,87,88,89,94,95,96,97,98,102,104,106,109,128,132,138,139,140,148,152,166,176,178,189,190,191,192,196,207,208,211,213,215,],[-5,-7,-8,34,-26,-58,-6,-23,-79,-14,34,-63,-19,-9,34,-24,-85,-80,-25,-16,-21,-11,-125,-12,34,-69,-70,-71,-68,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,-61,-82,-81,-83,-84,-28,-60,-126,-13,-132,-133,-86,-27,-59,-46,-87,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'IRI':([0,2,5,6,7,8,9,10,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,46,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,103,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,150,152,157,159,160,162,165,166,167,175,176,177,178,186,189,190,191,192,196,199,201,203,207,208,211,213,215,],[-5,-7,-8,31,-26,-58,-6,31,31,-23,-79,-14,31,-63,31,-19,-9,31,-72,-78,31,-24,-62,-85,-77,-80,-25,-76,31,31,-16,-88,31,-75,-74,-21,31,-11,-73,31,-49,-125,-50,-51,31,-12,31,31,31,-69,31,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,31,31,31,-61,-82,-81,-83,-84,-28,140,-60,-52,-126,-53,-54,-13,31,31,-132,-133,-86,-27,-59,-112,-46,31,-87,31,31,31,-127,31,-115,31,31,-45,31,-134,-102,-116,-47,-113,-111,-114,31,31,31,-103,-45,-48,-114,-104,]),'AT':([13,17,28,31,58,60,63,69,75,79,80,81,82,84,95,96,97,98,112,113,121,124,126,127,129,130,131,144,145,152,168,169,170,171,172,173,174,176,179,208,210,],[-79,-63,-85,-80,-96,-69,-70,-71,-68,-67,-65,-62,-64,-66,-82,-81,-83,-84,-98,147,-143,-144,-138,-145,-142,-137,-141,147,-137,-87,-99,147,-100,-146,147,-139,-147,147,-140,147,147,]),'LPAREN':([13,17,19,23,24,27,28,29,31,33,40,44,54,58,60,63,69,75,79,80,81,82,84,95,96,97,98,112,113,144,145,146,148,152,163,164,166,168,169,170,184,187,188,189,190,191,192,193,202,204,211,217,],[-79,-63,77,-65,-69,90,-85,-68,-80,-67,-64,-66,110,-96,-69,-70,-71,-68,-67,-65,-62,-64,-66,-82,-81,-83,-84,-98,-45,-45,-137,-114,-46,-87,-114,186,-115,-99,-45,-100,186,186,-39,-116,-47,-113,-111,-114,-40,186,-48,-101,]),'INTEGER':([90,93,150,160,186,201,],[129,129,129,129,-102,129,]),'VARIABLE':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,35,36,37,38,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,110,118,120,128,132,138,139,140,147,148,149,150,152,159,160,161,162,165,166,167,175,176,177,178,186,189,190,191,192,196,199,201,203,207,208,211,213,215,],[-5,-7,-8,28,-26,-58,-6,28,-23,-79,-14,28,-63,28,-19,-9,28,-72,-78,28,-24,-62,-85,-77,-80,-25,-76,95,-16,-88,98,-75,-74,-21,28,-11,-73,-49,-125,-50,-51,28,-12,28,28,28,-69,28,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,28,28,28,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,28,28,28,-132,-133,-86,-27,-59,-112,-46,28,28,-87,28,28,28,-127,28,-115,28,28,-45,28,-134,-102,-116,-47,-113,-111,-114,28,28,28,-103,-45,-48,-114,-104,]),'EQ':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,35,-26,-58,-6,35,-23,-79,-14,35,-63,35,-19,-9,35,-72,-78,35,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,35,-11,-73,-49,-125,-50,-51,35,-12,35,35,35,-69,35,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,35,35,35,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,35,35,-132,-133,-86,-27,-59,-112,-46,-87,35,35,-127,35,-115,35,35,-45,35,-134,-116,-47,-113,-111,-114,35,35,-103,-45,-48,-114,-104,]),'DIR_PREFIX':([0,2,5,6,7,8,9,12,13,14,15,17,20,21,25,26,28,31,32,36,41,43,48,52,53,60,63,69,75,78,79,80,81,82,83,84,85,86,87,88,89,94,95,96,97,98,102,104,106,109,128,132,138,139,140,148,152,166,176,178,189,190,191,192,196,207,208,211,213,215,],[-5,-7,-8,45,-26,-58,-6,-23,-79,-14,45,-63,-19,-9,45,-24,-85,-80,-25,-16,-21,-11,-125,-12,45,-69,-70,-71,-68,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,-61,-82,-81,-83,-84,-28,-60,-126,-13,-132,-133,-86,-27,-59,-46,-87,-115,-45,-134,-116,-47,-113,-111,-114,-103,-45,-48,-114,-104,]),'LBRACK':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,37,-26,-58,-6,37,-23,-79,-14,37,-63,37,-19,-9,37,-72,-78,37,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,37,-11,-73,-49,-125,-50,-51,37,-12,37,37,37,-69,37,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,37,37,37,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,37,37,-132,-133,-86,-27,-59,-112,-46,-87,37,37,-127,37,-115,37,37,-45,37,-134,-116,-47,-113,-111,-114,37,37,-103,-45,-48,-114,-104,]),'RBRACK':([13,17,28,31,55,57,58,60,62,63,65,67,68,69,70,71,72,73,74,75,76,79,80,81,82,84,95,96,97,98,112,113,115,116,118,119,121,124,126,127,128,129,130,131,132,144,145,146,148,151,152,163,164,166,168,169,170,171,172,173,174,178,179,184,185,187,188,189,190,191,192,193,194,200,202,204,205,211,212,217,],[-79,-63,-85,-80,-32,-118,-96,-69,-29,-70,-120,-117,-34,-71,-31,-33,-55,-119,-36,-68,-35,-67,-65,-62,-64,-66,-82,-81,-83,-84,-98,-45,-90,-89,-56,152,-143,-144,-138,-145,-132,-142,-137,-141,-133,-45,-137,-114,-46,-30,-87,-114,-37,-115,-99,-45,-100,-146,-45,-139,-147,-134,-140,-37,-94,-38,-39,-116,-47,-113,-111,-114,-114,-95,-40,-37,-91,-48,-93,-101,]),'WILDCARD':([0,2,5,6,7,8,9,11,12,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,36,37,39,40,41,42,43,44,47,48,49,50,51,52,53,56,59,60,61,63,69,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,93,94,95,96,97,98,102,104,105,106,107,108,109,118,120,128,132,138,139,140,147,148,152,159,160,162,165,166,167,175,176,177,178,189,190,191,192,196,199,203,207,208,211,213,215,],[-5,-7,-8,29,-26,-58,-6,29,-23,-79,-14,29,-63,75,-19,-9,75,-72,-78,29,-24,-62,-85,-77,-80,-25,-76,-16,-88,-75,-74,-21,75,-11,-73,-49,-125,-50,-51,29,-12,29,75,75,-69,75,-70,-71,-68,-105,-10,-67,-65,-62,-64,-57,-66,-15,-20,-18,-17,-22,75,75,75,-61,-82,-81,-83,-84,-28,-60,-52,-126,-53,-54,-13,75,75,-132,-133,-86,-27,-59,-112,-46,-87,75,75,-127,75,-115,75,75,-45,75,-134,-116,-47,-113,-111,-114,75,75,-103,-45,-48,-114,-104,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'tpl_call':([6,11,15,18,25,42,51,53,118,],[41,50,41,71,89,71,108,89,71,]),'occurrence':([18,42,118,],[55,55,55,]),'literal_no_qname':([90,93,150,160,201,],[123,134,171,134,171,]),'tpl_head':([6,15,25,53,],[11,11,11,11,]),'prefix_directive':([6,15,25,53,],[12,12,12,12,]),'_start_assoc1':([77,],[120,]),'opt_semi':([42,72,101,],[99,119,99,]),'_start_variant':([186,],[201,]),'opt_role_reifier':([133,195,],[158,206,]),'topic':([6,11,15,25,51,53,],[14,47,14,85,105,85,]),'header':([6,],[15,]),'roles':([120,199,],[155,209,]),'arg':([93,160,],[135,182,]),'embedded_topic':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'variables':([110,],[141,]),'topic_ref_no_ident':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[19,19,19,63,63,19,63,19,19,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'tpl_def':([6,15,25,53,],[20,20,86,86,]),'directive':([6,15,25,53,],[21,52,87,87,]),'opt_reifier':([146,163,193,194,196,213,214,],[164,184,204,205,207,215,216,]),'_start_scope':([147,],[167,]),'theme':([167,203,],[190,211,]),'instance':([0,],[3,]),'literal':([150,201,],[172,210,]),'role':([120,177,199,],[154,197,154,]),'identity':([18,42,118,],[68,68,68,]),'embedded_start':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'encoding_directive':([0,],[5,]),'topicmap':([6,15,],[25,53,]),'mergemap_directive':([6,15,25,53,],[26,26,26,26,]),'opt_variants':([164,184,204,],[185,200,212,]),'_start_name':([56,58,],[111,114,]),'opt_scope':([113,144,169,172,176,208,],[146,163,193,194,196,213,]),'string':([90,93,111,149,150,160,201,],[126,126,144,168,126,126,126,]),'assignment':([18,42,118,],[62,62,151,]),'args':([93,],[136,]),'variant':([164,184,187,204,],[188,188,202,188,]),'name_start':([18,42,118,],[58,58,58,]),'tpl_call_or_assoc_start':([6,11,15,18,25,42,51,53,118,],[30,30,30,64,30,64,30,30,64,]),'iid':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[40,40,40,65,82,40,65,40,40,82,82,82,82,82,82,65,82,82,82,82,82,82,82,82,82,]),'include_directive':([6,15,25,53,],[32,32,32,32,]),'_start_assoc2':([158,],[180,]),'name_value':([149,],[169,]),'topic_ref':([18,22,42,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[66,83,66,112,115,116,122,133,137,66,153,181,137,189,191,195,153,153,191,]),'qiri':([6,10,11,15,18,22,25,34,35,38,42,46,51,53,56,59,61,90,92,93,118,120,150,157,159,160,165,167,175,177,199,201,203,],[23,46,23,23,67,80,23,94,96,97,67,104,23,23,80,80,80,80,80,80,67,80,174,179,80,80,80,80,80,80,80,174,80,]),'variable':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,110,118,120,149,150,159,160,161,165,167,175,177,199,201,203,],[33,33,33,57,79,33,57,33,33,79,79,79,125,79,125,142,57,79,170,173,79,125,183,79,79,79,79,79,173,79,]),'opt_more_roles':([180,],[198,]),'variants':([164,184,204,],[187,187,187,]),'_start_occ':([66,],[117,]),'opt_params':([110,],[143,]),'association':([6,11,15,25,51,53,],[36,49,36,88,107,88,]),'themes':([167,],[192,]),'ident':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[39,39,39,69,69,39,69,39,39,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'name':([18,42,118,],[70,70,70,]),'opt_more_args':([30,64,123,],[91,91,156,]),'version_directive':([0,5,],[2,9,]),'_start_untyped_name':([58,],[113,]),'block_start':([6,11,15,25,51,53,],[42,42,42,42,42,42,]),'topicmap_reifier':([6,21,52,],[43,78,109,]),'assignments':([18,42,],[72,101,]),'slo':([6,11,15,18,22,25,42,51,53,56,59,61,90,92,93,118,120,159,160,165,167,175,177,199,203,],[44,44,44,73,84,44,73,44,44,84,84,84,84,84,84,73,84,84,84,84,84,84,84,84,84,]),'ako':([18,42,118,],[74,74,74,]),'eot':([42,101,],[102,139,]),'reifier':([146,163,193,194,196,213,214,],[166,166,166,166,166,166,166,]),'isa':([18,42,118,],[76,76,76,]),'tpl_body':([11,],[51,]),'scope':([113,144,169,172,176,208,210,],[148,148,148,148,148,148,214,]),'prolog':([0,],[6,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instance","S'",1,None,None,None),
+  ('instance -> prolog header topicmap','instance',3,'p_noop','parser.py',29),
+  ('instance -> prolog header','instance',2,'p_noop','parser.py',30),
+  ('instance -> prolog topicmap','instance',2,'p_noop','parser.py',31),
+  ('instance -> prolog','instance',1,'p_noop','parser.py',32),
+  ('prolog -> <empty>','prolog',0,'p_noop','parser.py',33),
+  ('prolog -> encoding_directive version_directive','prolog',2,'p_noop','parser.py',34),
+  ('prolog -> version_directive','prolog',1,'p_noop','parser.py',35),
+  ('prolog -> encoding_directive','prolog',1,'p_noop','parser.py',36),
+  ('header -> directive','header',1,'p_noop','parser.py',37),
+  ('header -> directive topicmap_reifier','header',2,'p_noop','parser.py',38),
+  ('header -> topicmap_reifier','header',1,'p_noop','parser.py',39),
+  ('header -> header directive','header',2,'p_noop','parser.py',40),
+  ('header -> header directive topicmap_reifier','header',3,'p_noop','parser.py',41),
+  ('topicmap -> topic','topicmap',1,'p_noop','parser.py',42),
+  ('topicmap -> topicmap topic','topicmap',2,'p_noop','parser.py',43),
+  ('topicmap -> association','topicmap',1,'p_noop','parser.py',44),
+  ('topicmap -> topicmap association','topicmap',2,'p_noop','parser.py',45),
+  ('topicmap -> topicmap directive','topicmap',2,'p_noop','parser.py',46),
+  ('topicmap -> tpl_def','topicmap',1,'p_noop','parser.py',47),
+  ('topicmap -> topicmap tpl_def','topicmap',2,'p_noop','parser.py',48),
+  ('topicmap -> tpl_call','topicmap',1,'p_noop','parser.py',49),
+  ('topicmap -> topicmap tpl_call','topicmap',2,'p_noop','parser.py',50),
+  ('directive -> prefix_directive','directive',1,'p_noop','parser.py',51),
+  ('directive -> mergemap_directive','directive',1,'p_noop','parser.py',52),
+  ('directive -> include_directive','directive',1,'p_noop','parser.py',53),
+  ('encoding_directive -> DIR_ENCODING STRING','encoding_directive',2,'p_noop','parser.py',54),
+  ('topic -> block_start assignments eot','topic',3,'p_noop','parser.py',55),
+  ('topic -> block_start eot','topic',2,'p_noop','parser.py',56),
+  ('assignments -> assignment','assignments',1,'p_noop','parser.py',57),
+  ('assignments -> assignments SEMI assignment','assignments',3,'p_noop','parser.py',58),
+  ('assignment -> name','assignment',1,'p_noop','parser.py',59),
+  ('assignment -> occurrence','assignment',1,'p_noop','parser.py',60),
+  ('assignment -> tpl_call','assignment',1,'p_noop','parser.py',61),
+  ('assignment -> identity','assignment',1,'p_noop','parser.py',62),
+  ('assignment -> isa','assignment',1,'p_noop','parser.py',63),
+  ('assignment -> ako','assignment',1,'p_noop','parser.py',64),
+  ('opt_variants -> <empty>','opt_variants',0,'p_noop','parser.py',65),
+  ('opt_variants -> variants','opt_variants',1,'p_noop','parser.py',66),
+  ('variants -> variant','variants',1,'p_noop','parser.py',67),
+  ('variants -> variants variant','variants',2,'p_noop','parser.py',68),
+  ('opt_more_roles -> <empty>','opt_more_roles',0,'p_noop','parser.py',69),
+  ('opt_more_roles -> COMMA roles','opt_more_roles',2,'p_noop','parser.py',70),
+  ('roles -> role','roles',1,'p_noop','parser.py',71),
+  ('roles -> roles COMMA role','roles',3,'p_noop','parser.py',72),
+  ('opt_scope -> <empty>','opt_scope',0,'p_noop','parser.py',73),
+  ('opt_scope -> scope','opt_scope',1,'p_noop','parser.py',74),
+  ('themes -> theme','themes',1,'p_noop','parser.py',75),
+  ('themes -> themes COMMA theme','themes',3,'p_noop','parser.py',76),
+  ('tpl_body -> topic','tpl_body',1,'p_noop','parser.py',77),
+  ('tpl_body -> association','tpl_body',1,'p_noop','parser.py',78),
+  ('tpl_body -> tpl_call','tpl_body',1,'p_noop','parser.py',79),
+  ('tpl_body -> tpl_body topic','tpl_body',2,'p_noop','parser.py',80),
+  ('tpl_body -> tpl_body association','tpl_body',2,'p_noop','parser.py',81),
+  ('tpl_body -> tpl_body tpl_call','tpl_body',2,'p_noop','parser.py',82),
+  ('opt_semi -> <empty>','opt_semi',0,'p_noop','parser.py',83),
+  ('opt_semi -> SEMI','opt_semi',1,'p_noop','parser.py',84),
+  ('topicmap_reifier -> TILDE topic_ref','topicmap_reifier',2,'p_topicmap_reifier','parser.py',91),
+  ('version_directive -> DIR_VERSION DECIMAL','version_directive',2,'p_version_directive','parser.py',103),
+  ('prefix_directive -> DIR_PREFIX IDENT IRI','prefix_directive',3,'p_prefix_directive','parser.py',111),
+  ('mergemap_directive -> DIR_MERGEMAP qiri qiri','mergemap_directive',3,'p_mergemap_directive','parser.py',118),
+  ('include_directive -> DIR_INCLUDE qiri','include_directive',2,'p_include_directive','parser.py',125),
+  ('ident -> IDENT','ident',1,'p_ident','parser.py',132),
+  ('topic_ref_no_ident -> embedded_topic','topic_ref_no_ident',1,'p_topic_ref_no_ident','parser.py',139),
+  ('topic_ref_no_ident -> iid','topic_ref_no_ident',1,'p_topic_ref_no_ident','parser.py',140),
+  ('topic_ref_no_ident -> qiri','topic_ref_no_ident',1,'p_topic_ref_no_ident','parser.py',141),
+  ('topic_ref_no_ident -> slo','topic_ref_no_ident',1,'p_topic_ref_no_ident','parser.py',142),
+  ('topic_ref_no_ident -> variable','topic_ref_no_ident',1,'p_topic_ref_no_ident','parser.py',143),
+  ('topic_ref_no_ident -> WILDCARD','topic_ref_no_ident',1,'p_topic_ref_no_ident_wildcards','parser.py',150),
+  ('topic_ref_no_ident -> NAMED_WILDCARD','topic_ref_no_ident',1,'p_topic_ref_no_ident_wildcards','parser.py',151),
+  ('topic_ref -> topic_ref_no_ident','topic_ref',1,'p_topic_ref','parser.py',160),
+  ('topic_ref -> ident','topic_ref',1,'p_topic_ref','parser.py',161),
+  ('block_start -> qiri','block_start',1,'p_block_start','parser.py',168),
+  ('block_start -> slo','block_start',1,'p_block_start','parser.py',169),
+  ('block_start -> iid','block_start',1,'p_block_start','parser.py',170),
+  ('block_start -> ident','block_start',1,'p_block_start','parser.py',171),
+  ('block_start -> variable','block_start',1,'p_block_start','parser.py',172),
+  ('block_start -> WILDCARD','block_start',1,'p_block_start_wildcards','parser.py',179),
+  ('block_start -> NAMED_WILDCARD','block_start',1,'p_block_start_wildcards','parser.py',180),
+  ('qiri -> QNAME','qiri',1,'p_qiri_qname','parser.py',187),
+  ('qiri -> IRI','qiri',1,'p_qiri_iri','parser.py',194),
+  ('slo -> EQ qiri','slo',2,'p_slo','parser.py',201),
+  ('slo -> EQ VARIABLE','slo',2,'p_slo_variable','parser.py',208),
+  ('iid -> CIRCUMFLEX qiri','iid',2,'p_iid','parser.py',215),
+  ('iid -> CIRCUMFLEX VARIABLE','iid',2,'p_iid_variable','parser.py',222),
+  ('variable -> VARIABLE','variable',1,'p_variable','parser.py',229),
+  ('eot -> opt_semi DOT','eot',2,'p_eot','parser.py',236),
+  ('embedded_topic -> embedded_start assignments opt_semi RBRACK','embedded_topic',4,'p_embedded_topic','parser.py',243),
+  ('embedded_start -> LBRACK','embedded_start',1,'p_embedded_start','parser.py',251),
+  ('isa -> KW_ISA topic_ref','isa',2,'p_isa','parser.py',258),
+  ('ako -> KW_AKO topic_ref','ako',2,'p_ako','parser.py',265),
+  ('occurrence -> topic_ref _start_occ COLON literal opt_scope opt_reifier','occurrence',6,'p_occurrence','parser.py',272),
+  ('_start_occ -> <empty>','_start_occ',0,'p__start_occ','parser.py',282),
+  ('name -> name_start _start_name COLON name_value opt_scope opt_reifier opt_variants','name',7,'p_name_typed','parser.py',288),
+  ('name -> name_start _start_untyped_name opt_scope opt_reifier opt_variants','name',5,'p_name_untyped1','parser.py',297),
+  ('name -> HYPHEN _start_name string opt_scope opt_reifier opt_variants','name',6,'p_name_untyped2','parser.py',306),
+  ('_start_untyped_name -> <empty>','_start_untyped_name',0,'p__start_untyped_name','parser.py',315),
+  ('_start_name -> <empty>','_start_name',0,'p__start_name','parser.py',322),
+  ('name_start -> HYPHEN topic_ref','name_start',2,'p_name_start','parser.py',332),
+  ('name_value -> string','name_value',1,'p_name_value','parser.py',339),
+  ('name_value -> variable','name_value',1,'p_name_value','parser.py',340),
+  ('variant -> LPAREN _start_variant literal scope opt_reifier RPAREN','variant',6,'p_variant','parser.py',347),
+  ('_start_variant -> <empty>','_start_variant',0,'p__start_variant','parser.py',356),
+  ('association -> topic_ref_no_ident LPAREN _start_assoc1 roles RPAREN opt_scope opt_reifier','association',7,'p_association','parser.py',363),
+  ('association -> tpl_call_or_assoc_start COLON topic_ref opt_role_reifier _start_assoc2 opt_more_roles RPAREN opt_scope opt_reifier','association',9,'p_association','parser.py',364),
+  ('_start_assoc1 -> <empty>','_start_assoc1',0,'p__start_assoc1','parser.py',371),
+  ('_start_assoc2 -> <empty>','_start_assoc2',0,'p__start_assoc2','parser.py',378),
+  ('tpl_call_or_assoc_start -> IDENT LPAREN topic_ref','tpl_call_or_assoc_start',3,'p_tpl_call_or_assoc_start','parser.py',390),
+  ('role -> topic_ref COLON topic_ref opt_role_reifier','role',4,'p_role','parser.py',397),
+  ('opt_role_reifier -> <empty>','opt_role_reifier',0,'p_opt_role_reifier','parser.py',404),
+  ('opt_role_reifier -> TILDE topic_ref','opt_role_reifier',2,'p_opt_role_reifier','parser.py',405),
+  ('scope -> AT _start_scope themes','scope',3,'p_scope','parser.py',412),
+  ('_start_scope -> <empty>','_start_scope',0,'p__start_scope','parser.py',419),
+  ('theme -> topic_ref','theme',1,'p_theme','parser.py',426),
+  ('opt_reifier -> <empty>','opt_reifier',0,'p_reifier','parser.py',433),
+  ('opt_reifier -> reifier','opt_reifier',1,'p_reifier','parser.py',434),
+  ('reifier -> TILDE topic_ref','reifier',2,'p_reifier','parser.py',435),
+  ('identity -> qiri','identity',1,'p_identity_qiri','parser.py',443),
+  ('identity -> variable','identity',1,'p_identity_variable','parser.py',450),
+  ('identity -> slo','identity',1,'p_identity_slo','parser.py',457),
+  ('identity -> iid','identity',1,'p_identity_iid','parser.py',468),
+  ('args -> arg','args',1,'p_args','parser.py',479),
+  ('args -> args COMMA arg','args',3,'p_args','parser.py',480),
+  ('arg -> topic_ref','arg',1,'p_arg','parser.py',491),
+  ('arg -> literal_no_qname','arg',1,'p_arg','parser.py',492),
+  ('tpl_def -> tpl_head KW_END','tpl_def',2,'p_tpl_def','parser.py',499),
+  ('tpl_def -> tpl_head tpl_body KW_END','tpl_def',3,'p_tpl_def','parser.py',500),
+  ('tpl_head -> KW_DEF IDENT LPAREN opt_params RPAREN','tpl_head',5,'p_tpl_head','parser.py',507),
+  ('opt_params -> <empty>','opt_params',0,'p_opt_params','parser.py',514),
+  ('opt_params -> variables','opt_params',1,'p_opt_params','parser.py',515),
+  ('variables -> variable','variables',1,'p_variables','parser.py',522),
+  ('variables -> variables COMMA variable','variables',3,'p_variables','parser.py',523),
+  ('tpl_call -> IDENT LPAREN RPAREN','tpl_call',3,'p_tpl_call_no_args','parser.py',534),
+  ('tpl_call -> tpl_call_or_assoc_start opt_more_args RPAREN','tpl_call',3,'p_tpl_call','parser.py',541),
+  ('tpl_call -> IDENT LPAREN literal_no_qname opt_more_args RPAREN','tpl_call',5,'p_tpl_call2','parser.py',551),
+  ('opt_more_args -> <empty>','opt_more_args',0,'p_opt_more_args','parser.py',560),
+  ('opt_more_args -> COMMA args','opt_more_args',2,'p_opt_more_args','parser.py',561),
+  ('string -> STRING','string',1,'p_string','parser.py',568),
+  ('literal_no_qname -> string','literal_no_qname',1,'p_literal_no_qname','parser.py',575),
+  ('literal_no_qname -> variable','literal_no_qname',1,'p_literal_no_qname','parser.py',576),
+  ('literal_no_qname -> STRING DOUBLE_CIRCUMFLEX qiri','literal_no_qname',3,'p_literal_no_qname_explicit_datatype','parser.py',583),
+  ('literal_no_qname -> DECIMAL','literal_no_qname',1,'p_literal_no_qname_decimal','parser.py',590),
+  ('literal_no_qname -> INTEGER','literal_no_qname',1,'p_literal_no_qname_integer','parser.py',597),
+  ('literal_no_qname -> STAR','literal_no_qname',1,'p_literal_no_qname_ctm_integer','parser.py',604),
+  ('literal_no_qname -> DATE','literal_no_qname',1,'p_literal_no_qname_date','parser.py',611),
+  ('literal_no_qname -> DATE_TIME','literal_no_qname',1,'p_literal_no_qname_datetime','parser.py',618),
+  ('literal -> literal_no_qname','literal',1,'p_literal','parser.py',625),
+  ('literal -> qiri','literal',1,'p_literal','parser.py',626),
+]
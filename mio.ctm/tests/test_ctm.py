@@ -12,8 +12,13 @@ CTM test cases.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import io
+from nose.tools import ok_, eq_
 from mappaext.cxtm.cxtm_test import create_invalid_cxtm_cases, create_valid_cxtm_cases
+from tm import Source
+from tm.mio.handler import MapHandler
 from mio.ctm import create_deserializer
+import mio.ctm
 
 _EXCLUDED = [
     'topic-identifier-unicode.ctm'  # Due to limitations of the re.module
@@ -29,6 +34,30 @@ def test_cxtm_invalid():
         yield test
 
 
+class _TopicCounter(MapHandler):
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.topics = 0
+        self.first_topic_pos = None
+
+    def endTopic(self):
+        self.topics += 1
+        if self.first_topic_pos is None:
+            self.first_topic_pos = self.stream.tell()
+
+
+def test_streaming():
+    data = u'%encoding "utf-8"\n' + u'a - "Eine Größe"; - """a\nlonger name""" .\n' * 10000
+    stream = io.BytesIO(data.encode('utf-8'))
+    handler = _TopicCounter(stream)
+    deser = create_deserializer()
+    deser.handler = handler
+    deser.parse(Source(file=stream, iri='http://www.example.org/'))
+    eq_(10000, handler.topics)
+    ok_(handler.first_topic_pos < 2 * mio.ctm._CHUNK_SIZE)
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
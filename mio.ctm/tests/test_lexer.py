@@ -13,7 +13,8 @@ Tests against mio.ctm.lexer.
 :license:      BSD license
 """
 from nose.tools import eq_
-from mio.ctm import _make_lexer as make_lexer
+from mio.ctm import _make_lexer as make_lexer, _tokenizer as tokenizer
+from mio.ctm.lexer import segments
 
 
 def the_lexer(data):
@@ -106,6 +107,67 @@ http://psi.example.org/ ex:fake.''',
                  ]
 
 
+def test_triple_string_ends_at_first_delimiter():
+    lex(u'a - """x""" .\nb - """y""" .',
+        [('IDENT', u'a'), ('HYPHEN', u'-'), ('STRING', u'x'), ('DOT', u'.'),
+         ('IDENT', u'b'), ('HYPHEN', u'-'), ('STRING', u'y'), ('DOT', u'.')])
+
+
+def _tokens(token):
+    res = []
+    while True:
+        tok = token()
+        if not tok:
+            break
+        res.append((tok.type, tok.value, tok.lineno))
+    return res
+
+
+def _chunked(data, size):
+    return [data[i:i+size] for i in range(0, len(data), size)]
+
+
+def check_segments(data, size):
+    lexer = make_lexer()
+    expected = _tokens(tokenizer(lexer, [data]))
+    lexer = make_lexer()
+    eq_(expected, _tokens(tokenizer(lexer, segments(_chunked(data, size)))))
+    eq_(data, u''.join(segments(_chunked(data, size))))
+
+
+def test_segments():
+    for d in _DATA + _SEGMENT_DATA:
+        d = unicode(d)
+        for size in (1, 2, 3, 5, 8, 100):
+            yield check_segments, d, size
+
+
+def test_segments_bounded():
+    data = u'a - "a name"; - """another\nname""" .\n' * 1000
+    for segment in segments(_chunked(data, 64)):
+        assert len(segment) < 200
+
+
+def test_segments_bounded_iri_comment_start():
+    data = u'a http://x/#( b ) . c - "#(" .\n' * 1000
+    for segment in segments(_chunked(data, 64)):
+        assert len(segment) < 200
+
+
+_SEGMENT_DATA = [
+                 u'a - """x""" .\nb - """y""" .',
+                 u'a - """x"" ""y"" "" z""" .',
+                 u'a - """\\\\""" . b - """\\"""""" .',
+                 u'a - "\\\\" . b - "\\"" .',
+                 u'a - "x y" @b . #( ( ) # #( )# x y )# c .',
+                 u'a #comment with "quotes" and <\nb .',
+                 u'a <http://www.example.org/a#b> b <http://www.example.org/?x=%20#(y)> .',
+                 u'a http://www.example.org/#fragment ; b .',
+                 u'a http://x/#( b ) . c - "#(" .',
+                 u'a http://x/"#(y ; b http://x/;#z. c:d .',
+                 ]
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
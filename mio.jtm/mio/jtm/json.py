@@ -19,6 +19,7 @@ try:
 except ImportError:
     import json
 from json.encoder import encode_basestring_ascii as escape
+from tm.ioutils import BufferedOutput, DEFAULT_BUFFER_SIZE
 
 load = json.load
 loads = json.loads
@@ -34,13 +35,25 @@ class JSONWriter(object):
     """
     __slots__ = ['_out', '_want_comma', '_depth', 'prettify']
 
-    def __init__(self, out):
+    def __init__(self, out, depth=0, buffer_size=0):
         """\
         Initializes the writer with the provided ``out`` file-alike object.
+
+        The initial nesting ``depth`` is used to indent JSON fragments
+        which are written without calling ``start``.
+
+        If ``buffer_size`` is greater than ``0``, the JSON is collected and
+        written encoded to ``out`` once (at least) ``buffer_size`` characters
+        are available or if the writer is flushed
+        (c.f. ``DEFAULT_BUFFER_SIZE``). Otherwise, each fragment is written
+        immediately (default).
         """
-        self._out = codecs.getwriter('utf-8')(out)
+        if buffer_size > 0:
+            self._out = BufferedOutput(out, 'utf-8', buffer_size)
+        else:
+            self._out = codecs.getwriter('utf-8')(out)
         self._want_comma = False
-        self._depth = 0
+        self._depth = depth
         self.prettify = False
 
     def start(self):
@@ -57,14 +70,17 @@ class JSONWriter(object):
         self._out.write(u'\n')
         self._out.flush()
 
+    def flush(self):
+        """\
+        Writes the buffered JSON (if any) and flushes the output.
+        """
+        self._out.flush()
+
     def key(self, key):
         """\
         Writes ``"key":``. The `key` is not escaped.
         """
-        if self._want_comma:
-            self._out.write(u',')
-            self._indent()
-        self._out.write(u'"%s":' % key)
+        self._out.write(u'%s"%s":' % (self._separator(), key))
         self._want_comma = False
 
     def key_value(self, key, value):
@@ -72,8 +88,8 @@ class JSONWriter(object):
         Writes ``"key": "value"`` where the `value` is escaped according to
         the JSON rules, but `key` is left untouched.
         """
-        self.key(key)
-        self.value(value)
+        self._out.write(u'%s"%s":%s' % (self._separator(), key, escape(value)))
+        self._want_comma = True
     
     def value(self, val):
         """\
@@ -84,6 +100,16 @@ class JSONWriter(object):
         self._out.write(escape(val))
         self._want_comma = True
 
+    def raw(self, data):
+        """\
+        Writes the already serialized JSON `data`, i.e. a value or a
+        comma-separated sequence of values.
+        """
+        if self._want_comma:
+            self._out.write(u',')
+        self._out.write(data)
+        self._want_comma = True
+
     def start_object(self):
         """\
         Indicates the start of an object.
@@ -126,25 +152,30 @@ class JSONWriter(object):
         All elements of the ``iterable`` are written in an escaped form while
         the ``key`` is not escaped.
         """
-        write = self._out.write
-        written = False
-        for c, e in enumerate(iterable):
-            if not c:
-                self.key(key)
-                write(u'[')
-                written = True
-            else:
-                write(u',')
-            write(escape(e))
-        if written:
-            write(u']')
-        self._want_comma = written or self._want_comma
+        values = u','.join([escape(e) for e in iterable])
+        if values:
+            self._out.write(u'%s"%s":[%s]' % (self._separator(), key, values))
+            self._want_comma = True
+
+    def _separator(self):
+        """\
+        Returns the separator (a comma and the indentation) which is
+        required in front of a key.
+        """
+        if not self._want_comma:
+            return u''
+        if self.prettify:
+            return u',' + self._indentation()
+        return u','
 
     def _indent(self):
         """\
         Indents a line.
         """
         if self.prettify:
-            if self._depth:
-                self._out.write(u'\n')
-            self._out.write(u' ' * self._depth * 2)
+            self._out.write(self._indentation())
+
+    def _indentation(self):
+        if self._depth:
+            return u'\n' + u' ' * self._depth * 2
+        return u''
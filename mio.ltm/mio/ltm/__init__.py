@@ -61,20 +61,21 @@ class LTMDeserializer(Deserializer):
         """\
         
         """
-        parser = plyutils.make_parser(parser_mod)
-        parser.context = LTMContext(handler=self.handler, 
-                                    iri=source.iri, 
-                                    subordinate=self.subordinate, 
-                                    legacy=self.legacy,
-                                    included_by = self._included_by,
-                                    context=self._context)
         data = source.stream
         if not data:
             try:
                 data = urlopen(source.iri)
             except IOError:
                 raise MIOException('Cannot read from ' + source.iri)
-        parser.parse(self._reader(data, source.encoding), lexer=_make_lexer())
+        with plyutils.pooled_parser(parser_mod) as parser:
+            with plyutils.pooled_lexer(lexer_mod) as lexer:
+                parser.context = LTMContext(handler=self.handler, 
+                                            iri=source.iri, 
+                                            subordinate=self.subordinate, 
+                                            legacy=self.legacy,
+                                            included_by = self._included_by,
+                                            context=self._context)
+                parser.parse(self._reader(data, source.encoding), lexer=lexer)
 
     def _reader(self, fileobj, encoding=None):
         found_bom = False
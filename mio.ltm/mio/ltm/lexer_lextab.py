@@ -0,0 +1,9 @@
+# mio.ltm.lexer_lextab.py. This file automatically created by PLY (version 3.4). Don't edit!
+_tabversion   = '3.4'
+_lextokens    = {'DIR_TOPICMAP': 1, 'DIR_MERGEMAP': 1, 'SLASH': 1, 'QNAME': 1, 'LCURLY': 1, 'DATA': 1, 'RPAREN': 1, 'SEMI': 1, 'RCURLY': 1, 'TILDE': 1, 'COMMA': 1, 'DIR_VERSION': 1, 'COLON': 1, 'IDENT': 1, 'STRING': 1, 'RBRACK': 1, 'PERCENT': 1, 'DIR_INCLUDE': 1, 'AT': 1, 'LPAREN': 1, 'EQ': 1, 'LBRACK': 1, 'DIR_PREFIX': 1, 'DIR_BASEURI': 1}
+_lexreflags   = 0
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>[\\r\\n]+)|(?P<t_ws>[\\t ]+)|(?P<t_comment>/\\*([^*]|\\*[^/])*\\*/)|(?P<t_QNAME>[a-zA-Z_][\\-\\.\\w]*:[a-zA-Z_][\\-\\.\\w]*)|(?P<t_STRING>"([^"]|"{2})*")|(?P<t_DATA>\\[\\[([^\\]]|\\](?!\\]))*\\]\\])|(?P<t_directive>\\#[A-Z]+)|(?P<t_IDENT>[a-zA-Z_][\\-\\.\\w]*)|(?P<t_RBRACK>\\])|(?P<t_LPAREN>\\()|(?P<t_LBRACK>\\[)|(?P<t_RPAREN>\\))|(?P<t_TILDE>~)|(?P<t_SLASH>/)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_AT>@)|(?P<t_SEMI>;)|(?P<t_PERCENT>%)|(?P<t_RCURLY>})|(?P<t_EQ>=)|(?P<t_LCURLY>{)', [None, ('t_newline', 'newline'), ('t_ws', 'ws'), ('t_comment', 'comment'), None, ('t_QNAME', 'QNAME'), ('t_STRING', 'STRING'), None, ('t_DATA', 'DATA'), None, ('t_directive', 'directive'), (None, 'IDENT'), (None, 'RBRACK'), (None, 'LPAREN'), (None, 'LBRACK'), (None, 'RPAREN'), (None, 'TILDE'), (None, 'SLASH'), (None, 'COLON'), (None, 'COMMA'), (None, 'AT'), (None, 'SEMI'), (None, 'PERCENT'), (None, 'RCURLY'), (None, 'EQ'), (None, 'LCURLY')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
@@ -0,0 +1,113 @@
+
+# /root/package/mio.ltm/mio/ltm/parser_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\x15\x08)\xac\xdf\x0b\xda\xb7\xbe\xc0\x08\xe09!\xee\x16'
+    
+_lr_action_items = {'DIR_TOPICMAP':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,11,-20,-39,-14,-16,-47,-3,-18,-6,-5,11,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'DIR_MERGEMAP':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,10,-20,-39,-14,-16,-47,-3,-18,-6,-5,10,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'SLASH':([59,80,83,96,105,106,108,109,111,114,122,],[73,-58,73,-61,-64,113,-63,-65,-62,-66,124,]),'QNAME':([0,1,5,6,7,8,9,12,13,14,15,16,17,18,19,21,22,24,25,27,28,30,31,34,35,36,37,38,39,42,43,44,45,46,52,55,56,57,59,60,68,69,73,74,77,82,83,84,85,86,87,97,98,99,100,102,107,113,116,121,124,125,],[-11,-13,-12,13,-20,-39,-14,-16,-47,-3,13,-18,-6,-5,13,-17,-46,-4,13,-15,-19,-43,-37,-7,-10,-9,-8,-69,-45,-42,-44,-38,13,-71,13,13,-40,-41,-79,-71,-52,13,13,-83,13,-53,-79,13,-80,-48,-68,-83,-82,-49,-84,-50,-76,13,13,-49,13,13,]),'LCURLY':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,15,-20,-39,-14,-16,-47,-3,-18,-6,-5,15,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'DATA':([58,],[72,]),'RPAREN':([13,22,51,53,61,62,63,75,76,86,89,90,100,102,121,125,126,],[-47,-46,59,-35,-73,-74,-72,-36,-83,-48,-70,-75,-84,-50,-49,-83,127,]),'SEMI':([80,96,104,105,109,],[-58,104,110,110,-65,]),'RCURLY':([70,71,72,],[83,-77,-78,]),'COLON':([13,22,40,47,61,62,63,102,],[-47,-46,-51,55,-73,77,-72,-50,]),'TILDE':([11,13,22,59,61,62,63,74,76,80,83,84,85,86,87,90,96,97,98,99,100,102,105,106,108,109,111,112,114,116,121,125,],[32,-47,-46,-79,-73,-74,-72,88,88,-58,-79,-81,-80,-48,-68,-75,-61,88,-82,-49,-84,-50,-64,-59,-63,-65,-62,88,-66,-60,-49,88,]),'COMMA':([13,22,33,50,51,53,61,62,63,75,76,89,90,100,102,],[-47,-46,45,58,60,-35,-73,-74,-72,-36,-83,-70,-75,-84,-50,]),'$end':([0,1,2,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,0,-12,-1,-20,-39,-14,-16,-47,-3,-18,-6,-5,-2,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'IDENT':([0,1,5,6,7,8,9,11,12,13,14,15,16,17,18,19,21,22,24,25,26,27,28,30,31,32,34,35,36,37,38,39,42,43,44,45,46,52,55,56,57,59,60,68,69,73,74,77,82,83,84,85,86,87,88,97,98,99,100,102,107,113,116,121,124,125,],[-11,-13,-12,22,-20,-39,-14,31,-16,-47,-3,22,-18,-6,-5,22,-17,-46,-4,22,41,-15,-19,-43,-37,44,-7,-10,-9,-8,-69,-45,-42,-44,-38,22,-71,22,22,-40,-41,-79,-71,-52,22,22,-83,22,-53,-79,22,-80,-48,-68,100,-83,-82,-49,-84,-50,-76,22,22,-49,22,22,]),'STRING':([3,4,10,23,29,30,48,49,58,66,78,95,104,110,119,],[7,8,30,39,42,43,56,57,71,80,91,103,109,114,122,]),'RBRACK':([13,22,40,47,54,64,65,67,68,69,79,80,81,82,86,91,92,93,94,96,100,101,103,105,106,108,109,111,112,114,115,116,117,118,120,121,123,127,],[-47,-46,-51,-25,-27,-29,-54,-28,-52,-26,-21,-58,-30,-53,-48,-55,-22,102,-23,-61,-84,-24,-56,-64,-59,-63,-65,-62,-83,-66,-31,-60,-57,-33,-32,-49,-34,-67,]),'PERCENT':([13,22,40,41,47,54,64,65,67,68,69,80,81,82,86,96,100,105,106,108,109,111,112,114,115,116,117,118,120,121,123,127,],[-47,-46,-51,48,-25,-27,-29,78,-28,-52,-26,-58,-30,-53,-48,-61,-84,-64,-59,-63,-65,-62,-83,-66,-31,-60,-57,-33,-32,-49,-34,-67,]),'DIR_INCLUDE':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,23,-20,-39,-14,-16,-47,-3,-18,-6,-5,23,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'AT':([0,13,22,40,41,47,54,64,65,67,68,69,79,80,81,82,86,91,92,94,96,100,101,103,105,106,108,109,111,112,114,115,116,117,118,120,121,123,127,],[3,-47,-46,-51,49,-25,-27,-29,-54,-28,-52,-26,95,-58,-30,-53,-48,-55,95,-23,-61,-84,-24,-56,-64,-59,-63,-65,-62,-83,-66,-31,-60,-57,-33,-32,-49,-34,-67,]),'LPAREN':([13,20,22,80,86,96,99,100,105,106,108,109,111,112,114,115,116,118,120,121,123,127,],[-47,38,-46,-58,-48,-61,38,-84,-64,-59,-63,-65,-62,-83,-66,119,-60,-33,119,-49,-34,-67,]),'EQ':([13,22,40,47,54,64,67,68,69,80,81,82,86,96,100,105,106,108,109,111,112,114,115,116,117,118,120,121,123,127,],[-47,-46,-51,-25,66,-29,66,-52,-26,-58,-30,-53,-48,-61,-84,-64,-59,-63,-65,-62,-83,-66,-31,-60,-57,-33,-32,-49,-34,-67,]),'DIR_VERSION':([0,5,7,],[4,4,-20,]),'LBRACK':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,38,39,42,43,44,46,52,56,57,59,60,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,25,-20,-39,-14,-16,-47,-3,-18,-6,-5,25,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-69,-45,-42,-44,-38,-71,25,-40,-41,-79,-71,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'DIR_PREFIX':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,26,-20,-39,-14,-16,-47,-3,-18,-6,-5,26,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),'DIR_BASEURI':([0,1,5,6,7,8,9,12,13,14,16,17,18,19,21,22,24,27,28,30,31,34,35,36,37,39,42,43,44,56,57,59,74,83,84,85,86,87,97,98,99,100,102,107,],[-11,-13,-12,29,-20,-39,-14,-16,-47,-3,-18,-6,-5,29,-17,-46,-4,-15,-19,-43,-37,-7,-10,-9,-8,-45,-42,-44,-38,-40,-41,-79,-83,-79,-81,-80,-48,-68,-83,-82,-49,-84,-50,-76,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'_start_topic':([40,],[47,]),'sids':([79,],[92,]),'tids':([73,113,124,],[84,116,125,]),'prefix_directive':([6,19,],[12,12,]),'opt_scope':([59,83,],[74,97,]),'topic':([6,19,52,],[14,34,61,]),'player':([52,],[62,]),'names':([54,],[67,]),'sortname':([96,],[105,]),'include_directive':([6,19,],[16,16,]),'directive':([6,19,],[17,35,]),'opt_reifier':([74,76,97,112,125,],[87,89,107,115,126,]),'opt_role_type':([62,],[76,]),'occ':([6,19,],[18,36,]),'opt_name_scope':([106,],[112,]),'instance':([0,],[2,]),'tm':([6,],[19,]),'role':([46,60,],[53,75,]),'_start_assoc':([38,],[46,]),'sid':([79,92,],[94,101,]),'tid':([6,15,19,25,45,52,55,69,73,77,84,113,116,124,125,],[20,33,20,40,50,63,68,82,86,90,99,86,121,86,121,]),'encoding_directive':([0,],[5,]),'mergemap_directive':([6,19,],[21,21,]),'_start_name':([80,],[96,]),'displayname':([104,105,],[108,111,]),'opt_sort_display':([96,],[106,]),'variant':([115,120,],[118,123,]),'opt_names':([54,],[65,]),'assoc':([6,19,84,],[24,37,98,]),'opt_slo':([65,],[79,]),'variants':([115,],[120,]),'types':([55,],[69,]),'opt_sids':([79,],[93,]),'themes':([73,],[85,]),'resource':([58,],[70,]),'name':([54,67,],[64,81,]),'roles':([46,],[51,]),'opt_types':([47,],[54,]),'version_directive':([0,5,],[1,9,]),'opt_variants':([115,],[117,]),'_start_role':([46,60,],[52,52,]),'tm_directive':([6,19,],[27,27,]),'baseuri_directive':([6,19,],[28,28,]),'prolog':([0,],[6,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instance","S'",1,None,None,None),
+  ('instance -> prolog','instance',1,'p_noop','parser.py',36),
+  ('instance -> prolog tm','instance',2,'p_noop','parser.py',37),
+  ('tm -> topic','tm',1,'p_noop','parser.py',38),
+  ('tm -> assoc','tm',1,'p_noop','parser.py',39),
+  ('tm -> occ','tm',1,'p_noop','parser.py',40),
+  ('tm -> directive','tm',1,'p_noop','parser.py',41),
+  ('tm -> tm topic','tm',2,'p_noop','parser.py',42),
+  ('tm -> tm assoc','tm',2,'p_noop','parser.py',43),
+  ('tm -> tm occ','tm',2,'p_noop','parser.py',44),
+  ('tm -> tm directive','tm',2,'p_noop','parser.py',45),
+  ('prolog -> <empty>','prolog',0,'p_noop','parser.py',46),
+  ('prolog -> encoding_directive','prolog',1,'p_noop','parser.py',47),
+  ('prolog -> version_directive','prolog',1,'p_noop','parser.py',48),
+  ('prolog -> encoding_directive version_directive','prolog',2,'p_noop','parser.py',49),
+  ('directive -> tm_directive','directive',1,'p_noop','parser.py',50),
+  ('directive -> prefix_directive','directive',1,'p_noop','parser.py',51),
+  ('directive -> mergemap_directive','directive',1,'p_noop','parser.py',52),
+  ('directive -> include_directive','directive',1,'p_noop','parser.py',53),
+  ('directive -> baseuri_directive','directive',1,'p_noop','parser.py',54),
+  ('encoding_directive -> AT STRING','encoding_directive',2,'p_noop','parser.py',55),
+  ('opt_sids -> <empty>','opt_sids',0,'p_noop','parser.py',56),
+  ('opt_sids -> sids','opt_sids',1,'p_noop','parser.py',57),
+  ('sids -> sid','sids',1,'p_noop','parser.py',58),
+  ('sids -> sids sid','sids',2,'p_noop','parser.py',59),
+  ('opt_types -> <empty>','opt_types',0,'p_noop','parser.py',60),
+  ('opt_types -> COLON types','opt_types',2,'p_noop','parser.py',61),
+  ('opt_names -> <empty>','opt_names',0,'p_noop','parser.py',62),
+  ('opt_names -> names','opt_names',1,'p_noop','parser.py',63),
+  ('names -> name','names',1,'p_noop','parser.py',64),
+  ('names -> names name','names',2,'p_noop','parser.py',65),
+  ('opt_variants -> <empty>','opt_variants',0,'p_noop','parser.py',66),
+  ('opt_variants -> variants','opt_variants',1,'p_noop','parser.py',67),
+  ('variants -> variant','variants',1,'p_noop','parser.py',68),
+  ('variants -> variants variant','variants',2,'p_noop','parser.py',69),
+  ('roles -> role','roles',1,'p_noop','parser.py',70),
+  ('roles -> roles COMMA role','roles',3,'p_noop','parser.py',71),
+  ('tm_directive -> DIR_TOPICMAP IDENT','tm_directive',2,'p_tm_directive','parser.py',78),
+  ('tm_directive -> DIR_TOPICMAP TILDE IDENT','tm_directive',3,'p_tm_directive','parser.py',79),
+  ('version_directive -> DIR_VERSION STRING','version_directive',2,'p_version_directive','parser.py',89),
+  ('prefix_directive -> DIR_PREFIX IDENT PERCENT STRING','prefix_directive',4,'p_prefix_directive_slo','parser.py',96),
+  ('prefix_directive -> DIR_PREFIX IDENT AT STRING','prefix_directive',4,'p_prefix_directive_sid','parser.py',103),
+  ('baseuri_directive -> DIR_BASEURI STRING','baseuri_directive',2,'p_baseuri_directive','parser.py',110),
+  ('mergemap_directive -> DIR_MERGEMAP STRING','mergemap_directive',2,'p_mergemap_directive','parser.py',117),
+  ('mergemap_directive -> DIR_MERGEMAP STRING STRING','mergemap_directive',3,'p_mergemap_directive','parser.py',118),
+  ('include_directive -> DIR_INCLUDE STRING','include_directive',2,'p_include_directive','parser.py',129),
+  ('tid -> IDENT','tid',1,'p_tid_IDENT','parser.py',136),
+  ('tid -> QNAME','tid',1,'p_tid_QNAME','parser.py',143),
+  ('tids -> tid','tids',1,'p_tids','parser.py',150),
+  ('tids -> tids tid','tids',2,'p_tids','parser.py',151),
+  ('topic -> LBRACK tid _start_topic opt_types opt_names opt_slo opt_sids RBRACK','topic',8,'p_topic','parser.py',162),
+  ('_start_topic -> <empty>','_start_topic',0,'p__start_topic','parser.py',169),
+  ('types -> tid','types',1,'p_types','parser.py',176),
+  ('types -> types tid','types',2,'p_types','parser.py',177),
+  ('opt_slo -> <empty>','opt_slo',0,'p_opt_slo','parser.py',184),
+  ('opt_slo -> PERCENT STRING','opt_slo',2,'p_opt_slo','parser.py',185),
+  ('sid -> AT STRING','sid',2,'p_sid','parser.py',194),
+  ('name -> EQ STRING _start_name opt_sort_display opt_name_scope opt_reifier opt_variants','name',7,'p_name','parser.py',202),
+  ('_start_name -> <empty>','_start_name',0,'p_start_name','parser.py',220),
+  ('opt_name_scope -> <empty>','opt_name_scope',0,'p_opt_name_scope','parser.py',229),
+  ('opt_name_scope -> SLASH tids','opt_name_scope',2,'p_opt_name_scope','parser.py',230),
+  ('opt_sort_display -> <empty>','opt_sort_display',0,'p_opt_sort_display','parser.py',238),
+  ('opt_sort_display -> sortname displayname','opt_sort_display',2,'p_opt_sort_display','parser.py',239),
+  ('opt_sort_display -> SEMI displayname','opt_sort_display',2,'p_opt_sort_display','parser.py',240),
+  ('opt_sort_display -> sortname','opt_sort_display',1,'p_opt_sort_display','parser.py',241),
+  ('sortname -> SEMI STRING','sortname',2,'p_sortname','parser.py',255),
+  ('displayname -> SEMI STRING','displayname',2,'p_displayname','parser.py',263),
+  ('variant -> LPAREN STRING SLASH tids opt_reifier RPAREN','variant',6,'p_variant','parser.py',271),
+  ('assoc -> tid LPAREN _start_assoc roles RPAREN opt_scope opt_reifier','assoc',7,'p_assoc','parser.py',287),
+  ('_start_assoc -> <empty>','_start_assoc',0,'p_start_assoc','parser.py',298),
+  ('role -> _start_role player opt_role_type opt_reifier','role',4,'p_role','parser.py',305),
+  ('_start_role -> <empty>','_start_role',0,'p_start_role','parser.py',314),
+  ('player -> tid','player',1,'p_player','parser.py',323),
+  ('player -> topic','player',1,'p_player','parser.py',324),
+  ('opt_role_type -> <empty>','opt_role_type',0,'p_opt_role_type','parser.py',334),
+  ('opt_role_type -> COLON tid','opt_role_type',2,'p_opt_role_type','parser.py',335),
+  ('occ -> LCURLY tid COMMA tid COMMA resource RCURLY opt_scope opt_reifier','occ',9,'p_occ','parser.py',343),
+  ('resource -> STRING','resource',1,'p_resource_uri','parser.py',358),
+  ('resource -> DATA','resource',1,'p_resource_string','parser.py',365),
+  ('opt_scope -> <empty>','opt_scope',0,'p_opt_scope','parser.py',372),
+  ('opt_scope -> SLASH themes','opt_scope',2,'p_opt_scope','parser.py',373),
+  ('themes -> tids','themes',1,'p_themes','parser.py',380),
+  ('themes -> tids assoc','themes',2,'p_themes','parser.py',381),
+  ('opt_reifier -> <empty>','opt_reifier',0,'p_opt_reifier','parser.py',388),
+  ('opt_reifier -> TILDE IDENT','opt_reifier',2,'p_opt_reifier','parser.py',389),
+]
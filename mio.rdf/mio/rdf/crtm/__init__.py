@@ -27,22 +27,28 @@ class CRTMMappingReader(object):
 
     def read(self, src):
         self.handler.start()
-        parser = _make_parser(src.iri, self.handler)
         data = src.stream
         if not data:
             try:
                 data = urlopen(src.iri)
             except IOError:
                 raise mio. MIOException('Cannot read from "%s"' % src.iri)
-        parser.parse(data, _make_lexer())
+        with plyutils.pooled_parser(parser_mod) as parser:
+            with plyutils.pooled_lexer(lexer_mod) as lexer:
+                _initialize_parser(parser, src.iri, self.handler)
+                parser.parse(data, lexer)
         self.handler.end()
 
 
 def _make_parser(base_iri, handler=None, debug=False):
     parser = plyutils.make_parser(parser_mod, debug=debug)
+    _initialize_parser(parser, base_iri, handler)
+    return parser
+
+
+def _initialize_parser(parser, base_iri, handler):
     parser.context = parser_mod.ParserContext(base_iri)
     parser.handler = handler
-    return parser
 
 
 def _make_lexer(debug=False):
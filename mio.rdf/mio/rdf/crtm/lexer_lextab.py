@@ -0,0 +1,9 @@
+# mio.rdf.crtm.lexer_lextab.py. This file automatically created by PLY (version 3.4). Don't edit!
+_tabversion   = '3.4'
+_lextokens    = {u'LOCAL_IDENT': 1, u'HYPHEN': 1, u'QNAME': 1, u'LCURLY': 1, u'KW_NAME': 1, u'RPAREN': 1, u'KW_ASSOC': 1, u'RCURLY': 1, u'KW_SLO': 1, u'KW_AKO': 1, u'COLON': 1, u'COMMA': 1, u'KW_FALSE': 1, u'KW_ISA': 1, u'IDENT': 1, u'KW_OCC': 1, u'DIR_LANG2SCOPE': 1, u'DIR_INCLUDE': 1, u'IRI': 1, u'AT': 1, u'LPAREN': 1, u'KW_LANG': 1, u'KW_IID': 1, u'EQ': 1, u'SEMI': 1, u'KW_SID': 1, u'KW_TRUE': 1, u'DIR_PREFIX': 1}
+_lexreflags   = 0
+_lexliterals  = ''
+_lexstateinfo = {u'lang': u'exclusive', 'INITIAL': 'inclusive', u'kw': u'exclusive'}
+_lexstatere   = {u'lang': [(u'(?P<t_lang_ws>\\s+)|(?P<t_lang_commons>lang|false|true)|(?P<t_lang_end>.)|(?P<t_lang_EQ>=)', [None, (u't_lang_ws', 'ws'), (u't_lang_commons', 'commons'), (u't_lang_end', 'end'), (None, 'EQ')])], 'INITIAL': [(u'(?P<t_comment>\\#[^\\r\\n]*)|(?P<t_ws>\\s+)|(?P<t_SEMI>;)|(?P<t_COLON>:)|(?P<t_directive>%langtoscope|%prefix|%include)|(?P<t_IRI><[^<>\\"\\{\\}\\`\\\\ ]+>)|(?P<t_QNAME>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*:((([0-9]+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_IDENT>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*)|(?P<t_LOCAL_IDENT>([0-9]+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_COMMA>,)|(?P<t_AT>@)|(?P<t_HYPHEN>-)|(?P<t_RCURLY>})|(?P<t_LCURLY>{)', [None, (u't_comment', 'comment'), (u't_ws', 'ws'), (u't_SEMI', 'SEMI'), (u't_COLON', 'COLON'), (u't_directive', 'directive'), (u't_IRI', 'IRI'), (u't_QNAME', 'QNAME'), None, None, None, None, None, None, None, None, None, None, None, (u't_IDENT', 'IDENT'), None, None, None, (u't_LOCAL_IDENT', 'LOCAL_IDENT'), None, None, None, (None, 'LPAREN'), (None, 'RPAREN'), (None, 'COMMA'), (None, 'AT'), (None, 'HYPHEN'), (None, 'RCURLY'), (None, 'LCURLY')])], u'kw': [(u'(?P<t_kw_ws>\\s+)|(?P<t_kw_keyword>occurrence|subject-locator|iid|assoc|association|name|occ|subject-identifier|slo|ako|sid|item-identifier|isa)|(?P<t_kw_end>.)', [None, (u't_kw_ws', 'ws'), (u't_kw_keyword', 'keyword'), (u't_kw_end', 'end')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'lang': 't_error', 'INITIAL': 't_error', 'kw': 't_error'}
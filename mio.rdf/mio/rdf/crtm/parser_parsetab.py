@@ -0,0 +1,102 @@
+
+# /root/package/mio.rdf/mio/rdf/crtm/parser_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\xfb6\x0c6\xb2\xe5&\x14J\xea\xe1\x01n\x13\xdc\x10'
+    
+_lr_action_items = {'LOCAL_IDENT':([3,12,18,23,24,26,31,32,33,34,36,37,40,41,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,61,62,65,66,67,69,73,74,75,77,78,79,80,81,82,83,85,86,87,89,90,93,94,96,97,98,100,102,103,104,108,110,111,112,113,115,116,117,],[-70,-72,-65,-60,-59,-66,-71,-73,60,60,-15,-43,-26,-43,-53,-67,-18,-57,-67,-42,-71,-64,-54,-19,-14,-57,-52,-17,-16,60,-22,60,-42,-67,-42,-68,-56,-42,-55,-31,-25,-32,-57,-41,-69,-39,-42,-57,-23,60,-28,-62,-27,-67,-35,60,-36,-34,-42,-61,60,-37,-33,-24,-58,-38,-63,]),'HYPHEN':([16,30,84,91,101,106,],[-47,37,-40,-47,37,37,]),'QNAME':([0,2,3,5,7,8,12,14,15,16,17,19,20,21,22,23,24,25,28,29,30,31,32,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,66,67,68,69,73,74,75,77,78,79,80,81,83,84,85,86,87,88,91,92,93,94,96,97,98,101,102,103,104,106,107,108,111,112,115,116,117,],[3,-12,-70,-10,-5,3,-72,-6,3,-47,3,-9,-7,-8,-45,-60,-59,-44,-11,3,3,-71,-73,-46,-15,-43,-13,-26,-43,3,-53,-67,-18,-57,-67,3,-71,3,-64,-54,-19,-14,-57,-52,-17,-16,3,-67,3,3,-68,-56,-42,-55,-31,-25,-32,-57,-69,-40,-39,-42,-57,-20,-47,-21,-28,-62,-27,-67,-35,3,-36,-34,-42,3,3,-61,-37,-33,-58,-38,-63,]),'LCURLY':([4,11,49,],[18,26,82,]),'KW_NAME':([16,30,84,91,101,106,],[-47,41,-40,-47,41,41,]),'RPAREN':([3,31,114,],[-70,-71,117,]),'KW_ASSOC':([16,30,84,91,101,106,],[-47,42,-40,-47,42,42,]),'RCURLY':([3,12,23,24,31,32,36,37,40,41,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,61,62,65,66,67,69,73,74,75,77,78,79,80,81,83,85,86,87,89,93,94,96,97,98,102,103,104,108,110,111,112,113,115,116,117,],[-70,-72,-60,-59,-71,-73,-15,-43,-26,-43,-53,-67,-18,-57,-67,-42,-71,-64,-54,-19,-14,-57,-52,-17,-16,88,-22,92,-42,-67,-42,-68,-56,-42,-55,-31,-25,-32,-57,-69,-39,-42,-57,-23,-28,-62,-27,-67,-35,-36,-34,-42,-61,116,-37,-33,-24,-58,-38,-63,]),'KW_SLO':([16,30,84,91,101,106,],[-47,43,-40,-47,43,43,]),'KW_AKO':([16,30,84,91,101,106,],[-47,44,-40,-47,44,44,]),'COMMA':([1,3,11,12,31,32,49,51,59,60,63,64,83,95,105,],[17,-70,-71,-72,-71,-73,-71,85,-49,-48,-50,90,17,107,-51,]),'COLON':([1,3,11,12,31,32,49,51,59,60,63,64,105,],[16,-70,-71,-72,-71,-73,-71,84,-49,-48,-50,91,-51,]),'KW_FALSE':([9,109,],[23,23,]),'KW_ISA':([16,30,84,91,101,106,],[-47,47,-40,-47,47,47,]),'$end':([0,2,3,5,6,7,8,12,14,15,19,20,21,22,23,24,25,28,29,31,32,35,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,66,67,69,73,74,75,77,78,79,80,81,83,85,86,87,88,92,93,94,96,97,98,102,103,104,108,111,112,115,116,117,],[-4,-12,-70,-10,0,-5,-2,-72,-6,-3,-9,-7,-8,-45,-60,-59,-44,-11,-1,-71,-73,-46,-15,-43,-13,-26,-43,-53,-67,-18,-57,-67,-42,-71,-64,-54,-19,-14,-57,-52,-17,-16,-42,-67,-42,-68,-56,-42,-55,-31,-25,-32,-57,-69,-39,-42,-57,-20,-21,-28,-62,-27,-67,-35,-36,-34,-42,-61,-37,-33,-58,-38,-63,]),'IDENT':([0,2,3,5,7,8,12,13,14,15,18,19,20,21,22,23,24,25,26,28,29,31,32,33,34,35,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,61,62,65,66,67,69,73,74,75,77,78,79,80,81,82,83,85,86,87,88,89,90,92,93,94,96,97,98,100,102,103,104,108,110,111,112,113,115,116,117,],[4,-12,-70,-10,-5,4,-72,27,-6,4,-65,-9,-7,-8,-45,-60,-59,-44,-66,-11,4,-71,-73,59,59,-46,-15,-43,-13,-26,-43,-53,-67,-18,-57,-67,-42,-71,-64,-54,-19,-14,-57,-52,-17,-16,59,-22,59,-42,-67,-42,-68,-56,-42,-55,-31,-25,-32,-57,-41,-69,-39,-42,-57,-20,-23,59,-21,-28,-62,-27,-67,-35,59,-36,-34,-42,-61,59,-37,-33,-24,-58,-38,-63,]),'KW_OCC':([16,30,84,91,101,106,],[-47,48,-40,-47,48,48,]),'DIR_LANG2SCOPE':([0,2,5,15,22,23,24,25,28,35,],[9,-12,-10,9,-45,-60,-59,-44,-11,-46,]),'DIR_INCLUDE':([0,2,5,15,22,23,24,25,28,35,],[10,-12,-10,10,-45,-60,-59,-44,-11,-46,]),'IRI':([0,2,3,5,7,8,10,12,14,15,16,17,19,20,21,22,23,24,25,27,28,29,30,31,32,35,36,37,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,66,67,68,69,73,74,75,77,78,79,80,81,83,84,85,86,87,88,91,92,93,94,96,97,98,101,102,103,104,106,107,108,111,112,115,116,117,],[11,-12,-70,-10,-5,11,25,-72,-6,11,-47,31,-9,-7,-8,-45,-60,-59,-44,35,-11,11,49,-71,-73,-46,-15,-43,-13,-26,-43,31,-53,-67,-18,-57,-67,49,-71,31,-64,-54,-19,-14,-57,-52,-17,-16,49,-67,31,49,-68,-56,-42,-55,-31,-25,-32,-57,-69,-40,-39,-42,-57,-20,-47,-21,-28,-62,-27,-67,-35,49,-36,-34,-42,49,31,-61,-37,-33,-58,-38,-63,]),'AT':([3,16,30,37,41,44,47,48,49,51,55,66,67,69,81,84,91,97,101,106,117,],[-70,-47,50,-43,-43,50,50,50,-71,-64,50,50,50,50,50,-40,-47,50,50,50,-63,]),'LPAREN':([3,16,30,31,38,42,49,51,55,70,71,72,84,91,101,106,],[-70,-47,-29,-71,68,-29,-71,-64,-30,68,-64,-30,-40,-47,-29,-29,]),'KW_LANG':([76,],[99,]),'KW_IID':([16,30,84,91,101,106,],[-47,52,-40,-47,52,52,]),'EQ':([99,],[109,]),'SEMI':([3,12,31,32,46,49,51,55,81,83,87,],[-70,-72,-71,-73,76,-71,-64,76,76,-69,76,]),'KW_SID':([16,30,84,91,101,106,],[-47,56,-40,-47,56,56,]),'KW_TRUE':([9,109,],[24,24,]),'DIR_PREFIX':([0,2,3,5,7,8,12,14,15,19,20,21,22,23,24,25,28,29,31,32,35,36,37,39,40,41,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,66,67,69,73,74,75,77,78,79,80,81,83,85,86,87,88,92,93,94,96,97,98,102,103,104,108,111,112,115,116,117,],[13,-12,-70,-10,-5,13,-72,-6,13,-9,-7,-8,-45,-60,-59,-44,-11,13,-71,-73,-46,-15,-43,-13,-26,-43,-53,-67,-18,-57,-67,-42,-71,-64,-54,-19,-14,-57,-52,-17,-16,-42,-67,-42,-68,-56,-42,-55,-31,-25,-32,-57,-69,-39,-42,-57,-20,-21,-28,-62,-27,-67,-35,-36,-34,-42,-61,-37,-33,-58,-38,-63,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'qiris':([0,8,15,29,50,],[1,1,1,1,83,]),'occurrence':([30,101,106,],[36,36,36,]),'_char_body_qiri_comma':([85,],[102,]),'prefix_directive':([0,8,15,29,],[2,19,2,19,]),'opt_scope':([44,47,67,97,],[74,77,94,108,]),'opt_type':([30,42,101,106,],[38,70,38,38,]),'statement_body':([30,101,106,],[39,111,113,]),'char_body':([30,48,66,69,101,106,],[40,80,80,80,40,40,]),'_char_body_qiri':([84,],[101,]),'locals':([33,34,61,65,100,110,],[64,64,64,64,64,64,]),'_char_body_iri':([82,],[100,]),'opt_lang':([46,55,81,87,],[75,86,86,104,]),'directive':([0,15,],[5,28,]),'instance':([0,],[6,]),'bool':([9,109,],[22,115,]),'identity':([30,101,106,],[45,45,45,]),'statement':([0,8,15,29,],[7,20,7,20,]),'scope':([30,44,47,48,55,66,67,69,81,97,101,106,],[46,73,73,46,87,46,73,46,87,73,46,46,]),'type':([30,42,48,66,69,101,106,],[55,72,81,81,81,55,55,]),'body':([0,15,],[8,29,]),'_remember_predicates':([16,91,],[30,106,]),'_process_characteristic':([48,66,69,75,86,104,],[78,78,78,98,103,112,]),'in_scope_statement':([33,34,61,65,100,110,],[62,62,89,89,62,89,]),'opt_char_body':([48,66,69,],[79,93,96,]),'in_scope_statements':([33,34,100,],[61,65,110,]),'_name_scoped_stmt':([18,],[33,]),'qiri':([0,8,15,17,29,30,42,48,50,66,68,69,101,106,107,],[12,12,12,32,12,51,71,51,12,51,95,51,51,51,114,]),'scoped_statement':([0,8,15,29,],[14,21,14,21,]),'association':([30,101,106,],[53,53,53,]),'name':([30,101,106,],[54,54,54,]),'roles':([38,70,],[67,97,]),'local':([33,34,61,65,90,100,110,],[63,63,63,63,105,63,63,]),'_anon_prefix':([26,],[34,]),'_is_name':([37,41,],[66,69,]),'ako':([30,101,106,],[57,57,57,]),'isa':([30,101,106,],[58,58,58,]),'prolog':([0,],[15,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instance","S'",1,None,None,None),
+  ('instance -> prolog body','instance',2,'p_noop','parser.py',128),
+  ('instance -> body','instance',1,'p_noop','parser.py',129),
+  ('instance -> prolog','instance',1,'p_noop','parser.py',130),
+  ('instance -> <empty>','instance',0,'p_noop','parser.py',131),
+  ('body -> statement','body',1,'p_noop','parser.py',132),
+  ('body -> scoped_statement','body',1,'p_noop','parser.py',133),
+  ('body -> body statement','body',2,'p_noop','parser.py',134),
+  ('body -> body scoped_statement','body',2,'p_noop','parser.py',135),
+  ('body -> body prefix_directive','body',2,'p_noop','parser.py',136),
+  ('prolog -> directive','prolog',1,'p_noop','parser.py',137),
+  ('prolog -> prolog directive','prolog',2,'p_noop','parser.py',138),
+  ('directive -> prefix_directive','directive',1,'p_noop','parser.py',139),
+  ('statement -> qiris COLON _remember_predicates statement_body','statement',4,'p_noop','parser.py',140),
+  ('statement_body -> name','statement_body',1,'p_noop','parser.py',141),
+  ('statement_body -> occurrence','statement_body',1,'p_noop','parser.py',142),
+  ('statement_body -> isa','statement_body',1,'p_noop','parser.py',143),
+  ('statement_body -> ako','statement_body',1,'p_noop','parser.py',144),
+  ('statement_body -> identity','statement_body',1,'p_noop','parser.py',145),
+  ('statement_body -> association','statement_body',1,'p_noop','parser.py',146),
+  ('scoped_statement -> IDENT LCURLY _name_scoped_stmt in_scope_statements RCURLY','scoped_statement',5,'p_noop','parser.py',147),
+  ('scoped_statement -> IRI LCURLY _anon_prefix in_scope_statements RCURLY','scoped_statement',5,'p_noop','parser.py',148),
+  ('in_scope_statements -> in_scope_statement','in_scope_statements',1,'p_noop','parser.py',149),
+  ('in_scope_statements -> in_scope_statements in_scope_statement','in_scope_statements',2,'p_noop','parser.py',150),
+  ('in_scope_statement -> locals COLON _remember_predicates statement_body','in_scope_statement',4,'p_noop','parser.py',151),
+  ('occurrence -> KW_OCC opt_char_body','occurrence',2,'p_noop','parser.py',152),
+  ('occurrence -> char_body','occurrence',1,'p_noop','parser.py',153),
+  ('name -> KW_NAME _is_name opt_char_body','name',3,'p_noop','parser.py',154),
+  ('name -> HYPHEN _is_name opt_char_body','name',3,'p_noop','parser.py',155),
+  ('opt_type -> <empty>','opt_type',0,'p_noop','parser.py',156),
+  ('opt_type -> type','opt_type',1,'p_noop','parser.py',157),
+  ('opt_char_body -> _process_characteristic','opt_char_body',1,'p_noop','parser.py',158),
+  ('opt_char_body -> char_body','opt_char_body',1,'p_noop','parser.py',159),
+  ('char_body -> type scope opt_lang _process_characteristic','char_body',4,'p_noop','parser.py',160),
+  ('char_body -> type opt_lang _process_characteristic','char_body',3,'p_noop','parser.py',161),
+  ('char_body -> scope opt_lang _process_characteristic','char_body',3,'p_noop','parser.py',162),
+  ('char_body -> qiri COMMA _char_body_qiri_comma','char_body',3,'p_noop','parser.py',163),
+  ('char_body -> qiri COLON _char_body_qiri statement_body','char_body',4,'p_noop','parser.py',164),
+  ('char_body -> IRI LCURLY _char_body_iri in_scope_statements RCURLY','char_body',5,'p_noop','parser.py',165),
+  ('_char_body_qiri_comma -> <empty>','_char_body_qiri_comma',0,'p__char_body_qiri_comma','parser.py',173),
+  ('_char_body_qiri -> <empty>','_char_body_qiri',0,'p__char_body_qiri','parser.py',183),
+  ('_char_body_iri -> <empty>','_char_body_iri',0,'p__char_body_iri','parser.py',193),
+  ('_process_characteristic -> <empty>','_process_characteristic',0,'p__process_characteristic','parser.py',203),
+  ('_is_name -> <empty>','_is_name',0,'p__is_name','parser.py',210),
+  ('directive -> DIR_INCLUDE IRI','directive',2,'p_include_directive','parser.py',217),
+  ('directive -> DIR_LANG2SCOPE bool','directive',2,'p_lang2scope_directive','parser.py',224),
+  ('prefix_directive -> DIR_PREFIX IDENT IRI','prefix_directive',3,'p_prefix_directive','parser.py',231),
+  ('_remember_predicates -> <empty>','_remember_predicates',0,'p__remember_predicates','parser.py',238),
+  ('local -> LOCAL_IDENT','local',1,'p_local','parser.py',251),
+  ('local -> IDENT','local',1,'p_local','parser.py',252),
+  ('locals -> local','locals',1,'p_locals','parser.py',260),
+  ('locals -> locals COMMA local','locals',3,'p_locals','parser.py',261),
+  ('identity -> KW_SID','identity',1,'p_identity_sid','parser.py',272),
+  ('identity -> KW_SLO','identity',1,'p_identity_slo','parser.py',279),
+  ('identity -> KW_IID','identity',1,'p_identity_iid','parser.py',286),
+  ('isa -> KW_ISA opt_scope','isa',2,'p_isa','parser.py',293),
+  ('ako -> KW_AKO opt_scope','ako',2,'p_ako','parser.py',300),
+  ('opt_lang -> <empty>','opt_lang',0,'p_opt_lang','parser.py',307),
+  ('opt_lang -> SEMI KW_LANG EQ bool','opt_lang',4,'p_opt_lang','parser.py',308),
+  ('bool -> KW_TRUE','bool',1,'p_bool','parser.py',315),
+  ('bool -> KW_FALSE','bool',1,'p_bool','parser.py',316),
+  ('association -> KW_ASSOC opt_type roles opt_scope','association',4,'p_association','parser.py',323),
+  ('association -> opt_type roles opt_scope','association',3,'p_association','parser.py',324),
+  ('roles -> LPAREN qiri COMMA qiri RPAREN','roles',5,'p_roles','parser.py',331),
+  ('type -> qiri','type',1,'p_type','parser.py',340),
+  ('_name_scoped_stmt -> <empty>','_name_scoped_stmt',0,'p__name_scoped_stmt','parser.py',347),
+  ('_anon_prefix -> <empty>','_anon_prefix',0,'p__anon_prefix','parser.py',354),
+  ('opt_scope -> <empty>','opt_scope',0,'p_opt_scope','parser.py',361),
+  ('opt_scope -> scope','opt_scope',1,'p_opt_scope','parser.py',362),
+  ('scope -> AT qiris','scope',2,'p_scope','parser.py',369),
+  ('qiri -> QNAME','qiri',1,'p_qiri_qname','parser.py',377),
+  ('qiri -> IRI','qiri',1,'p_qiri_iri','parser.py',384),
+  ('qiris -> qiri','qiris',1,'p_qiris','parser.py',391),
+  ('qiris -> qiris COMMA qiri','qiris',3,'p_qiris','parser.py',392),
+]
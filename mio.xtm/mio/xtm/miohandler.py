@@ -16,7 +16,7 @@ translates events into XML Topic Maps (XTM) syntax.
 import logging
 from tm import voc, XSD
 from tm.mio import SUBJECT_IDENTIFIER, SUBJECT_LOCATOR, ITEM_IDENTIFIER
-from tm.xmlutils import XMLWriter
+from tm.xmlutils import XMLWriter, DEFAULT_BUFFER_SIZE
 import tm.mio.handler as mio_handler
 
 __all__ = ['XTM21Handler']
@@ -50,7 +50,8 @@ class XTM21Handler(mio_handler.HamsterMapHandler):
         SUBJECT_LOCATOR: u'subjectLocator'
     }
 
-    def __init__(self, writer=None, fileobj=None, encoding='utf-8', prettify=False):
+    def __init__(self, writer=None, fileobj=None, encoding='utf-8', prettify=False,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
         """\
 
         `writer`
@@ -62,6 +63,9 @@ class XTM21Handler(mio_handler.HamsterMapHandler):
         `prettify`
             Indicates if the XML should be prettified or written in one line (default)
             (ignored iff `writer` is provided)
+        `buffer_size`
+            The number of characters which are collected before they are
+            written to `fileobj` (ignored iff `writer` is provided)
 
         >>> import io
         >>> out = io.BytesIO()
@@ -84,7 +88,7 @@ class XTM21Handler(mio_handler.HamsterMapHandler):
         '<?xml version="1.0" encoding="utf-8" standalone="yes"?>\\n<topicMap xmlns="http://www.topicmaps.org/xtm/" version="2.1">\\n  <topic>\\n    <subjectIdentifier href="http://psi.example.org/something"/>\\n  </topic>\\n</topicMap>\\n'
         """
         super(XTM21Handler, self).__init__()
-        self._out = writer if writer else XMLWriter(fileobj, encoding, prettify)
+        self._out = writer if writer else XMLWriter(fileobj, encoding, prettify, buffer_size)
         self._state = _STATE_ILLEGAL
         self._last_topic = None
         # Optional properties
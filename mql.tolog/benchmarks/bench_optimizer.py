@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Compares the end-to-end latency of ``parse_query`` with the XSLT optimizers
+and the in-process optimizers (c.f. ``mql.tolog.optimizer``).
+
+The plan cache is disabled, so each call parses and optimizes the query.
+
+Usage::
+
+    python bench_optimizer.py [number of iterations]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import sys
+from time import time
+from mql.tolog import parse_query
+
+_BASE = u'http://www.semagia.com/bench/'
+
+_QUERIES = (
+    u'instance-of($x, composer)?',
+    u'select $c, $o from instance-of($c, composer), composed-by($c : composer, $o : work), '
+    u'topic-name($c, $n), value($n, $v), not(premiere-date($o, $d)) order by $v?',
+    u'parent-of($p, $c) :- { parenthood($p : parent, $c : child) | '
+    u'fatherhood($p : father, $c : child) }. '
+    u'ancestor-of($a, $d) :- { parent-of($a, $d) | parent-of($a, $x), ancestor-of($x, $d) }. '
+    u'select $a from ancestor-of($a, lars), instance-of($a, person), topic($a)?',
+    u'select $t, $n from topic-name($t, $n), type($n, short-name), occurrence($t, $o), '
+    u'type($o, homepage), resource($o, $r), association-role($a, $r2), role-player($r2, $t)?',
+)
+
+
+def bench(query, xslt, iterations):
+    """\
+    Returns the time (in seconds) which was necessary to parse and optimize
+    the `query` `iterations` times.
+    """
+    start = time()
+    for _ in xrange(iterations):
+        parse_query(query, iri=_BASE, cache=False, xslt=xslt)
+    return time() - start
+
+
+def main(iterations=200):
+    for query in _QUERIES:
+        # Warm up: Compile the stylesheets, fill the parser pool
+        bench(query, True, 1)
+        bench(query, False, 1)
+        xslt = bench(query, True, iterations)
+        tree = bench(query, False, iterations)
+        print('%s' % query[:70])
+        print('  xslt: %8.1f us/query  in-process: %8.1f us/query  speedup: %.2fx'
+              % (xslt / iterations * 1000000, tree / iterations * 1000000, xslt / tree))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
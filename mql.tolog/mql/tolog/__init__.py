@@ -13,10 +13,12 @@ Provides functions to parse tolog queries.
 :license:      BSD license
 """
 from __future__ import absolute_import
-from functools import partial
 from urllib2 import urlopen
+from functools import partial
 from tm import make_source, plyutils, xmlutils
-from . import lexer as lexer_mod, parser as parser_mod, handler as handler_mod, xsl
+from lxml import etree
+from . import lexer as lexer_mod, parser as parser_mod, handler as handler_mod, xsl, plancache, \
+    cardinality, optimizer, querytree
 
 __all__ = ('parse', 'parse_query')
 
@@ -37,14 +39,15 @@ def parse(src, handler, tolog_plus=False, **kw):
         tolog+ mode is enabled automatically, regardless of the provided
         `tolog_plus` value
     """
-    parser = plyutils.make_parser(parser_mod)
-    parser_mod.initialize_parser(parser, handler, tolog_plus)
     source = make_source(src, kw.get('iri'))
     data = source.stream or urlopen(source.iri)
     handler.base_iri = source.iri
     handler.start()
-    lexer = _make_lexer(tolog_plus)
-    parser.parse(data.read(), lexer=lexer)
+    with plyutils.pooled_parser(parser_mod) as parser:
+        with plyutils.pooled_lexer(lexer_mod) as lexer:
+            parser_mod.initialize_parser(parser, handler, tolog_plus)
+            lexer.tolog_plus = tolog_plus
+            parser.parse(data.read(), lexer=lexer)
     handler.end()
 
 
@@ -62,7 +65,8 @@ def _make_lexer(tolog_plus):
     return lexer
 
 
-def parse_query(src, query_handler=None, factory=None, tolog_plus=False, optimizers=None, **kw):
+def parse_query(src, query_handler=None, factory=None, tolog_plus=False, optimizers=None, cache=True,
+                layer=None, xslt=False, statistics=None, **kw):
     """\
     Parses and optimizes the query and returns an executable query.
     
@@ -90,17 +94,111 @@ def parse_query(src, query_handler=None, factory=None, tolog_plus=False, optimiz
         the parsed provided query. If the optimizers are not provided,
         a default set of optimizers will be applied to the query.
         To omit any optimization, an empty iterable must be provided.
+    `cache`
+        A `plancache.PlanCache` which keeps the optimized queries, ``True``
+        (default) to use the default cache (c.f. `plancache.get_default_cache`)
+        or ``False`` to optimize the query regardless of previous results.
+        The cache is looked up by the query string (and the keyword
+        arguments) first and by the canonicalized query afterwards.
+    `layer`
+        An optional `layer.TopicMapLayer` which provides cardinality
+        estimates (c.f. `layer.TopicMapLayer.estimate`). If provided, the
+        ``annotate-costs`` optimizer uses the estimates instead of static
+        costs. Since the estimates depend on the current state of the
+        topic map, the `cache` is not used in this case.
+    `xslt`
+        Indicates if the XSLT stylesheets should be used to optimize the
+        query (disabled by default). If disabled, the query is optimized
+        in-process (c.f. `optimizer`) unless an optimizer is requested which
+        is only available as XSLT stylesheet.
+    `statistics`
+        An optional `statistics.Statistics` provider. If provided, the costs
+        and the join order of the predicates are computed by the numbers of
+        the provider (c.f. `statistics.CostModel`). The statistics are
+        supported by the in-process optimizers only and the `cache` is not
+        used in this case.
     """
     query_handler = query_handler or handler_mod.make_queryhandler(factory)
     source = make_source(src, iri=kw.get('iri'))
     query_handler.base_iri = source.iri
     if optimizers is None:
         optimizers = xsl.DEFAULT_TRANSFORMERS
-    xsl.apply_transformations(parse_to_etree(source, tolog_plus, **kw), optimizers,
-                              partial(xsl.saxify, handler=handler_mod.SAXMediator(query_handler)))
+    optimizers = tuple(optimizers)
+    pipeline = _XSLT_PIPELINE if xslt or not optimizer.is_available(optimizers) else _TREE_PIPELINE
+    optimize = pipeline.optimize
+    if statistics is not None:
+        if pipeline is not _TREE_PIPELINE:
+            raise ValueError('Statistics are not supported by the XSLT optimizers')
+        optimize = partial(optimizer.apply_optimizers, statistics=statistics, base_iri=source.iri)
+    if layer is not None or statistics is not None:
+        cache = False
+    if cache is True:
+        cache = plancache.get_default_cache()
+    if cache is not False:
+        query = (source.stream or urlopen(source.iri)).read()
+        parse_kw = dict(kw, iri=source.iri)
+        key = query, tolog_plus, optimizers, pipeline.name, tuple(sorted(parse_kw.items()))
+        doc = cache.get(key)
+        if doc is None:
+            doc = _optimize_cached(pipeline.parse(query, tolog_plus, **parse_kw),
+                                   pipeline, optimizers, cache)
+            cache.put(key, doc)
+    elif layer is not None:
+        doc = _optimize_estimated(pipeline.parse(source, tolog_plus, **kw),
+                                  pipeline.annotate, optimize, optimizers, layer, source.iri)
+    else:
+        doc = optimize(pipeline.parse(source, tolog_plus, **kw), optimizers)
+    pipeline.saxify(doc, handler_mod.SAXMediator(query_handler))
     return query_handler.query
 
 
+class _Pipeline(object):
+    """\
+    Bundles the functions to parse, optimize and emit a query.
+    """
+    def __init__(self, name, parse, optimize, make_key, annotate, saxify):
+        self.name = name
+        self.parse = parse
+        self.optimize = optimize
+        self.make_key = make_key
+        self.annotate = annotate
+        self.saxify = saxify
+
+
+def _optimize_estimated(doc, annotate, optimize, optimizers, layer, base_iri):
+    """\
+    Applies the `optimizers` and annotates the query with the cardinality
+    estimates of the `layer` right before ``annotate-costs`` is applied.
+    """
+    try:
+        idx = optimizers.index(u'annotate-costs')
+    except ValueError:
+        return optimize(doc, optimizers)
+    doc = annotate(optimize(doc, optimizers[:idx]), layer, base_iri)
+    return optimize(doc, optimizers[idx:])
+
+
+def _optimize_cached(doc, pipeline, optimizers, cache):
+    """\
+    Returns the optimized `doc` from the `cache` or applies the `optimizers`
+    and puts the result into the `cache`.
+
+    The cache key is the canonical representation of the query and
+    the optimizer names. If ``query-c14n`` is the first optimizer, it is
+    applied before the key is created, so equivalent queries share one
+    entry.
+    """
+    if optimizers[:1] == (u'query-c14n',):
+        doc = pipeline.optimize(doc, optimizers[:1])
+        optimizers = optimizers[1:]
+    key = pipeline.make_key(doc), optimizers, pipeline.name
+    res = cache.get(key)
+    if res is None:
+        res = pipeline.optimize(doc, optimizers)
+        cache.put(key, res)
+    return res
+
+
 def parse_to_etree(src, tolog_plus=False, **kw):
     """\
     Returns the provided query as Etree.
@@ -120,6 +218,33 @@ def parse_to_etree(src, tolog_plus=False, **kw):
     return contenthandler.etree
 
 
+def parse_to_tree(src, tolog_plus=False, **kw):
+    """\
+    Returns the provided query as `querytree.Node`.
+
+    `src`
+        A string, a file object or a `tm.Source` instance to read the query from.
+        If a string is used, this function expects an iri keyword which
+        defines the base IRI.
+    `tolog_plus`
+        Indicates if tolog+ parsing mode should be enabled.
+        Note: If the query starts with a ``%version`` directive, the 
+        tolog+ mode is enabled automatically, regardless of the provided
+        `tolog_plus` value
+    """
+    builder = querytree.TreeBuilder()
+    parse(src, handler_mod.XMLParserHandler(builder), tolog_plus, **kw)
+    return builder.root
+
+
+_XSLT_PIPELINE = _Pipeline('xslt', parse_to_etree, xsl.apply_transformations,
+                           lambda doc: etree.tostring(doc, method='c14n'),
+                           cardinality.annotate, xsl.saxify)
+
+_TREE_PIPELINE = _Pipeline('tree', parse_to_tree, optimizer.apply_optimizers,
+                           querytree.Node.key, cardinality.annotate_tree, querytree.saxify)
+
+
 def convert_to_tolog(src, tolog_plus=False, hints=False, optimizers=None, **kw):
     """\
     Parses the provided query and returns the query as (an optimized) tolog
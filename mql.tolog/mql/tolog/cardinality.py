@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Annotates the predicates of a query with the cardinality estimates of a
+`layer.TopicMapLayer`.
+
+The predicates get an ``estimate`` attribute which holds the number of rows
+the layer expects for the predicate (c.f. `layer.TopicMapLayer.estimate`).
+The ``annotate-costs`` stylesheet prefers these estimates over its static
+costs.
+
+Only those predicates are annotated which have at least one variable and
+whose constant arguments allow a lookup, i.e. ``instance-of($x, composer)``
+or ``composed-by($c : composer, tosca : work)``. Predicates which refer to
+an unknown topic get an estimate of ``0`` since they cannot match.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from decimal import Decimal
+from functools import partial
+from tm import ANY, irilib
+from . import consts, querytree
+from .handler import _PREFIXNAME2KIND
+
+__all__ = ('annotate', 'annotate_tree')
+
+# Indicates a variable or a parameter
+_OPEN = object()
+
+# Indicates a reference to a non-existing topic
+_UNKNOWN = object()
+
+
+def annotate(doc, layer, base_iri):
+    """\
+    Returns a copy of `doc` where the predicates have an ``estimate``
+    attribute if the `layer` provides an estimate.
+
+    `doc`
+        The query as Etree.
+    `layer`
+        A `layer.TopicMapLayer` which provides the estimates.
+    `base_iri`
+        The base IRI of the query which is used to resolve identifiers.
+    """
+    return querytree.to_etree(annotate_tree(querytree.from_etree(doc), layer, base_iri))
+
+
+def annotate_tree(root, layer, base_iri):
+    """\
+    Returns a copy of the `querytree.Node` `root` where the predicates have
+    an ``estimate`` attribute if the `layer` provides an estimate.
+
+    c.f. `annotate`
+    """
+    resolve = _Resolver(partial(_lookup, layer), base_iri, root)
+    def transform(node):
+        children = [transform(child) for child in node.children]
+        estimator = _ESTIMATORS.get(node.name)
+        estimate = estimator(node, layer, resolve) if estimator is not None else None
+        if estimate is None:
+            return node.replace(children=children)
+        attrs = dict(node.attrs)
+        attrs[u'estimate'] = unicode(estimate)
+        return node.replace(attrs=attrs, children=children)
+    return transform(root)
+
+
+class _Resolver(object):
+    """\
+    Translates the arguments of a predicate into topics and values.
+    """
+    def __init__(self, lookup, base_iri, root):
+        """\
+
+        `lookup`
+            A function which accepts the kind of a topic reference
+            (``consts.SID``, ``consts.SLO``, ``consts.IID``, ``consts.OID``)
+            and the IRI (or object id) and returns the construct or ``None``.
+        `base_iri`
+            The base IRI of the query.
+        `root`
+            The `querytree.Node` which represents the query.
+        """
+        self._lookup = lookup
+        self._base = base_iri
+        self._prefixes = {}
+        self._topics = {}
+        for el in root.children:
+            if el.name == u'base':
+                self._base = el.get(u'iri')
+            elif el.name == u'namespace':
+                self._prefixes[el.get(u'identifier')] = el.get(u'iri')
+
+    def __call__(self, el, value_expected=False):
+        """\
+        Returns a topic, a value, ``_OPEN`` for variables and parameters, or
+        ``_UNKNOWN`` if the topic reference cannot be resolved.
+
+        If `value_expected` is ``True``, IRIs are returned as value.
+        """
+        name = el.name
+        value = el.get(u'value')
+        if name == u'string':
+            return value
+        if name == u'iri' and value_expected:
+            return self._resolve_iri(value)
+        if name == u'integer':
+            return int(value)
+        if name == u'decimal':
+            return Decimal(value)
+        if name in (u'date', u'datetime'):
+            return value
+        if name == u'identifier':
+            ref = consts.IID, self._resolve_iri(u'#' + value)
+        elif name == u'iri':
+            ref = consts.SID, self._resolve_iri(value)
+        elif name == u'subjectlocator':
+            ref = consts.SLO, self._resolve_iri(value)
+        elif name == u'itemidentifier':
+            ref = consts.IID, self._resolve_iri(value)
+        elif name == u'objectid':
+            ref = consts.OID, value
+        elif name in (u'qname', u'curie'):
+            iri = self._prefixes.get(el.get(u'prefix'))
+            if iri is None:
+                return _UNKNOWN
+            ref = _PREFIXNAME2KIND[el.get(u'kind')], iri + el.get(u'localpart')
+        else:
+            return _OPEN
+        topic = self._topics.get(ref)
+        if topic is None:
+            topic = self._lookup(*ref)
+            topic = self._topics[ref] = _UNKNOWN if topic is None else topic
+        return topic
+
+    def _resolve_iri(self, reference):
+        return irilib.resolve_iri(self._base, reference)
+
+
+def _lookup(layer, kind, value):
+    """\
+    Returns the construct of the `layer` which is referenced by `kind` and
+    `value` or ``None``.
+    """
+    if kind == consts.SID:
+        return layer.get_topic_by_subject_identifier(value)
+    if kind == consts.SLO:
+        return layer.get_topic_by_subject_locator(value)
+    if kind == consts.IID:
+        return layer.get_construct_by_item_identifier(value)
+    if kind == consts.OID:
+        return layer.get_construct_by_id(value)
+    return None
+
+
+def _name(el, resolve):
+    """\
+    Returns the topic which is referenced by the ``name`` child of `el`.
+    """
+    for name in el.children:
+        if name.name == u'name':
+            return resolve(name.children[0]) if name.children else _OPEN
+    return _OPEN
+
+
+def _builtin_predicate(el, layer, resolve):
+    name = el.get(u'name')
+    if name not in _BUILTIN_PREDICATES:
+        return None
+    args = el.children
+    if len(args) != 2 or resolve(args[0]) is not _OPEN:
+        return None
+    arg = resolve(args[1], value_expected=name == u'value')
+    if arg is _OPEN:
+        return None
+    if arg is _UNKNOWN:
+        return 0
+    if name == u'instance-of':
+        types = [arg]
+        types.extend(layer.get_subtypes(arg))
+        return layer.estimate('get_topics', types)
+    if name == u'direct-instance-of':
+        return layer.estimate('get_topics', [arg])
+    if name == u'type':
+        return layer.estimate('get_typed', arg)
+    if name == u'scope':
+        return layer.estimate('get_scoped', arg)
+    if name == u'role-player':
+        return layer.estimate('get_roles_played', arg)
+    estimates = [layer.estimate('get_names_by_value', arg),
+                 layer.estimate('get_occurrences_by_value', arg, ANY),
+                 layer.estimate('get_variants_by_value', arg, ANY)]
+    return None if None in estimates else sum(estimates)
+
+
+def _dynamic_predicate(el, layer, resolve):
+    typ = _name(el, resolve)
+    topic, value = el.children[-2:]
+    topic, value = resolve(topic), resolve(value, value_expected=True)
+    if typ is _OPEN or _OPEN not in (topic, value):
+        return None
+    if _UNKNOWN in (typ, topic, value):
+        return 0
+    if value is not _OPEN:
+        return layer.estimate('get_occurrences_by_value', value, ANY)
+    if topic is _OPEN:
+        return layer.estimate('get_typed', typ)
+    return None
+
+
+def _association_predicate(el, layer, resolve):
+    typ = _name(el, resolve)
+    if typ is _OPEN:
+        return None
+    if typ is _UNKNOWN:
+        return 0
+    estimates = [layer.estimate('get_associations', [typ])]
+    open_players = 0
+    for pair in el.children:
+        if pair.name != u'pair':
+            continue
+        role_type, player = [resolve(child.children[0]) for child in pair.children
+                                if child.name in (u'type', u'player')]
+        if _UNKNOWN in (role_type, player):
+            return 0
+        if player is _OPEN:
+            open_players += 1
+        elif role_type is not _OPEN:
+            estimates.append(layer.estimate('get_roles_played', player, [role_type]))
+    if not open_players or None in estimates:
+        return None
+    return min(estimates)
+
+
+# Built-in predicates which are estimated if the first argument is a variable
+# and the second argument is a constant
+_BUILTIN_PREDICATES = (u'instance-of', u'direct-instance-of', u'type', u'scope',
+                       u'role-player', u'value')
+
+_ESTIMATORS = {
+    u'builtin-predicate': _builtin_predicate,
+    u'dynamic-predicate': _dynamic_predicate,
+    u'association-predicate': _association_predicate,
+}
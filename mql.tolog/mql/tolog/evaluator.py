@@ -0,0 +1,1183 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Evaluates select queries (c.f. `query.SelectQuery`) against a
+`layer.TopicMapLayer`.
+
+The evaluator is pull-based: The ``where`` clause is translated into a
+pipeline of operators. Each operator consumes an iterator of rows (dicts
+which map variable names to values) and returns an iterator of rows, so
+rows are produced lazily while the result is iterated.
+
+Predicates are joined with the incoming rows as follows:
+
+* If no variable of the predicate is bound, the predicate's rows are
+  streamed.
+* If the bound variables can be answered by the layer (i.e. by
+  ``get_topic_by_subject_identifier``, ``get_*_by_value``, ``get_typed``,
+  ``get_scoped``, ``get_roles_played`` etc.), the layer is asked once per
+  distinct combination of values and the answer is kept in a hash table.
+* Otherwise, the predicate's rows are read once and put into a hash table
+  (keyed by the bound variables) which is probed by the incoming rows
+  (hash join).
+
+Comparisons, ``not`` clauses and function calls are deferred until
+their variables are bound.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+import operator
+from decimal import Decimal, InvalidOperation
+from itertools import chain, islice
+from tm import ANY, XSD
+from tm.mql import InvalidQueryError
+from . import consts, query as q
+
+__all__ = ('evaluate', 'Result', 'Row')
+
+
+def evaluate(query, layer, params=None):
+    """\
+    Executes the `query` and returns a `Result`.
+
+    `query`
+        A `query.SelectQuery` (c.f. `mql.tolog.parse_query`).
+    `layer`
+        The `layer.TopicMapLayer` to query.
+    `params`
+        An optional dict which provides the values of the query parameters.
+    """
+    if not isinstance(query, q.SelectQuery):
+        raise InvalidQueryError('Expected a select query, got: %r' % query)
+    ctx = _Context(layer, query.rules, params or {})
+    ops = _compile(ctx, query.where, ())
+    rows = _run(ops, {})
+    names = [item.name for item in query.header if isinstance(item, q.Variable)]
+    counts = [item.variable for item in query.header if isinstance(item, q.Count)]
+    keys = [item.name if isinstance(item, q.Variable) else item.variable for item in query.header]
+    if counts:
+        rows = _count(rows, names, counts)
+    order_by = query.order_by
+    if order_by:
+        rows = _order(layer, rows, keys, order_by)
+    else:
+        rows = _distinct(rows, keys)
+    if query.offset or query.limit is not None:
+        start = query.offset or 0
+        rows = islice(rows, start, None if query.limit is None else start + query.limit)
+    return Result(keys, rows)
+
+
+class Result(object):
+    """\
+    `IResult` implementation which iterates lazily over the rows.
+    """
+    def __init__(self, keys, rows):
+        self._keys = list(keys)
+        self._rows = rows
+
+    def keys(self):
+        return list(self._keys)
+
+    def __iter__(self):
+        keys = self._keys
+        for values in self._rows:
+            yield Row(keys, values)
+
+    def first(self):
+        try:
+            return next(iter(self), None)
+        finally:
+            self.close()
+
+    def scalar(self):
+        row = self.first()
+        return row[0] if row is not None else None
+
+    def close(self):
+        close = getattr(self._rows, 'close', None)
+        if close:
+            close()
+        self._rows = iter(())
+
+
+class Row(object):
+    """\
+    `IRow` implementation. The values are accessible by index or by
+    variable name.
+    """
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys, values):
+        self._keys = keys
+        self._values = values
+
+    def keys(self):
+        return list(self._keys)
+
+    def __getitem__(self, key):
+        if isinstance(key, basestring):
+            try:
+                key = self._keys.index(key)
+            except ValueError:
+                raise KeyError(key)
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._values)
+
+    def __repr__(self):
+        return 'Row(%r)' % (self._values,)
+
+
+#
+# Helpers for the result
+#
+
+def _distinct(rows, keys):
+    seen = set()
+    for row in rows:
+        values = tuple(row.get(key) for key in keys)
+        if values not in seen:
+            seen.add(values)
+            yield values
+
+
+def _count(rows, names, counts):
+    """\
+    Groups the `rows` by the variables `names` and counts the distinct
+    values of the variables `counts`.
+    """
+    groups = {}
+    order = []
+    seen = set()
+    for row in rows:
+        group = tuple(row.get(name) for name in names)
+        if group not in groups:
+            groups[group] = [0] * len(counts)
+            order.append(group)
+        for i, name in enumerate(counts):
+            value = row.get(name)
+            if value is not None and (group, i, value) not in seen:
+                seen.add((group, i, value))
+                groups[group][i] += 1
+    for group in order:
+        row = dict(zip(names, group))
+        row.update(zip(counts, groups[group]))
+        yield row
+
+
+def _order(layer, rows, keys, order_by):
+    """\
+    Returns the distinct projections of the `rows` in the requested order.
+    """
+    names = [name for name, _ in order_by]
+    seen = set()
+    items = []
+    for row in rows:
+        values = tuple(row.get(key) for key in keys)
+        if values not in seen:
+            seen.add(values)
+            items.append((values, [row.get(name) for name in names]))
+    sort_keys = {}
+    def sort_key(value):
+        key = sort_keys.get(value)
+        if key is None:
+            key = sort_keys[value] = _sort_key(layer, value)
+        return key
+    # Stable sorting, starting with the least significant key
+    for i in reversed(xrange(len(order_by))):
+        items.sort(key=lambda item: sort_key(item[1][i]),
+                   reverse=order_by[i][1] == consts.DESC)
+    return (values for values, _ in items)
+
+
+def _sort_key(layer, value):
+    """\
+    Returns a key to sort `value`. Topics are sorted by their name, other
+    Topic Maps constructs by their identifier.
+    """
+    if value is None:
+        return (0, None)
+    if isinstance(value, (basestring, int, long, float, Decimal)):
+        return (1, value)
+    if layer.is_topic(value):
+        names = [layer.get_value(name) for name in layer.get_names(value)]
+        return (2, min(names) if names else u'', layer.get_construct_id(value))
+    return (3, layer.get_construct_id(value))
+
+
+#
+# Compiler
+#
+
+# Indicates an unknown topic reference
+_UNKNOWN = object()
+
+
+class _Context(object):
+    """\
+    Keeps the layer, the rules and parameters, and caches resolved topic
+    references and compiled rules.
+    """
+    def __init__(self, layer, rules, params):
+        self.layer = layer
+        self.rules = dict((rule.name, rule) for rule in rules)
+        self.params = params
+        self.compiled_rules = {}
+        self._refs = {}
+
+    def resolve(self, term):
+        """\
+        Returns the value of a constant (a literal, a topic reference or a
+        parameter). Topic references which cannot be resolved are returned
+        as ``_UNKNOWN``.
+        """
+        if isinstance(term, q.Literal):
+            return term.value
+        if isinstance(term, q.Parameter):
+            try:
+                return self.params[term.name]
+            except KeyError:
+                raise InvalidQueryError('No value for the parameter "%s" provided' % term.name)
+        if isinstance(term, q.Reference):
+            value = self._refs.get(term)
+            if value is None:
+                value = self._resolve_reference(term)
+                self._refs[term] = value
+            return value
+        raise InvalidQueryError('Unexpected term %r' % term)
+
+    def _resolve_reference(self, ref):
+        layer = self.layer
+        kind, value = ref.kind, ref.value
+        if kind == consts.SID:
+            res = layer.get_topic_by_subject_identifier(value)
+        elif kind == consts.SLO:
+            res = layer.get_topic_by_subject_locator(value)
+        elif kind == consts.IID:
+            res = layer.get_construct_by_item_identifier(value)
+        else:
+            res = layer.get_construct_by_id(value)
+        return _UNKNOWN if res is None else res
+
+
+def _run(ops, row):
+    """\
+    Returns an iterator over the rows which are produced by applying the
+    operators `ops` to the provided `row`.
+    """
+    rows = iter((row,))
+    for op in ops:
+        rows = op(rows)
+    return rows
+
+
+def _compile(ctx, clauses, bound):
+    """\
+    Returns a list of operators for the `clauses`.
+
+    `bound`
+        An iterable of variable names which are bound by previous clauses.
+    """
+    return [_compile_clause(ctx, clause, bound)
+            for clause, bound in _schedule(clauses, bound)]
+
+
+def _schedule(clauses, bound):
+    """\
+    Returns a list of (clause, bound variables) tuples.
+
+    The order of the clauses is kept, but clauses which need bound variables
+    are moved behind the clauses which bind these variables.
+    """
+    remaining = list(clauses)
+    bound = frozenset(bound)
+    res = []
+    while remaining:
+        for i, clause in enumerate(remaining):
+            missing = _requires(clause, bound)
+            if not missing or not any(missing & _binds(other)
+                                      for other in remaining if other is not clause):
+                break
+        else:
+            i = 0
+        clause = remaining.pop(i)
+        res.append((clause, bound))
+        bound = bound | _binds(clause)
+    return res
+
+
+def _requires(clause, bound):
+    """\
+    Returns the variables which must be bound before `clause` is evaluated.
+    """
+    if isinstance(clause, q.InfixPredicate):
+        if clause.name == u'eq' and (_is_known(clause.lh, bound) or _is_known(clause.rh, bound)):
+            return frozenset()
+        return frozenset(q.variables(clause)) - bound
+    if isinstance(clause, q.Not):
+        return frozenset(q.variables(clause)) - bound
+    if isinstance(clause, q.Predicate) and clause.name in _FUNCTIONS:
+        inputs = _FUNCTIONS[clause.name][1]
+        return frozenset(q.variables([clause.args[i] for i in inputs if i < len(clause.args)])) - bound
+    if isinstance(clause, q.BuiltinPredicate) and clause.name == u'value-like':
+        return frozenset(q.variables(clause.args[1:2])) - bound
+    return frozenset()
+
+
+def _binds(clause):
+    """\
+    Returns the variables which may be bound by `clause`.
+    """
+    if isinstance(clause, q.Not):
+        return frozenset()
+    if isinstance(clause, q.InfixPredicate) and clause.name != u'eq':
+        return frozenset()
+    return frozenset(q.variables(clause))
+
+
+def _is_known(term, bound):
+    return not isinstance(term, q.Variable) or term.name in bound
+
+
+def _compile_clause(ctx, clause, bound):
+    if isinstance(clause, q.BuiltinPredicate):
+        try:
+            func, indexes = _BUILTINS[clause.name]
+        except KeyError:
+            raise InvalidQueryError('Unsupported predicate "%s"' % clause.name)
+        args = clause.args
+        if clause.name in _LOCATOR_PREDICATES:
+            args = args[:1] + tuple(_locator(arg) for arg in args[1:])
+        return _join(ctx, _Relation(ctx, func, indexes, clause.hints), args)
+    if isinstance(clause, q.InternalPredicate):
+        return _join(ctx, _Relation(ctx, _INTERNALS[clause.name], (), clause.hints), clause.args)
+    if isinstance(clause, q.AssociationPredicate):
+        return _join_association(ctx, clause)
+    if isinstance(clause, q.DynamicOccurrencePredicate):
+        occ_type = ctx.resolve(clause.type)
+        if occ_type is _UNKNOWN:
+            return _nothing
+        return _join(ctx, _Relation(ctx, _dynamic_occurrence(occ_type), (0, 1), ()),
+                     (clause.topic, clause.value))
+    if isinstance(clause, q.InfixPredicate):
+        return _Comparison(ctx, clause)
+    if isinstance(clause, q.Not):
+        return _Not(_compile(ctx, clause.clauses, bound))
+    if isinstance(clause, q.Or):
+        return _Or([_compile(ctx, branch, bound) for branch in clause.branches],
+                   clause.short_circuit)
+    if isinstance(clause, q.Predicate):
+        if clause.name in ctx.rules:
+            return _RuleInvocation(ctx, ctx.rules[clause.name], clause.args)
+        if clause.name in _FUNCTIONS:
+            return _Function(ctx, clause.name, clause.args)
+        raise InvalidQueryError('Unknown predicate "%s"' % clause.name)
+    raise InvalidQueryError('Unsupported clause %r' % clause)
+
+
+def _locator(term):
+    """\
+    Returns a string literal if `term` is an IRI reference.
+
+    The ``query-c14n`` optimizer translates string arguments of predicates
+    like ``subject-identifier`` into IRIs.
+    """
+    if isinstance(term, q.Reference) and term.kind != consts.OID:
+        return q.Literal(term.value, XSD.anyURI)
+    return term
+
+
+def _terms(ctx, args):
+    """\
+    Returns a list of (is variable, variable name or value) tuples.
+    """
+    return [(True, arg.name) if isinstance(arg, q.Variable) else (False, ctx.resolve(arg))
+            for arg in args]
+
+
+def _values(terms, row):
+    """\
+    Returns the values of the `terms` wrt. `row`, ``None`` indicates an
+    unbound variable.
+    """
+    return [row.get(value) if is_var else value for is_var, value in terms]
+
+
+def _extend(row, terms, values):
+    """\
+    Returns a copy of `row` where the variables of `terms` are bound to the
+    provided `values` or ``None`` if the values are not compatible with
+    the row.
+    """
+    res = dict(row)
+    for (is_var, name), value in zip(terms, values):
+        if is_var:
+            current = res.get(name)
+            if current is None:
+                res[name] = value
+            elif current != value:
+                return None
+        elif name != value:
+            return None
+    return res
+
+
+def _nothing(rows):
+    return iter(())
+
+
+#
+# Operators
+#
+
+def _join(ctx, relation, args):
+    """\
+    Returns an operator which joins the incoming rows with the `relation`.
+    """
+    terms = _terms(ctx, args)
+    if any(value is _UNKNOWN for is_var, value in terms if not is_var):
+        return _nothing
+    constant = [value if not is_var else None for is_var, value in terms]
+    variables = [i for i, (is_var, _) in enumerate(terms) if is_var]
+
+    def join(rows):
+        # Maps the positions of the bound variables to a (hash table, complete) tuple
+        tables = {}
+        for row in rows:
+            values = _values(terms, row)
+            key_positions = tuple(i for i in variables if values[i] is not None)
+            if not key_positions:
+                matches = relation.lookup(values)
+            else:
+                key = tuple(values[i] for i in key_positions)
+                table, complete = tables.get(key_positions, (None, False))
+                if table is None:
+                    if relation.is_indexed([value is not None for value in values]):
+                        # Index lookup, the answers are kept per key
+                        table = {}
+                    else:
+                        # Hash join: Read the relation once
+                        table, complete = _build(relation.lookup(constant), key_positions), True
+                    tables[key_positions] = table, complete
+                matches = table.get(key)
+                if matches is None:
+                    if complete:
+                        continue
+                    matches = table[key] = list(relation.lookup(values))
+            for match in matches:
+                res = _extend(row, terms, match)
+                if res is not None:
+                    yield res
+    return join
+
+
+def _build(tuples, key_positions):
+    """\
+    Returns a dict which maps the values at the `key_positions` to a list of
+    `tuples`.
+    """
+    table = {}
+    for tup in tuples:
+        table.setdefault(tuple(tup[i] for i in key_positions), []).append(tup)
+    return table
+
+
+class _Relation(object):
+    """\
+    Represents a predicate which is evaluated against the layer.
+    """
+    def __init__(self, ctx, func, indexes, hints):
+        """\
+
+        `func`
+            A function which accepts the layer, a list of values (``None``
+            indicates an unknown value) and a function which filters
+            constructs according to the hints. The function returns
+            an iterable of value tuples which *may* match the values.
+        `indexes`
+            Positions which can be used for a direct lookup.
+        """
+        self._layer = ctx.layer
+        self._func = func
+        self._indexes = indexes
+        self._accept = _kind_filter(ctx.layer, hints)
+
+    def is_indexed(self, bound):
+        return any(bound[i] for i in self._indexes if i < len(bound))
+
+    def lookup(self, values):
+        return self._func(self._layer, values, self._accept)
+
+
+def _kind_filter(layer, hints):
+    """\
+    Returns a function which returns if a construct is of a kind provided
+    by the `hints`.
+    """
+    checks = [getattr(layer, 'is_%s' % hint) for hint in hints or ()]
+    if not checks:
+        return lambda obj: True
+    return lambda obj: any(check(obj) for check in checks)
+
+
+def _join_association(ctx, clause):
+    assoc_type = ctx.resolve(clause.type)
+    role_types = []
+    for role_type, _ in clause.roles:
+        if isinstance(role_type, q.Variable):
+            raise InvalidQueryError('Variables are not supported as role types')
+        role_types.append(ctx.resolve(role_type))
+    if assoc_type is _UNKNOWN or _UNKNOWN in role_types:
+        return _nothing
+    relation = _Relation(ctx, _associations(assoc_type, role_types), range(len(role_types)), ())
+    return _join(ctx, relation, [player for _, player in clause.roles])
+
+
+class _Comparison(object):
+    """\
+    Filters rows by comparing two values. ``eq`` binds a variable if the
+    other value is known.
+    """
+    _COMPARATORS = {
+        u'eq': operator.eq, u'ne': operator.ne,
+        u'lt': operator.lt, u'le': operator.le,
+        u'gt': operator.gt, u'ge': operator.ge,
+    }
+
+    def __init__(self, ctx, clause):
+        self._name = clause.name
+        self._compare = self._COMPARATORS[clause.name]
+        self._terms = _terms(ctx, (clause.lh, clause.rh))
+
+    def __call__(self, rows):
+        terms, name, compare = self._terms, self._name, self._compare
+        for row in rows:
+            lh, rh = _values(terms, row)
+            if lh is None or rh is None:
+                if name != u'eq' or lh is rh:
+                    raise InvalidQueryError('Unbound variable in comparison')
+                value = rh if lh is None else lh
+                if value is not _UNKNOWN:
+                    yield _extend(row, terms, (value, value))
+            elif lh is _UNKNOWN or rh is _UNKNOWN:
+                if name == u'ne':
+                    yield row
+            elif compare(*_coerce(lh, rh)):
+                yield row
+
+
+_NUMBERS = (int, long, float, Decimal)
+
+
+def _coerce(lh, rh):
+    """\
+    Converts a string into a number if the other value is a number.
+    """
+    try:
+        if isinstance(lh, _NUMBERS) and isinstance(rh, basestring):
+            return lh, Decimal(rh)
+        if isinstance(rh, _NUMBERS) and isinstance(lh, basestring):
+            return Decimal(lh), rh
+    except InvalidOperation:
+        pass
+    return lh, rh
+
+
+class _Not(object):
+    """\
+    Passes all rows for which the clauses do not produce any row.
+    """
+    def __init__(self, ops):
+        self._ops = ops
+
+    def __call__(self, rows):
+        ops = self._ops
+        for row in rows:
+            for _ in _run(ops, row):
+                break
+            else:
+                yield row
+
+
+class _Or(object):
+    """\
+    Returns the rows of all branches or the rows of the first branch which
+    produces rows if the `short_circuit` flag is set.
+    """
+    def __init__(self, branches, short_circuit):
+        self._branches = branches
+        self._short_circuit = short_circuit
+
+    def __call__(self, rows):
+        short_circuit = self._short_circuit
+        for row in rows:
+            for ops in self._branches:
+                found = False
+                for res in _run(ops, row):
+                    found = True
+                    yield res
+                if found and short_circuit:
+                    break
+
+
+class _RuleInvocation(object):
+    """\
+    Evaluates the body of a rule with the parameters bound to the arguments.
+    """
+    def __init__(self, ctx, rule, args):
+        if len(args) != len(rule.params):
+            raise InvalidQueryError('The rule "%s" expects %d arguments, got %d'
+                                    % (rule.name, len(rule.params), len(args)))
+        self._ctx = ctx
+        self._rule = rule
+        self._params = [param.name for param in rule.params]
+        self._terms = _terms(ctx, args)
+
+    def _body(self, bound):
+        """\
+        Returns the compiled body of the rule. The rule is compiled lazily,
+        once per combination of bound parameters.
+        """
+        key = self._rule.name, bound
+        compiled = self._ctx.compiled_rules
+        ops = compiled.get(key)
+        if ops is None:
+            ops = compiled[key] = _compile(self._ctx, self._rule.body, bound)
+        return ops
+
+    def __call__(self, rows):
+        params, terms = self._params, self._terms
+        for row in rows:
+            values = _values(terms, row)
+            if _UNKNOWN in values:
+                continue
+            inner = dict((param, value) for param, value in zip(params, values) if value is not None)
+            seen = set()
+            for res in _run(self._body(frozenset(inner)), inner):
+                result = tuple(res.get(param) for param in params)
+                if result in seen:
+                    continue
+                seen.add(result)
+                new_row = dict(row)
+                for (is_var, name), value in zip(terms, result):
+                    if is_var and value is not None:
+                        current = new_row.get(name)
+                        if current is None:
+                            new_row[name] = value
+                        elif current != value:
+                            break
+                else:
+                    yield new_row
+
+
+class _Function(object):
+    """\
+    Invokes a module function.
+    """
+    def __init__(self, ctx, name, args):
+        self._name = name
+        self._func, self._inputs, self._output = _FUNCTIONS[name]
+        if len(args) != len(self._inputs) + (self._output is not None):
+            raise InvalidQueryError('Wrong number of arguments for "%s"' % name)
+        self._terms = _terms(ctx, args)
+
+    def __call__(self, rows):
+        func, inputs, output, terms = self._func, self._inputs, self._output, self._terms
+        for row in rows:
+            values = _values(terms, row)
+            args = [values[i] for i in inputs]
+            if _UNKNOWN in values:
+                continue
+            if None in args:
+                raise InvalidQueryError('Unbound variable in function "%s"' % self._name)
+            res = func(*args)
+            if output is None:
+                if res:
+                    yield row
+            else:
+                values[output] = res
+                new_row = _extend(row, terms, values)
+                if new_row is not None:
+                    yield new_row
+
+
+#
+# Relations
+#
+
+def _topics(layer, values, accept):
+    topic = values[0]
+    if topic is not None:
+        return ((topic,),) if layer.is_topic(topic) else ()
+    return ((topic,) for topic in layer.get_topics())
+
+
+def _topicmap(layer, values, accept):
+    return ((layer.get_topicmap(),),)
+
+
+def _associations_(layer, values, accept):
+    assoc = values[0]
+    if assoc is not None:
+        return ((assoc,),) if layer.is_association(assoc) else ()
+    return ((assoc,) for assoc in layer.get_associations())
+
+
+def _association_role(layer, values, accept):
+    assoc, role = values
+    if assoc is not None:
+        if not layer.is_association(assoc):
+            return ()
+        return ((assoc, role) for role in layer.get_roles(assoc))
+    if role is not None:
+        return ((layer.get_parent(role), role),) if layer.is_role(role) else ()
+    return ((assoc, role) for assoc in layer.get_associations()
+                            for role in layer.get_roles(assoc))
+
+
+def _role_player(layer, values, accept):
+    role, player = values[:2]
+    role_type = values[2] if len(values) > 2 else None
+    if role is not None:
+        if not layer.is_role(role):
+            return ()
+        res = ((role, layer.get_player(role)),)
+    elif player is not None:
+        if not layer.is_topic(player):
+            return ()
+        types = [role_type] if role_type is not None else ANY
+        res = ((role, player) for role in layer.get_roles_played(player, types))
+    elif role_type is not None:
+        res = ((role, layer.get_player(role)) for role in layer.get_typed(role_type)
+                                                if layer.is_role(role))
+    else:
+        res = ((role, layer.get_player(role)) for role in _all_roles(layer))
+    return _with_type(layer, res, 0, len(values))
+
+
+def _with_type(layer, tuples, index, arity):
+    """\
+    Appends the type of the construct at `index` to each tuple if the
+    predicate has three arguments (c.f. ``fold-type`` optimizer).
+    """
+    if arity < 3:
+        return tuples
+    return (tup + (layer.get_type(tup[index]),) for tup in tuples)
+
+
+def _children(getter, is_kind):
+    """\
+    Returns a relation function for ``occurrence`` and ``topic-name``.
+    """
+    def relation(layer, values, accept):
+        topic, child = values[:2]
+        child_type = values[2] if len(values) > 2 else None
+        if topic is not None:
+            if not layer.is_topic(topic):
+                return ()
+            types = [child_type] if child_type is not None else ANY
+            res = ((topic, child) for child in getter(layer, topic, types))
+        elif child is not None:
+            res = ((layer.get_parent(child), child),) if is_kind(layer, child) else ()
+        elif child_type is not None:
+            res = ((layer.get_parent(child), child) for child in layer.get_typed(child_type)
+                                                    if is_kind(layer, child))
+        else:
+            res = ((topic, child) for topic in layer.get_topics()
+                                    for child in getter(layer, topic, ANY))
+        return _with_type(layer, res, 1, len(values))
+    return relation
+
+
+_occurrence = _children(lambda layer, topic, types: layer.get_occurrences(topic, types),
+                        lambda layer, obj: layer.is_occurrence(obj))
+_topic_name = _children(lambda layer, topic, types: layer.get_names(topic, types),
+                        lambda layer, obj: layer.is_name(obj))
+
+
+def _variant(layer, values, accept):
+    name, variant = values
+    if name is not None:
+        return ((name, variant) for variant in layer.get_variants(name)) if layer.is_name(name) else ()
+    if variant is not None:
+        return ((layer.get_parent(variant), variant),) if layer.is_variant(variant) else ()
+    return ((name, variant) for name in _all_names(layer)
+                            for variant in layer.get_variants(name))
+
+
+def _direct_instance_of(layer, values, accept):
+    instance, type = values[:2]
+    if instance is not None:
+        if not layer.is_topic(instance):
+            return ()
+        return ((instance, type) for type in layer.get_types(instance))
+    if type is not None:
+        return ((instance, type) for instance in layer.get_topics([type]))
+    return ((instance, type) for instance in layer.get_topics()
+                                for type in layer.get_types(instance))
+
+
+def _instance_of(layer, values, accept):
+    instance, type = values[:2]
+    if instance is not None:
+        if not layer.is_topic(instance):
+            return ()
+        return ((instance, type) for type in _all_types(layer, instance))
+    if type is not None:
+        types = [type]
+        types.extend(layer.get_subtypes(type))
+        return ((instance, type) for instance in _unique(layer.get_topics(types)))
+    return ((instance, type) for instance in layer.get_topics()
+                                for type in _all_types(layer, instance))
+
+
+def _all_types(layer, topic):
+    """\
+    Returns the types and supertypes of `topic`.
+    """
+    types = list(layer.get_types(topic))
+    return _unique(chain(types, *[layer.get_supertypes(type) for type in types]))
+
+
+def _types(layer, values, accept):
+    return ((type,) for type in layer.get_topic_types())
+
+
+def _direct_types(layer, values, accept):
+    return ((type,) for type in layer.get_topic_direct_types())
+
+
+def _type(layer, values, accept):
+    tmc, type = values
+    if tmc is not None:
+        if not _is_typed(layer, tmc):
+            return ()
+        return ((tmc, layer.get_type(tmc)),)
+    if type is not None:
+        return ((tmc, type) for tmc in layer.get_typed(type) if accept(tmc))
+    return ((tmc, layer.get_type(tmc)) for tmc in _typed_constructs(layer) if accept(tmc))
+
+
+def _scope(layer, values, accept):
+    scoped, theme = values
+    if scoped is not None:
+        if not _is_scoped(layer, scoped):
+            return ()
+        return ((scoped, theme) for theme in layer.get_scope(scoped))
+    if theme is not None:
+        return ((scoped, theme) for scoped in layer.get_scoped(theme) if accept(scoped))
+    return ((scoped, theme) for scoped in _scoped_constructs(layer) if accept(scoped)
+                                for theme in layer.get_scope(scoped))
+
+
+def _value(layer, values, accept):
+    tmc, value = values
+    if tmc is not None:
+        if not _has_value(layer, tmc):
+            return ()
+        return ((tmc, layer.get_value(tmc)),)
+    if value is not None:
+        return ((tmc, value) for tmc in _by_value(layer, value, ANY) if accept(tmc))
+    return ((tmc, layer.get_value(tmc)) for tmc in _valued_constructs(layer) if accept(tmc))
+
+
+def _value_like(layer, values, accept):
+    tmc, search = values[:2]
+    if search is None:
+        raise InvalidQueryError('value-like requires a search string')
+    words = search.lower().split()
+    if tmc is not None:
+        candidates = (tmc,) if _has_value(layer, tmc) else ()
+    else:
+        candidates = (tmc for tmc in _valued_constructs(layer) if accept(tmc))
+    res = []
+    for tmc in candidates:
+        value = layer.get_value(tmc).lower()
+        if all(word in value for word in words):
+            res.append((tmc, search, 1) if len(values) > 2 else (tmc, search))
+    return res
+
+
+def _datatype(layer, values, accept):
+    tmc = values[0]
+    if tmc is not None:
+        if not (layer.is_occurrence(tmc) or layer.is_variant(tmc)):
+            return ()
+        candidates = (tmc,)
+    else:
+        candidates = (tmc for tmc in _valued_constructs(layer)
+                        if not layer.is_name(tmc) and accept(tmc))
+    return ((tmc, layer.get_datatype(tmc)) for tmc in candidates)
+
+
+def _resource(layer, values, accept):
+    tmc, iri = values
+    if tmc is not None:
+        candidates = (tmc,) if _has_value(layer, tmc) else ()
+    elif iri is not None:
+        candidates = chain(layer.get_occurrences_by_value(iri, XSD.anyURI),
+                           layer.get_variants_by_value(iri, XSD.anyURI))
+    else:
+        candidates = _valued_constructs(layer)
+    return ((tmc, layer.get_value(tmc)) for tmc in candidates
+                if accept(tmc) and not layer.is_name(tmc)
+                    and layer.get_datatype(tmc) == XSD.anyURI)
+
+
+def _identity(getter, lookup):
+    """\
+    Returns a relation function for ``subject-identifier`` and
+    ``subject-locator``.
+    """
+    def relation(layer, values, accept):
+        topic, iri = values
+        if topic is not None:
+            if not layer.is_topic(topic):
+                return ()
+            return ((topic, iri) for iri in getter(layer, topic))
+        if iri is not None:
+            topic = lookup(layer, iri)
+            return ((topic, iri),) if topic is not None else ()
+        return ((topic, iri) for topic in layer.get_topics()
+                                for iri in getter(layer, topic))
+    return relation
+
+
+_subject_identifier = _identity(lambda layer, topic: layer.get_subject_identifiers(topic),
+                                lambda layer, iri: layer.get_topic_by_subject_identifier(iri))
+_subject_locator = _identity(lambda layer, topic: layer.get_subject_locators(topic),
+                             lambda layer, iri: layer.get_topic_by_subject_locator(iri))
+
+
+def _item_identifier(layer, values, accept):
+    tmc, iri = values
+    if tmc is not None:
+        return ((tmc, iri) for iri in layer.get_item_identifiers(tmc))
+    if iri is not None:
+        tmc = layer.get_construct_by_item_identifier(iri)
+        return ((tmc, iri),) if tmc is not None and accept(tmc) else ()
+    return ((tmc, iri) for tmc in _all_constructs(layer) if accept(tmc)
+                        for iri in layer.get_item_identifiers(tmc))
+
+
+def _object_id(layer, values, accept):
+    tmc, ident = values
+    if tmc is not None:
+        return ((tmc, layer.get_construct_id(tmc)),)
+    if ident is not None:
+        tmc = layer.get_construct_by_id(ident)
+        return ((tmc, ident),) if tmc is not None else ()
+    return ((tmc, layer.get_construct_id(tmc)) for tmc in _all_constructs(layer))
+
+
+def _reifies(layer, values, accept):
+    reifier, reified = values
+    if reifier is not None:
+        reified = layer.get_reified(reifier)
+        return ((reifier, reified),) if reified is not None else ()
+    if reified is not None:
+        reifier = layer.get_reifier(reified)
+        return ((reifier, reified),) if reifier is not None else ()
+    return ((layer.get_reifier(tmc), tmc) for tmc in _all_constructs(layer)
+                if accept(tmc) and layer.get_reifier(tmc) is not None)
+
+
+def _associations(assoc_type, role_types):
+    """\
+    Returns a relation function for an association predicate. The relation
+    consists of the players of the roles.
+    """
+    def match(layer, assoc, values, pinned):
+        roles = list(layer.get_roles(assoc))
+        res = set()
+        def assign(i, used, players):
+            if i == len(role_types):
+                res.add(tuple(players))
+                return
+            for role in roles:
+                if role in used:
+                    continue
+                if i in pinned and role is not pinned[i]:
+                    continue
+                if layer.get_type(role) != role_types[i]:
+                    continue
+                player = layer.get_player(role)
+                if values[i] is not None and values[i] != player:
+                    continue
+                used.add(role)
+                players.append(player)
+                assign(i + 1, used, players)
+                players.pop()
+                used.remove(role)
+        assign(0, set(), [])
+        return res
+
+    def relation(layer, values, accept):
+        for i, value in enumerate(values):
+            if value is not None:
+                if not layer.is_topic(value):
+                    return
+                for role in layer.get_roles_played(value, [role_types[i]]):
+                    assoc = layer.get_parent(role)
+                    if layer.get_type(assoc) == assoc_type:
+                        for players in match(layer, assoc, values, {i: role}):
+                            yield players
+                return
+        for assoc in layer.get_associations([assoc_type]):
+            for players in match(layer, assoc, values, {}):
+                yield players
+    return relation
+
+
+def _dynamic_occurrence(occ_type):
+    """\
+    Returns a relation function for a dynamic occurrence predicate.
+    """
+    def relation(layer, values, accept):
+        topic, value = values
+        if topic is not None:
+            if not layer.is_topic(topic):
+                return ()
+            return ((topic, layer.get_value(occ)) for occ in layer.get_occurrences(topic, [occ_type]))
+        if value is not None:
+            return ((layer.get_parent(occ), value) for occ in layer.get_occurrences_by_value(value)
+                        if layer.get_type(occ) == occ_type)
+        return ((layer.get_parent(occ), layer.get_value(occ)) for occ in layer.get_typed(occ_type)
+                    if layer.is_occurrence(occ))
+    return relation
+
+
+#
+# Helpers to iterate over the constructs of the topic map
+#
+
+def _unique(iterable):
+    seen = set()
+    for item in iterable:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def _all_roles(layer):
+    return (role for assoc in layer.get_associations() for role in layer.get_roles(assoc))
+
+
+def _all_names(layer):
+    return (name for topic in layer.get_topics() for name in layer.get_names(topic))
+
+
+def _all_occurrences(layer):
+    return (occ for topic in layer.get_topics() for occ in layer.get_occurrences(topic))
+
+
+def _all_variants(layer):
+    return (variant for name in _all_names(layer) for variant in layer.get_variants(name))
+
+
+def _typed_constructs(layer):
+    return chain(layer.get_associations(), _all_roles(layer), _all_occurrences(layer), _all_names(layer))
+
+
+def _scoped_constructs(layer):
+    return chain(layer.get_associations(), _all_occurrences(layer), _all_names(layer), _all_variants(layer))
+
+
+def _valued_constructs(layer):
+    return chain(_all_occurrences(layer), _all_names(layer), _all_variants(layer))
+
+
+def _all_constructs(layer):
+    return chain((layer.get_topicmap(),), layer.get_topics(), _typed_constructs(layer), _all_variants(layer))
+
+
+def _by_value(layer, value, datatype):
+    return chain(layer.get_names_by_value(value),
+                 layer.get_occurrences_by_value(value, datatype),
+                 layer.get_variants_by_value(value, datatype))
+
+
+def _is_typed(layer, tmc):
+    return layer.is_association(tmc) or layer.is_role(tmc) \
+            or layer.is_occurrence(tmc) or layer.is_name(tmc)
+
+
+def _is_scoped(layer, tmc):
+    return layer.is_association(tmc) or layer.is_occurrence(tmc) \
+            or layer.is_name(tmc) or layer.is_variant(tmc)
+
+
+def _has_value(layer, tmc):
+    return layer.is_occurrence(tmc) or layer.is_name(tmc) or layer.is_variant(tmc)
+
+
+# Maps the name of a built-in predicate to the relation function and the
+# positions of the arguments which allow a direct lookup
+_BUILTINS = {
+    u'association': (_associations_, (0,)),
+    u'association-role': (_association_role, (0, 1)),
+    u'datatype': (_datatype, (0,)),
+    u'direct-instance-of': (_direct_instance_of, (0, 1)),
+    u'instance-of': (_instance_of, (0, 1)),
+    u'item-identifier': (_item_identifier, (0, 1)),
+    u'object-id': (_object_id, (0, 1)),
+    u'occurrence': (_occurrence, (0, 1, 2)),
+    u'reifies': (_reifies, (0, 1)),
+    u'resource': (_resource, (0, 1)),
+    u'role-player': (_role_player, (0, 1, 2)),
+    u'scope': (_scope, (0, 1)),
+    u'source-locator': (_item_identifier, (0, 1)),
+    u'subject-identifier': (_subject_identifier, (0, 1)),
+    u'subject-locator': (_subject_locator, (0, 1)),
+    u'topic': (_topics, (0,)),
+    u'topic-name': (_topic_name, (0, 1, 2)),
+    u'topicmap': (_topicmap, ()),
+    u'type': (_type, (0, 1)),
+    u'value': (_value, (0, 1)),
+    u'value-like': (_value_like, (0, 1)),
+    u'variant': (_variant, (0, 1)),
+}
+
+# Predicates which expect a locator (an IRI) as second argument
+_LOCATOR_PREDICATES = (u'datatype', u'item-identifier', u'resource', u'source-locator',
+                       u'subject-identifier', u'subject-locator')
+
+_INTERNALS = {
+    u'types': _types,
+    u'direct-types': _direct_types,
+}
+
+
+_STRING_MODULE = consts.TOLOG_STRING_MODULE_IRI
+
+# Maps a function IRI to the function, the positions of the input arguments
+# and the position of the output argument (``None`` for filters)
+_FUNCTIONS = {
+    _STRING_MODULE + u'starts-with': (lambda s, prefix: s.startswith(prefix), (0, 1), None),
+    _STRING_MODULE + u'ends-with': (lambda s, suffix: s.endswith(suffix), (0, 1), None),
+    _STRING_MODULE + u'contains': (lambda s, sub: sub in s, (0, 1), None),
+    _STRING_MODULE + u'concat': (lambda s1, s2: s1 + s2, (1, 2), 0),
+    _STRING_MODULE + u'length': (lambda s: len(s), (1,), 0),
+}
@@ -15,6 +15,7 @@ tolog handler implementations.
 from __future__ import absolute_import
 import logging
 import xml.sax as sax
+from tm.mql import InvalidQueryError
 from . import consts
 
 
@@ -308,6 +309,9 @@ class SAXMediator(sax.ContentHandler):
         elif name == u'function-call':
             args = [attrs.get(_NAME_ATTR)]
             evt = u'Function'
+        elif name == u'base':
+            args = [attrs.get((None, u'iri'))]
+            method = handler.base
         kw = {}
         costs, hints = attrs.get(_COST_ATTR), attrs.get(_HINT_ATTR)
         if costs:
@@ -327,3 +331,280 @@ class SAXMediator(sax.ContentHandler):
             return
         state = self._states.pop()
         getattr(self._handler, u'end%s' % state)()
+
+
+class _Name(list):
+    """\
+    Collects the name of a predicate.
+    """
+
+
+def make_queryhandler(factory=None):
+    """\
+    Returns a `IQueryHandler` which creates the query with the provided
+    `factory`.
+
+    `factory`
+        A `IQueryFactory` instance. If it is ``None``, a
+        `query.QueryFactory` is used.
+    """
+    if factory is None:
+        from .query import QueryFactory
+        factory = QueryFactory()
+    return QueryHandler(factory)
+
+
+class QueryHandler(TologHandler):
+    """\
+    `IQueryHandler` which translates the events into calls of a
+    `IQueryFactory`.
+
+    Only select queries are supported. If the events do not contain a
+    select query (i.e. the query was not canonicalized), the clauses
+    are treated as select query which selects all variables.
+    """
+    def __init__(self, factory):
+        """\
+
+        `factory`
+            The `IQueryFactory` instance.
+        """
+        self._factory = factory
+        self.base_iri = None
+        self.query = None
+
+    def start(self):
+        self.query = None
+        self._base = self.base_iri
+        self._prefixes = {}
+        self._rules = []
+        self._stack = [[]]
+        self._branches = []
+        self._short_circuit = []
+        self._where = None
+        self._order_by = None
+        self._limit = None
+        self._offset = None
+
+    def end(self):
+        if self.query is None:
+            from .query import variables
+            clauses = self._stack.pop()
+            self.query = self._create_select_query(
+                            [self._factory.create_variable(name) for name in variables(clauses)],
+                            clauses)
+        self._stack = None
+
+    def _create_select_query(self, header, where):
+        return self._factory.create_select_query(header, where, self._order_by,
+                                                 self._limit, self._offset,
+                                                 self._rules)
+
+    def _unsupported(self, *args, **kw):
+        raise InvalidQueryError('Only select queries are supported')
+
+    startInsert = startDelete = startMerge = startUpdate = _unsupported
+    startCreate = startDrop = startLoad = startFunction = _unsupported
+
+    def _push(self, *args, **kw):
+        self._stack.append([])
+
+    def _pop(self):
+        return self._stack.pop()
+
+    def _append(self, item):
+        self._stack[-1].append(item)
+
+    startSelect = startWhere = _push
+    startAssociationPredicate = startDynamicPredicate = startPredicate = _push
+    startPair = startType = startPlayer = startNot = _push
+
+    def startName(self):
+        self._stack.append(_Name())
+
+    def base(self, iri):
+        self._base = iri
+
+    def namespace(self, identifier, iri, kind):
+        self._prefixes[identifier] = iri, kind
+
+    def endSelect(self):
+        header = self._pop()
+        self.query = self._create_select_query(header, self._where or ())
+
+    def endWhere(self):
+        self._where = self._pop()
+
+    def startRule(self, name, variables):
+        self._stack.append([name, [self._factory.create_variable(v) for v in variables]])
+
+    def endRule(self):
+        items = self._pop()
+        self._rules.append(self._factory.create_rule(items[0], items[1], items[2:]))
+
+    def endName(self):
+        name, = self._pop()
+        self._append(name)
+
+    def startBuiltinPredicate(self, name, costs=None, hints=None):
+        self._stack.append([name, hints])
+
+    def endBuiltinPredicate(self):
+        items = self._pop()
+        self._append(self._factory.create_builtin_predicate(items[0], items[2:], items[1]))
+
+    def startInternalPredicate(self, name, removed_variables, costs=None, hints=None):
+        self._stack.append([name, hints])
+
+    def endInternalPredicate(self):
+        items = self._pop()
+        pred = self._factory.create_internal_predicate(items[0], items[2:], items[1])
+        if pred is None:
+            raise InvalidQueryError('Unknown internal predicate "%s"' % items[0])
+        self._append(pred)
+
+    def startInfixPredicate(self, name, costs=None):
+        self._stack.append([name])
+
+    def endInfixPredicate(self):
+        name, lh, rh = self._pop()
+        self._append(self._factory.create_infix_predicate(name, lh, rh))
+
+    def endAssociationPredicate(self):
+        items = self._pop()
+        self._append(self._factory.create_association_predicate(self._topic_ref(items[0]), items[1:]))
+
+    def endPair(self):
+        self._append(tuple(self._pop()))
+
+    def endType(self):
+        type, = self._pop()
+        self._append(type)
+
+    endPlayer = endType
+
+    def endDynamicPredicate(self):
+        name, topic, value = self._pop()
+        self._append(self._factory.create_dynamic_occurrence_predicate(self._topic_ref(name), topic, value))
+
+    def endPredicate(self):
+        items = self._pop()
+        self._append(self._factory.create_predicate(items[0], items[1:]))
+
+    def endNot(self):
+        self._append(self._factory.create_not(self._pop()))
+
+    def startOr(self):
+        self._branches.append([])
+        self._short_circuit.append(False)
+
+    def endOr(self):
+        self._append(self._factory.create_or(self._branches.pop(), self._short_circuit.pop()))
+
+    def startBranch(self, short_circuit=False):
+        self._stack.append([])
+        if short_circuit:
+            self._short_circuit[-1] = True
+
+    def endBranch(self):
+        self._branches[-1].append(self._pop())
+
+    def startOrderby(self):
+        self._order_by = []
+
+    def endOrderby(self):
+        pass
+
+    def ascending(self, name):
+        self._order_by.append((name, consts.ASC))
+
+    def descending(self, name):
+        self._order_by.append((name, consts.DESC))
+
+    def startPagination(self):
+        pass
+
+    def endPagination(self):
+        pass
+
+    def limit(self, value):
+        self._limit = int(value)
+
+    def offset(self, value):
+        self._offset = int(value)
+
+    def count(self, name):
+        self._append(self._factory.create_count(name))
+
+    def variable(self, name):
+        self._append(self._factory.create_variable(name))
+
+    def parameter(self, name):
+        self._append(self._factory.create_parameter(name))
+
+    def _topic_ref(self, name):
+        """\
+        Returns a topic reference for a predicate name.
+        """
+        if isinstance(name, basestring):
+            return self._factory.create_item_identifier(self._resolve_iri(u'#' + name))
+        return name
+
+    def _resolve_iri(self, reference):
+        factory = self._factory
+        return factory.resolve_iri(factory.create_iri(self._base), reference)
+
+    def identifier(self, value):
+        if isinstance(self._stack[-1], _Name):
+            # Predicate name, translated into a topic reference if necessary
+            self._append(value)
+        else:
+            self._append(self._topic_ref(value))
+
+    def iri(self, value):
+        self._append(self._factory.create_subject_identifier(self._resolve_iri(value)))
+
+    def subjectidentifier(self, value):
+        self.iri(value)
+
+    def subjectlocator(self, value):
+        self._append(self._factory.create_subject_locator(self._resolve_iri(value)))
+
+    def itemidentifier(self, value):
+        self._append(self._factory.create_item_identifier(self._resolve_iri(value)))
+
+    def objectid(self, value):
+        self._append(self._factory.create_object_id(value))
+
+    def string(self, value):
+        self._append(self._factory.create_string(value))
+
+    def integer(self, value):
+        self._append(self._factory.create_integer(value))
+
+    def decimal(self, value):
+        self._append(self._factory.create_decimal(value))
+
+    def date(self, value):
+        self._append(self._factory.create_date(value))
+
+    def datetime(self, value):
+        self._append(self._factory.create_datetime(value))
+
+    def qname(self, kind, prefix, localpart):
+        try:
+            iri, _ = self._prefixes[prefix]
+        except KeyError:
+            raise InvalidQueryError('Unknown prefix "%s"' % prefix)
+        factory = self._factory
+        iri = factory.create_iri(iri + localpart)
+        if kind == consts.MODULE:
+            self._append(iri)
+        elif kind == consts.SID:
+            self._append(factory.create_subject_identifier(iri))
+        elif kind == consts.SLO:
+            self._append(factory.create_subject_locator(iri))
+        else:
+            self._append(factory.create_item_identifier(iri))
+
+    curie = qname
@@ -558,9 +558,12 @@ class IQueryFactory(Interface):
              as target IRI, too.
         """
     
-    def create_select_query(header, where, order_by=None, limit=None, offset=None):
+    def create_select_query(header, where, order_by=None, limit=None, offset=None, rules=None):
         """\
         
+        `rules`
+            An optional iterable of rules (c.f. `create_rule`) which may be
+            invoked by the `where` clause.
         """
 
     def create_insert_query(variables, fragment, where, order_by=None, limit=None, offset=None):
@@ -739,6 +742,22 @@ class IQueryFactory(Interface):
             An object created by `create_iri` or `resolve_iri`.
         """
 
+    def create_object_id(value):
+        """\
+        Creates an object identifier.
+
+        `value`
+            A string representing an object identifier.
+        """
+
+    def create_parameter(name):
+        """\
+        Creates a parameter.
+
+        `name`
+            A string representing the parameter name (without ``%`` delimiters).
+        """
+
     def create_variable(name):
         """\
         Creates a variable.
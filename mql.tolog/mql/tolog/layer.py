@@ -113,7 +113,7 @@ class TopicMapLayer(object):
         `iid`
             An IRI.
         """
-        obj = self.get_object_by_item_identifier(iid)
+        obj = self.get_construct_by_item_identifier(iid)
         return obj if self.is_name(obj) else None
 
     def get_variant_by_item_identifier(self, iid):
@@ -181,6 +181,7 @@ class TopicMapLayer(object):
 
         `types`
             An iterable of topics or ``ANY`` if the type is unconstrained.
+            If provided, only the direct instances of the types are returned.
         """
 
     @abstractmethod
@@ -252,6 +253,72 @@ class TopicMapLayer(object):
             An iterable of topics or ``ANY`` if the type is unconstrained.
         """
 
+    @abstractmethod
+    def get_player(self, role):
+        """\
+        Returns the player of the provided `role`.
+        """
+
+    @abstractmethod
+    def get_type(self, tmc):
+        """\
+        Returns the type of the provided association, role, occurrence or
+        name.
+        """
+
+    @abstractmethod
+    def get_scope(self, tmc):
+        """\
+        Returns an iterable of themes of the provided association,
+        occurrence, name or variant.
+        """
+
+    @abstractmethod
+    def get_value(self, tmc):
+        """\
+        Returns the value (a string) of the provided occurrence, name or
+        variant.
+        """
+
+    @abstractmethod
+    def get_datatype(self, tmc):
+        """\
+        Returns the datatype IRI of the provided occurrence or variant.
+        """
+
+    @abstractmethod
+    def get_types(self, topic):
+        """\
+        Returns an iterable of topics the provided `topic` is a direct
+        instance of.
+        """
+
+    @abstractmethod
+    def get_supertypes(self, topic):
+        """\
+        Returns an iterable of all (transitive) supertypes of `topic`.
+        """
+
+    @abstractmethod
+    def get_subtypes(self, topic):
+        """\
+        Returns an iterable of all (transitive) subtypes of `topic`.
+        """
+
+    @abstractmethod
+    def get_typed(self, type):
+        """\
+        Returns an iterable of associations, roles, occurrences and names
+        which are typed by `type`.
+        """
+
+    @abstractmethod
+    def get_scoped(self, theme):
+        """\
+        Returns an iterable of associations, occurrences, names and variants
+        which have the provided `theme` in their scope.
+        """
+
     @abstractmethod
     def get_subject_identifiers(self, topic):
         """\
@@ -309,15 +376,21 @@ class TopicMapLayer(object):
         """
 
     @abstractmethod
-    def get_occurrences_by_value(self, value, datatype):
+    def get_occurrences_by_value(self, value, datatype=ANY):
         """\
         Returns an iterable of occurrences which have the provided value/datatype.
+
+        `datatype`
+            The datatype IRI or ``ANY`` if the datatype is unconstrained.
         """
 
     @abstractmethod
-    def get_variants_by_value(self, value, datatype):
+    def get_variants_by_value(self, value, datatype=ANY):
         """\
         Returns an iterable of variants which have the provided value/datatype.
+
+        `datatype`
+            The datatype IRI or ``ANY`` if the datatype is unconstrained.
         """
 
     @abstractmethod
@@ -358,6 +431,21 @@ class TopicMapLayer(object):
         Returns an iterable of name types.
         """
 
+    def estimate(self, method, *args):
+        """\
+        Returns the (estimated) number of items which the invocation of
+        the method with the name `method` and the provided `args` would
+        return or ``None`` if no estimate is available.
+
+        The estimate must be computed without executing the method, i.e.
+        ``layer.estimate('get_topics', [composer])`` should read the size
+        of an index instead of counting the items of
+        ``layer.get_topics([composer])``.
+
+        This implementation returns always ``None``.
+        """
+        return None
+
     def is_parent_of(self, parent, child):
         """\
         Returns if `parent` is the parent of `child`.
@@ -461,12 +549,42 @@ class AdvancedTopicMapLayer(TopicMapLayer):
     def get_names_by_value(self, value):
         return self._layer.get_names_by_value(value)
 
-    def get_occurrences_by_value(self, value, datatype):
+    def get_occurrences_by_value(self, value, datatype=ANY):
         return self._layer.get_occurrences_by_value(value, datatype)
 
-    def get_variants_by_value(self, value, datatype):
+    def get_variants_by_value(self, value, datatype=ANY):
         return self._layer.get_variants_by_value(value, datatype)
 
+    def get_player(self, role):
+        return self._layer.get_player(role)
+
+    def get_type(self, tmc):
+        return self._layer.get_type(tmc)
+
+    def get_scope(self, tmc):
+        return self._layer.get_scope(tmc)
+
+    def get_value(self, tmc):
+        return self._layer.get_value(tmc)
+
+    def get_datatype(self, tmc):
+        return self._layer.get_datatype(tmc)
+
+    def get_types(self, topic):
+        return self._layer.get_types(topic)
+
+    def get_supertypes(self, topic):
+        return self._layer.get_supertypes(topic)
+
+    def get_subtypes(self, topic):
+        return self._layer.get_subtypes(topic)
+
+    def get_typed(self, type):
+        return self._layer.get_typed(type)
+
+    def get_scoped(self, theme):
+        return self._layer.get_scoped(theme)
+
     def get_topic_direct_types(self):
         return self._layer.get_topic_direct_types()
 
@@ -485,6 +603,9 @@ class AdvancedTopicMapLayer(TopicMapLayer):
     def get_name_types(self):
         return self._layer.get_name_types()
 
+    def estimate(self, method, *args):
+        return self._layer.estimate(method, *args)
+
     def is_parent_of(self, parent, child):
         res = self._layer.is_parent_of(parent, child)
         if not res and self.is_topic(child):
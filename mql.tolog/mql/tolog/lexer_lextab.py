@@ -0,0 +1,9 @@
+# mql.tolog.lexer_lextab.py. This file automatically created by PLY (version 3.4). Don't edit!
+_tabversion   = '3.4'
+_lextokens    = {'KW_FOR': 1, 'KW_BY': 1, 'KW_ASC': 1, 'QNAME': 1, 'LPAREN': 1, 'LCURLY': 1, 'KW_DESC': 1, 'GT': 1, 'KW_DELETE': 1, 'SID': 1, 'DATE': 1, 'KW_CREATE': 1, 'DOT': 1, 'DATE_TIME': 1, 'KW_INSERT': 1, 'RPAREN': 1, 'RCURLY': 1, 'KW_ORDER': 1, 'NE': 1, 'KW_LIMIT': 1, 'DIR_IMPORT': 1, 'PIPE': 1, 'IID': 1, 'LT': 1, 'OID': 1, 'KW_SELECT': 1, 'KW_MERGE': 1, 'INTEGER': 1, 'KW_IMPORT': 1, 'KW_NOT': 1, 'LE': 1, 'KW_COUNT': 1, 'IDENT': 1, 'IMPLIES': 1, 'STRING': 1, 'DECIMAL': 1, 'DIR_VERSION': 1, 'PARAM': 1, 'KW_INTO': 1, 'CURIE': 1, 'GE': 1, 'SLO': 1, 'PIPE_PIPE': 1, 'KW_UPDATE': 1, 'TM_FRAGMENT': 1, 'VARIABLE': 1, 'EQ': 1, 'KW_DROP': 1, 'CIRCUMFLEX': 1, 'KW_WHERE': 1, 'IRI': 1, 'COLON': 1, 'KW_USING': 1, 'KW_FROM': 1, 'KW_LOAD': 1, 'KW_AS': 1, 'X_DIRECTIVE': 1, 'DIR_PREFIX': 1, 'DIR_BASE': 1, 'COMMA': 1, 'QM': 1, 'KW_OFFSET': 1, 'DOUBLE_CIRCUMFLEX': 1}
+_lexreflags   = 0
+_lexliterals  = ''
+_lexstateinfo = {'tm': 'exclusive', 'INITIAL': 'inclusive'}
+_lexstatere   = {'tm': [(u'(?P<t_tm_content>\\s+)', [None, (u't_tm_content', 'content')])], 'INITIAL': [(u'(?P<t_mlcomment>/\\*[^\\*/]*\\*/)|(?P<t_comment>\\#[^\\r\\n]*)|(?P<t_newline>[\\r\\n])|(?P<t_QM>\\?)|(?P<t_STRING>"([^"]|"{2})*")|(?P<t_IRI><[^<>\\"\\{\\}\\`\\\\ ]+>)|(?P<t_VARIABLE>\\$([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*)|(?P<t_PARAM>%([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*%)|(?P<t_OID>@([0-9]+|[0-9]*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_SID>i"[^"]+")|(?P<t_SLO>a"[^"]+")|(?P<t_IID>s"[^"]+")|(?P<t_CURIE>\\[([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*:[^<>\\"\\{\\}\\`\\\\\\] ]+\\])|(?P<t_QNAME>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*:(([0-9]+([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040])*)|([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*))|(?P<t_IDENT>([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff])+(\\.*([a-zA-Z_]|[\xc0-\xd6]|[\xd8-\xf6]|[\xf8-\u02ff]|[\u0370-\u037d]|[\u037f-\u1fff]|[\u200c-\u200d]|[\u2070-\u218f]|[\u2c00-\u2fef]|[\u3001-\ud7ff]|[\uf900-\ufdcf]|[\ufdf0-\ufffd]|[\U00010000-\U000effff]|[\\-0-9]|[\xb7]|[\u0300-\u036f]|[\u203f-\u2040]))*)|(?P<t_directive>%[A-Z\\-a-z]+)|(?P<t_DATE_TIME>\\-?(000[1-9]|00[1-9][0-9]|0[1-9][0-9][0-9]|[1-9][0-9][0-9][0-9]+)\\-(0[1-9]|1[0-2])\\-(0[1-9]|1[0-9]|2[0-9]|3[0-1])T[0-9]{2}:[0-9]{2}:[0-9]{2}(\\.[0-9]+)?(Z|((\\+|\\-)[0-9]{2}:[0-9]{2}))?)|(?P<t_DATE>\\-?(000[1-9]|00[1-9][0-9]|0[1-9][0-9][0-9]|[1-9][0-9][0-9][0-9]+)\\-(0[1-9]|1[0-2])\\-(0[1-9]|1[0-9]|2[0-9]|3[0-1]))|(?P<t_DECIMAL>(\\-|\\+)?([0-9]+\\.[0-9]+|\\.([0-9])+))|(?P<t_INTEGER>(\\-|\\+)?[0-9]+)|(?P<t_PIPE_PIPE>\\|{2})|(?P<t_DOUBLE_CIRCUMFLEX>\\^\\^)|(?P<t_PIPE>\\|)|(?P<t_LE><=)|(?P<t_NE>/=)|(?P<t_DOT>\\.)|(?P<t_LPAREN>\\()|(?P<t_IMPLIES>:-)|(?P<t_RCURLY>\\})|(?P<t_GE>>=)|(?P<t_RPAREN>\\))|(?P<t_CIRCUMFLEX>\\^)|(?P<t_LCURLY>\\{)|(?P<t_LT><)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_EQ>=)|(?P<t_GT>>)', [None, (u't_mlcomment', 'mlcomment'), (u't_comment', 'comment'), (u't_newline', 'newline'), (u't_QM', 'QM'), (u't_STRING', 'STRING'), None, (u't_IRI', 'IRI'), (u't_VARIABLE', 'VARIABLE'), None, None, None, (u't_PARAM', 'PARAM'), None, None, None, (u't_OID', 'OID'), None, None, None, None, (u't_SID', 'SID'), (u't_SLO', 'SLO'), (u't_IID', 'IID'), (u't_CURIE', 'CURIE'), None, None, None, (u't_QNAME', 'QNAME'), None, None, None, None, None, None, None, None, None, (u't_IDENT', 'IDENT'), None, None, None, (u't_directive', 'directive'), (u't_DATE_TIME', 'DATE_TIME'), None, None, None, None, None, None, None, (u't_DATE', 'DATE'), None, None, None, (u't_DECIMAL', 'DECIMAL'), None, None, None, (u't_INTEGER', 'INTEGER'), None, (None, 'PIPE_PIPE'), (None, 'DOUBLE_CIRCUMFLEX'), (None, 'PIPE'), (None, 'LE'), (None, 'NE'), (None, 'DOT'), (None, 'LPAREN'), (None, 'IMPLIES'), (None, 'RCURLY'), (None, 'GE'), (None, 'RPAREN'), (None, 'CIRCUMFLEX'), (None, 'LCURLY'), (None, 'LT'), (None, 'COLON'), (None, 'COMMA'), (None, 'EQ'), (None, 'GT')])]}
+_lexstateignore = {'tm': '', 'INITIAL': ' \t'}
+_lexstateerrorf = {'tm': 't_error', 'INITIAL': 't_error'}
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+`TopicMapLayer` implementation for Mappa topic maps.
+
+The layer answers the type, scope and value lookups by the indices of the
+topic map (``tm.index.type_instance``, ``tm.index.scoped`` and
+``tm.index.literal``) and reports the number of results of these lookups
+(c.f. `MappaTopicMapLayer.estimate`) without executing them.
+
+`MappaStatistics` provides the numbers for the statistics-driven cost model
+(c.f. `statistics.CostModel`). The numbers are read from the indices which
+are updated incrementally by the topic map.
+
+Usage::
+
+    >>> from mql.tolog import parse_query
+    >>> from mql.tolog.evaluator import evaluate
+    >>> layer = MappaTopicMapLayer(tm)
+    >>> query = parse_query(u'instance-of($x, composer)?', iri=tm.iri, layer=layer)
+    >>> result = evaluate(query, layer)
+    >>> query = parse_query(u'instance-of($x, composer)?', iri=tm.iri,
+    ...                     statistics=MappaStatistics(tm))
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from itertools import chain
+from tm import ANY
+from mappa import Literal, utils
+from . import layer, statistics, consts
+
+__all__ = ('MappaTopicMapLayer', 'MappaStatistics')
+
+
+class MappaTopicMapLayer(layer.TopicMapLayer):
+    """\
+    `TopicMapLayer` which operates on a Mappa topic map.
+    """
+    def __init__(self, tm):
+        """\
+
+        `tm`
+            The topic map.
+        """
+        self._tm = tm
+
+    def get_topic_by_subject_identifier(self, sid):
+        return self._tm.topic_by_sid(sid)
+
+    def get_topic_by_subject_locator(self, slo):
+        return self._tm.topic_by_slo(slo)
+
+    def get_construct_by_item_identifier(self, iid):
+        return self._tm.construct_by_iid(iid)
+
+    def get_construct_by_id(self, tmc_id):
+        tm = self._tm
+        if tmc_id == tm.id:
+            return tm
+        try:
+            return tm.construct_by_id(int(tmc_id))
+        except ValueError:
+            return None
+
+    def get_construct_id(self, tmc):
+        return unicode(tmc.id)
+
+    def get_parent(self, tmc):
+        return None if utils.is_topicmap(tmc) else tmc.parent
+
+    def get_topicmap(self):
+        return self._tm
+
+    def get_topics(self, types=ANY):
+        if types is ANY:
+            return self._tm.topics
+        ti_idx = self._tm.index.type_instance
+        return _union(ti_idx.topics(typ) for typ in types)
+
+    def get_associations(self, types=ANY, scope=ANY):
+        tm = self._tm
+        if scope is not ANY:
+            res = tm.index.scoped.associations(scope, exact=False)
+            if types is not ANY:
+                types = frozenset(types)
+                res = [assoc for assoc in res if assoc.type in types]
+            return res
+        if types is ANY:
+            return tm.associations
+        ti_idx = tm.index.type_instance
+        return _union(ti_idx.associations(typ) for typ in types)
+
+    def get_occurrences(self, topic, types=ANY, scope=ANY):
+        return _filter(topic.occurrences, types, scope)
+
+    def get_names(self, topic, types=ANY, scope=ANY):
+        return _filter(topic.names, types, scope)
+
+    def get_variants(self, name, scope=ANY):
+        return _filter(name.variants, ANY, scope)
+
+    def get_roles_played(self, topic, types=ANY):
+        return _filter(topic.roles_played, types, ANY)
+
+    def get_roles(self, assoc, types=ANY):
+        return _filter(assoc.roles, types, ANY)
+
+    def get_player(self, role):
+        return role.player
+
+    def get_type(self, tmc):
+        return tmc.type
+
+    def get_scope(self, tmc):
+        return tmc.scope
+
+    def get_value(self, tmc):
+        return tmc.value
+
+    def get_datatype(self, tmc):
+        return tmc.datatype
+
+    def get_types(self, topic):
+        return list(topic.types)
+
+    def get_supertypes(self, topic):
+        return utils.supertypes(topic)
+
+    def get_subtypes(self, topic):
+        return utils.subtypes(topic)
+
+    def get_typed(self, type):
+        ti_idx = self._tm.index.type_instance
+        return chain(ti_idx.associations(type), ti_idx.roles(type),
+                     ti_idx.occurrences(type), ti_idx.names(type))
+
+    def get_scoped(self, theme):
+        scoped_idx = self._tm.index.scoped
+        return chain(scoped_idx.associations_by_theme(theme),
+                     scoped_idx.occurrences_by_theme(theme),
+                     scoped_idx.names_by_theme(theme),
+                     scoped_idx.variants_by_theme(theme))
+
+    def get_subject_identifiers(self, topic):
+        return topic.sids
+
+    def get_subject_locators(self, topic):
+        return topic.slos
+
+    def get_item_identifiers(self, tmc):
+        return tmc.iids
+
+    def get_reifier(self, reified):
+        return reified.reifier
+
+    def get_reified(self, reifier):
+        return reifier.reified
+
+    def get_names_by_value(self, value):
+        return self._tm.index.literal.names(Literal(unicode(value)))
+
+    def get_occurrences_by_value(self, value, datatype=ANY):
+        lit_idx = self._tm.index.literal
+        return _union(lit_idx.occurrences(lit) for lit in _literals(lit_idx, value, datatype))
+
+    def get_variants_by_value(self, value, datatype=ANY):
+        lit_idx = self._tm.index.literal
+        return _union(lit_idx.variants(lit) for lit in _literals(lit_idx, value, datatype))
+
+    def get_topic_direct_types(self):
+        return self._tm.index.type_instance.topic_types()
+
+    def get_topic_types(self):
+        res = set()
+        for typ in self._tm.index.type_instance.topic_types():
+            res.add(typ)
+            res.update(utils.supertypes(typ))
+        return res
+
+    def get_association_types(self):
+        return self._tm.index.type_instance.association_types()
+
+    def get_role_types(self):
+        return self._tm.index.type_instance.role_types()
+
+    def get_occurrence_types(self):
+        return self._tm.index.type_instance.occurrence_types()
+
+    def get_name_types(self):
+        return self._tm.index.type_instance.name_types()
+
+    def is_instance_of(self, instance, type, scope=ANY):
+        return utils.isa(instance, type)
+
+    def is_topicmap(self, obj):
+        return utils.is_topicmap(obj)
+
+    def is_topic(self, obj):
+        return utils.is_topic(obj)
+
+    def is_association(self, obj):
+        return utils.is_association(obj)
+
+    def is_role(self, obj):
+        return utils.is_role(obj)
+
+    def is_occurrence(self, obj):
+        return utils.is_occurrence(obj)
+
+    def is_name(self, obj):
+        return utils.is_name(obj)
+
+    def is_variant(self, obj):
+        return utils.is_variant(obj)
+
+    def estimate(self, method, *args):
+        """\
+        Returns the number of items the call of `method` with the provided
+        `args` returns (or an upper bound) by reading the sizes of the
+        indices.
+
+        Supported methods are ``get_topics``, ``get_associations``,
+        ``get_typed``, ``get_scoped``, ``get_roles_played``,
+        ``get_occurrences``, ``get_names`` and the ``get_*_by_value``
+        methods. ``None`` is returned for all other methods.
+        """
+        estimator = _ESTIMATORS.get(method)
+        return estimator(self._tm, *args) if estimator is not None else None
+
+
+class MappaStatistics(statistics.Statistics):
+    """\
+    `statistics.Statistics` provider which reads the numbers from the indices
+    of a Mappa topic map.
+    """
+    def __init__(self, tm):
+        """\
+
+        `tm`
+            The topic map.
+        """
+        self._tm = tm
+
+    def resolve(self, kind, value):
+        tm = self._tm
+        if kind == consts.SID:
+            return tm.topic_by_sid(value)
+        if kind == consts.SLO:
+            return tm.topic_by_slo(value)
+        if kind == consts.IID:
+            return tm.construct_by_iid(value)
+        if kind == consts.OID:
+            try:
+                return tm.construct_by_id(int(value))
+            except ValueError:
+                return None
+        return None
+
+    def topic_count(self, type=ANY):
+        if type is ANY:
+            return self._tm.index.statistics.topic_count()
+        return _estimate_topics(self._tm, [type])
+
+    def association_count(self, type=ANY):
+        if type is ANY:
+            return self._tm.index.statistics.association_count()
+        return self._tm.index.type_instance.association_count(type)
+
+    def role_count(self, type=ANY):
+        if type is ANY:
+            return self._tm.index.statistics.role_count()
+        return self._tm.index.type_instance.role_count(type)
+
+    def occurrence_count(self, type=ANY):
+        if type is ANY:
+            return self._tm.index.statistics.occurrence_count()
+        return self._tm.index.type_instance.occurrence_count(type)
+
+    def name_count(self, type=ANY):
+        if type is ANY:
+            return self._tm.index.statistics.name_count()
+        return self._tm.index.type_instance.name_count(type)
+
+    def variant_count(self):
+        return self._tm.index.statistics.variant_count()
+
+    def type_count(self, kind):
+        return getattr(self._tm.index.type_instance, kind + u'_type_count')()
+
+    def scoped_count(self, theme):
+        return _estimate_scoped(self._tm, theme)
+
+    def value_count(self, value=ANY):
+        if value is ANY:
+            stats_idx = self._tm.index.statistics
+            return stats_idx.occurrence_count() + stats_idx.name_count() + stats_idx.variant_count()
+        return _estimate_names_by_value(self._tm, value) \
+                + _estimate_occurrences_by_value(self._tm, value) \
+                + _estimate_variants_by_value(self._tm, value)
+
+    def distinct_value_count(self):
+        return self._tm.index.literal.value_count()
+
+
+def _union(iterables):
+    """\
+    Returns the items of the provided iterables without duplicates.
+    """
+    iterables = list(iterables)
+    if len(iterables) == 1:
+        return iterables[0]
+    res = set()
+    for items in iterables:
+        res.update(items)
+    return res
+
+
+def _filter(constructs, types, scope):
+    """\
+    Returns those `constructs` which have one of the `types` and whose scope
+    is a superset of the provided `scope`.
+    """
+    if types is ANY and scope is ANY:
+        return constructs
+    if types is not ANY:
+        types = frozenset(types)
+    if scope is not ANY:
+        scope = frozenset(scope)
+    return [c for c in constructs if (types is ANY or c.type in types)
+                                        and (scope is ANY or scope.issubset(c.scope))]
+
+
+def _literals(lit_idx, value, datatype):
+    """\
+    Returns the literals which have the provided `value` and `datatype`.
+    If the `datatype` is ``ANY``, all literals with the `value` are returned.
+    """
+    if datatype is ANY:
+        return lit_idx.literals(unicode(value))
+    return (Literal(unicode(value), datatype),)
+
+
+#
+# Estimators
+#
+def _estimate_topics(tm, types=ANY):
+    if types is ANY:
+        return len(tm.topics)
+    ti_idx = tm.index.type_instance
+    return sum(ti_idx.topic_count(typ) for typ in types)
+
+
+def _estimate_associations(tm, types=ANY, scope=ANY):
+    if types is ANY and scope is ANY:
+        return len(tm.associations)
+    estimates = []
+    if types is not ANY:
+        ti_idx = tm.index.type_instance
+        estimates.append(sum(ti_idx.association_count(typ) for typ in types))
+    if scope is not ANY:
+        scoped_idx = tm.index.scoped
+        estimates.append(min([scoped_idx.association_count_by_theme(theme) for theme in scope]
+                             or [len(tm.associations)]))
+    return min(estimates)
+
+
+def _estimate_typed(tm, type):
+    ti_idx = tm.index.type_instance
+    return ti_idx.association_count(type) + ti_idx.role_count(type) \
+            + ti_idx.occurrence_count(type) + ti_idx.name_count(type)
+
+
+def _estimate_scoped(tm, theme):
+    scoped_idx = tm.index.scoped
+    return scoped_idx.association_count_by_theme(theme) \
+            + scoped_idx.occurrence_count_by_theme(theme) \
+            + scoped_idx.name_count_by_theme(theme) \
+            + scoped_idx.variant_count_by_theme(theme)
+
+
+def _estimate_roles_played(tm, topic, types=ANY):
+    if types is ANY:
+        return len(topic.roles_played)
+    # A topic plays usually only a few roles, counting them is cheap
+    return len(_filter(topic.roles_played, types, ANY))
+
+
+def _estimate_occurrences(tm, topic, types=ANY, scope=ANY):
+    return len(topic.occurrences)
+
+
+def _estimate_names(tm, topic, types=ANY, scope=ANY):
+    return len(topic.names)
+
+
+def _estimate_names_by_value(tm, value):
+    return tm.index.literal.name_count(Literal(unicode(value)))
+
+
+def _estimate_occurrences_by_value(tm, value, datatype=ANY):
+    lit_idx = tm.index.literal
+    return sum(lit_idx.occurrence_count(lit) for lit in _literals(lit_idx, value, datatype))
+
+
+def _estimate_variants_by_value(tm, value, datatype=ANY):
+    lit_idx = tm.index.literal
+    return sum(lit_idx.variant_count(lit) for lit in _literals(lit_idx, value, datatype))
+
+
+_ESTIMATORS = {
+    'get_topics': _estimate_topics,
+    'get_associations': _estimate_associations,
+    'get_typed': _estimate_typed,
+    'get_scoped': _estimate_scoped,
+    'get_roles_played': _estimate_roles_played,
+    'get_occurrences': _estimate_occurrences,
+    'get_names': _estimate_names,
+    'get_names_by_value': _estimate_names_by_value,
+    'get_occurrences_by_value': _estimate_occurrences_by_value,
+    'get_variants_by_value': _estimate_variants_by_value,
+}
@@ -0,0 +1,655 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+In-process query optimizers which operate on `querytree.Node` trees.
+
+Each optimizer is named after the XSLT stylesheet it replaces (c.f.
+`xsl.DEFAULT_TRANSFORMERS`) and produces the same result as the
+stylesheet. The optimizers do not modify the provided tree; unmodified
+subtrees are shared between the input and the output.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from collections import defaultdict
+from .querytree import Node
+from .statistics import CostModel, variables
+
+__all__ = ('get_optimizer_names', 'get_optimizer', 'is_available', 'apply_optimizers')
+
+_MOD_EXPERIMENTAL = u'http://psi.ontopia.net/tolog/experimental/'
+_MOD_NUMBER = u'http://psi.ontopia.net/tolog/number/'
+
+_INFINITE_RESULT = 10000
+_WHOLE_TM_RESULT = 1000
+_BIG_RESULT = 100
+_MEDIUM_RESULT = 10
+_SMALL_RESULT = 3
+_SINGLE_RESULT = 1
+_FILTER_RESULT = 0
+_FAIL_RESULT = -1
+
+
+def get_optimizer_names():
+    """\
+    Returns an iterable of available optimizer names.
+    """
+    return _OPTIMIZERS.keys()
+
+
+def get_optimizer(name):
+    """\
+    Returns a function which accepts a `querytree.Node` and returns the
+    optimized node.
+    """
+    try:
+        return _OPTIMIZERS[name]
+    except KeyError:
+        raise ValueError('%s is not available' % name)
+
+
+def is_available(names):
+    """\
+    Returns if all optimizers referenced by `names` are available.
+    """
+    return all(name in _OPTIMIZERS for name in names)
+
+
+def apply_optimizers(node, names, statistics=None, base_iri=None):
+    """\
+    Applies the optimizers (referenced by `names`) in the provided order
+    against the `node` and returns the result.
+
+    `node`
+        The query as `querytree.Node`.
+    `names`
+        An iterable of optimizer names.
+    `statistics`
+        An optional `statistics.Statistics` provider. If provided,
+        ``annotate-costs`` and ``reorder-predicates`` compute the costs and
+        the join order of the predicates by the numbers of the provider.
+    `base_iri`
+        The base IRI of the query (required iff `statistics` is provided).
+    """
+    cost_model = CostModel(statistics, base_iri, node) if statistics is not None else None
+    for name in names:
+        optimize = get_optimizer(name)
+        if cost_model is not None and name in _COST_MODEL_OPTIMIZERS:
+            node = optimize(node, cost_model)
+        else:
+            node = optimize(node)
+    return node
+
+
+#
+# Helpers
+#
+def _is_var(node, idx):
+    """\
+    Returns if the child at the provided index of `node` is a variable
+    (XPath: ``tl:*[idx + 1][local-name(.) = 'variable']``).
+    """
+    children = node.children
+    return len(children) > idx and children[idx].name == u'variable'
+
+
+def _is_bound(node, idx):
+    """\
+    Returns if the child at the provided index of `node` exists and is not
+    a variable (XPath: ``tl:*[idx + 1][local-name(.) != 'variable']``).
+    """
+    children = node.children
+    return len(children) > idx and children[idx].name != u'variable'
+
+
+def _count_vars(node):
+    return sum(1 for child in node.children if child.name == u'variable')
+
+
+def _is_builtin(node, *names):
+    return node.name == u'builtin-predicate' and node.get(u'name') in names
+
+
+def _var_name(node, idx):
+    return node.children[idx].get(u'name')
+
+
+def _module_iris(root):
+    """\
+    Returns a dict of module prefixes to module IRIs.
+    """
+    res = defaultdict(set)
+    for node in root.iter():
+        if node.name == u'namespace' and node.get(u'kind') == u'module':
+            res[node.get(u'identifier')].add(node.get(u'iri'))
+    return res
+
+
+def _qnames(node):
+    """\
+    Returns the ``qname`` nodes of the ``name`` children of `node`.
+    """
+    return [qname for name in node.children if name.name == u'name'
+                    for qname in name.children if qname.name == u'qname']
+
+
+def _predicate_module_iris(node, modules):
+    """\
+    Returns the module IRIs iff `node` is a module predicate invocation,
+    otherwise ``None``.
+    """
+    qnames = _qnames(node)
+    if not any(qname.get(u'kind') == u'module' for qname in qnames):
+        return None
+    iris = set()
+    for qname in qnames:
+        iris.update(modules.get(qname.get(u'prefix'), ()))
+    return iris
+
+
+def _rule_name(node):
+    """\
+    Returns the name of the invoked rule iff `node` is a rule invocation,
+    otherwise ``None``.
+    """
+    for name in node.children:
+        if name.name == u'name':
+            for ident in name.children:
+                if ident.name == u'identifier':
+                    return ident.get(u'value')
+    return None
+
+
+def _rebuild(node, children):
+    """\
+    Returns `node` if the `children` are the children of `node`, otherwise
+    a new node with the provided children.
+    """
+    old = node.children
+    if len(old) == len(children) and all(a is b for a, b in zip(old, children)):
+        return node
+    return node.replace(children=children)
+
+
+def _transform_children(node, transform):
+    children = []
+    for child in node.children:
+        children.extend(transform(child))
+    return _rebuild(node, children)
+
+
+#
+# query-c14n
+#
+_STATEMENTS = (u'select', u'insert', u'merge', u'update', u'delete')
+
+_EXPERIMENTAL_INFIX = {u'gt': u'gt', u'lt': u'lt', u'gteq': u'ge', u'lteq': u'le'}
+
+
+def query_c14n(root):
+    """\
+    Converts clause queries into select queries, translates the comparison
+    predicates of the experimental module into infix predicates and renames
+    the ``source-locator`` predicate into ``item-identifier``.
+    """
+    modules = _module_iris(root)
+    def transform(node):
+        if node.name == u'predicate':
+            iris = _predicate_module_iris(node, modules)
+            if iris is not None:
+                if _MOD_EXPERIMENTAL in iris:
+                    for qname in _qnames(node):
+                        name = _EXPERIMENTAL_INFIX.get(qname.get(u'localpart'))
+                        if name is not None:
+                            attrs = {u'name': name}
+                            attrs.update(node.attrs)
+                            children = []
+                            for child in node.children:
+                                if child.name != u'name':
+                                    children.extend(transform(child))
+                            return [Node(u'infix-predicate', attrs, children)]
+                return [node]
+        elif _is_builtin(node, u'source-locator'):
+            children = []
+            for child in node.children:
+                children.extend(transform(child))
+            return [Node(u'builtin-predicate', {u'name': u'item-identifier'}, children)]
+        return [_transform_children(node, transform)]
+    if root.name != u'tolog' or any(child.name in _STATEMENTS for child in root.children):
+        return transform(root)[0]
+    header = {u'base': [], u'namespace': [], u'rule': []}
+    where = []
+    for child in root.children:
+        header.get(child.name, where).extend(transform(child))
+    return Node(u'tolog', None, header[u'base'] + header[u'namespace'] + header[u'rule']
+                                + [Node(u'select', None, _clause_variables(root) + [Node(u'where', None, where)])])
+
+
+def _clause_variables(root):
+    """\
+    Returns the variables of a clause query which do not occur within a
+    rule (without duplicates).
+    """
+    res, seen = [], set()
+    def collect(node, in_rule, depth):
+        for child in node.children:
+            if child.name == u'variable':
+                name = child.get(u'name')
+                if depth and not in_rule and name not in seen:
+                    res.append(child)
+                seen.add(name)
+            collect(child, in_rule or child.name == u'rule', depth + 1)
+    collect(root, False, 0)
+    return res
+
+
+#
+# inline-rules
+#
+def inline_rules(root):
+    """\
+    Replaces rule invocations with the rule body iff the rule body does not
+    invoke other rules.
+    """
+    rules = defaultdict(list)
+    for node in root.iter():
+        if node.name == u'rule' \
+            and not any(desc.name == u'predicate' for body in node.children if body.name == u'body'
+                            for child in body.children for desc in child.iter()):
+            rules[node.get(u'name')].append(node)
+    allowed = root.name == u'tolog' \
+                and sum(1 for stmt in root.children for where in stmt.children if where.name == u'where') == 1
+    def transform(node):
+        if node.name == u'rule' and node.get(u'name') in rules:
+            return [] if allowed else [node]
+        if node.name == u'predicate':
+            name = _rule_name(node)
+            if name is not None:
+                rule_nodes = rules.get(name)
+                if not (allowed and rule_nodes):
+                    return [node]
+                return _inline(rule_nodes, [child for child in node.children if child.name != u'name'])
+        return [_transform_children(node, transform)]
+    return transform(root)[0]
+
+
+def _inline(rules, args):
+    """\
+    Returns the bodies of the `rules` where the rule variables are replaced
+    by the arguments of the rule invocation.
+    """
+    mapping = defaultdict(list)
+    pos = 0
+    for rule in rules:
+        for var in rule.children:
+            if var.name == u'variable':
+                if pos < len(args):
+                    mapping[var.get(u'name')].append(args[pos])
+                pos += 1
+    def replace(node):
+        if node.name == u'variable':
+            name = node.get(u'name')
+            return mapping.get(name) or [Node(u'variable', {u'name': u'__inlined__' + name})]
+        return [_transform_children(node, replace)]
+    res = []
+    for rule in rules:
+        for body in rule.children:
+            if body.name == u'body':
+                for child in body.children:
+                    res.extend(replace(child))
+    return res
+
+
+#
+# annotate-predicates
+#
+_TOPIC_FIRST = (u'topic', u'topic-name', u'reifies', u'subject-identifier', u'subject-locator',
+                u'occurrence', u'instance-of', u'direct-instance-of')
+_TOPIC_SECOND = (u'type', u'scope', u'role-player', u'instance-of', u'direct-instance-of')
+
+# Variable position per predicate name for each kind of statement
+_HINT_KEYS = (
+    (u'association', {0: (u'association', u'association-role')}),
+    (u'role', {1: (u'association-role',), 0: (u'role-player',)}),
+    (u'occurrence', {1: (u'occurrence',)}),
+    (u'name', {1: (u'topic-name',), 0: (u'variant',)}),
+    (u'variant', {1: (u'variant',)}),
+    (u'topic', {0: _TOPIC_FIRST, 1: _TOPIC_SECOND}),
+)
+
+_HINT_PREDICATES = (u'type', u'scope', u'value', u'value-like', u'datatype', u'resource',
+                    u'item-identifier')
+
+
+def annotate_predicates(root):
+    """\
+    Annotates predicates like ``type`` and ``value`` with a ``hint``
+    attribute which indicates which kind of statement is meant.
+    """
+    keys = dict((hint, set()) for hint, _ in _HINT_KEYS)
+    for node in root.iter():
+        if node.name != u'builtin-predicate':
+            continue
+        name = node.get(u'name')
+        for hint, positions in _HINT_KEYS:
+            for idx, names in positions.iteritems():
+                if name in names and _is_var(node, idx):
+                    keys[hint].add(_var_name(node, idx))
+    def transform(node):
+        idx = None
+        if _is_builtin(node, *_HINT_PREDICATES) and _is_var(node, 0):
+            idx = 0
+        elif _is_builtin(node, u'reifies') and _is_var(node, 1):
+            idx = 1
+        if idx is None:
+            return [_transform_children(node, transform)]
+        var = _var_name(node, idx)
+        hint = u' '.join(hint for hint, _ in _HINT_KEYS if var in keys[hint])
+        if not hint:
+            return [node]
+        attrs = dict(node.attrs)
+        attrs[u'hint'] = hint
+        return [node.replace(attrs=attrs)]
+    return transform(root)[0]
+
+
+#
+# remove-redundant-predicates
+#
+_TOPIC_IMPLIED_FIRST = (u'subject-identifier', u'subject-locator', u'topic-name', u'occurrence',
+                        u'reifies', u'direct-instance-of', u'instance-of')
+_TOPIC_IMPLIED_SECOND = (u'type', u'role-player', u'scope', u'direct-instance-of', u'instance-of')
+
+
+def remove_redundant_predicates(root):
+    """\
+    Removes ``topic`` and ``association`` predicates if other predicates
+    imply them.
+    """
+    def transform(node):
+        topics, assocs = set(), set()
+        for child in node.children:
+            if _is_builtin(child, *_TOPIC_IMPLIED_FIRST) and _is_var(child, 0):
+                topics.add(_var_name(child, 0))
+            if _is_builtin(child, *_TOPIC_IMPLIED_SECOND) and _is_var(child, 1):
+                topics.add(_var_name(child, 1))
+            if _is_builtin(child, u'association-role') and _is_var(child, 0):
+                assocs.add(_var_name(child, 0))
+        children = []
+        for child in node.children:
+            if _is_builtin(child, u'topic') and _is_var(child, 0):
+                if _var_name(child, 0) not in topics:
+                    children.append(child)
+            elif _is_builtin(child, u'association') and _is_var(child, 0):
+                if _var_name(child, 0) not in assocs:
+                    children.append(child)
+            else:
+                children.append(transform(child))
+        return _rebuild(node, children)
+    return transform(root)
+
+
+#
+# annotate-costs
+#
+def _builtin_cost(node):
+    name = node.get(u'name')
+    first_var, first_bound = _is_var(node, 0), _is_bound(node, 0)
+    second_var, second_bound = _is_var(node, 1), _is_bound(node, 1)
+    if name in (u'role-player', u'type', u'reifies', u'object-id', u'datatype') \
+            and first_bound and second_var:
+        return _SINGLE_RESULT
+    if name in (u'type', u'instance-of', u'direct-instance-of', u'scope', u'datatype') \
+            and first_var and second_bound:
+        return _BIG_RESULT
+    if name == u'role-player' and first_var and second_bound:
+        return _MEDIUM_RESULT
+    if name in (u'subject-identifier', u'subject-locator', u'item-identifier', u'association-role',
+                u'topic-name', u'occurrence', u'variant', u'instance-of', u'direct-instance-of',
+                u'scope') and first_bound and second_var:
+        return _SMALL_RESULT
+    if name in (u'subject-identifier', u'subject-locator', u'item-identifier', u'association-role',
+                u'topic-name', u'occurrence', u'variant', u'reifies', u'object-id') \
+            and first_var and second_bound:
+        return _SINGLE_RESULT
+    var_count = _count_vars(node)
+    if name in (u'subject-identifier', u'subject-locator', u'variant', u'reifies', u'resource') \
+            and var_count == 2:
+        return _BIG_RESULT
+    if var_count == 0:
+        return _FILTER_RESULT
+    if name in (u'base-locator', u'topic-map'):
+        return _FILTER_RESULT
+    return _WHOLE_TM_RESULT
+
+
+def _infix_cost(node):
+    var_count = _count_vars(node)
+    if node.get(u'name') == u'eq' and var_count in (0, 1, 2):
+        return (_SINGLE_RESULT, _FILTER_RESULT, _WHOLE_TM_RESULT)[var_count]
+    if var_count == 0:
+        return _FILTER_RESULT
+    return _INFINITE_RESULT
+
+
+def _dynamic_cost(node):
+    var_count = _count_vars(node)
+    if var_count == 2:
+        return _WHOLE_TM_RESULT
+    if var_count == 1:
+        return _SMALL_RESULT
+    if var_count == 0:
+        return _FILTER_RESULT
+    return None
+
+
+def _association_cost(node):
+    pairs = [pair for pair in node.children if pair.name == u'pair']
+    bound = sum(1 for pair in pairs for child in pair.children
+                    for arg in child.children if arg.name != u'variable')
+    if bound == len(pairs) * 2:
+        return _FILTER_RESULT
+    if bound == 0:
+        return _BIG_RESULT
+    return _MEDIUM_RESULT - bound
+
+
+def _experimental_cost(node):
+    localparts = set(qname.get(u'localpart') for qname in _qnames(node))
+    if u'name' in localparts:
+        if _is_bound(node, 0) and _is_var(node, 1):
+            return _SINGLE_RESULT
+        if _is_var(node, 0) and _is_bound(node, 1):
+            return _INFINITE_RESULT
+        if _is_bound(node, 0) and _is_bound(node, 1):
+            return _FILTER_RESULT
+    if u'in' in localparts:
+        if _is_bound(node, 0):
+            return _FILTER_RESULT
+        if _is_var(node, 0):
+            return _SMALL_RESULT
+    return _WHOLE_TM_RESULT
+
+
+def _estimate_cost(estimate):
+    try:
+        value = float(estimate)
+    except ValueError:
+        return estimate
+    if value == 0:
+        return _FAIL_RESULT
+    if value >= _WHOLE_TM_RESULT:
+        return _WHOLE_TM_RESULT - 1
+    return estimate
+
+
+_COST_FUNCTIONS = {
+    u'builtin-predicate': _builtin_cost,
+    u'infix-predicate': _infix_cost,
+    u'dynamic-predicate': _dynamic_cost,
+    u'association-predicate': _association_cost,
+}
+
+_NO_COST = object()
+
+
+def annotate_costs(root, cost_model=None):
+    """\
+    Adds a ``cost`` attribute to the predicates.
+
+    If a predicate provides an ``estimate`` attribute (c.f. `cardinality`),
+    the cost is derived from the estimate. If a `statistics.CostModel` is
+    provided, the estimated number of rows is used as cost; predicates which
+    cannot be estimated get the static costs.
+    """
+    modules = _module_iris(root)
+    def cost_of(node):
+        estimate = node.get(u'estimate')
+        if estimate is not None:
+            return _estimate_cost(estimate)
+        if cost_model is not None:
+            cost = cost_model.cost(node)
+            if cost is not None:
+                return cost
+        func = _COST_FUNCTIONS.get(node.name)
+        if func is not None:
+            return func(node)
+        if node.name == u'internal-predicate':
+            return {u'types': _BIG_RESULT, u'direct-types': _BIG_RESULT - 1}.get(node.get(u'name'))
+        if node.name == u'predicate':
+            iris = _predicate_module_iris(node, modules)
+            if iris is not None:
+                if _MOD_EXPERIMENTAL in iris:
+                    return _experimental_cost(node)
+                if _MOD_NUMBER in iris:
+                    return _WHOLE_TM_RESULT
+                return _NO_COST
+            if _rule_name(node) is not None:
+                open_vars = _count_vars(node)
+                return _BIG_RESULT + open_vars - 1 if open_vars else _FILTER_RESULT
+        return None
+    def transform(node):
+        cost = cost_of(node)
+        if cost is _NO_COST:
+            return node
+        if cost is None:
+            return _rebuild(node, [transform(child) for child in node.children])
+        attrs = dict(node.attrs)
+        attrs[u'cost'] = unicode(cost)
+        return Node(node.name, attrs, [transform(child) for child in node.children])
+    return transform(root)
+
+
+#
+# fold-type
+#
+def fold_type(root):
+    """\
+    Merges ``role-player($x, x), type($x, z)`` into ``role-player($x, x, z)``,
+    ``occurrence(t, $x), type($x, z)`` into ``occurrence(t, $x, z)`` and
+    ``topic-name(t, $x), type($x, z)`` into ``topic-name(t, $x, z)``.
+    """
+    def transform(node):
+        types, users = defaultdict(list), defaultdict(int)
+        for child in node.children:
+            if child.name != u'builtin-predicate':
+                continue
+            if _is_builtin(child, u'type') and _is_var(child, 0) and _is_bound(child, 1):
+                types[_var_name(child, 0)].append(child)
+            elif _is_builtin(child, u'role-player') and _is_var(child, 0) and _is_bound(child, 1):
+                users[_var_name(child, 0)] += 1
+            elif _is_builtin(child, u'topic-name', u'occurrence') and _is_bound(child, 0) and _is_var(child, 1):
+                users[_var_name(child, 1)] += 1
+        children = []
+        for child in node.children:
+            var = None
+            if _is_builtin(child, u'role-player') and _is_var(child, 0) and _is_bound(child, 1):
+                var = _var_name(child, 0)
+            elif _is_builtin(child, u'topic-name', u'occurrence') and _is_bound(child, 0) and _is_var(child, 1):
+                var = _var_name(child, 1)
+            elif _is_builtin(child, u'type') and _is_var(child, 0) and _is_bound(child, 1):
+                if users[_var_name(child, 0)] != 1:
+                    children.append(child)
+                continue
+            else:
+                children.append(transform(child))
+                continue
+            typ = types[var]
+            if len(typ) == 1:
+                child = Node(u'builtin-predicate', child.attrs, child.children + typ[0].children[1:2])
+            children.append(child)
+        return _rebuild(node, children)
+    return transform(root)
+
+
+#
+# reorder-predicates
+#
+def _cost_key(node):
+    try:
+        return float(node.get(u'cost'))
+    except (TypeError, ValueError):
+        # Predicates without costs are evaluated first
+        return float('-inf')
+
+
+def reorder_predicates(root, cost_model=None):
+    """\
+    Reorders the predicates of ``where`` clauses by their costs.
+
+    If a `statistics.CostModel` is provided, the predicates are ordered
+    greedily: The predicate with the least number of estimated rows comes
+    first, its variables are considered as bound for the remaining
+    predicates, and so on.
+    """
+    def transform(node):
+        children = [transform(child) for child in node.children]
+        if node.name == u'where':
+            children.sort(key=_cost_key)
+            if cost_model is not None:
+                children = _join_order(children, cost_model)
+            return Node(u'where', None, children)
+        return _rebuild(node, children)
+    return transform(root)
+
+
+def _join_order(predicates, cost_model):
+    """\
+    Returns the `predicates` (sorted by their static costs) in the order of
+    their estimated number of rows.
+
+    Predicates without costs (i.e. ``not`` and ``or``) keep their position.
+    """
+    res = [pred for pred in predicates if pred.get(u'cost') is None]
+    remaining = predicates[len(res):]
+    bound = set()
+    def rows(pred):
+        estimate = cost_model.rows(pred, bound)
+        return estimate if estimate is not None else float(pred.get(u'cost'))
+    while remaining:
+        idx = min(xrange(len(remaining)), key=lambda i: (rows(remaining[i]), i))
+        pred = remaining.pop(idx)
+        res.append(pred)
+        bound.update(variables(pred))
+    return res
+
+
+# Optimizers which accept a `statistics.CostModel`
+_COST_MODEL_OPTIMIZERS = (u'annotate-costs', u'reorder-predicates')
+
+_OPTIMIZERS = {
+    u'query-c14n': query_c14n,
+    u'inline-rules': inline_rules,
+    u'annotate-predicates': annotate_predicates,
+    u'remove-redundant-predicates': remove_redundant_predicates,
+    u'annotate-costs': annotate_costs,
+    u'fold-type': fold_type,
+    u'reorder-predicates': reorder_predicates,
+}
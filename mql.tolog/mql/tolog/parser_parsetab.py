@@ -0,0 +1,191 @@
+
+# /root/package/mql.tolog/mql/tolog/parser_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\x83v&\xa9c3V\xd7\xbc\x03\x95\t\xb1v\xdeo'
+    
+_lr_action_items = {'KW_FOR':([98,],[155,]),'KW_UPDATE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,53,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,53,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'KW_ASC':([223,],[243,]),'QNAME':([0,1,2,6,7,8,9,10,11,12,14,17,19,26,30,31,36,38,39,46,48,51,55,57,59,60,62,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,115,116,140,152,153,154,155,156,170,171,174,176,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,26,-6,-91,-92,26,-65,-110,-12,-81,-106,-105,-9,26,-14,26,26,-15,26,-109,-99,-108,-13,-149,26,-115,-107,-111,-112,-8,-116,-117,26,26,26,26,-98,-129,-113,-114,-10,-11,26,26,26,26,26,26,26,26,-93,-88,26,26,26,26,-90,26,26,26,26,26,26,26,26,26,-87,-150,-150,-89,-86,-128,26,26,26,26,26,]),'CIRCUMFLEX':([0,1,2,6,7,8,9,11,12,14,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,155,156,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,10,-6,-91,-92,-65,-110,-12,-81,-106,-105,-9,-14,-15,10,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,10,10,10,10,-98,-129,-113,-114,-10,-11,10,10,10,10,10,10,10,-93,-88,10,10,10,-90,10,10,10,10,10,10,10,-87,-150,-150,-89,-86,-128,10,10,10,10,10,]),'LCURLY':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,88,90,92,94,95,100,102,110,116,140,152,153,156,195,199,200,202,205,226,231,232,233,],[-4,-5,-7,60,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,60,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,60,-98,-129,-113,-114,-10,-11,60,-93,-88,60,60,-90,-87,-150,-150,-89,-86,-128,60,60,60,]),'COLON':([12,19,22,26,29,32,35,37,43,49,51,55,56,57,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,138,167,168,169,220,224,],[-110,-106,-103,-105,-161,-158,-102,-153,-104,-159,-109,-99,-139,-108,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,184,-154,-156,-155,239,184,]),'KW_DELETE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,11,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,11,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'SID':([0,1,2,6,7,8,9,11,12,14,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,155,156,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,12,-6,-91,-92,-65,-110,-12,-81,-106,-105,-9,-14,-15,12,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,12,12,12,12,-98,-129,-113,-114,-10,-11,12,12,12,12,12,12,12,-93,-88,12,12,12,-90,12,12,12,12,12,12,12,-87,-150,-150,-89,-86,-128,12,12,12,12,12,]),'DATE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,61,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,61,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,61,61,-98,-129,-113,-114,-10,-11,61,61,61,61,61,61,61,-93,-88,61,61,-90,61,61,61,61,-87,-150,-150,-89,-86,-128,61,61,61,61,61,]),'KW_CREATE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,62,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,62,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'DOT':([12,19,22,26,28,29,32,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,144,145,157,158,159,160,161,162,167,168,169,182,192,198,217,227,229,],[-110,-106,-103,-105,-33,-161,-158,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,-31,-130,-143,-145,-142,-144,-146,-141,-154,-156,-155,-134,226,-147,-131,-151,-148,]),'DATE_TIME':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,29,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,29,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,29,29,-98,-129,-113,-114,-10,-11,29,29,29,29,29,29,29,-93,-88,29,29,-90,29,29,29,29,-87,-150,-150,-89,-86,-128,29,29,29,29,29,]),'KW_INSERT':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,15,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,15,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'RPAREN':([12,19,22,26,28,29,32,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,90,94,95,119,120,122,124,135,136,137,138,139,144,145,157,158,159,160,161,162,167,168,169,182,185,193,198,203,208,211,215,216,217,218,219,224,227,229,250,251,],[-110,-106,-103,-105,-33,-161,-158,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-98,-113,-114,-69,-67,-70,-71,182,-98,-138,-135,-52,-31,-130,-143,-145,-142,-144,-146,-141,-154,-156,-155,-134,217,227,-147,-68,234,235,-136,-132,-131,-54,-53,-135,-151,-148,-55,-133,]),'RCURLY':([12,19,22,26,28,29,32,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,144,145,157,158,159,160,161,162,165,167,168,169,182,197,198,201,217,227,229,230,245,246,],[-110,-106,-103,-105,-33,-161,-158,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,-31,-130,-143,-145,-142,-144,-146,-141,198,-154,-156,-155,-134,229,-147,-56,-131,-151,-148,-57,-59,-58,]),'KW_ORDER':([12,19,22,26,27,28,29,32,33,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,144,145,157,158,159,160,161,162,167,168,169,182,198,213,217,227,229,247,],[-110,-106,-103,-105,86,-33,-161,-158,-130,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,-31,-130,-143,-145,-142,-144,-146,-141,-154,-156,-155,-134,-147,86,-131,-151,-148,-85,]),'NE':([12,19,21,22,26,29,32,35,37,43,49,51,52,55,56,57,61,63,64,65,67,68,70,71,72,74,77,78,94,95,136,146,167,168,169,],[-110,-106,-138,-103,-105,-161,-158,-102,-153,-104,-159,-109,105,-99,-139,-108,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-116,-117,-113,-114,-98,-138,-154,-156,-155,]),'KW_LIMIT':([89,221,222,223,241,242,243,252,],[148,-119,-48,-122,-124,-121,-123,-49,]),'DIR_IMPORT':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,45,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,45,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'PIPE':([12,19,22,26,28,29,32,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,144,145,157,158,159,160,161,162,165,167,168,169,182,197,198,201,217,227,229,230,245,246,],[-110,-106,-103,-105,-33,-161,-158,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,-31,-130,-143,-145,-142,-144,-146,-141,200,-154,-156,-155,-134,200,-147,-56,-131,-151,-148,-57,-59,-58,]),'IID':([0,1,2,6,7,8,9,11,12,14,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,155,156,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,63,-6,-91,-92,-65,-110,-12,-81,-106,-105,-9,-14,-15,63,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,63,63,63,63,-98,-129,-113,-114,-10,-11,63,63,63,63,63,63,63,-93,-88,63,63,63,-90,63,63,63,63,63,63,63,-87,-150,-150,-89,-86,-128,63,63,63,63,63,]),'LT':([12,19,21,22,26,29,32,35,37,43,49,51,52,55,56,57,61,63,64,65,67,68,70,71,72,74,77,78,94,95,136,146,167,168,169,],[-110,-106,-138,-103,-105,-161,-158,-102,-153,-104,-159,-109,106,-99,-139,-108,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-116,-117,-113,-114,-98,-138,-154,-156,-155,]),'KW_SELECT':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,16,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,16,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'DIR_VERSION':([0,],[4,]),'INTEGER':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,148,149,152,153,156,183,184,186,188,195,199,200,202,205,225,226,231,232,233,238,239,],[-4,-5,-7,32,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,32,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,32,32,-98,-129,-113,-114,-10,-11,32,32,32,32,32,32,32,-93,-88,189,190,32,32,-90,32,32,32,32,-87,-150,-150,-89,-86,244,-128,32,32,32,32,32,]),'KW_IMPORT':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,66,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,66,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'KW_BY':([86,],[143,]),'KW_NOT':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,88,90,92,94,95,100,102,110,116,140,152,153,156,195,199,200,202,205,226,231,232,233,],[-4,-5,-7,34,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,34,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,34,-98,-129,-113,-114,-10,-11,34,-93,-88,34,34,-90,-87,-150,-150,-89,-86,-128,34,34,34,]),'$end':([3,12,13,14,18,19,20,22,23,25,26,27,28,29,30,32,33,35,36,37,41,42,43,44,46,47,48,49,50,51,54,55,56,57,58,59,61,63,64,65,67,68,69,71,72,73,74,75,77,78,85,87,89,90,91,94,95,96,97,100,101,102,111,116,117,118,119,120,121,122,123,124,125,126,133,134,136,137,140,141,142,144,145,147,150,151,156,157,158,159,160,161,162,164,167,168,169,172,173,175,177,182,189,190,191,194,195,196,198,202,203,204,206,207,209,210,213,214,217,221,222,223,226,227,228,229,234,236,237,241,242,243,244,247,248,249,252,],[0,-110,-16,-12,-24,-106,-17,-103,-18,-23,-105,-43,-33,-161,-9,-158,-130,-102,-14,-153,-19,-22,-104,-21,-15,-3,-1,-159,-34,-109,-30,-99,-139,-108,-32,-13,-160,-115,-107,-111,-140,-157,-20,-112,-137,-25,-97,-8,-116,-117,-35,-44,-50,-98,-62,-113,-114,-63,-75,-10,-2,-11,-60,-93,-38,-37,-69,-67,-39,-70,-102,-71,-45,-77,-83,-82,-98,-138,-88,-29,-36,-31,-130,-51,-47,-45,-90,-143,-145,-142,-144,-146,-141,-39,-154,-156,-155,-40,-41,-41,-46,-134,-126,-125,-61,-76,-87,-41,-147,-89,-68,-84,-42,-64,-72,-74,-43,-39,-131,-119,-48,-122,-128,-151,-78,-148,-66,-35,-41,-124,-121,-123,-127,-85,-94,-80,-49,]),'KW_COUNT':([16,81,179,],[-95,127,127,]),'IDENT':([0,1,2,6,7,8,9,11,12,14,17,19,24,26,30,36,40,45,46,48,51,53,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,109,110,116,140,152,153,156,166,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,35,-6,-91,-92,-65,-110,-12,-81,-106,84,-105,-9,-14,98,99,-15,35,-109,-79,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,123,35,35,35,-98,-129,-113,-114,-10,-11,35,35,35,35,35,35,163,35,-93,-88,35,35,-90,202,35,35,35,35,35,35,35,-87,-150,-150,-89,-86,-128,35,35,35,35,35,]),'IMPLIES':([33,182,],[92,-134,]),'STRING':([0,1,2,6,7,8,9,11,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,66,71,75,77,78,79,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,170,174,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,68,-6,-91,-92,-65,-110,-12,-106,-105,-9,-14,-15,68,-109,-99,-108,-13,-149,-115,-107,-111,113,-112,-8,-116,-117,124,68,68,-98,-129,-113,-114,-10,-11,68,68,68,68,68,68,68,-93,-88,68,68,-90,124,124,68,68,68,68,-87,-150,-150,-89,-86,-128,68,68,68,68,68,]),'KW_USING':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,40,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,40,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'DECIMAL':([0,1,2,4,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,8,49,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,49,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,49,49,-98,-129,-113,-114,-10,-11,49,49,49,49,49,49,49,-93,-88,49,49,-90,49,49,49,49,-87,-150,-150,-89,-86,-128,49,49,49,49,49,]),'KW_MERGE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,17,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,17,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'KW_WHERE':([12,19,22,26,35,43,51,55,57,63,64,65,71,74,77,78,90,94,95,97,117,118,119,120,121,122,123,124,125,126,128,129,130,131,133,134,164,172,173,175,177,180,194,196,203,204,210,212,214,234,235,237,],[-110,-106,-103,-105,-102,-104,-109,-99,-108,-115,-107,-111,-112,-97,-116,-117,-98,-113,-114,-75,-38,-37,-69,-67,-39,-70,-102,-71,-45,-77,-28,-39,-26,-96,-83,-82,-39,-40,205,205,-46,205,-76,205,-68,-84,-74,-27,-39,-66,-118,205,]),'PARAM':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,37,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,37,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,37,37,-98,-129,-113,-114,-10,-11,37,37,37,37,37,37,37,-93,-88,37,37,-90,37,37,37,37,-87,-150,-150,-89,-86,-128,37,37,37,37,37,]),'KW_INTO':([19,26,55,90,91,125,126,151,],[-106,-105,-99,-98,-62,176,-77,176,]),'IRI':([0,1,2,5,6,7,8,9,10,11,12,14,17,19,26,30,31,36,38,39,46,48,51,55,57,59,60,62,63,64,65,66,71,75,76,77,78,79,82,83,84,88,90,92,94,95,99,100,102,103,104,105,106,107,108,110,115,116,140,152,153,154,155,156,170,171,174,176,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,9,70,-6,-91,-92,77,-65,-110,-12,-81,-106,-105,-9,90,-14,94,90,-15,70,-109,-99,-108,-13,-149,90,-115,-107,-111,114,-112,-8,116,-116,-117,90,90,136,140,136,-98,-129,-113,-114,156,-10,-11,136,136,136,136,136,136,136,169,-93,-88,136,136,90,90,-90,90,90,90,90,90,136,136,136,136,-87,-150,-150,-89,-86,-128,136,136,136,136,136,]),'GE':([12,19,21,22,26,29,32,35,37,43,49,51,52,55,56,57,61,63,64,65,67,68,70,71,72,74,77,78,94,95,136,146,167,168,169,],[-110,-106,-138,-103,-105,-161,-158,-102,-153,-104,-159,-109,104,-99,-139,-108,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-116,-117,-113,-114,-98,-138,-154,-156,-155,]),'SLO':([0,1,2,6,7,8,9,11,12,14,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,155,156,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,71,-6,-91,-92,-65,-110,-12,-81,-106,-105,-9,-14,-15,71,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,71,71,71,71,-98,-129,-113,-114,-10,-11,71,71,71,71,71,71,71,-93,-88,71,71,71,-90,71,71,71,71,71,71,71,-87,-150,-150,-89,-86,-128,71,71,71,71,71,]),'PIPE_PIPE':([12,19,22,26,28,29,32,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,94,95,136,137,144,145,157,158,159,160,161,162,165,167,168,169,182,197,198,201,217,227,229,230,245,246,],[-110,-106,-103,-105,-33,-161,-158,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-113,-114,-98,-138,-31,-130,-143,-145,-142,-144,-146,-141,199,-154,-156,-155,-134,199,-147,-56,-131,-151,-148,-57,-59,-58,]),'LPAREN':([12,19,21,22,26,34,35,51,55,57,63,64,65,70,71,74,77,78,93,94,95,123,127,136,146,163,],[-110,-106,83,-103,-105,-152,-102,-109,-99,-108,-115,-107,-111,-98,-112,-97,-116,-117,153,-113,-114,174,178,-98,188,174,]),'TM_FRAGMENT':([15,80,],[-73,126,]),'VARIABLE':([0,1,2,6,7,8,9,11,12,14,16,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,81,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,143,152,153,156,170,174,178,179,181,183,184,186,187,188,195,199,200,202,205,226,231,232,233,238,239,240,],[-4,-5,-7,43,-6,-91,-92,-65,-110,-12,-95,-81,-106,-105,-9,-14,-15,43,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,43,131,134,43,43,-98,-129,-113,-114,-10,-11,43,43,43,43,43,43,43,-93,-88,-120,43,43,-90,43,43,211,131,134,43,43,43,223,43,-87,-150,-150,-89,-86,-128,43,43,43,43,43,223,]),'EQ':([0,1,2,6,7,8,9,11,12,14,17,19,21,22,26,29,30,32,35,36,37,43,46,48,49,51,52,55,56,57,59,60,61,63,64,65,67,68,70,71,72,74,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,136,140,146,152,153,155,156,167,168,169,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,38,-6,-91,-92,-65,-110,-12,-81,-106,-138,-103,-105,-161,-9,-158,-102,-14,-153,-104,-15,38,-159,-109,108,-99,-139,-108,-13,-149,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-8,-116,-117,38,38,38,38,-98,-129,-113,-114,-10,-11,38,38,38,38,38,38,38,-93,-98,-88,-138,38,38,38,-90,-154,-156,-155,38,38,38,38,38,38,38,-87,-150,-150,-89,-86,-128,38,38,38,38,38,]),'KW_DROP':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,39,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,39,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'KW_DESC':([223,],[241,]),'GT':([12,19,21,22,26,29,32,35,37,43,49,51,52,55,56,57,61,63,64,65,67,68,70,71,72,74,77,78,94,95,136,146,167,168,169,],[-110,-106,-138,-103,-105,-161,-158,-102,-153,-104,-159,-109,107,-99,-139,-108,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-116,-117,-113,-114,-98,-138,-154,-156,-155,]),'CURIE':([0,1,2,6,7,8,9,10,11,12,14,17,19,26,30,31,36,38,39,46,48,51,55,57,59,60,62,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,115,116,140,152,153,154,155,156,170,171,174,176,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,19,-6,-91,-92,19,-65,-110,-12,-81,-106,-105,-9,19,-14,19,19,-15,19,-109,-99,-108,-13,-149,19,-115,-107,-111,-112,-8,-116,-117,19,19,19,19,-98,-129,-113,-114,-10,-11,19,19,19,19,19,19,19,19,-93,-88,19,19,19,19,-90,19,19,19,19,19,19,19,19,19,-87,-150,-150,-89,-86,-128,19,19,19,19,19,]),'OID':([0,1,2,6,7,8,9,11,12,14,17,19,26,30,36,46,48,51,55,57,59,60,63,64,65,71,75,77,78,79,82,83,88,90,92,94,95,100,102,103,104,105,106,107,108,110,116,140,152,153,156,170,174,181,183,184,186,188,195,199,200,202,205,226,231,232,233,238,239,],[-4,-5,-7,22,-6,-91,-92,-65,-110,-12,-81,-106,-105,-9,-14,-15,22,-109,-99,-108,-13,-149,-115,-107,-111,-112,-8,-116,-117,22,22,22,22,-98,-129,-113,-114,-10,-11,22,22,22,22,22,22,22,-93,-88,22,22,-90,22,22,22,22,22,22,22,-87,-150,-150,-89,-86,-128,22,22,22,22,22,]),'KW_FROM':([12,19,22,26,35,43,51,55,57,63,64,65,71,74,77,78,90,94,95,117,118,119,120,121,122,123,124,128,129,130,131,133,134,164,203,212,214,234,235,],[-110,-106,-103,-105,-102,-104,-109,-99,-108,-115,-107,-111,-112,-97,-116,-117,-98,-113,-114,-38,-37,-69,-67,171,-70,-102,-71,-28,171,-26,-96,-83,-82,171,-68,-27,171,-66,-118,]),'KW_LOAD':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,31,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,31,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'KW_AS':([112,113,114,],[166,-101,-100,]),'X_DIRECTIVE':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,76,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,76,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'DIR_PREFIX':([0,1,2,6,7,8,9,12,14,19,26,30,36,46,48,51,55,57,59,63,64,65,71,75,77,78,90,94,95,100,102,116,140,156,195,202,226,],[-4,-5,-7,24,-6,-91,-92,-110,-12,-106,-105,-9,-14,-15,24,-109,-99,-108,-13,-115,-107,-111,-112,-8,-116,-117,-98,-113,-114,-10,-11,-93,-88,-90,-87,-89,-128,]),'DIR_BASE':([0,1,8,],[5,5,-91,]),'LE':([12,19,21,22,26,29,32,35,37,43,49,51,52,55,56,57,61,63,64,65,67,68,70,71,72,74,77,78,94,95,136,146,167,168,169,],[-110,-106,-138,-103,-105,-161,-158,-102,-153,-104,-159,-109,103,-99,-139,-108,-160,-115,-107,-111,-140,-157,-98,-112,-137,-97,-116,-117,-113,-114,-98,-138,-154,-156,-155,]),'COMMA':([12,19,22,26,27,28,29,32,33,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,90,94,95,96,97,117,119,120,122,123,124,128,129,130,131,132,133,134,135,136,137,138,139,144,145,157,158,159,160,161,162,165,167,168,169,182,192,193,194,198,203,204,208,210,212,215,216,217,218,219,221,222,223,224,227,229,235,241,242,243,245,246,247,250,251,252,],[-110,-106,-103,-105,88,-33,-161,-158,-130,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,-98,-113,-114,154,-75,170,-69,-67,-70,-102,-71,-28,179,-26,-96,181,-83,-82,183,-98,-138,-135,186,-31,-130,-143,-145,-142,-144,-146,-141,88,-154,-156,-155,-134,88,88,-76,-147,-68,154,170,154,-27,-136,-132,-131,-54,238,240,-48,-122,-135,-151,-148,-118,-124,-121,-123,88,88,88,-55,-133,-49,]),'QM':([12,19,22,26,27,28,29,32,33,35,37,43,49,50,51,54,55,56,57,58,61,63,64,65,67,68,71,72,74,77,78,85,87,89,94,95,136,137,144,145,147,150,157,158,159,160,161,162,167,168,169,182,189,190,198,213,217,221,222,223,227,229,236,241,242,243,244,247,252,],[-110,-106,-103,-105,-43,-33,-161,-158,-130,-102,-153,-104,-159,-34,-109,-30,-99,-139,-108,-32,-160,-115,-107,-111,-140,-157,-112,-137,-97,-116,-117,142,-44,-50,-113,-114,-98,-138,-31,-130,-51,-47,-143,-145,-142,-144,-146,-141,-154,-156,-155,-134,-126,-125,-147,-43,-131,-119,-48,-122,-151,-148,142,-124,-121,-123,-127,-85,-49,]),'KW_OFFSET':([89,189,221,222,223,241,242,243,252,],[149,225,-119,-48,-122,-124,-121,-123,-49,]),'DOUBLE_CIRCUMFLEX':([68,],[115,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'load':([6,48,],[42,42,]),'qiris':([39,171,176,],[96,204,210,]),'pairs':([186,],[219,]),'drop':([6,48,],[25,25,]),'opt_tail':([27,213,],[85,236,]),'_start_load':([91,],[151,]),'clause':([6,48,88,110,152,153,231,232,233,],[54,54,144,54,54,54,54,54,54,]),'prefix_directive':([6,48,],[59,59,]),'order_elements':([187,],[221,]),'direction':([223,],[242,]),'function_call':([79,109,],[118,164,]),'base_directive':([0,1,],[2,7,]),'pair':([186,238,],[218,250,]),'into_statement':([125,151,],[177,177,]),'predclause':([6,48,88,110,152,153,231,232,233,],[33,33,145,145,145,145,145,145,145,]),'value':([6,48,83,88,103,104,105,106,107,108,110,152,153,183,184,186,188,231,232,233,238,239,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'query':([6,48,],[13,13,]),'clauselist':([6,48,110,152,153,231,232,233,],[27,27,165,192,193,245,246,247,]),'notclause':([6,48,88,110,152,153,231,232,233,],[28,28,28,28,28,28,28,28,28,]),'_start_or':([60,],[110,]),'_start_insert':([15,],[80,]),'limit_offset':([89,],[147,]),'directive':([6,48,],[30,100,]),'create':([6,48,],[44,44,]),'where_clause':([173,175,180,196,237,],[206,206,213,206,206,]),'delete_element':([79,],[121,]),'param':([79,170,174,],[120,203,120,]),'using_directive':([6,48,],[14,14,]),'order_element':([187,240,],[222,252,]),'instance':([0,],[3,]),'tail':([27,213,],[87,87,]),'count_clause':([81,179,],[128,128,]),'order_clause':([27,213,],[89,89,]),'x_directive':([6,48,],[46,46,]),'statement':([6,48,],[47,101,]),'sid':([6,48,79,82,83,88,103,104,105,106,107,108,110,152,153,155,170,174,181,183,184,186,188,231,232,233,238,239,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'qiri':([6,31,39,48,62,79,82,83,88,103,104,105,106,107,108,110,152,153,154,155,170,171,174,176,181,183,184,186,188,231,232,233,238,239,],[65,91,97,65,111,65,65,65,65,65,65,65,65,65,65,65,65,65,194,65,65,97,65,97,65,65,65,65,65,65,65,65,65,65,]),'opt_limit_offset':([89,],[150,]),'parameter':([6,48,83,88,103,104,105,106,107,108,110,152,153,183,184,186,188,231,232,233,238,239,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'opt_more_pairs':([139,],[185,]),'arguments':([83,188,],[135,135,]),'oredclauses':([165,],[197,]),'head':([6,],[48,]),'iri_or_string':([66,],[112,]),'_start_branch':([199,200,],[231,232,]),'fragment':([80,],[125,]),'import_directive':([6,48,],[36,36,]),'literal':([82,181,],[132,214,]),'opt_into':([125,151,],[175,191,]),'update':([6,48,],[69,69,]),'opclause':([6,48,88,110,152,153,231,232,233,],[50,50,50,50,50,50,50,50,50,]),'select_query':([6,48,],[18,18,]),'iid':([6,48,79,82,83,88,103,104,105,106,107,108,110,152,153,155,170,174,181,183,184,186,188,231,232,233,238,239,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'paramlist':([79,174,],[117,208,]),'variable':([6,48,79,83,88,103,104,105,106,107,108,110,152,153,170,174,183,184,186,188,231,232,233,238,239,],[72,72,119,72,72,72,72,72,72,72,72,72,72,72,119,119,72,72,72,72,72,72,72,72,72,]),'_start_not':([34,],[93,]),'_start_rule':([92,],[152,]),'_start_select':([16,],[81,]),'_start_update':([53,],[109,]),'select_elements':([81,],[129,]),'select_element':([81,179,],[130,212,]),'insert':([6,48,],[20,20,]),'clause_query':([6,48,],[73,73,]),'from_clause':([121,129,164,214,],[172,172,172,172,]),'oredclause':([165,197,],[201,230,]),'uri_ref':([6,48,79,82,83,88,103,104,105,106,107,108,110,152,153,155,170,174,181,183,184,186,188,231,232,233,238,239,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,195,74,74,74,74,74,74,74,74,74,74,74,74,]),'datatype':([115,],[167,]),'ref':([6,48,79,82,83,88,103,104,105,106,107,108,110,152,153,170,174,181,183,184,186,188,231,232,233,238,239,],[21,21,122,133,137,146,137,137,137,137,137,137,146,146,146,122,122,133,137,137,137,137,146,146,146,137,137,]),'_start_where':([205,],[233,]),'version_directive':([0,],[1,]),'_start_order':([143,],[187,]),'qname':([6,10,31,38,39,48,62,79,82,83,88,103,104,105,106,107,108,110,115,152,153,154,155,170,171,174,176,181,183,184,186,188,231,232,233,238,239,],[55,78,55,95,55,55,55,55,55,55,55,55,55,55,55,55,55,55,168,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'rule':([6,48,],[75,102,]),'_start_merge':([17,],[82,]),'merge':([6,48,],[23,23,]),'opt_qm':([85,236,],[141,248,]),'slo':([6,48,79,82,83,88,103,104,105,106,107,108,110,152,153,155,170,174,181,183,184,186,188,231,232,233,238,239,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'opt_where':([173,175,196,237,],[207,209,228,249,]),'expr':([6,48,83,88,103,104,105,106,107,108,110,152,153,183,184,186,188,231,232,233,238,239,],[52,52,138,52,157,158,159,160,161,162,52,52,52,215,216,220,224,52,52,52,220,251,]),'orclause':([6,48,88,110,152,153,231,232,233,],[58,58,58,58,58,58,58,58,58,]),'opt_from':([121,129,164,214,],[173,180,196,237,]),'delete':([6,48,],[41,41,]),'_start_delete':([11,],[79,]),'_first_pair':([83,188,],[139,139,]),'prolog':([0,],[6,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> instance","S'",1,None,None,None),
+  ('instance -> prolog head','instance',2,'p_noop','parser.py',37),
+  ('instance -> prolog head statement','instance',3,'p_noop','parser.py',38),
+  ('instance -> prolog statement','instance',2,'p_noop','parser.py',39),
+  ('prolog -> <empty>','prolog',0,'p_noop','parser.py',40),
+  ('prolog -> version_directive','prolog',1,'p_noop','parser.py',41),
+  ('prolog -> version_directive base_directive','prolog',2,'p_noop','parser.py',42),
+  ('prolog -> base_directive','prolog',1,'p_noop','parser.py',43),
+  ('head -> rule','head',1,'p_noop','parser.py',44),
+  ('head -> directive','head',1,'p_noop','parser.py',45),
+  ('head -> head directive','head',2,'p_noop','parser.py',46),
+  ('head -> head rule','head',2,'p_noop','parser.py',47),
+  ('directive -> using_directive','directive',1,'p_noop','parser.py',48),
+  ('directive -> prefix_directive','directive',1,'p_noop','parser.py',49),
+  ('directive -> import_directive','directive',1,'p_noop','parser.py',50),
+  ('directive -> x_directive','directive',1,'p_noop','parser.py',51),
+  ('statement -> query','statement',1,'p_noop','parser.py',52),
+  ('statement -> insert','statement',1,'p_noop','parser.py',53),
+  ('statement -> merge','statement',1,'p_noop','parser.py',54),
+  ('statement -> delete','statement',1,'p_noop','parser.py',55),
+  ('statement -> update','statement',1,'p_noop','parser.py',56),
+  ('statement -> create','statement',1,'p_noop','parser.py',57),
+  ('statement -> load','statement',1,'p_noop','parser.py',58),
+  ('statement -> drop','statement',1,'p_noop','parser.py',59),
+  ('query -> select_query','query',1,'p_noop','parser.py',60),
+  ('query -> clause_query','query',1,'p_noop','parser.py',61),
+  ('select_elements -> select_element','select_elements',1,'p_noop','parser.py',62),
+  ('select_elements -> select_elements COMMA select_element','select_elements',3,'p_noop','parser.py',63),
+  ('select_element -> count_clause','select_element',1,'p_noop','parser.py',64),
+  ('clause_query -> clauselist opt_tail opt_qm','clause_query',3,'p_noop','parser.py',65),
+  ('clauselist -> clause','clauselist',1,'p_noop','parser.py',66),
+  ('clauselist -> clauselist COMMA clause','clauselist',3,'p_noop','parser.py',67),
+  ('clause -> orclause','clause',1,'p_noop','parser.py',68),
+  ('clause -> notclause','clause',1,'p_noop','parser.py',69),
+  ('clause -> opclause','clause',1,'p_noop','parser.py',70),
+  ('opt_qm -> <empty>','opt_qm',0,'p_noop','parser.py',71),
+  ('opt_qm -> QM','opt_qm',1,'p_noop','parser.py',72),
+  ('delete_element -> function_call','delete_element',1,'p_noop','parser.py',73),
+  ('delete_element -> paramlist','delete_element',1,'p_noop','parser.py',74),
+  ('opt_from -> <empty>','opt_from',0,'p_noop','parser.py',75),
+  ('opt_from -> from_clause','opt_from',1,'p_noop','parser.py',76),
+  ('opt_where -> <empty>','opt_where',0,'p_noop','parser.py',77),
+  ('opt_where -> where_clause','opt_where',1,'p_noop','parser.py',78),
+  ('opt_tail -> <empty>','opt_tail',0,'p_noop','parser.py',79),
+  ('opt_tail -> tail','opt_tail',1,'p_noop','parser.py',80),
+  ('opt_into -> <empty>','opt_into',0,'p_noop','parser.py',81),
+  ('opt_into -> into_statement','opt_into',1,'p_noop','parser.py',82),
+  ('tail -> order_clause opt_limit_offset','tail',2,'p_noop','parser.py',83),
+  ('order_elements -> order_element','order_elements',1,'p_noop','parser.py',84),
+  ('order_elements -> order_elements COMMA order_element','order_elements',3,'p_noop','parser.py',85),
+  ('opt_limit_offset -> <empty>','opt_limit_offset',0,'p_noop','parser.py',86),
+  ('opt_limit_offset -> limit_offset','opt_limit_offset',1,'p_noop','parser.py',87),
+  ('opt_more_pairs -> <empty>','opt_more_pairs',0,'p_noop','parser.py',88),
+  ('opt_more_pairs -> COMMA pairs','opt_more_pairs',2,'p_noop','parser.py',89),
+  ('pairs -> pair','pairs',1,'p_noop','parser.py',90),
+  ('pairs -> pairs COMMA pair','pairs',3,'p_noop','parser.py',91),
+  ('oredclauses -> oredclause','oredclauses',1,'p_noop','parser.py',92),
+  ('oredclauses -> oredclauses oredclause','oredclauses',2,'p_noop','parser.py',93),
+  ('oredclause -> PIPE _start_branch clauselist','oredclause',3,'p_noop','parser.py',94),
+  ('oredclause -> PIPE_PIPE _start_branch clauselist','oredclause',3,'p_noop','parser.py',95),
+  ('create -> KW_CREATE qiri','create',2,'p_create','parser.py',102),
+  ('load -> KW_LOAD qiri _start_load opt_into','load',4,'p_load','parser.py',112),
+  ('_start_load -> <empty>','_start_load',0,'p__start_load','parser.py',119),
+  ('drop -> KW_DROP qiris','drop',2,'p_drop','parser.py',128),
+  ('delete -> KW_DELETE _start_delete delete_element opt_from opt_where','delete',5,'p_delete','parser.py',139),
+  ('_start_delete -> <empty>','_start_delete',0,'p__start_delete','parser.py',146),
+  ('function_call -> IDENT LPAREN paramlist RPAREN','function_call',4,'p_function_call','parser.py',153),
+  ('paramlist -> param','paramlist',1,'p_paramlist','parser.py',164),
+  ('paramlist -> paramlist COMMA param','paramlist',3,'p_paramlist','parser.py',165),
+  ('param -> variable','param',1,'p_param','parser.py',176),
+  ('param -> ref','param',1,'p_param','parser.py',177),
+  ('param -> STRING','param',1,'p_param_STRING','parser.py',184),
+  ('insert -> KW_INSERT _start_insert fragment opt_into opt_where','insert',5,'p_insert','parser.py',191),
+  ('_start_insert -> <empty>','_start_insert',0,'p__start_insert','parser.py',198),
+  ('into_statement -> KW_INTO qiris','into_statement',2,'p_into_statement','parser.py',205),
+  ('qiris -> qiri','qiris',1,'p_qiris','parser.py',216),
+  ('qiris -> qiris COMMA qiri','qiris',3,'p_qiris','parser.py',217),
+  ('fragment -> TM_FRAGMENT','fragment',1,'p_fragment','parser.py',228),
+  ('update -> KW_UPDATE _start_update function_call opt_from opt_where','update',5,'p_update','parser.py',242),
+  ('_start_update -> <empty>','_start_update',0,'p__start_update','parser.py',249),
+  ('merge -> KW_MERGE _start_merge literal COMMA literal opt_from opt_where','merge',7,'p_merge','parser.py',256),
+  ('_start_merge -> <empty>','_start_merge',0,'p__start_merge','parser.py',263),
+  ('literal -> VARIABLE','literal',1,'p_literal_variable','parser.py',270),
+  ('literal -> ref','literal',1,'p_literal_topic_ref','parser.py',277),
+  ('from_clause -> KW_FROM qiris','from_clause',2,'p_from_clause','parser.py',284),
+  ('where_clause -> KW_WHERE _start_where clauselist','where_clause',3,'p_where_clause','parser.py',295),
+  ('_start_where -> <empty>','_start_where',0,'p__start_where','parser.py',302),
+  ('using_directive -> KW_USING IDENT KW_FOR uri_ref','using_directive',4,'p_using_directive','parser.py',309),
+  ('prefix_directive -> DIR_PREFIX IDENT IRI','prefix_directive',3,'p_prefix_directive','parser.py',317),
+  ('import_directive -> KW_IMPORT iri_or_string KW_AS IDENT','import_directive',4,'p_import_directive','parser.py',324),
+  ('import_directive -> DIR_IMPORT IDENT IRI','import_directive',3,'p_import_directive','parser.py',325),
+  ('version_directive -> DIR_VERSION DECIMAL','version_directive',2,'p_version_directive','parser.py',335),
+  ('base_directive -> DIR_BASE IRI','base_directive',2,'p_base_directive','parser.py',346),
+  ('x_directive -> X_DIRECTIVE IRI','x_directive',2,'p_x_directive','parser.py',353),
+  ('select_query -> KW_SELECT _start_select select_elements opt_from where_clause opt_tail opt_qm','select_query',7,'p_select_query','parser.py',360),
+  ('_start_select -> <empty>','_start_select',0,'p__start_select','parser.py',367),
+  ('select_element -> VARIABLE','select_element',1,'p_select_element','parser.py',374),
+  ('ref -> uri_ref','ref',1,'p_ref','parser.py',381),
+  ('qiri -> IRI','qiri',1,'p_qiri_IRI','parser.py',388),
+  ('qiri -> qname','qiri',1,'p_qiri_qname','parser.py',395),
+  ('iri_or_string -> IRI','iri_or_string',1,'p_iri_or_string','parser.py',402),
+  ('iri_or_string -> STRING','iri_or_string',1,'p_iri_or_string','parser.py',403),
+  ('ref -> IDENT','ref',1,'p_ref_IDENT','parser.py',410),
+  ('ref -> OID','ref',1,'p_ref_OID','parser.py',417),
+  ('variable -> VARIABLE','variable',1,'p_variable','parser.py',424),
+  ('qname -> QNAME','qname',1,'p_qname_QNAME','parser.py',431),
+  ('qname -> CURIE','qname',1,'p_qname_CURIE','parser.py',442),
+  ('uri_ref -> sid','uri_ref',1,'p_uri_ref','parser.py',453),
+  ('uri_ref -> slo','uri_ref',1,'p_uri_ref','parser.py',454),
+  ('uri_ref -> iid','uri_ref',1,'p_uri_ref','parser.py',455),
+  ('sid -> SID','sid',1,'p_sid_SID','parser.py',462),
+  ('sid -> qiri','sid',1,'p_sid_qiri','parser.py',469),
+  ('slo -> SLO','slo',1,'p_slo','parser.py',476),
+  ('slo -> EQ IRI','slo',2,'p_slo','parser.py',477),
+  ('slo -> EQ qname','slo',2,'p_slo_QNAME','parser.py',484),
+  ('iid -> IID','iid',1,'p_iid','parser.py',492),
+  ('iid -> CIRCUMFLEX IRI','iid',2,'p_iid','parser.py',493),
+  ('iid -> CIRCUMFLEX qname','iid',2,'p_iid_QNAME','parser.py',500),
+  ('count_clause -> KW_COUNT LPAREN VARIABLE RPAREN','count_clause',4,'p_count_clause','parser.py',508),
+  ('order_clause -> KW_ORDER KW_BY _start_order order_elements','order_clause',4,'p_order_clause','parser.py',515),
+  ('_start_order -> <empty>','_start_order',0,'p__start_order','parser.py',522),
+  ('order_element -> VARIABLE direction','order_element',2,'p_order_element','parser.py',529),
+  ('direction -> <empty>','direction',0,'p_direction_ASC','parser.py',539),
+  ('direction -> KW_ASC','direction',1,'p_direction_ASC','parser.py',540),
+  ('direction -> KW_DESC','direction',1,'p_direction_DESC','parser.py',547),
+  ('limit_offset -> KW_OFFSET INTEGER','limit_offset',2,'p_limit_offset','parser.py',554),
+  ('limit_offset -> KW_LIMIT INTEGER','limit_offset',2,'p_limit_offset','parser.py',555),
+  ('limit_offset -> KW_LIMIT INTEGER KW_OFFSET INTEGER','limit_offset',4,'p_limit_offset','parser.py',556),
+  ('rule -> predclause IMPLIES _start_rule clauselist DOT','rule',5,'p_rule','parser.py',570),
+  ('_start_rule -> <empty>','_start_rule',0,'p__start_rule','parser.py',577),
+  ('clause -> predclause','clause',1,'p_clause_predcause','parser.py',598),
+  ('clause -> ref LPAREN _first_pair opt_more_pairs RPAREN','clause',5,'p_clause_assoc_predicate','parser.py',628),
+  ('_first_pair -> expr COLON expr','_first_pair',3,'p__first_pair','parser.py',650),
+  ('pair -> expr COLON expr','pair',3,'p_pair','parser.py',662),
+  ('predclause -> ref LPAREN arguments RPAREN','predclause',4,'p_predclause','parser.py',669),
+  ('arguments -> expr','arguments',1,'p_arguments','parser.py',676),
+  ('arguments -> arguments COMMA expr','arguments',3,'p_arguments','parser.py',677),
+  ('expr -> variable','expr',1,'p_expr','parser.py',688),
+  ('expr -> ref','expr',1,'p_expr','parser.py',689),
+  ('expr -> value','expr',1,'p_expr','parser.py',690),
+  ('expr -> parameter','expr',1,'p_expr','parser.py',691),
+  ('opclause -> expr EQ expr','opclause',3,'p_opclause','parser.py',707),
+  ('opclause -> expr NE expr','opclause',3,'p_opclause','parser.py',708),
+  ('opclause -> expr LE expr','opclause',3,'p_opclause','parser.py',709),
+  ('opclause -> expr LT expr','opclause',3,'p_opclause','parser.py',710),
+  ('opclause -> expr GE expr','opclause',3,'p_opclause','parser.py',711),
+  ('opclause -> expr GT expr','opclause',3,'p_opclause','parser.py',712),
+  ('orclause -> LCURLY _start_or clauselist RCURLY','orclause',4,'p_orclause','parser.py',724),
+  ('orclause -> LCURLY _start_or clauselist oredclauses RCURLY','orclause',5,'p_orclause','parser.py',725),
+  ('_start_or -> <empty>','_start_or',0,'p__start_or','parser.py',734),
+  ('_start_branch -> <empty>','_start_branch',0,'p__start_branch','parser.py',743),
+  ('notclause -> KW_NOT _start_not LPAREN clauselist RPAREN','notclause',5,'p_notclause','parser.py',752),
+  ('_start_not -> <empty>','_start_not',0,'p__start_not','parser.py',759),
+  ('parameter -> PARAM','parameter',1,'p_parameter','parser.py',766),
+  ('value -> STRING DOUBLE_CIRCUMFLEX datatype','value',3,'p_value_literal_iri','parser.py',773),
+  ('datatype -> IRI','datatype',1,'p_datatype_iri','parser.py',780),
+  ('datatype -> qname','datatype',1,'p_datatype_qname','parser.py',787),
+  ('value -> STRING','value',1,'p_value_STRING','parser.py',794),
+  ('value -> INTEGER','value',1,'p_value_INTEGER','parser.py',801),
+  ('value -> DECIMAL','value',1,'p_value_DECIMAL','parser.py',808),
+  ('value -> DATE','value',1,'p_value_DATE','parser.py',815),
+  ('value -> DATE_TIME','value',1,'p_value_DATE_TIME','parser.py',822),
+  ('value -> IRI','value',1,'p_value_IRI','parser.py',829),
+]
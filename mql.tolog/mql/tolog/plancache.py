@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Cache for optimized queries (query plans).
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+import threading
+from collections import OrderedDict
+
+__all__ = ('PlanCache', 'get_default_cache')
+
+
+class PlanCache(object):
+    """\
+    Thread-safe LRU cache which maps a key (usually the canonicalized query
+    and the names of the applied optimizers) to an optimized query.
+    """
+    def __init__(self, maxsize=256):
+        """\
+
+        `maxsize`
+            The max. number of plans to keep. If more plans are added, the
+            least recently used plan is discarded.
+        """
+        if maxsize < 1:
+            raise ValueError('Expected a positive size, got: %r' % maxsize)
+        self.maxsize = maxsize
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """\
+        Returns the plan for ``key`` or ``None`` if the plan is unknown.
+        """
+        with self._lock:
+            plan = self._plans.pop(key, None)
+            if plan is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._plans[key] = plan
+            return plan
+
+    def put(self, key, plan):
+        """\
+        Adds the ``plan`` under the provided ``key``.
+        """
+        with self._lock:
+            self._plans.pop(key, None)
+            self._plans[key] = plan
+            if len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        """\
+        Removes all plans and resets the statistics.
+        """
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """\
+        Returns a dict with the number of ``hits``, ``misses``, the current
+        ``size`` and the ``maxsize`` of this cache.
+        """
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses,
+                        size=len(self._plans), maxsize=self.maxsize)
+
+    def __len__(self):
+        return len(self._plans)
+
+
+_DEFAULT_CACHE = PlanCache()
+
+
+def get_default_cache():
+    """\
+    Returns the `PlanCache` which is used by `mql.tolog.parse_query` by
+    default.
+    """
+    return _DEFAULT_CACHE
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Query model.
+
+Provides lightweight, immutable objects which represent a (optimized) tolog
+query and a `QueryFactory` which creates them.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from decimal import Decimal
+from tm import XSD, irilib
+from . import consts
+
+__all__ = ('QueryFactory', 'variables')
+
+
+class _Node(object):
+    """\
+    Common superclass of all query nodes.
+
+    Nodes are equal if they are of the same class and their fields are equal.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *args):
+        for name, value in zip(self._fields, args):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is immutable' % self.__class__.__name__)
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.__class__, self._key()))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, u', '.join(map(repr, self._key())))
+
+
+class Variable(_Node):
+    """\
+    Represents a variable.
+    """
+    __slots__ = _fields = ('name',)
+
+
+class Parameter(_Node):
+    """\
+    Represents a parameter which is provided when the query is executed.
+    """
+    __slots__ = _fields = ('name',)
+
+
+class Literal(_Node):
+    """\
+    Represents a string, integer, decimal, date or date time value.
+
+    `value` is a Python value (unicode, int, `decimal.Decimal`) and
+    `datatype` the IRI of the datatype.
+    """
+    __slots__ = _fields = ('value', 'datatype')
+
+
+class Reference(_Node):
+    """\
+    Represents a reference to a topic (or any other Topic Maps construct).
+
+    `kind` is one of ``consts.SID``, ``consts.SLO``, ``consts.IID`` or
+    ``consts.OID`` and `value` an absolute IRI or an object id.
+    """
+    __slots__ = _fields = ('kind', 'value')
+
+
+class Count(_Node):
+    """\
+    Represents ``count($variable)`` within the select clause.
+    """
+    __slots__ = _fields = ('variable',)
+
+
+class BuiltinPredicate(_Node):
+    """\
+    Represents a built-in predicate like ``instance-of``.
+    """
+    __slots__ = _fields = ('name', 'args', 'hints')
+
+
+class InternalPredicate(_Node):
+    """\
+    Represents a predicate which was introduced by an optimizer, like
+    ``types``.
+    """
+    __slots__ = _fields = ('name', 'args', 'hints')
+
+
+class InfixPredicate(_Node):
+    """\
+    Represents a comparison. `name` is one of ``eq``, ``ne``, ``lt``,
+    ``le``, ``gt``, ``ge``.
+    """
+    __slots__ = _fields = ('name', 'lh', 'rh')
+
+
+class AssociationPredicate(_Node):
+    """\
+    Represents an association predicate. `roles` is a tuple of
+    (role type, player) tuples.
+    """
+    __slots__ = _fields = ('type', 'roles')
+
+
+class DynamicOccurrencePredicate(_Node):
+    """\
+    Represents a dynamic occurrence predicate, like
+    ``date-of-birth($person, $date)``.
+    """
+    __slots__ = _fields = ('type', 'topic', 'value')
+
+
+class Predicate(_Node):
+    """\
+    Represents an invocation of a rule or of a module function.
+
+    `name` is the name of the rule or the absolute IRI of a module function.
+    """
+    __slots__ = _fields = ('name', 'args')
+
+
+class Not(_Node):
+    """\
+    Represents ``not(...)``.
+    """
+    __slots__ = _fields = ('clauses',)
+
+
+class Or(_Node):
+    """\
+    Represents ``{ ... | ... }``. `branches` is a tuple of clause tuples.
+    """
+    __slots__ = _fields = ('branches', 'short_circuit')
+
+
+class Rule(_Node):
+    """\
+    Represents a rule.
+    """
+    __slots__ = _fields = ('name', 'params', 'body')
+
+
+class SelectQuery(_Node):
+    """\
+    Represents a select query.
+
+    `header` is a tuple of `Variable` and `Count` instances, `order_by` a
+    tuple of (variable name, ``consts.ASC`` / ``consts.DESC``) tuples and
+    `rules` a tuple of `Rule` instances.
+    """
+    __slots__ = _fields = ('header', 'where', 'order_by', 'limit', 'offset', 'rules')
+
+
+def variables(node, seen=None):
+    """\
+    Returns a list of variable names which occur in `node` (a clause, an
+    iterable of clauses, or a term) in order of their appearance.
+    """
+    res = [] if seen is None else seen
+    if isinstance(node, Variable):
+        if node.name not in res:
+            res.append(node.name)
+    elif isinstance(node, (tuple, list)):
+        for child in node:
+            variables(child, res)
+    elif isinstance(node, _Node) and not isinstance(node, (Rule, SelectQuery)):
+        for child in node._key():
+            variables(child, res)
+    return res
+
+
+class QueryFactory(object):
+    """\
+    `IQueryFactory` implementation which creates the objects of this module.
+    """
+    def create_select_query(self, header, where, order_by=None, limit=None, offset=None, rules=None):
+        return SelectQuery(tuple(header), tuple(where), tuple(order_by or ()),
+                           limit, offset, tuple(rules or ()))
+
+    def create_rule(self, name, params, body):
+        return Rule(name, tuple(params), tuple(body))
+
+    def create_predicate(self, name, args):
+        return Predicate(name, tuple(args))
+
+    def create_builtin_predicate(self, name, args, hints=None):
+        return BuiltinPredicate(name, tuple(args), tuple(hints or ()))
+
+    def create_internal_predicate(self, name, args, hints=None):
+        if name not in (u'types', u'direct-types'):
+            return None
+        return InternalPredicate(name, tuple(args), tuple(hints or ()))
+
+    def create_infix_predicate(self, name, lh, rh, hints=None):
+        return InfixPredicate(name, lh, rh)
+
+    def create_association_predicate(self, type, roles):
+        return AssociationPredicate(type, tuple(tuple(role) for role in roles))
+
+    def create_dynamic_occurrence_predicate(self, type, topic, value):
+        return DynamicOccurrencePredicate(type, topic, value)
+
+    def create_not(self, clauses):
+        return Not(tuple(clauses))
+
+    def create_or(self, branches, short_circuit=False):
+        return Or(tuple(tuple(branch) for branch in branches), short_circuit)
+
+    def create_count(self, variable):
+        return Count(variable)
+
+    def create_iri(self, iri):
+        return iri
+
+    def resolve_iri(self, base, reference):
+        return irilib.resolve_iri(base, reference)
+
+    def create_subject_identifier(self, iri):
+        return Reference(consts.SID, iri)
+
+    def create_subject_locator(self, iri):
+        return Reference(consts.SLO, iri)
+
+    def create_item_identifier(self, iri):
+        return Reference(consts.IID, iri)
+
+    def create_object_id(self, value):
+        return Reference(consts.OID, value)
+
+    def create_variable(self, name):
+        return Variable(name)
+
+    def create_parameter(self, name):
+        return Parameter(name)
+
+    def create_string(self, value):
+        return Literal(value, XSD.string)
+
+    def create_integer(self, value):
+        return Literal(int(value), XSD.integer)
+
+    def create_decimal(self, value):
+        return Literal(Decimal(value), XSD.decimal)
+
+    def create_date(self, value):
+        return Literal(value, XSD.date)
+
+    def create_datetime(self, value):
+        return Literal(value, XSD.dateTime)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Lightweight, in-process representation of the tolog-xml query tree.
+
+A `Node` corresponds to an element of the tolog-xml vocabulary
+(``http://psi.semagia.com/tolog-xml/``), i.e. ``<builtin-predicate
+name="instance-of"><variable name="x"/>...</builtin-predicate>`` is
+represented by ``Node(u'builtin-predicate', {u'name': u'instance-of'},
+[Node(u'variable', {u'name': u'x'}), ...])``.
+
+The tree is created directly by the `handler.XMLParserHandler` (c.f.
+`TreeBuilder`) and can be converted from / into an Etree.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from lxml import etree
+
+__all__ = ('Node', 'TreeBuilder', 'from_etree', 'to_etree', 'saxify')
+
+_NS = u'http://psi.semagia.com/tolog-xml/'
+
+_EMPTY = {}
+
+
+class Node(object):
+    """\
+    An element of the query tree.
+
+    Nodes must not be modified once they are part of a tree since the
+    optimizers share unmodified subtrees between the input and the output.
+    """
+    __slots__ = ('name', 'attrs', 'children', 'text')
+
+    def __init__(self, name, attrs=None, children=None, text=None):
+        """\
+
+        `name`
+            The local name of the element.
+        `attrs`
+            A dict of attribute names to values (optional).
+        `children`
+            A list of child nodes (optional).
+        `text`
+            The character content of the element (only used by data
+            elements like ``<content>``).
+        """
+        self.name = name
+        self.attrs = attrs or _EMPTY
+        self.children = children or []
+        self.text = text
+
+    def get(self, name, default=None):
+        """\
+        Returns the value of the attribute `name` or `default`.
+        """
+        return self.attrs.get(name, default)
+
+    def replace(self, attrs=None, children=None, name=None):
+        """\
+        Returns a new node which uses the provided values instead of the
+        values of this node.
+        """
+        return Node(name or self.name,
+                    self.attrs if attrs is None else attrs,
+                    self.children if children is None else children,
+                    self.text)
+
+    def iter(self):
+        """\
+        Returns an iterator over this node and all descendants in document
+        order.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def key(self):
+        """\
+        Returns a hashable representation of this node and its descendants.
+        """
+        return (self.name, tuple(sorted(self.attrs.items())),
+                tuple(child.key() for child in self.children), self.text)
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self.key() == other.key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return 'Node(%r, %r, %r)' % (self.name, self.attrs, self.children)
+
+
+class TreeBuilder(object):
+    """\
+    Implements the methods of ``tm.xmlutils.SimpleXMLWriter`` which are
+    used by `handler.XMLParserHandler` and creates a tree of `Node`
+    instances.
+    """
+    def __init__(self):
+        self.root = None
+        self._stack = []
+
+    def startDocument(self):
+        self.root = None
+        self._stack = []
+
+    def endDocument(self):
+        pass
+
+    def startPrefixMapping(self, prefix, uri):
+        pass
+
+    def endPrefixMapping(self, prefix):
+        pass
+
+    def startElement(self, name, attrs=None):
+        node = Node(name, dict(attrs) if attrs else None)
+        if self._stack:
+            self._stack[-1].children.append(node)
+        else:
+            self.root = node
+        self._stack.append(node)
+
+    def pop(self, indent=True):
+        self._stack.pop()
+
+    endElement = lambda self, name, indent=True: self.pop()
+
+    def emptyElement(self, name, attrs=None):
+        self._stack[-1].children.append(Node(name, dict(attrs) if attrs else None))
+
+    def dataElement(self, name, data, attrs=None):
+        self._stack[-1].children.append(Node(name, dict(attrs) if attrs else None, text=data))
+
+
+def from_etree(doc):
+    """\
+    Returns the root `Node` of the provided Etree (or Element).
+    """
+    el = doc.getroot() if hasattr(doc, 'getroot') else doc
+    return _from_element(el)
+
+
+def _from_element(el):
+    return Node(etree.QName(el).localname, dict(el.attrib),
+                [_from_element(child) for child in el if isinstance(child.tag, basestring)],
+                el.text if len(el) == 0 and el.text else None)
+
+
+def to_etree(node):
+    """\
+    Returns the provided `node` as Etree.
+    """
+    return etree.ElementTree(_to_element(node, None))
+
+
+def _to_element(node, parent):
+    tag = u'{%s}%s' % (_NS, node.name)
+    if parent is None:
+        el = etree.Element(tag, nsmap={None: _NS})
+    else:
+        el = etree.SubElement(parent, tag)
+    for name, value in node.attrs.iteritems():
+        el.set(name, value)
+    if node.text:
+        el.text = node.text
+    for child in node.children:
+        _to_element(child, el)
+    return el
+
+
+def saxify(node, handler):
+    """\
+    Issues SAX events from the provided tree.
+
+    `node`
+        The root `Node`.
+    `handler`
+        A ``xml.sax.ContentHandler`` which supports namespaces,
+        i.e. `handler.SAXMediator`.
+    """
+    handler.startDocument()
+    handler.startPrefixMapping(None, _NS)
+    _saxify(node, handler)
+    handler.endPrefixMapping(None)
+    handler.endDocument()
+
+
+def _saxify(node, handler):
+    name = _NS, node.name
+    handler.startElementNS(name, node.name,
+                           dict(((None, k), v) for k, v in node.attrs.iteritems()))
+    if node.text:
+        handler.characters(node.text)
+    for child in node.children:
+        _saxify(child, handler)
+    handler.endElementNS(name, node.name)
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Statistics-driven cost model.
+
+A `Statistics` provider reports the number of constructs per type and
+per theme and the selectivity of values. The `CostModel` translates these
+numbers into the (estimated) number of rows a predicate returns, depending
+on which variables are already bound. ``annotate-costs`` and
+``reorder-predicates`` (c.f. `optimizer`) use the cost model, if provided,
+to compute the costs and the join order of the predicates.
+
+The estimates follow the usual model of relational optimizers: A predicate
+with ``n`` rows returns ``n / d`` rows if an argument with ``d`` distinct
+values is bound.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from __future__ import absolute_import
+from abc import abstractmethod, ABCMeta
+from math import ceil
+from decimal import Decimal
+from tm import ANY
+from .cardinality import _Resolver, _OPEN, _UNKNOWN
+
+__all__ = ('Statistics', 'CostModel', 'variables')
+
+# Indicates a variable which is bound by a preceding predicate or a parameter
+_BOUND = object()
+
+_STATEMENT_KINDS = (u'association', u'role', u'occurrence', u'name')
+
+
+class Statistics(object):
+    """\
+    Provides the numbers of a topic map which are used by the `CostModel`.
+
+    All counts should be available without scanning the topic map, i.e. by
+    reading the size of an index. If a number is not available, ``None``
+    should be returned.
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def resolve(self, kind, value):
+        """\
+        Returns the construct which is referenced by `kind` and `value` or
+        ``None`` if no such construct exists.
+
+        `kind`
+            ``consts.SID``, ``consts.SLO``, ``consts.IID`` or ``consts.OID``
+        `value`
+            An IRI or an object identifier.
+        """
+
+    @abstractmethod
+    def topic_count(self, type=ANY):
+        """\
+        Returns the number of topics or the number of instances of `type`.
+        """
+
+    @abstractmethod
+    def association_count(self, type=ANY):
+        """\
+        Returns the number of associations (of the provided `type`).
+        """
+
+    @abstractmethod
+    def role_count(self, type=ANY):
+        """\
+        Returns the number of association roles (of the provided `type`).
+        """
+
+    @abstractmethod
+    def occurrence_count(self, type=ANY):
+        """\
+        Returns the number of occurrences (of the provided `type`).
+        """
+
+    @abstractmethod
+    def name_count(self, type=ANY):
+        """\
+        Returns the number of names (of the provided `type`).
+        """
+
+    @abstractmethod
+    def variant_count(self):
+        """\
+        Returns the number of variants.
+        """
+
+    @abstractmethod
+    def type_count(self, kind):
+        """\
+        Returns the number of distinct types of the constructs of the
+        provided `kind`.
+
+        `kind`
+            ``topic``, ``association``, ``role``, ``occurrence``, or
+            ``name``.
+        """
+
+    @abstractmethod
+    def scoped_count(self, theme):
+        """\
+        Returns the number of associations, occurrences, names and variants
+        which use `theme` in their scope.
+        """
+
+    @abstractmethod
+    def value_count(self, value=ANY):
+        """\
+        Returns the number of occurrences, names and variants (with the
+        provided `value`, regardless of the datatype).
+        """
+
+    @abstractmethod
+    def distinct_value_count(self):
+        """\
+        Returns the number of distinct values of all occurrences, names and
+        variants.
+        """
+
+    def count(self, kind, type=ANY):
+        """\
+        Returns the number of constructs of the provided `kind`
+        (c.f. `type_count`).
+        """
+        return getattr(self, kind + u'_count')(type)
+
+
+class CostModel(object):
+    """\
+    Estimates the number of rows of predicates by the numbers of a
+    `Statistics` provider.
+    """
+    def __init__(self, statistics, base_iri, root):
+        """\
+
+        `statistics`
+            A `Statistics` provider.
+        `base_iri`
+            The base IRI of the query which is used to resolve identifiers.
+        `root`
+            The query as `querytree.Node`.
+        """
+        self.statistics = statistics
+        self._resolve = _Resolver(statistics.resolve, base_iri, root)
+
+    def rows(self, node, bound=frozenset()):
+        """\
+        Returns the estimated number of rows of the predicate `node` or
+        ``None`` if the predicate cannot be estimated.
+
+        `node`
+            A `querytree.Node` which represents a predicate.
+        `bound`
+            A collection of variable names which are bound when the
+            predicate is evaluated.
+        """
+        estimate = node.get(u'estimate')
+        if estimate is not None and not variables(node).intersection(bound):
+            # The topic map layer provided an exact number
+            return float(estimate)
+        estimator = _ESTIMATORS.get(node.name)
+        return estimator(self, node, bound) if estimator is not None else None
+
+    def cost(self, node):
+        """\
+        Returns the cost of the predicate `node` if none of its variables
+        is bound or ``None`` if the predicate cannot be estimated.
+
+        Predicates which cannot match (i.e. refer to an unknown topic) get
+        the cost ``-1``.
+        """
+        rows = self.rows(node)
+        if rows is None:
+            return None
+        if not rows:
+            return -1 if variables(node) else None
+        return int(ceil(rows))
+
+    def _term(self, node, bound, value_expected=False):
+        name = node.name
+        if name == u'variable':
+            return _BOUND if node.get(u'name') in bound else _OPEN
+        if name == u'parameter':
+            return _BOUND
+        res = self._resolve(node, value_expected)
+        return _BOUND if res is _OPEN else res
+
+    def _args(self, node, bound, value_expected=()):
+        return [self._term(child, bound, idx in value_expected)
+                    for idx, child in enumerate(node.children)]
+
+
+def variables(node):
+    """\
+    Returns the names of the variables which occur in `node`.
+    """
+    return set(n.get(u'name') for n in node.iter() if n.name == u'variable')
+
+
+def _scale(rows, columns):
+    """\
+    Returns the number of `rows` reduced by the bound columns.
+
+    `columns`
+        An iterable of ``(term, number of distinct values)`` tuples.
+    """
+    if rows is None:
+        return None
+    rows = float(rows)
+    for term, distinct in columns:
+        if term is not _OPEN and distinct:
+            rows /= distinct
+    return rows
+
+
+def _is_value(term):
+    return isinstance(term, (basestring, int, long, Decimal))
+
+
+def _is_topic(term):
+    return term not in (_OPEN, _BOUND, _UNKNOWN) and not _is_value(term)
+
+
+def _builtin_predicate(model, node, bound):
+    name = node.get(u'name')
+    args = model._args(node, bound, (1,) if name == u'value' else ())
+    if _UNKNOWN in args:
+        return 0
+    if _OPEN not in args:
+        return 0
+    stats = model.statistics
+    if name == u'topic' and len(args) == 1:
+        rows = stats.topic_count()
+        return _scale(rows, [(args[0], rows)])
+    if name == u'association' and len(args) == 1:
+        rows = stats.association_count()
+        return _scale(rows, [(args[0], rows)])
+    if len(args) < 2:
+        return None
+    first, second = args[:2]
+    # fold-type appends the type as third argument
+    typ = args[2] if len(args) > 2 and _is_topic(args[2]) else ANY
+    if name in (u'instance-of', u'direct-instance-of'):
+        if _is_topic(second):
+            rows = stats.topic_count(second)
+            return _scale(rows, [(first, rows)])
+        rows = stats.topic_count()
+        return _scale(rows, [(first, rows), (second, stats.type_count(u'topic'))])
+    if name == u'type':
+        kinds = [kind for kind in (node.get(u'hint') or u'').split() if kind in _STATEMENT_KINDS] \
+                    or _STATEMENT_KINDS
+        counts = [stats.count(kind, second if _is_topic(second) else ANY) for kind in kinds]
+        if None in counts:
+            return None
+        rows = sum(counts)
+        if _is_topic(second):
+            return _scale(rows, [(first, rows)])
+        types = [stats.type_count(kind) for kind in kinds]
+        return _scale(rows, [(first, rows), (second, None if None in types else sum(types))])
+    if name == u'scope':
+        if _is_topic(second):
+            rows = stats.scoped_count(second)
+            return _scale(rows, [(first, rows)])
+        return None
+    if name == u'role-player':
+        rows = stats.role_count(typ)
+        return _scale(rows, [(first, rows), (second, stats.topic_count())])
+    if name == u'association-role':
+        rows = stats.role_count()
+        return _scale(rows, [(first, stats.association_count()), (second, rows)])
+    if name == u'topic-name':
+        rows = stats.name_count(typ)
+        return _scale(rows, [(first, stats.topic_count()), (second, rows)])
+    if name == u'occurrence':
+        rows = stats.occurrence_count(typ)
+        return _scale(rows, [(first, stats.topic_count()), (second, rows)])
+    if name == u'variant':
+        rows = stats.variant_count()
+        return _scale(rows, [(first, stats.name_count()), (second, rows)])
+    if name == u'value':
+        if _is_value(second):
+            rows = stats.value_count(unicode(second))
+            return _scale(rows, [(first, rows)])
+        rows = stats.value_count()
+        return _scale(rows, [(first, rows), (second, stats.distinct_value_count())])
+    return None
+
+
+def _type(model, node, bound):
+    """\
+    Returns the type of a dynamic predicate.
+    """
+    for name in node.children:
+        if name.name == u'name' and name.children:
+            return model._term(name.children[0], bound)
+    return _OPEN
+
+
+def _dynamic_predicate(model, node, bound):
+    typ = _type(model, node, bound)
+    args = [model._term(child, bound, idx == 1)
+                for idx, child in enumerate(node.children[-2:])]
+    if _UNKNOWN in args or typ is _UNKNOWN:
+        return 0
+    if _OPEN not in args:
+        return 0
+    if not _is_topic(typ):
+        return None
+    stats = model.statistics
+    topic, value = args
+    occs, topics = stats.occurrence_count(typ), stats.topic_count()
+    if occs is None:
+        return None
+    if _is_value(value):
+        count = stats.value_count(unicode(value))
+        if count is None:
+            return None
+        rows = min(occs, count)
+    else:
+        rows = _scale(occs, [(value, occs)])
+    return _scale(rows, [(topic, min(occs, topics) if topics is not None else None)])
+
+
+def _association_predicate(model, node, bound):
+    typ = _type(model, node, bound)
+    if typ is _UNKNOWN:
+        return 0
+    if not _is_topic(typ):
+        return None
+    players = []
+    for pair in node.children:
+        if pair.name != u'pair':
+            continue
+        for child in pair.children:
+            if not child.children:
+                continue
+            term = model._term(child.children[0], bound)
+            if term is _UNKNOWN:
+                return 0
+            if child.name == u'player':
+                players.append(term)
+    if _OPEN not in players:
+        return 0
+    stats = model.statistics
+    rows = stats.association_count(typ)
+    topics = stats.topic_count()
+    if rows is None or topics is None:
+        return None
+    return _scale(rows, [(player, min(rows, topics)) for player in players])
+
+
+def _infix_predicate(model, node, bound):
+    args = model._args(node, bound)
+    if _OPEN not in args:
+        return 0
+    if node.get(u'name') == u'eq' and args.count(_OPEN) == 1:
+        return 1
+    return None
+
+
+_ESTIMATORS = {
+    u'builtin-predicate': _builtin_predicate,
+    u'dynamic-predicate': _dynamic_predicate,
+    u'association-predicate': _association_predicate,
+    u'infix-predicate': _infix_predicate,
+}
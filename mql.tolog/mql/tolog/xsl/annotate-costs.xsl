@@ -285,6 +285,25 @@
     </xsl:call-template>
   </xsl:template>
 
+  <xsl:template match="tl:*[@estimate]" priority="1">
+    <!--** Matches predicates with a cardinality estimate provided by the 
+           topic map layer (c.f. mql.tolog.cardinality).
+
+           The estimate replaces the static costs. Estimates which exceed the
+           static costs of a predicate which returns the whole topic map 
+           are capped, predicates which cannot match get the lowest costs.
+     -->
+    <xsl:call-template name="annotate">
+      <xsl:with-param name="cost">
+        <xsl:choose>
+          <xsl:when test="@estimate = 0"><xsl:value-of select="$FAIL_RESULT"/></xsl:when>
+          <xsl:when test="@estimate &gt;= $WHOLE_TM_RESULT"><xsl:value-of select="$WHOLE_TM_RESULT - 1"/></xsl:when>
+          <xsl:otherwise><xsl:value-of select="@estimate"/></xsl:otherwise>
+        </xsl:choose>
+      </xsl:with-param>
+    </xsl:call-template>
+  </xsl:template>
+
   <xsl:template match="tl:predicate[tl:name/tl:qname[@kind='module']]">
     <xsl:variable name="iri" select="key('namespaces', tl:name/tl:qname/@prefix)/@iri"/>
     <xsl:choose>
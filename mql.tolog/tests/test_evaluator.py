@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the mql.tolog.evaluator module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from itertools import count
+from nose.tools import eq_, ok_, raises
+from tm import ANY, XSD
+from tm.mql import InvalidQueryError
+from mql.tolog import parse_query, layer
+from mql.tolog.evaluator import evaluate
+
+_BASE = u'http://www.semagia.com/tolog-test/'
+
+_IDS = count()
+
+
+class Construct(object):
+    def __init__(self, kind, parent=None, type=None, value=None, datatype=None, scope=()):
+        self.id = u'%s%d' % (kind[0], next(_IDS))
+        self.kind = kind
+        self.parent = parent
+        self.type = type
+        self.value = value
+        self.datatype = datatype
+        self.scope = tuple(scope)
+        self.iids = []
+        self.children = []
+        self.reifier = None
+        if parent is not None:
+            parent.children.append(self)
+
+    def __repr__(self):
+        return '<%s %r>' % (self.kind, self.value or self.id)
+
+
+class Topic(Construct):
+    def __init__(self, tm, ident):
+        super(Topic, self).__init__('topic', tm)
+        self.iids.append(_BASE + u'#' + ident)
+        self.sids = []
+        self.slos = []
+        self.types = []
+        self.roles = []
+        self.ident = ident
+
+    def __repr__(self):
+        return '<topic %s>' % self.ident
+
+
+class MemoryLayer(layer.TopicMapLayer):
+    """\
+    Minimal in-memory topic map which counts the calls of some methods.
+    """
+    def __init__(self):
+        self.tm = Construct('topicmap')
+        self.topics = {}
+        self.supertypes = {}
+        self.calls = dict(get_topics=0, get_names_by_value=0, get_roles_played=0)
+
+    def topic(self, ident, *types):
+        topic = self.topics.get(ident)
+        if topic is None:
+            topic = self.topics[ident] = Topic(self.tm, ident)
+        for t in types:
+            topic.types.append(self.topic(t))
+        return topic
+
+    def name(self, topic, value, type=None, scope=()):
+        return Construct('name', self.topic(topic), type=self.topic(type or 'name'), value=value,
+                         datatype=XSD.string, scope=[self.topic(theme) for theme in scope])
+
+    def occurrence(self, topic, type, value, datatype=XSD.string):
+        return Construct('occurrence', self.topic(topic), type=self.topic(type), value=value,
+                         datatype=datatype)
+
+    def association(self, type, *roles):
+        assoc = Construct('association', self.tm, type=self.topic(type))
+        for role_type, player in roles:
+            role = Construct('role', assoc, type=self.topic(role_type))
+            role.player = self.topic(player)
+            role.player.roles.append(role)
+        return assoc
+
+    def _all(self, kind):
+        def walk(parent):
+            for child in parent.children:
+                if child.kind == kind:
+                    yield child
+                for c in walk(child):
+                    yield c
+        return list(walk(self.tm))
+
+    def get_topic_by_subject_identifier(self, sid):
+        return next((t for t in self.topics.values() if sid in t.sids), None)
+
+    def get_topic_by_subject_locator(self, slo):
+        return next((t for t in self.topics.values() if slo in t.slos), None)
+
+    def get_construct_by_item_identifier(self, iid):
+        return next((c for c in [self.tm] + self._all_constructs() if iid in c.iids), None)
+
+    def _all_constructs(self):
+        return self.topics.values() + [c for kind in ('association', 'role', 'occurrence', 'name', 'variant')
+                                        for c in self._all(kind)]
+
+    def get_construct_by_id(self, tmc_id):
+        return next((c for c in [self.tm] + self._all_constructs() if c.id == tmc_id), None)
+
+    def get_construct_id(self, tmc):
+        return tmc.id
+
+    def get_parent(self, tmc):
+        return tmc.parent
+
+    def get_topicmap(self):
+        return self.tm
+
+    def get_topics(self, types=ANY):
+        self.calls['get_topics'] += 1
+        topics = sorted(self.topics.values(), key=lambda t: t.ident)
+        if types is ANY:
+            return topics
+        return [t for t in topics if set(t.types) & set(types)]
+
+    def get_associations(self, types=ANY, scope=ANY):
+        return [a for a in self._all('association') if types is ANY or a.type in types]
+
+    def _children(self, parent, kind, types):
+        return [c for c in parent.children if c.kind == kind and (types is ANY or c.type in types)]
+
+    def get_occurrences(self, topic, types=ANY, scope=ANY):
+        return self._children(topic, 'occurrence', types)
+
+    def get_names(self, topic, types=ANY, scope=ANY):
+        return self._children(topic, 'name', types)
+
+    def get_variants(self, name, scope=ANY):
+        return self._children(name, 'variant', ANY)
+
+    def get_roles_played(self, topic, types=ANY):
+        self.calls['get_roles_played'] += 1
+        return [r for r in topic.roles if types is ANY or r.type in types]
+
+    def get_player(self, role):
+        return role.player
+
+    def get_type(self, tmc):
+        return tmc.type
+
+    def get_scope(self, tmc):
+        return tmc.scope
+
+    def get_value(self, tmc):
+        return tmc.value
+
+    def get_datatype(self, tmc):
+        return tmc.datatype
+
+    def get_types(self, topic):
+        return topic.types
+
+    def get_supertypes(self, topic):
+        res = []
+        todo = list(self.supertypes.get(topic, ()))
+        while todo:
+            t = todo.pop()
+            if t not in res:
+                res.append(t)
+                todo.extend(self.supertypes.get(t, ()))
+        return res
+
+    def get_subtypes(self, topic):
+        return [t for t in self.topics.values() if topic in self.get_supertypes(t)]
+
+    def get_typed(self, type):
+        return [c for kind in ('association', 'role', 'occurrence', 'name')
+                    for c in self._all(kind) if c.type is type]
+
+    def get_scoped(self, theme):
+        return [c for kind in ('association', 'occurrence', 'name', 'variant')
+                    for c in self._all(kind) if theme in c.scope]
+
+    def get_subject_identifiers(self, topic):
+        return topic.sids
+
+    def get_subject_locators(self, topic):
+        return topic.slos
+
+    def get_item_identifiers(self, tmc):
+        return tmc.iids
+
+    def get_roles(self, assoc, types=ANY):
+        return self._children(assoc, 'role', types)
+
+    def get_reifier(self, reified):
+        return reified.reifier
+
+    def get_reified(self, reifier):
+        return next((c for c in self._all_constructs() if c.reifier is reifier), None)
+
+    def get_names_by_value(self, value):
+        self.calls['get_names_by_value'] += 1
+        return [n for n in self._all('name') if n.value == value]
+
+    def get_occurrences_by_value(self, value, datatype=ANY):
+        return [o for o in self._all('occurrence') if o.value == value
+                    and (datatype is ANY or o.datatype == datatype)]
+
+    def get_variants_by_value(self, value, datatype=ANY):
+        return [v for v in self._all('variant') if v.value == value
+                    and (datatype is ANY or v.datatype == datatype)]
+
+    def get_topic_direct_types(self):
+        return list(set(t for topic in self.topics.values() for t in topic.types))
+
+    def get_topic_types(self):
+        types = self.get_topic_direct_types()
+        return list(set(types + [s for t in types for s in self.get_supertypes(t)]))
+
+    def get_association_types(self):
+        return list(set(a.type for a in self._all('association')))
+
+    def get_role_types(self):
+        return list(set(r.type for r in self._all('role')))
+
+    def get_occurrence_types(self):
+        return list(set(o.type for o in self._all('occurrence')))
+
+    def get_name_types(self):
+        return list(set(n.type for n in self._all('name')))
+
+    def is_instance_of(self, instance, type, scope=ANY):
+        return type in instance.types
+
+    def is_topicmap(self, obj):
+        return getattr(obj, 'kind', None) == 'topicmap'
+
+    def is_topic(self, obj):
+        return getattr(obj, 'kind', None) == 'topic'
+
+    def is_association(self, obj):
+        return getattr(obj, 'kind', None) == 'association'
+
+    def is_role(self, obj):
+        return getattr(obj, 'kind', None) == 'role'
+
+    def is_occurrence(self, obj):
+        return getattr(obj, 'kind', None) == 'occurrence'
+
+    def is_name(self, obj):
+        return getattr(obj, 'kind', None) == 'name'
+
+    def is_variant(self, obj):
+        return getattr(obj, 'kind', None) == 'variant'
+
+
+def make_layer():
+    l = MemoryLayer()
+    l.topic('puccini', 'composer')
+    l.topic('verdi', 'composer')
+    l.topic('wagner', 'composer')
+    l.topic('tosca', 'opera')
+    l.topic('boheme', 'opera')
+    l.topic('aida', 'opera')
+    l.topic('lucca', 'city')
+    l.supertypes[l.topic('composer')] = [l.topic('person')]
+    l.topic('puccini').sids.append(u'http://psi.ontopia.net/opera/puccini')
+    l.name('puccini', u'Giacomo Puccini')
+    l.name('puccini', u'Puccini', scope=['short'])
+    l.name('verdi', u'Giuseppe Verdi')
+    l.name('wagner', u'Richard Wagner')
+    l.name('tosca', u'Tosca')
+    l.name('boheme', u'La Bohème')
+    l.name('aida', u'Aida')
+    l.occurrence('tosca', 'premiere-date', u'1900-01-14', XSD.date)
+    l.occurrence('boheme', 'premiere-date', u'1896-02-01', XSD.date)
+    l.occurrence('aida', 'premiere-date', u'1871-12-24', XSD.date)
+    l.occurrence('puccini', 'homepage', u'http://www.puccini.it/', XSD.anyURI)
+    l.association('composed-by', ('composer', 'puccini'), ('work', 'tosca'))
+    l.association('composed-by', ('composer', 'puccini'), ('work', 'boheme'))
+    l.association('composed-by', ('composer', 'verdi'), ('work', 'aida'))
+    l.association('born-in', ('person', 'puccini'), ('place', 'lucca'))
+    return l
+
+
+def query(l, q, **params):
+    return evaluate(parse_query(q, iri=_BASE), l, params)
+
+
+def rows(l, q, **params):
+    return [tuple(getattr(v, 'ident', v) for v in row) for row in query(l, q, **params)]
+
+
+def test_instance_of():
+    l = make_layer()
+    eq_([('puccini',), ('verdi',), ('wagner',)], sorted(rows(l, u'instance-of($x, composer)?')))
+    eq_([('puccini',), ('verdi',), ('wagner',)], sorted(rows(l, u'instance-of($x, person)?')))
+    eq_([('composer',), ('person',)], sorted(rows(l, u'instance-of(puccini, $t)?')))
+    eq_([('composer',)], rows(l, u'direct-instance-of(puccini, $t)?'))
+
+
+def test_association_predicate():
+    l = make_layer()
+    eq_([('boheme',), ('tosca',)], sorted(rows(l, u'composed-by(puccini : composer, $o : work)?')))
+    eq_([('puccini', 'boheme'), ('puccini', 'tosca'), ('verdi', 'aida')],
+        sorted(rows(l, u'select $c, $o from composed-by($c : composer, $o : work)?')))
+    eq_([], rows(l, u'composed-by(wagner : composer, $o : work)?'))
+    eq_([], rows(l, u'composed-by($c : place, $o : work)?'))
+
+
+def test_join():
+    l = make_layer()
+    q = u'''select $c, $v from instance-of($c, composer),
+            composed-by($c : composer, $o : work), topic-name($c, $n), value($n, $v)?'''
+    eq_([('puccini', u'Giacomo Puccini'), ('puccini', u'Puccini'), ('verdi', u'Giuseppe Verdi')],
+        sorted(rows(l, q)))
+
+
+def test_value_lookup():
+    l = make_layer()
+    eq_([('aida',)], rows(l, u'select $t from value($n, "Aida"), topic-name($t, $n)?'))
+    ok_(l.calls['get_names_by_value'] > 0)
+
+
+def test_dynamic_occurrence():
+    l = make_layer()
+    eq_([('aida', u'1871-12-24'), ('boheme', u'1896-02-01')],
+        sorted(rows(l, u'premiere-date($o, $d), $d < "1900"?')))
+    eq_([('tosca',)], rows(l, u'select $o from premiere-date($o, "1900-01-14")?'))
+
+
+def test_comparison_deferred():
+    l = make_layer()
+    # The optimizer moves the comparison in front of the predicate which binds $y
+    eq_([('tosca',), ('boheme',)],
+        rows(l, u'select $x from $y = puccini, composed-by($y : composer, $x : work) order by $x desc?'))
+
+
+def test_not():
+    l = make_layer()
+    eq_([('verdi',), ('wagner',)],
+        sorted(rows(l, u'select $c from instance-of($c, composer), not(born-in($c : person, lucca : place))?')))
+
+
+def test_or():
+    l = make_layer()
+    q = u'''select $t from { composed-by($t : composer, aida : work)
+                           | born-in($t : person, lucca : place) }?'''
+    eq_([('puccini',), ('verdi',)], sorted(rows(l, q)))
+    q = u'''select $t from { composed-by($t : composer, aida : work)
+                           || born-in($t : person, lucca : place) }?'''
+    eq_([('verdi',)], rows(l, q))
+
+
+def test_rule():
+    l = make_layer()
+    q = u'''composer-of($c, $o) :- composed-by($c : composer, $o : work).
+            select $o from composer-of(puccini, $o)?'''
+    eq_([('boheme',), ('tosca',)], sorted(rows(l, q)))
+
+
+def test_recursive_rule():
+    l = make_layer()
+    l.association('parent-child', ('parent', 'a'), ('child', 'b'))
+    l.association('parent-child', ('parent', 'b'), ('child', 'c'))
+    l.association('parent-child', ('parent', 'c'), ('child', 'd'))
+    q = u'''descendant-of($a, $d) :- {
+                parent-child($a : parent, $d : child)
+              | parent-child($a : parent, $x : child), descendant-of($x, $d)
+            }.
+            select $d from descendant-of(a, $d)?'''
+    eq_([('b',), ('c',), ('d',)], sorted(rows(l, q)))
+
+
+def test_count():
+    l = make_layer()
+    q = u'select $c, count($o) from composed-by($c : composer, $o : work) order by $c?'
+    eq_([('puccini', 2), ('verdi', 1)], rows(l, q))
+
+
+def test_order_limit_offset():
+    l = make_layer()
+    q = u'select $n from instance-of($o, opera), topic-name($o, $t), value($t, $n) order by $n limit 2 offset 1?'
+    eq_([(u'La Boh\xe8me',), (u'Tosca',)], rows(l, q))
+
+
+def test_identifiers():
+    l = make_layer()
+    eq_([(u'Giacomo Puccini',), (u'Puccini',)],
+        sorted(rows(l, u'select $n from topic-name(i"http://psi.ontopia.net/opera/puccini", $t), value($t, $n)?')))
+    eq_([('puccini',)], rows(l, u'subject-identifier($t, "http://psi.ontopia.net/opera/puccini")?'))
+    oid = l.topic('verdi').id
+    eq_([('verdi',)], rows(l, u'select $t from object-id($t, "%s")?' % oid))
+    eq_([], rows(l, u'instance-of($x, unknown-topic)?'))
+
+
+def test_type_scope():
+    l = make_layer()
+    eq_([(u'Puccini',)], rows(l, u'select $v from scope($n, short), value($n, $v)?'))
+    eq_([('puccini',)], rows(l, u'select $t from occurrence($t, $o), type($o, homepage)?'))
+    eq_([(u'http://www.puccini.it/',)], rows(l, u'select $r from occurrence(puccini, $o), resource($o, $r)?'))
+
+
+def test_function():
+    l = make_layer()
+    q = u'''import "http://psi.ontopia.net/tolog/string/" as str
+            select $n from topic-name($t, $n), value($n, $v), str:starts-with($v, "G")?'''
+    eq_(2, len(rows(l, q)))
+
+
+def test_parameter():
+    l = make_layer()
+    eq_([('boheme',), ('tosca',)],
+        sorted(rows(l, u'composed-by(%c% : composer, $o : work)?', c=l.topic('puccini'))))
+
+
+@raises(InvalidQueryError)
+def test_missing_parameter():
+    rows(make_layer(), u'composed-by(%c% : composer, $o : work)?')
+
+
+def test_lazy():
+    l = make_layer()
+    res = query(l, u'instance-of($x, $y)?')
+    calls = l.calls['get_topics']
+    eq_(0, calls)
+    row = res.first()
+    ok_(row is not None)
+    eq_([u'x', u'y'], row.keys())
+    ok_(row['x'] is row[0])
+
+
+def test_hash_join():
+    l = make_layer()
+    # The datatype cannot be used to lookup constructs, the relation is read once
+    q = u'''select $o from instance-of($t, opera), occurrence($t, $o),
+            datatype($o, "http://www.w3.org/2001/XMLSchema#date")?'''
+    eq_(3, len(rows(l, q)))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the mql.tolog.mappalayer and mql.tolog.cardinality modules.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from nose.tools import eq_, ok_
+import mappa
+from mappa import XSD, TMDM, Literal
+from tm import ANY
+from mql.tolog import parse_query, parse_to_etree, cardinality
+from mql.tolog.evaluator import evaluate
+from mql.tolog.mappalayer import MappaTopicMapLayer
+
+_BASE = u'http://www.semagia.com/tolog-test/'
+
+
+def make_layer():
+    tm = mappa.connect().create(_BASE)
+    def topic(ident):
+        return tm.create_topic_by_iid(_BASE + u'#' + ident)
+    person, composer, opera = topic(u'person'), topic(u'composer'), topic(u'opera')
+    for i in range(10):
+        topic(u'person%d' % i).add_type(person)
+    puccini, verdi = topic(u'puccini'), topic(u'verdi')
+    puccini.add_type(composer)
+    verdi.add_type(composer)
+    tosca, aida = topic(u'tosca'), topic(u'aida')
+    tosca.add_type(opera)
+    aida.add_type(opera)
+    composed_by, work, creator = topic(u'composed-by'), topic(u'work'), topic(u'composer-role')
+    italian = topic(u'italian')
+    for w, c in ((tosca, puccini), (aida, verdi)):
+        assoc = tm.create_association(composed_by, scope=[italian] if w is tosca else ())
+        assoc.create_role(work, w)
+        assoc.create_role(creator, c)
+    premiere = topic(u'premiere')
+    tosca.create_occurrence(premiere, Literal(u'1900-01-14', XSD.date))
+    aida.create_occurrence(premiere, u'1871-12-24')
+    name_type = tm.create_topic_by_sid(TMDM.topic_name)
+    puccini.create_name(name_type, u'Giacomo Puccini')
+    verdi.create_name(name_type, u'Giuseppe Verdi')
+    return MappaTopicMapLayer(tm)
+
+
+def topic(layer, ident):
+    return layer.get_construct_by_item_identifier(_BASE + u'#' + ident)
+
+
+def idents(layer, topics):
+    return sorted(iid[len(_BASE) + 1:] for t in topics for iid in layer.get_item_identifiers(t))
+
+
+def test_get_topics():
+    layer = make_layer()
+    composer, opera = topic(layer, u'composer'), topic(layer, u'opera')
+    eq_([u'puccini', u'verdi'], idents(layer, layer.get_topics([composer])))
+    eq_([u'aida', u'puccini', u'tosca', u'verdi'], idents(layer, layer.get_topics([composer, opera])))
+    eq_(len(layer.get_topicmap().topics), len(list(layer.get_topics())))
+    eq_(2, layer.estimate('get_topics', [composer]))
+    eq_(10, layer.estimate('get_topics', [topic(layer, u'person')]))
+
+
+def test_get_associations():
+    layer = make_layer()
+    composed_by, italian = topic(layer, u'composed-by'), topic(layer, u'italian')
+    eq_(2, len(list(layer.get_associations([composed_by]))))
+    eq_(1, len(list(layer.get_associations([composed_by], [italian]))))
+    eq_(1, len(list(layer.get_associations(ANY, [italian]))))
+    eq_(2, layer.estimate('get_associations', [composed_by]))
+    eq_(1, layer.estimate('get_associations', [composed_by], [italian]))
+
+
+def test_get_occurrences_by_value():
+    layer = make_layer()
+    eq_(1, len(list(layer.get_occurrences_by_value(u'1900-01-14'))))
+    eq_(1, len(list(layer.get_occurrences_by_value(u'1900-01-14', XSD.date))))
+    eq_(0, len(list(layer.get_occurrences_by_value(u'1900-01-14', XSD.string))))
+    eq_(1, layer.estimate('get_occurrences_by_value', u'1900-01-14', ANY))
+    eq_(1, len(list(layer.get_names_by_value(u'Giacomo Puccini'))))
+    eq_(1, layer.estimate('get_names_by_value', u'Giacomo Puccini'))
+
+
+def test_get_topic_types():
+    layer = make_layer()
+    eq_([u'composer', u'opera', u'person'], idents(layer, layer.get_topic_types()))
+
+
+def test_estimate_unknown_method():
+    layer = make_layer()
+    ok_(layer.estimate('get_reifier', layer.get_topicmap()) is None)
+
+
+def test_evaluate():
+    layer = make_layer()
+    query = parse_query(u'select $n from instance-of($c, composer), composed-by($c : composer-role, tosca : work), '
+                        u'topic-name($c, $name), value($name, $n)?', iri=_BASE, layer=layer)
+    eq_([u'Giacomo Puccini'], [row[0] for row in evaluate(query, layer)])
+
+
+def estimates(q, layer):
+    doc = cardinality.annotate(parse_to_etree(q, iri=_BASE), layer, _BASE)
+    return [el.get('estimate') for el in doc.getroot().iter('{http://psi.semagia.com/tolog-xml/}*')
+                if el.tag.endswith('-predicate')]
+
+
+def test_annotate():
+    layer = make_layer()
+    eq_(['10', '2', None, '0'],
+        estimates(u'instance-of($p, person), instance-of($c, composer), instance-of($c, $t), '
+                  u'instance-of($x, unknown)?', layer))
+    eq_(['1', '2', '1'],
+        estimates(u'composed-by($c : composer-role, tosca : work), composed-by($c : composer-role, $w : work), '
+                  u'value($n, "Giuseppe Verdi")?', layer))
+    eq_([None, '1'], estimates(u'composed-by(puccini : composer-role, tosca : work), '
+                               u'premiere($o, "1871-12-24")?', layer))
+
+
+def test_reorder_by_estimates():
+    layer = make_layer()
+    q = u'instance-of($x, person), instance-of($y, composer), instance-of($z, opera)?'
+    query = parse_query(q, iri=_BASE, layer=layer)
+    eq_([u'y', u'z', u'x'], [pred.args[0].name for pred in query.where])
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the mql.tolog.optimizer and mql.tolog.querytree modules.
+
+The in-process optimizers must produce the same results as the XSLT
+stylesheets.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import os
+import io
+import json
+import glob
+from nose.tools import ok_, eq_, raises
+from lxml import etree
+from tm import xmlutils
+from mql.tolog import parse_query, parse_to_etree, parse_to_tree, handler, xsl, \
+        optimizer, querytree
+from test_parser import _ACCEPT_DATA
+
+_BASE = u'http://www.semagia.com/tolog-test/'
+
+_IGNORE = (
+    'fold-type-assoc.tl',
+    'tolog-tut-2-4_2.tl',
+)
+
+_QUERIES = (
+    u'select $x from instance-of($x, a), not(b($x)), { c($x) | d($x) }, $x /= b, topic($x), '
+    u'association($a), association-role($a, $r), role-player($r, $x), type($r, rt)?',
+    u'base-locator("http://www.semagia.com/")?',
+    u'a /= b?',
+    u'import "http://psi.ontopia.net/tolog/experimental/" as e '
+    u'e:gt($x, 1), e:lteq($x, 2), e:in($x, 1, 2), e:name($x, "a"), e:name(a, $n)?',
+    u'import "http://psi.ontopia.net/tolog/number/" as n n:value($x, $y)?',
+    u'r($x, $y) :- instance-of($x, $y). s($a) :- r($a, b). select $x from r($x, c), s($x), r($q, $z)?',
+    u'r($x, $y) :- instance-of($x, $y). r($x, $y) :- type($x, $y). r($x, a)?',
+    u'occurrence(a, $o), type($o, t), value($o, $v), topic-name(b, $n), type($n, nt), type($n, nt2)?',
+    u'source-locator($x, "http://www.semagia.com/")?',
+    u'member-of($m : member, $g : group), member-of(a : member, $g : group), member-of(a : member, b : group)?',
+)
+
+
+def c14n(doc):
+    return etree.tostring(doc, method='c14n')
+
+
+def optimize(tree, optimizers):
+    return querytree.to_etree(optimizer.apply_optimizers(querytree.from_etree(tree), optimizers))
+
+
+def test_baseline():
+    base_dir = os.path.abspath('./xsltests/')
+    with open(os.path.join(base_dir, 'query2optimizers.json'), 'rb') as f:
+        query2optimizers = json.load(f)
+    tolog_dir = os.path.join(base_dir, './in/')
+    baseline_dir = os.path.join(base_dir, './baseline/')
+    for fn in query2optimizers:
+        optimizers = ['query-c14n']
+        optimizers.extend(query2optimizers[fn])
+        if fn in _IGNORE or not optimizer.is_available(optimizers):
+            continue
+        res = optimize(parse_to_etree(open(os.path.join(tolog_dir, fn), 'rb')), optimizers)
+        out = io.BytesIO()
+        res.write_c14n(out)
+        expected = io.open(os.path.join(baseline_dir, fn + '.c14n'), encoding='utf-8').read()
+        yield eq_, expected, out.getvalue()
+
+
+def test_xslt_equivalence():
+    def check(tree, optimizers):
+        eq_(c14n(xsl.apply_transformations(tree, optimizers)), c14n(optimize(tree, optimizers)))
+    trees = [parse_to_etree(open(fn, 'rb')) for fn in glob.glob(os.path.abspath('./xsltests/in/') + '/*.tl')]
+    trees.extend(parse_to_etree(q, iri=_BASE) for q in _QUERIES)
+    for q in _ACCEPT_DATA:
+        tolog_plus = True
+        if isinstance(q, tuple):
+            q, tolog_plus = q
+        try:
+            trees.append(parse_to_etree(q, tolog_plus, iri=_BASE))
+        except AttributeError:
+            # tolog-xml does not support all statements (i.e. LOAD)
+            pass
+    for tree in trees:
+        for i in range(1, len(xsl.DEFAULT_TRANSFORMERS) + 1):
+            yield check, tree, xsl.DEFAULT_TRANSFORMERS[:i]
+
+
+def test_default_optimizers_available():
+    ok_(optimizer.is_available(xsl.DEFAULT_TRANSFORMERS))
+    ok_(not optimizer.is_available([u'back-to-tolog']))
+
+
+@raises(ValueError)
+def test_unknown_optimizer():
+    optimizer.get_optimizer(u'back-to-tolog')
+
+
+def test_input_unchanged():
+    for q in _QUERIES:
+        tree = parse_to_tree(q, iri=_BASE)
+        key = tree.key()
+        optimizer.apply_optimizers(tree, xsl.DEFAULT_TRANSFORMERS)
+        eq_(key, tree.key())
+
+
+def test_parse_to_tree():
+    for q in _QUERIES:
+        eq_(c14n(parse_to_etree(q, iri=_BASE)), c14n(querytree.to_etree(parse_to_tree(q, iri=_BASE))))
+        eq_(parse_to_tree(q, iri=_BASE), querytree.from_etree(parse_to_etree(q, iri=_BASE)))
+
+
+class QueryHandler(handler.XMLParserHandler):
+    """\
+    Query handler which creates an etree.
+    """
+    def __init__(self):
+        self.ch = xmlutils.ETreeContentHandler()
+        super(QueryHandler, self).__init__(xmlutils.SAXSimpleXMLWriter(self.ch))
+
+    query = property(lambda self: self.ch.etree)
+
+
+def test_parse_query():
+    def query(q, xslt):
+        return c14n(parse_query(q, QueryHandler(), iri=_BASE, cache=False, xslt=xslt))
+    for q in _QUERIES:
+        eq_(query(q, True), query(q, False))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
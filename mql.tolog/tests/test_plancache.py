@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the mql.tolog.plancache module
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from nose.tools import ok_, eq_, raises
+from lxml import etree
+from tm import xmlutils
+from mql.tolog import parse_query, handler
+from mql.tolog.plancache import PlanCache, get_default_cache
+
+
+class QueryHandler(handler.XMLParserHandler):
+    """\
+    Query handler which creates an etree.
+    """
+    def __init__(self):
+        self.ch = xmlutils.ETreeContentHandler()
+        super(QueryHandler, self).__init__(xmlutils.SAXSimpleXMLWriter(self.ch))
+
+    query = property(lambda self: self.ch.etree)
+
+
+def query(q, cache, **kw):
+    kw.setdefault('iri', u'http://www.semagia.com/tolog-test/')
+    res = parse_query(q, QueryHandler(), cache=cache, **kw)
+    return etree.tostring(res, method='c14n')
+
+
+def test_lru():
+    cache = PlanCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    eq_(1, cache.get('a'))
+    cache.put('c', 3)
+    eq_(2, len(cache))
+    ok_(cache.get('b') is None)
+    eq_(1, cache.get('a'))
+    eq_(3, cache.get('c'))
+    eq_(dict(hits=3, misses=1, size=2, maxsize=2), cache.stats())
+    cache.clear()
+    eq_(dict(hits=0, misses=0, size=0, maxsize=2), cache.stats())
+
+
+@raises(ValueError)
+def test_illegal_size():
+    PlanCache(0)
+
+
+def test_parse_query():
+    cache = PlanCache()
+    q = u'instance-of($x, $y), instance-of($y, $z)?'
+    expected = query(q, False)
+    eq_(expected, query(q, cache))
+    # Neither the query string nor the canonicalized query are known
+    eq_(2, cache.misses)
+    eq_(0, cache.hits)
+    eq_(expected, query(q, cache))
+    eq_(2, cache.misses)
+    eq_(1, cache.hits)
+    # Unknown query string, but the canonicalized query is the same
+    eq_(expected, query(u'select $x, $y, $z from instance-of($x, $y), instance-of($y, $z)?', cache))
+    eq_(3, cache.misses)
+    eq_(2, cache.hits)
+
+
+def test_parse_query_optimizers():
+    cache = PlanCache()
+    q = u'instance-of($x, $y)?'
+    query(q, cache)
+    query(q, cache, optimizers=())
+    eq_(4, cache.misses)
+    eq_(4, len(cache))
+
+
+def test_parse_query_keywords():
+    cache = PlanCache()
+    q = u'instance-of($x, $y)?'
+    expected = query(q, cache)
+    eq_(2, cache.misses)
+    # The keyword arguments are part of the key of the query string
+    eq_(expected, query(q, cache, iri=u'http://www.semagia.com/other/'))
+    eq_(3, cache.misses)
+    eq_(1, cache.hits)
+    eq_(expected, query(q, cache, iri=u'http://www.semagia.com/other/'))
+    eq_(3, cache.misses)
+    eq_(2, cache.hits)
+
+
+def test_parse_query_default_cache():
+    cache = get_default_cache()
+    hits = cache.hits
+    q = u'topic-name($t, $n)?'
+    query(q, True)
+    query(q, True)
+    ok_(cache.hits > hits)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
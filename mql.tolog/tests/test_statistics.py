@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the mql.tolog.statistics module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+from nose.tools import eq_, ok_, raises
+from mappa import TMDM
+from mql.tolog import parse_query, parse_to_tree, optimizer, xsl, consts
+from mql.tolog.evaluator import evaluate
+from mql.tolog.mappalayer import MappaStatistics
+from test_mappalayer import make_layer, _BASE
+
+
+def make_statistics():
+    layer = make_layer()
+    tm = layer.get_topicmap()
+    def topic(ident):
+        return tm.create_topic_by_iid(_BASE + u'#' + ident)
+    likes, liker, liked = topic(u'likes'), topic(u'liker'), topic(u'liked')
+    persons = [topic(u'person%d' % i) for i in range(10)]
+    name_type = tm.topic_by_sid(TMDM.topic_name)
+    for i, person in enumerate(persons):
+        person.create_name(name_type, u'Person %d' % i)
+    for p1 in persons:
+        for p2 in persons:
+            assoc = tm.create_association(likes)
+            assoc.create_role(liker, p1)
+            assoc.create_role(liked, p2)
+    return layer, MappaStatistics(tm)
+
+
+def topic(stats, ident):
+    return stats.resolve(consts.IID, _BASE + u'#' + ident)
+
+
+def optimize(q, stats):
+    return optimizer.apply_optimizers(parse_to_tree(q, iri=_BASE), xsl.DEFAULT_TRANSFORMERS,
+                                      statistics=stats, base_iri=_BASE)
+
+
+def predicates(tree):
+    where = [node for node in tree.iter() if node.name == u'where'][0]
+    return [pred.get(u'name') or pred.children[0].children[0].get(u'value') for pred in where.children]
+
+
+def test_counts():
+    layer, stats = make_statistics()
+    tm = layer.get_topicmap()
+    eq_(len(tm.topics), stats.topic_count())
+    eq_(2, stats.topic_count(topic(stats, u'composer')))
+    eq_(len(tm.associations), stats.association_count())
+    eq_(100, stats.association_count(topic(stats, u'likes')))
+    eq_(sum(len(assoc.roles) for assoc in tm.associations), stats.role_count())
+    eq_(100, stats.role_count(topic(stats, u'liker')))
+    eq_(2, stats.occurrence_count())
+    eq_(12, stats.name_count())
+    eq_(0, stats.variant_count())
+    eq_(1, stats.scoped_count(topic(stats, u'italian')))
+    eq_(14, stats.value_count())
+    eq_(1, stats.value_count(u'Giacomo Puccini'))
+    eq_(14, stats.distinct_value_count())
+    eq_(3, stats.type_count(u'topic'))
+    ti_idx = tm.index.type_instance
+    eq_(len(ti_idx.association_types()), stats.type_count(u'association'))
+    name_type = tm.topic_by_sid(TMDM.topic_name)
+    eq_(len(ti_idx.names(name_type)), stats.name_count(name_type))
+    occ_type = list(ti_idx.occurrence_types())[0]
+    eq_(len(ti_idx.occurrences(occ_type)), stats.occurrence_count(occ_type))
+    ok_(stats.resolve(consts.SID, u'http://www.semagia.com/unknown') is None)
+
+
+def test_join_order():
+    layer, stats = make_statistics()
+    # Static costs: instance-of, value, topic-name
+    eq_([u'instance-of', u'topic-name', u'value'],
+        predicates(optimize(u'value($n, $v), topic-name($t, $n), instance-of($t, composer)?', stats)))
+
+
+def test_association_types():
+    layer, stats = make_statistics()
+    q = u'likes($p : liker, $q : liked), composed-by($p : composer-role, $w : work)?'
+    # Static costs do not distinguish the association types
+    eq_([u'likes', u'composed-by'], predicates(optimize(q, None)))
+    eq_([u'composed-by', u'likes'], predicates(optimize(q, stats)))
+
+
+def test_costs():
+    layer, stats = make_statistics()
+    tree = optimize(u'instance-of($p, person), likes($p : liker, $q : liked), instance-of($x, unknown)?', stats)
+    where = [node for node in tree.iter() if node.name == u'where'][0]
+    eq_([u'-1', u'10', u'100'], [pred.get(u'cost') for pred in where.children])
+
+
+def test_parse_query():
+    layer, stats = make_statistics()
+    query = parse_query(u'select $n from topic-name($c, $name), value($name, $n), instance-of($c, composer) '
+                        u'order by $n?', iri=_BASE, statistics=stats)
+    eq_([u'Giacomo Puccini', u'Giuseppe Verdi'], [row[0] for row in evaluate(query, layer)])
+
+
+@raises(ValueError)
+def test_parse_query_xslt():
+    layer, stats = make_statistics()
+    parse_query(u'instance-of($x, composer)?', iri=_BASE, statistics=stats, xslt=True)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Benchmarks the IRI normalization against a corpus of real-world PSIs.
+
+Compares the full normalization with the detection of already normalized
+IRIs (``irilib.is_normalized``) and with ``irilib.normalize`` which uses
+the fast path and the normalization cache.
+
+Usage::
+
+    python bench_irilib.py [number of iterations]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import sys
+from time import time
+from tm import irilib
+from tm._urlutils import normalize as normalize_uncached
+
+_PSIS = (
+    'http://psi.topicmaps.org/iso13250/model/type-instance',
+    'http://psi.topicmaps.org/iso13250/model/type',
+    'http://psi.topicmaps.org/iso13250/model/instance',
+    'http://psi.topicmaps.org/iso13250/model/supertype-subtype',
+    'http://psi.topicmaps.org/iso13250/model/topic-name',
+    'http://psi.topicmaps.org/tmcl/topic-type',
+    'http://www.w3.org/2001/XMLSchema#string',
+    'http://www.w3.org/2001/XMLSchema#anyURI',
+    'http://www.w3.org/2001/XMLSchema#date',
+    'http://www.w3.org/2000/01/rdf-schema#',
+    'http://www.w3.org/1999/02/22-rdf-syntax-ns#type',
+    'http://xmlns.com/foaf/0.1/Person',
+    'http://purl.org/dc/elements/1.1/title',
+    'http://psi.ontopia.net/ontology/topic-type',
+    'http://psi.ontopia.net/tolog/string/concat',
+    'http://psi.ontopedia.net/Puccini',
+    'http://psi.ontopedia.net/Marc_Wilhelm_K%C3%BCster',
+    'http://psi.oasis-open.org/iso/639/#eng',
+    'http://psi.oasis-open.org/geolang/iso3166/#de',
+    'http://dbpedia.org/resource/Giacomo_Puccini',
+    'http://dbpedia.org/resource/Tosca_(opera)',
+    'http://en.wikipedia.org/wiki/Madama_Butterfly',
+    'http://de.wikipedia.org/wiki/G%C3%B6ttingen',
+    'http://www.subj3ct.com/subject?si=http%3A%2F%2Fpsi.ontopedia.net%2FPuccini',
+    'http://www.semagia.com/psi/test/',
+    'http://www.topicmaps.org/xtm/1.0/core.xtm#class-instance',
+    'https://www.semagia.com:8443/psi/lars',
+    # Not normalized
+    'HTTP://psi.ontopedia.net/Verdi',
+    'http://www.Semagia.com/',
+    'http://psi.ontopedia.net/%7elars',
+    'http://psi.ontopedia.net:80/Verdi',
+    'http://psi.ontopedia.net/a/../Verdi',
+    'urn:x-semagia:lars',
+    'mailto:lars@semagia.com',
+)
+
+
+def _corpus():
+    corpus = list(_PSIS)
+    for i in range(2000):
+        corpus.append('http://dbpedia.org/resource/Topic_%d' % i)
+        corpus.append('http://psi.ontopedia.net/Subject_%d' % i)
+    return corpus
+
+
+def bench(func, corpus, iterations):
+    """\
+    Returns the time (in seconds) to apply `func` `iterations` times to each
+    IRI of the `corpus`.
+    """
+    start = time()
+    for _ in xrange(iterations):
+        for iri in corpus:
+            func(iri)
+    return time() - start
+
+
+def main(iterations=10):
+    corpus = _corpus()
+    normalized = sum(1 for iri in corpus if irilib.is_normalized(iri))
+    print('%d IRIs, %d detected as normalized' % (len(corpus), normalized))
+    n = len(corpus) * iterations
+    cache = irilib.get_default_cache()
+    cache.clear()
+    for label, func in (('uncached', normalize_uncached),
+                        ('is_normalized', irilib.is_normalized),
+                        ('cache', irilib.NormalizationCache(len(corpus)).normalize),
+                        ('normalize', irilib.normalize)):
+        duration = bench(func, corpus, iterations)
+        print('%-14s %.3fs (%.2f us/IRI)' % (label, duration, duration / n * 1000000))
+    print('default cache: %r' % cache.stats())
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
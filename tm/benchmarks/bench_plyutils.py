@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Benchmarks the per-parse setup time of PLY lexers and parsers.
+
+Compares creating a new lexer / parser per parse with taking them from
+the pool. Uses the CTM and tolog grammars if ``mio.ctm`` resp.
+``mql.tolog`` are available.
+
+Usage::
+
+    python bench_plyutils.py [number of iterations]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import sys
+from time import time
+from tm import plyutils
+
+
+def _grammars():
+    grammars = []
+    try:
+        from mio.ctm import lexer, parser
+        grammars.append(('CTM', lexer, parser))
+    except ImportError:
+        pass
+    try:
+        from mql.tolog import lexer, parser
+        grammars.append(('tolog', lexer, parser))
+    except ImportError:
+        pass
+    return grammars
+
+
+def bench_make(lexer_mod, parser_mod, n):
+    """\
+    Returns the time (in seconds) to create ``n`` lexer / parser pairs.
+    """
+    start = time()
+    for i in xrange(n):
+        plyutils.make_lexer(lexer_mod)
+        plyutils.make_parser(parser_mod)
+    return time() - start
+
+
+def bench_pooled(lexer_mod, parser_mod, n):
+    """\
+    Returns the time (in seconds) to acquire and release ``n`` lexer / parser
+    pairs from the pool.
+    """
+    start = time()
+    for i in xrange(n):
+        with plyutils.pooled_parser(parser_mod):
+            with plyutils.pooled_lexer(lexer_mod):
+                pass
+    return time() - start
+
+
+def main(n=1000):
+    grammars = _grammars()
+    if not grammars:
+        print('Neither mio.ctm nor mql.tolog is available')
+        return
+    for name, lexer_mod, parser_mod in grammars:
+        # Warm up: Generate / import the tables
+        bench_make(lexer_mod, parser_mod, 1)
+        bench_pooled(lexer_mod, parser_mod, 1)
+        for label, func in (('make', bench_make), ('pooled', bench_pooled)):
+            duration = func(lexer_mod, parser_mod, n)
+            print('%-6s %-7s %d parses: %.3fs (%.2f us/parse)' % (name, label, n, duration, duration / n * 1000000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Benchmarks the ``XMLWriter`` with and without a buffer.
+
+Writes a XTM-like document with the provided number of topics.
+
+Usage::
+
+    python bench_xmlutils.py [number of topics]
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - <http://www.semagia.com/>
+:license:      BSD License
+"""
+import io
+import sys
+from time import time
+from tm.xmlutils import XMLWriter, DEFAULT_BUFFER_SIZE
+
+
+def write(writer, n):
+    """\
+    Writes a document with `n` topics.
+    """
+    writer.startDocument()
+    writer.startElement(u'topicMap', {u'xmlns': u'http://www.topicmaps.org/xtm/', u'version': u'2.0'})
+    for i in xrange(n):
+        writer.startElement(u'topic', {u'id': u't-%d' % i})
+        writer.emptyElement(u'subjectIdentifier', {u'href': u'http://psi.example.org/topic/%d' % i})
+        writer.startElement(u'name')
+        writer.dataElement(u'value', u'Topic %d & more' % i)
+        writer.endElement(u'name')
+        writer.startElement(u'occurrence')
+        writer.emptyElement(u'type', {u'href': u'#description'})
+        writer.dataElement(u'resourceData', u'A description of topic %d' % i)
+        writer.endElement(u'occurrence')
+        writer.endElement(u'topic')
+    writer.endElement(u'topicMap')
+    writer.endDocument()
+
+
+def bench(n, buffer_size):
+    """\
+    Returns the time (in seconds) to write a document with `n` topics.
+    """
+    out = io.BytesIO()
+    start = time()
+    write(XMLWriter(out, buffer_size=buffer_size), n)
+    return time() - start
+
+
+def main(n=100000):
+    for buffer_size in (0, 4096, DEFAULT_BUFFER_SIZE):
+        duration = bench(n, buffer_size)
+        print('buffer size %6d: %.3fs (%.2f us/topic)' % (buffer_size, duration, duration / n * 1000000))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against the ``ioutils`` module.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - http://www.semagia.com/
+:license:      BSD license
+"""
+import io
+from nose.tools import eq_
+from tm.ioutils import BufferedOutput
+
+
+def test_buffered_output():
+    out = io.BytesIO()
+    buf = BufferedOutput(out, buffer_size=4)
+    buf.write(u'ab')
+    eq_('', out.getvalue())
+    buf.write(u'c\xe4')
+    eq_(u'abc\xe4'.encode('utf-8'), out.getvalue())
+    buf.write(u'd')
+    buf.flush()
+    eq_(u'abc\xe4d'.encode('utf-8'), out.getvalue())
+
+
+def test_buffered_output_encoding():
+    out = io.BytesIO()
+    buf = BufferedOutput(out, 'iso-8859-1', 100)
+    buf.write(u'\xe4\xf6\xfc')
+    buf.flush()
+    eq_(u'\xe4\xf6\xfc'.encode('iso-8859-1'), out.getvalue())
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -12,8 +12,10 @@ Tests against the ``tm.irilib``.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
-from nose.tools import eq_
-from tm.irilib import normalize, resolve_iri
+from nose.tools import eq_, ok_, raises
+from tm.irilib import normalize, resolve_iri, is_normalized, NormalizationCache, \
+        get_default_cache
+from tm._urlutils import normalize as normalize_uncached
 
 
 
@@ -155,6 +157,111 @@ def test_windows_normalization():
     eq_('file://localhost/E:/somewhere/bla.ctm', normalize('file://localhost/E|/somewhere/bla.ctm'))
 
 
+def test_cache():
+    cache = NormalizationCache(2)
+    eq_('http://a/b', cache.normalize('HTTP://a/./b'))
+    eq_('http://a/b', cache.normalize('HTTP://a/./b'))
+    eq_(dict(hits=1, misses=1, size=1, maxsize=2), cache.stats())
+    cache.normalize('http://a/c')
+    cache.normalize('HTTP://a/./b')
+    cache.normalize('http://a/d')
+    # http://a/c was the least recently used IRI
+    eq_(2, len(cache))
+    eq_(2, cache.stats()['hits'])
+    cache.normalize('http://a/c')
+    eq_(dict(hits=2, misses=4, size=2, maxsize=2), cache.stats())
+    cache.clear()
+    eq_(dict(hits=0, misses=0, size=0, maxsize=2), cache.stats())
+
+
+def test_cache_interned():
+    cache = NormalizationCache()
+    iri = cache.normalize('HTTP://a/b')
+    ok_(iri is cache.normalize('http://a/./b'))
+    ok_(iri is cache.normalize('http://a/b'))
+
+
+def test_cache_type():
+    cache = NormalizationCache()
+    ok_(isinstance(cache.normalize('http://a/b'), str))
+    ok_(isinstance(cache.normalize(u'http://a/b'), unicode))
+
+
+def test_cache_resize():
+    cache = NormalizationCache()
+    for i in range(10):
+        cache.normalize('http://a/%d' % i)
+    cache.resize(3)
+    eq_(3, len(cache))
+    eq_(3, len(cache._interned))
+    eq_(3, cache.stats()['maxsize'])
+
+
+@raises(ValueError)
+def test_cache_illegal_size():
+    NormalizationCache(0)
+
+
+def test_default_cache():
+    cache = get_default_cache()
+    hits = cache.stats()['hits']
+    normalize('HTTP://www.semagia.com/default-cache')
+    normalize('HTTP://www.semagia.com/default-cache')
+    ok_(cache.stats()['hits'] > hits)
+
+
+def test_is_normalized():
+    iris = [
+            'http://psi.topicmaps.org/iso13250/model/type-instance',
+            'http://www.w3.org/2000/01/rdf-schema#',
+            'http://www.w3.org/2001/XMLSchema#anyURI',
+            'https://www.semagia.com:8443/a;b/c,d/~e/',
+            'http://psi.ontopedia.net/Marc_Wilhelm_K%C3%BCster',
+            'http://www.semagia.com/?a=b&c=%26&d',
+            'http://127.0.0.1/',
+    ]
+    for iri in iris:
+        ok_(is_normalized(iri), iri)
+        eq_(iri, normalize_uncached(iri))
+        ok_(iri is normalize(iri))
+        # Non-ASCII escapes are not kept if the IRI is a unicode string
+        eq_(normalize_uncached(unicode(iri)) == iri, is_normalized(unicode(iri)))
+
+
+def test_is_not_normalized():
+    iris = [
+            'HTTP://www.semagia.com/',
+            'http://www.Semagia.com/',
+            'http://www.semagia.com./',
+            'http://www.semagia.com',
+            'http://www.semagia.com:80/',
+            'https://www.semagia.com:443/',
+            'http://www.semagia.com:080/',
+            'http://www.semagia.com:/',
+            'http://lars@www.semagia.com/',
+            'http://www.semagia.com/a/./b',
+            'http://www.semagia.com/a/../b',
+            'http://www.semagia.com/a/..',
+            'http://www.semagia.com/a//b',
+            'http://www.semagia.com/%7elars',
+            'http://www.semagia.com/%7Elars',
+            'http://www.semagia.com/%c3%bc',
+            'http://www.semagia.com/%C3',
+            'http://www.semagia.com/a b',
+            ' http://www.semagia.com/',
+            'http://www.semagia.com/a?',
+            'http://www.semagia.com/a?b#',
+            'http://www.semagia.com/a?b=c=d',
+            'http://www.semagia.com/a?b=%3D',
+            'http://www.semagia.com/a#b#c',
+            u'http://www.semagia.com/\xfc',
+            'mailto:lars@semagia.com',
+            'urn:x-semagia:lars',
+    ]
+    for iri in iris:
+        ok_(not is_normalized(iri), iri)
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+Tests against ``tm.plyutils``.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - http://www.semagia.com/
+:license:      BSD license
+"""
+import threading
+from nose.tools import ok_, eq_
+from tm import plyutils
+
+
+class _Parser(object):
+    def __init__(self):
+        self.action = {}
+
+
+def test_pool_reuse():
+    pool = plyutils._Pool(_Parser)
+    parser = pool.acquire()
+    eq_(0, len(pool))
+    pool.release(parser)
+    eq_(1, len(pool))
+    ok_(parser is pool.acquire())
+    eq_(0, len(pool))
+
+
+def test_pool_reset():
+    pool = plyutils._Pool(_Parser)
+    parser = pool.acquire()
+    action = parser.action
+    parser.handler = 'handler'
+    parser.action = None
+    pool.release(parser)
+    parser = pool.acquire()
+    ok_(not hasattr(parser, 'handler'))
+    ok_(action is parser.action)
+    parser.lexstatestack = ['INITIAL']
+    pool.release(parser)
+    parser = pool.acquire()
+    ok_(not hasattr(parser, 'lexstatestack'))
+
+
+def test_pool_threads():
+    pool = plyutils._Pool(_Parser)
+    acquired = []
+    def run():
+        for i in range(100):
+            parser = pool.acquire()
+            acquired.append(parser)
+            pool.release(parser)
+    threads = [threading.Thread(target=run) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    eq_(400, len(acquired))
+    ok_(len(pool) <= 4)
+    eq_(len(pool), len(set(map(id, acquired))))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.core.runmodule()
@@ -12,7 +12,8 @@ Tests against the ``xmlutils`` module.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
-from nose.tools import ok_
+import io
+from nose.tools import ok_, eq_
 from StringIO import StringIO
 from xml.sax import saxutils
 from tm import xmlutils
@@ -55,6 +56,80 @@ def test_simplesaxhandler2():
     handler.endDocument()
     
 
+def _write_document(writer):
+    writer.startDocument()
+    writer.comment(u'Comment -- with <special> characters')
+    writer.startElement(u'xml', {u'a': u'b'})
+    writer.processingInstruction(u'target', u'data')
+    writer.startElement(u'a', {u'x': u'Tom & "Jerry"', u'y': u"it's \"\t\n"})
+    writer.characters(u'<b> & \u00fcber')
+    writer.endElement(u'a')
+    writer.emptyElement(u'f')
+    writer.emptyElement(u'f', {u'g': u"'"})
+    writer.dataElement(u'g', u'h > i')
+    writer.dataElement(u'i', u'j', {u'k': u'l'})
+    writer.endElement(u'xml')
+    writer.endDocument()
+
+
+_EXPECTED = (u'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+             u'<!-- Comment - - with &lt;special&gt; characters -->\n'
+             u'<xml a="b"><?target data?>'
+             u'<a y="it\'s &quot;&#9;&#10;" x=\'Tom &amp; "Jerry"\'>&lt;b&gt; &amp; \u00fcber</a>'
+             u'<f/><f g="\'"/><g>h &gt; i</g><i k="l">j</i></xml>\n').encode('utf-8')
+
+_EXPECTED_PRETTY = (u'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+                    u'<!-- Comment - - with &lt;special&gt; characters -->\n'
+                    u'<xml a="b"><?target data?>\n'
+                    u'  <a y="it\'s &quot;&#9;&#10;" x=\'Tom &amp; "Jerry"\'>&lt;b&gt; &amp; \u00fcber\n'
+                    u'  </a>\n'
+                    u'  <f/>\n'
+                    u'  <f g="\'"/>\n'
+                    u'  <g>h &gt; i</g>\n'
+                    u'  <i k="l">j</i>\n'
+                    u'</xml>\n').encode('utf-8')
+
+
+def test_xmlwriter():
+    for buffer_size in (0, 1, 10, xmlutils.DEFAULT_BUFFER_SIZE):
+        for prettify, expected in ((False, _EXPECTED), (True, _EXPECTED_PRETTY)):
+            out = io.BytesIO()
+            _write_document(xmlutils.XMLWriter(out, prettify=prettify, buffer_size=buffer_size))
+            yield eq_, expected, out.getvalue()
+
+
+def test_xmlwriter_buffer_size():
+    out = io.BytesIO()
+    writer = xmlutils.XMLWriter(out, buffer_size=100)
+    writer.startDocument()
+    writer.startElement(u'a')
+    eq_('', out.getvalue())
+    writer.characters(u'x' * 100)
+    ok_(out.getvalue())
+    writer.endElement(u'a')
+    writer.endDocument()
+    ok_(out.getvalue().endswith('</a>\n'))
+
+
+def test_xmlwriter_flush():
+    out = io.BytesIO()
+    writer = xmlutils.XMLWriter(out, buffer_size=xmlutils.DEFAULT_BUFFER_SIZE)
+    writer.startDocument()
+    writer.emptyElement(u'a')
+    eq_('', out.getvalue())
+    writer.flush()
+    ok_(out.getvalue().endswith('<a/>'))
+
+
+def test_xmlwriter_encoding():
+    out = io.BytesIO()
+    writer = xmlutils.XMLWriter(out, encoding='iso-8859-1', buffer_size=xmlutils.DEFAULT_BUFFER_SIZE)
+    writer.startDocument()
+    writer.dataElement(u'a', u'\u00fc')
+    writer.endDocument()
+    eq_('<?xml version="1.0" encoding="iso-8859-1" standalone="yes"?>\n<a>\xfc</a>\n', out.getvalue())
+
+
 if __name__ == '__main__':
     import nose
     nose.core.runmodule()
@@ -42,6 +42,65 @@ default_port = {
 _WIN_FILE_PATTERN = re.compile(r'^(/[A-Za-z]*)(%7C)')
 _MAILTO_HOST_PATTERN = re.compile(r'(@.+)')
 
+#LH: Matches http(s) IRIs which consist of characters which are kept by
+# normalize: lowercase scheme and host, no userinfo, no default port, an
+# absolute path, a non-empty query and fragment
+_NORMALIZED_PATTERN = re.compile(r"""(https?)://
+    [a-z0-9](?:[a-z0-9.-]*[a-z0-9-])?
+    (?::([1-9][0-9]*))?
+    (/[A-Za-z0-9_.~:/!$&'()*+,;=@\[\]%-]*)
+    (?:\?([A-Za-z0-9_.~:/?!$&'()*+,;=@\[\]%-]*[A-Za-z0-9_.~:/!$&'()*+,;=@\[\]%-]))?
+    (?:\#([A-Za-z0-9_.~%-]+))?
+    \Z""", re.VERBOSE)
+
+_DOT_SEGMENT_PATTERN = re.compile(r'//|/\.\.?(?:/|\Z)')
+
+_PATH_SAFE = "~:/?#[]@!$&'()*+,;="
+_QUERY_SAFE = "~:/?#[]@!$'()*+,;="
+
+
+def _clean(string):
+    if not isinstance(string, unicode):
+        string=unicode(unquote(string),'utf-8','replace')
+    else:
+        string=unquote(string)
+    return unicodedata.normalize('NFC',string).encode('utf-8')
+
+
+def _is_quoted(string, safe):
+    """\
+    Returns if `string` is kept by the percent-encoding of normalize.
+    """
+    return '%' not in string or quote(_clean(string), safe) == string
+
+
+def is_normalized(url):
+    """\
+    Returns ``True`` if `url` is known to be kept unchanged by normalize.
+
+    Only http(s) IRIs are detected, ``False`` does not imply that the IRI
+    is not normalized.
+    """
+    m = _NORMALIZED_PATTERN.match(url)
+    if m is None:
+        #LH: An empty fragment is kept if there is no query
+        if url[-1:] != '#' or '?' in url:
+            return False
+        m = _NORMALIZED_PATTERN.match(url, 0, len(url) - 1)
+        if m is None or m.group(5) is not None:
+            return False
+    scheme, port, path, query, fragment = m.groups()
+    if port and int(port) == default_port[scheme]:
+        return False
+    if _DOT_SEGMENT_PATTERN.search(path):
+        return False
+    if query and '%' in query and not all(_is_quoted(t, _QUERY_SAFE)
+                                          for q in query.split('&') for t in q.split('=', 1)):
+        return False
+    if query and any(q.count('=') > 1 for q in query.split('&')):
+        return False
+    return _is_quoted(path, _PATH_SAFE) and (not fragment or _is_quoted(fragment, '~'))
+
 
 def normalize(url):
     """Normalize a URL."""
@@ -59,12 +118,7 @@ def normalize(url):
     # Only perform percent-encoding where it is essential.
     # Always use uppercase A-through-F characters when percent-encoding.
     # All portions of the URI must be utf-8 encoded NFC from Unicode strings
-    def clean(string):
-        if not isinstance(string, unicode):
-            string=unicode(unquote(string),'utf-8','replace')
-        else:
-            string=unquote(string)
-        return unicodedata.normalize('NFC',string).encode('utf-8')
+    clean = _clean
     path = quote(clean(path),"~:/?#[]@!$&'()*+,;=")
     #LH: Replace '|' after drive letter
     if scheme == 'file':
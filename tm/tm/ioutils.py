@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2007 - 2014 -- Lars Heuer - Semagia <http://www.semagia.com/>.
+# All rights reserved.
+#
+# BSD license.
+#
+"""\
+I/O Utilities.
+
+:author:       Lars Heuer (heuer[at]semagia.com)
+:organization: Semagia - http://www.semagia.com/
+:license:      BSD license
+"""
+
+# Default number of characters which are collected by a `BufferedOutput`
+# before they are written to the output
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedOutput(object):
+    """\
+    Collects strings and writes them encoded in chunks of (at least)
+    `buffer_size` characters.
+    """
+    __slots__ = ['_out', '_encoding', '_buffer_size', '_chunks', '_size']
+
+    def __init__(self, out, encoding='utf-8', buffer_size=DEFAULT_BUFFER_SIZE):
+        """\
+
+        `out`
+            A file-alike object which accepts byte strings.
+        `encoding`
+            The encoding of the output (default: ``utf-8``).
+        `buffer_size`
+            The number of characters which are collected before they are
+            written to `out`.
+        """
+        self._out = out
+        self._encoding = encoding
+        self._buffer_size = buffer_size
+        self._chunks = []
+        self._size = 0
+
+    def write(self, data):
+        """\
+        Appends the string `data` to the buffer and writes the buffer if
+        it contains (at least) `buffer_size` characters.
+        """
+        self._chunks.append(data)
+        self._size += len(data)
+        if self._size >= self._buffer_size:
+            self._write_chunks()
+
+    def flush(self):
+        """\
+        Writes the buffered strings and flushes the underlying output.
+        """
+        self._write_chunks()
+        self._out.flush()
+
+    def _write_chunks(self):
+        if self._chunks:
+            self._out.write(u''.join(self._chunks).encode(self._encoding))
+            del self._chunks[:]
+            self._size = 0
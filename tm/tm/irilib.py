@@ -12,10 +12,13 @@ Constants and functions that may be useful to operate upon IRIs.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import threading
 from urlparse import urljoin
-from ._urlutils import normalize
+from collections import OrderedDict
+from ._urlutils import normalize as _normalize, is_normalized
 
-__all__ = ['resolve_iri', 'normalize']
+__all__ = ['resolve_iri', 'normalize', 'is_normalized', 'NormalizationCache',
+           'get_default_cache']
 
 
 def resolve_iri(base, reference):
@@ -26,6 +29,125 @@ def resolve_iri(base, reference):
         return urljoin(base[:-1], '#' + reference)
     return urljoin(base, reference)
 
+
+class NormalizationCache(object):
+    """\
+    Thread-safe LRU cache in front of the IRI normalization.
+
+    Equal normalized IRIs are represented by the same string object as long
+    as one of the IRIs which were normalized to it is kept in the cache.
+    """
+    def __init__(self, maxsize=4096):
+        """\
+
+        `maxsize`
+            The max. number of IRIs to keep. If more IRIs are added, the
+            least recently used IRI is discarded.
+        """
+        if maxsize < 1:
+            raise ValueError('Expected a positive size, got: %r' % maxsize)
+        self.maxsize = maxsize
+        # (type, IRI) -> normalized IRI. The type is part of the key since
+        # ``'a' == u'a'`` but the normalization keeps the type of the IRI
+        self._iris = OrderedDict()
+        # (type, normalized IRI) -> [normalized IRI, number of IRIs which
+        # refer to it]
+        self._interned = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def normalize(self, iri):
+        """\
+        Returns the normalized `iri`.
+        """
+        key = iri.__class__, iri
+        with self._lock:
+            res = self._iris.pop(key, None)
+            if res is not None:
+                self.hits += 1
+                self._iris[key] = res
+                return res
+            self.misses += 1
+        res = _normalize(iri)
+        with self._lock:
+            if key in self._iris:
+                # Another thread normalized the IRI in the meantime
+                return self._iris[key]
+            res_key = res.__class__, res
+            entry = self._interned.get(res_key)
+            if entry is None:
+                entry = self._interned[res_key] = [res, 0]
+            entry[1] += 1
+            res = self._iris[key] = entry[0]
+            while len(self._iris) > self.maxsize:
+                self._discard()
+        return res
+
+    def resize(self, maxsize):
+        """\
+        Changes the max. number of IRIs to keep.
+        """
+        if maxsize < 1:
+            raise ValueError('Expected a positive size, got: %r' % maxsize)
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._iris) > maxsize:
+                self._discard()
+
+    def clear(self):
+        """\
+        Removes all IRIs and resets the statistics.
+        """
+        with self._lock:
+            self._iris.clear()
+            self._interned.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """\
+        Returns a dict with the number of ``hits``, ``misses``, the current
+        ``size`` and the ``maxsize`` of this cache.
+        """
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses,
+                        size=len(self._iris), maxsize=self.maxsize)
+
+    def _discard(self):
+        _, res = self._iris.popitem(last=False)
+        res_key = res.__class__, res
+        entry = self._interned[res_key]
+        entry[1] -= 1
+        if not entry[1]:
+            del self._interned[res_key]
+
+    def __len__(self):
+        return len(self._iris)
+
+
+_DEFAULT_CACHE = NormalizationCache()
+
+
+def get_default_cache():
+    """\
+    Returns the `NormalizationCache` which is used by `normalize`.
+    """
+    return _DEFAULT_CACHE
+
+
+def normalize(iri):
+    """\
+    Returns the normalized `iri`.
+
+    IRIs which are already normalized (c.f. `is_normalized`) are returned
+    unchanged, the results of all other IRIs are kept in a
+    `NormalizationCache` (c.f. `get_default_cache`).
+    """
+    if is_normalized(iri):
+        return iri
+    return _DEFAULT_CACHE.normalize(iri)
+
 # All registered rootless schemes
 ROOTLESS_SCHEMES = (
                     'urn',          # RFC 2141
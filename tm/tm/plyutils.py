@@ -15,6 +15,8 @@ Utilities for lexers / parsers using `Ply <http://www.dabeaz.com/ply/>`_
 from __future__ import absolute_import
 import os
 import sys
+import threading
+from contextlib import contextmanager
 import tm.ply.yacc as yacc
 import tm.ply.lex as lex
 # Work-around for parsers which create a big parsetab file
@@ -57,6 +59,105 @@ if _yacc_pickle:
     make_parser = make_parser_pickled
 
 
+class _Pool(object):
+    """\
+    Thread-safe pool of reusable lexer / parser instances.
+
+    Released instances are reset to the state they had after their
+    creation, attributes set by the user (i.e. handlers) are removed.
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        obj = self._factory()
+        obj._pristine_state = dict(obj.__dict__)
+        return obj
+
+    def release(self, obj):
+        state = obj._pristine_state
+        obj.__dict__.clear()
+        obj.__dict__.update(state)
+        obj._pristine_state = state
+        lexstatestack = getattr(obj, 'lexstatestack', None)
+        if lexstatestack:
+            del lexstatestack[:]
+        with self._lock:
+            self._free.append(obj)
+
+    def __len__(self):
+        return len(self._free)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(kind, module, factory):
+    """\
+    Returns the pool for the ``kind`` of objects created from ``module``.
+    """
+    key = kind, module.__name__
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = _Pool(lambda: factory(module))
+    return pool
+
+
+@contextmanager
+def pooled_lexer(module):
+    """\
+    Returns a context manager which provides a lexer for the ``module``.
+
+    The lexer is taken from a pool and returned to it (and reset) when the
+    ``with`` block is left. The lexer must not be used outside of the
+    ``with`` block.
+
+    ::
+
+        with pooled_lexer(lexer_mod) as lexer:
+            lexer.input(data)
+            ...
+    """
+    pool = _get_pool('lexer', module, make_lexer)
+    lexer = pool.acquire()
+    try:
+        yield lexer
+    finally:
+        pool.release(lexer)
+
+
+@contextmanager
+def pooled_parser(module):
+    """\
+    Returns a context manager which provides a parser for the ``module``.
+
+    The parser is taken from a pool and returned to it (and reset) when the
+    ``with`` block is left. The parser must not be used outside of the
+    ``with`` block.
+
+    ::
+
+        with pooled_parser(parser_mod) as parser:
+            parser.handler = handler
+            parser.parse(data)
+    """
+    pool = _get_pool('parser', module, make_parser)
+    parser = pool.acquire()
+    try:
+        yield parser
+    finally:
+        pool.release(parser)
+
+
 def _make_parser_for_sdist(module):
     """\
     Prepare PLY parser modules for source distribution.
@@ -12,6 +12,7 @@ XML Utilities.
 :organization: Semagia - http://www.semagia.com/
 :license:      BSD license
 """
+import re
 import codecs
 from xml.sax.handler import ContentHandler
 from xml.sax import SAXException
@@ -24,6 +25,7 @@ except ImportError:
         from xml.etree import cElementTree as etree
     except ImportError:
         from xml.etree import ElementTree as etree
+from tm.ioutils import BufferedOutput, DEFAULT_BUFFER_SIZE
 
 
 def as_inputsource(source):
@@ -37,13 +39,37 @@ def as_inputsource(source):
     return input_source
 
 
+_TEXT_SPECIALS = re.compile(u'[&<>]')
+_ATTR_SPECIALS = re.compile(u'[&<>"\n\r\t]')
+
+
+def _escape(data, search=_TEXT_SPECIALS.search):
+    """\
+    Same as ``xml.sax.saxutils.escape`` but returns strings without special
+    characters as they are.
+    """
+    if search(data) is None:
+        return data
+    return escape(data)
+
+
+def _quoteattr(data, search=_ATTR_SPECIALS.search):
+    """\
+    Same as ``xml.sax.saxutils.quoteattr`` but avoids the escaping of
+    strings without special characters.
+    """
+    if search(data) is None:
+        return '"%s"' % data
+    return quoteattr(data)
+
+
 class XMLWriter(object):
     """\
     Simple SAX alike XML writer
     """
     __slots__ = ['_out', '_encoding', '_depth', 'prettify']
     
-    def __init__(self, out, encoding='utf-8', prettify=False):
+    def __init__(self, out, encoding='utf-8', prettify=False, buffer_size=0, depth=0):
         """\
 
         `out`
@@ -52,10 +78,21 @@ class XMLWriter(object):
             An encoding (default: UTF-8)
         `prettify`
             Indicates if the XML should be prettified (default: False)
+        `buffer_size`
+            If greater than ``0``, the XML is collected and written encoded
+            to `out` once (at least) `buffer_size` characters are
+            available or if the document ends (c.f. `DEFAULT_BUFFER_SIZE`).
+            Otherwise, each fragment is written immediately (default).
+        `depth`
+            The initial nesting depth, used to indent XML fragments which
+            are written without a document (default: 0)
         """
-        self._out = codecs.getwriter(encoding)(out)
+        if buffer_size > 0:
+            self._out = BufferedOutput(out, encoding, buffer_size)
+        else:
+            self._out = codecs.getwriter(encoding)(out)
         self._encoding = encoding
-        self._depth = 0
+        self._depth = depth
         self.prettify = prettify
 
     def startDocument(self):
@@ -74,6 +111,12 @@ class XMLWriter(object):
         self._newline()
         self._out.flush()
 
+    def flush(self):
+        """\
+        Writes the buffered XML (if any) and flushes the output.
+        """
+        self._out.flush()
+
     def startPrefixMapping(self, prefix, uri):
         # TODO
         pass
@@ -87,9 +130,10 @@ class XMLWriter(object):
         Writes a start tag with the optional attributes (a dict).
         """
         self._indent()
-        self._out.write(u'<%s' % name)
-        self._write_attributes(attrs)
-        self._out.write(u'>')
+        if attrs:
+            self._out.write(u'<%s%s>' % (name, self._attributes(attrs)))
+        else:
+            self._out.write(u'<%s>' % name)
         self._depth+=1
     
     def endElement(self, name, indent=True):
@@ -110,65 +154,57 @@ class XMLWriter(object):
         """\
         Writes a start tag, the data and an end tag.
         """
-        self.startElement(name, attrs)
-        self.characters(data)
-        self.endElement(name, False)
+        self._indent()
+        self._out.write(u'<%s%s>%s</%s>' % (name, self._attributes(attrs), _escape(data), name))
 
     def emptyElement(self, name, attrs=None):
         """\
         Writes ``<name att1="attr-val1" attr2="attr-val2"/>``
         """
         self._indent()
-        out = self._out
-        out.write(u'<%s' % name)
-        self._write_attributes(attrs)
-        out.write(u'/>')
+        self._out.write(u'<%s%s/>' % (name, self._attributes(attrs)))
     
     def characters(self, content):
         """\
         Writes an escaped value.
         """
-        self._out.write(escape(content))
+        self._out.write(_escape(content))
+
+    def raw(self, data):
+        """\
+        Writes the already serialized XML `data` (a fragment) as it is.
+        """
+        self._out.write(data)
 
     def processingInstruction(self, target, data):
         """\
         Writes a processing instruction.
         """
-        write = self._out.write
-        write(u'<?')
-        write(target)
-        write(u' ')
-        write(data)
-        write(u'?>')
+        self._out.write(u'<?%s %s?>' % (target, data))
 
     def comment(self, comment):
         """\
         Writes a comment.
         """
-        write = self._out.write
         self._indent()
-        write(u'<!-- ')
-        self.characters(comment.replace(u'--', u'- -'))
-        write(u' -->')
+        self._out.write(u'<!-- %s -->' % _escape(comment.replace(u'--', u'- -')))
         if not self.prettify:
             self._newline()
 
-    def _write_attributes(self, attrs):
+    def _attributes(self, attrs):
         """\
-        Serializes the attributes (a ``dict`` or ``None``), if any.
+        Returns the serialized attributes (a ``dict`` or ``None``), if any.
         """
-        if attrs:
-            write = self._out.write
-            for k, v in attrs.items():
-                write(u' %s=%s' % (k, quoteattr(v)))
+        if not attrs:
+            return u''
+        return u''.join([u' %s=%s' % (k, _quoteattr(v)) for k, v in attrs.items()])
 
     def _indent(self):
         """\
         Indents a line.
         """
         if self.prettify:
-            self._newline()
-            self._out.write(u' ' * self._depth * 2)
+            self._out.write(u'\n' + u' ' * self._depth * 2)
 
     def _newline(self):
         """\
@@ -182,7 +218,7 @@ class SimpleXMLWriter(XMLWriter):
     XMLWriter which remembers the names of started elements and provides
     a simple `pop` method to close the last element.
     """
-    def __init__(self, out, encoding='utf-8', prettify=False):
+    def __init__(self, out, encoding='utf-8', prettify=False, buffer_size=0):
         """\
 
         `out`
@@ -191,8 +227,12 @@ class SimpleXMLWriter(XMLWriter):
             An encoding (default: UTF-8)
         `prettify`
             Indicates if the XML should be prettified (default: False)
+        `buffer_size`
+            Number of characters to collect before writing to `out`
+            (c.f. `XMLWriter`)
         """
-        super(SimpleXMLWriter, self).__init__(out, encoding=encoding, prettify=prettify)
+        super(SimpleXMLWriter, self).__init__(out, encoding=encoding, prettify=prettify,
+                                              buffer_size=buffer_size)
         self._elements = []
 
     def startElement(self, name, attrs=None):